@@ -0,0 +1,53 @@
+"""Make uq_meta_snapshot treat NULL region (global) as a value.
+
+Bulk snapshot saves use ON CONFLICT ON CONSTRAINT uq_meta_snapshot. With
+the default NULLS DISTINCT semantics, global snapshots (region IS NULL)
+never conflict, so the constraint is recreated with NULLS NOT DISTINCT
+after removing any duplicate global rows (keeping the latest update).
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-03-01
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "040"
+down_revision: str | None = "039"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM meta_snapshots a
+        USING meta_snapshots b
+        WHERE a.region IS NULL
+          AND b.region IS NULL
+          AND a.snapshot_date = b.snapshot_date
+          AND a.format = b.format
+          AND a.best_of = b.best_of
+          AND a.tournament_type = b.tournament_type
+          AND (a.updated_at, a.id::text) < (b.updated_at, b.id::text)
+        """
+    )
+    op.drop_constraint("uq_meta_snapshot", "meta_snapshots", type_="unique")
+    op.execute(
+        """
+        ALTER TABLE meta_snapshots
+        ADD CONSTRAINT uq_meta_snapshot UNIQUE NULLS NOT DISTINCT
+            (snapshot_date, region, format, best_of, tournament_type)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_meta_snapshot", "meta_snapshots", type_="unique")
+    op.create_unique_constraint(
+        "uq_meta_snapshot",
+        "meta_snapshots",
+        ["snapshot_date", "region", "format", "best_of", "tournament_type"],
+    )
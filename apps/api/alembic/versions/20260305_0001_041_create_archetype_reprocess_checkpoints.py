@@ -0,0 +1,51 @@
+"""Create archetype_reprocess_checkpoints table.
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-03-05
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "041"
+down_revision: str | None = "040"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archetype_reprocess_checkpoints",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("job_key", sa.String(length=100), nullable=False),
+        sa.Column("region", sa.String(length=20), nullable=False),
+        sa.Column("force", sa.Boolean(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("last_placement_id", sa.Uuid(), nullable=True),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("updated", sa.Integer(), nullable=False),
+        sa.Column("skipped", sa.Integer(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("archetype_reprocess_checkpoints")
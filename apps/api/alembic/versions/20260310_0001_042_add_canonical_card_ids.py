@@ -0,0 +1,72 @@
+"""Add indexed canonical card ID columns.
+
+Adds cards.canonical_id and card_id_mappings.jp_canonical_id and backfills
+them with the same reduction as src.utils.card_ids.canonical_card_id():
+lowercase, then strip zero-padding from the set digits of
+<letters><digits>[pt<digits>] set parts and from the card number.
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-03-10
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "042"
+down_revision: str | None = "041"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _canonical_sql(column: str) -> str:
+    """SQL expression mirroring canonical_card_id() for a text column."""
+    raw = f"lower(btrim({column}))"
+    set_part = (
+        f"regexp_replace(regexp_replace({raw}, '-[^-]*$', ''), "
+        "'^([a-z]+)0*([0-9]+)((pt[0-9]+)?)$', '\\1\\2\\3')"
+    )
+    number = (
+        f"regexp_replace(substring({raw} from '[^-]*$'), "
+        "'^([a-z]*)0*([0-9]+)$', '\\1\\2')"
+    )
+    return (
+        f"CASE WHEN position('-' in {raw}) = 0 THEN {raw} "
+        f"ELSE {set_part} || '-' || {number} END"
+    )
+
+
+def _backfill_sql(table: str, target: str, source: str) -> str:
+    # Identifiers are fixed literals from this migration
+    return f"UPDATE {table} SET {target} = {_canonical_sql(source)}"  # noqa: S608
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cards",
+        sa.Column("canonical_id", sa.String(length=50), nullable=True),
+    )
+    op.add_column(
+        "card_id_mappings",
+        sa.Column("jp_canonical_id", sa.String(length=50), nullable=True),
+    )
+
+    op.execute(_backfill_sql("cards", "canonical_id", "id"))
+    op.execute(_backfill_sql("card_id_mappings", "jp_canonical_id", "jp_card_id"))
+
+    op.create_index("ix_cards_canonical_id", "cards", ["canonical_id"])
+    op.create_index(
+        "ix_card_id_mappings_jp_canonical_id",
+        "card_id_mappings",
+        ["jp_canonical_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_card_id_mappings_jp_canonical_id", table_name="card_id_mappings")
+    op.drop_index("ix_cards_canonical_id", table_name="cards")
+    op.drop_column("card_id_mappings", "jp_canonical_id")
+    op.drop_column("cards", "canonical_id")
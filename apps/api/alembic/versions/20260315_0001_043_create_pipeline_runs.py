@@ -0,0 +1,64 @@
+"""Create pipeline_runs table.
+
+Revision ID: 043
+Revises: 042
+Create Date: 2026-03-15
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "043"
+down_revision: str | None = "042"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_runs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("run_id", sa.String(length=64), nullable=False),
+        sa.Column("pipeline", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("wall_seconds", sa.Float(), nullable=False),
+        sa.Column("cpu_seconds", sa.Float(), nullable=False),
+        sa.Column("db_queries", sa.Integer(), nullable=False),
+        sa.Column("db_seconds", sa.Float(), nullable=False),
+        sa.Column("http_requests", sa.Integer(), nullable=False),
+        sa.Column("http_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("steps", postgresql.JSONB(), nullable=False),
+        sa.Column("steps_dropped", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_pipeline_runs_run_id", "pipeline_runs", ["run_id"])
+    op.create_index(
+        "ix_pipeline_runs_pipeline_started_at",
+        "pipeline_runs",
+        ["pipeline", "started_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_runs_pipeline_started_at", table_name="pipeline_runs")
+    op.drop_index("ix_pipeline_runs_run_id", table_name="pipeline_runs")
+    op.drop_table("pipeline_runs")
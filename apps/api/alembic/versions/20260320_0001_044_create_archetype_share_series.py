@@ -0,0 +1,104 @@
+"""Create archetype_share_series and archetype_key_cards tables.
+
+The share series is backfilled from the archetype_shares of existing
+meta snapshots. Key cards are filled by the next compute-meta run.
+
+Revision ID: 044
+Revises: 043
+Create Date: 2026-03-20
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "044"
+down_revision: str | None = "043"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archetype_share_series",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("archetype", sa.String(length=255), nullable=False),
+        sa.Column("region", sa.String(length=20), nullable=True),
+        sa.Column("format", sa.String(length=50), nullable=False),
+        sa.Column("best_of", sa.Integer(), nullable=False),
+        sa.Column("tournament_type", sa.String(length=20), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("share", sa.Float(), nullable=False),
+        sa.Column("sample_size", sa.Integer(), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        ALTER TABLE archetype_share_series
+        ADD CONSTRAINT uq_archetype_share_series UNIQUE NULLS NOT DISTINCT
+            (archetype, format, best_of, tournament_type, region, snapshot_date)
+        """
+    )
+
+    op.create_table(
+        "archetype_key_cards",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("archetype", sa.String(length=255), nullable=False),
+        sa.Column("region", sa.String(length=20), nullable=True),
+        sa.Column("format", sa.String(length=50), nullable=False),
+        sa.Column("best_of", sa.Integer(), nullable=False),
+        sa.Column("tournament_type", sa.String(length=20), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("decklist_count", sa.Integer(), nullable=False),
+        sa.Column("key_cards", postgresql.JSONB(), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        ALTER TABLE archetype_key_cards
+        ADD CONSTRAINT uq_archetype_key_cards UNIQUE NULLS NOT DISTINCT
+            (archetype, format, best_of, tournament_type, region)
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO archetype_share_series (
+            id, archetype, region, format, best_of, tournament_type,
+            snapshot_date, share, sample_size
+        )
+        SELECT
+            gen_random_uuid(), s.key, m.region, m.format, m.best_of,
+            m.tournament_type, m.snapshot_date, s.value::float, m.sample_size
+        FROM meta_snapshots m
+        CROSS JOIN LATERAL jsonb_each_text(m.archetype_shares) AS s
+        ON CONFLICT ON CONSTRAINT uq_archetype_share_series DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("archetype_key_cards")
+    op.drop_table("archetype_share_series")
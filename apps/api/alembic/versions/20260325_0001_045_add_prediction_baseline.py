@@ -0,0 +1,33 @@
+"""Add statistical baseline columns to archetype_predictions.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-03-25
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "045"
+down_revision: str | None = "044"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "archetype_predictions",
+        sa.Column("baseline_meta_share", sa.Float(), nullable=True),
+    )
+    op.add_column(
+        "archetype_predictions",
+        sa.Column("baseline_accuracy_score", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("archetype_predictions", "baseline_accuracy_score")
+    op.drop_column("archetype_predictions", "baseline_meta_share")
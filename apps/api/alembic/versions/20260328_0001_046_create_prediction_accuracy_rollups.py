@@ -0,0 +1,77 @@
+"""Add archetype_predictions.method and prediction_accuracy_rollups.
+
+Existing predictions are backfilled: those without a baseline were made
+by Claude alone, baseline-only ones carry the statistical methodology
+text, and the rest are Claude-narrated forecasts. Rollups are filled by
+the next score-predictions run.
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-03-28
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "046"
+down_revision: str | None = "045"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "archetype_predictions",
+        sa.Column("method", sa.String(length=20), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE archetype_predictions SET method = CASE
+            WHEN baseline_meta_share IS NULL THEN 'claude'
+            WHEN methodology LIKE 'Statistical baseline:%' THEN 'statistical'
+            ELSE 'narrated'
+        END
+        """
+    )
+
+    op.create_table(
+        "prediction_accuracy_rollups",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("archetype_id", sa.String(length=255), nullable=True),
+        sa.Column("method", sa.String(length=20), nullable=True),
+        sa.Column("month", sa.Date(), nullable=True),
+        sa.Column("prediction_count", sa.Integer(), nullable=False),
+        sa.Column("scored_count", sa.Integer(), nullable=False),
+        sa.Column("average_accuracy", sa.Float(), nullable=True),
+        sa.Column("mean_absolute_error", sa.Float(), nullable=True),
+        sa.Column("baseline_scored_count", sa.Integer(), nullable=False),
+        sa.Column("baseline_average_accuracy", sa.Float(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        ALTER TABLE prediction_accuracy_rollups
+        ADD CONSTRAINT uq_prediction_accuracy_rollup UNIQUE NULLS NOT DISTINCT
+            (archetype_id, method, month)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("prediction_accuracy_rollups")
+    op.drop_column("archetype_predictions", "method")
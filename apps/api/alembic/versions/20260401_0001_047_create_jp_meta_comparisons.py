@@ -0,0 +1,115 @@
+"""Create jp_meta_comparisons table.
+
+Backfilled from each global BO3 meta snapshot and the JP BO1 snapshot
+of the same date, format and tournament type.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-04-01
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "047"
+down_revision: str | None = "046"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jp_meta_comparisons",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("format", sa.String(length=50), nullable=False),
+        sa.Column("tournament_type", sa.String(length=20), nullable=False),
+        sa.Column("jp_sample_size", sa.Integer(), nullable=False),
+        sa.Column("en_sample_size", sa.Integer(), nullable=False),
+        sa.Column("archetypes", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "format",
+            "tournament_type",
+            "snapshot_date",
+            name="uq_jp_meta_comparison",
+        ),
+    )
+
+    # Mirrors meta_service.build_jp_comparison
+    op.execute(
+        """
+        INSERT INTO jp_meta_comparisons (
+            id, snapshot_date, format, tournament_type,
+            jp_sample_size, en_sample_size, archetypes
+        )
+        SELECT
+            gen_random_uuid(), en.snapshot_date, en.format, en.tournament_type,
+            COALESCE(jp.sample_size, 0), en.sample_size,
+            COALESCE(
+                (
+                    SELECT jsonb_agg(
+                        jsonb_build_object(
+                            'archetype', a.archetype,
+                            'jp_share', round(a.jp_share::numeric, 4),
+                            'en_share', round(a.en_share::numeric, 4),
+                            'divergence', round(
+                                (COALESCE(a.jp_share, 0) - COALESCE(a.en_share, 0))
+                                    ::numeric,
+                                4
+                            ),
+                            'jp_tier', jp.tier_assignments ->> a.archetype,
+                            'en_tier', en.tier_assignments ->> a.archetype
+                        )
+                        ORDER BY
+                            GREATEST(
+                                COALESCE(a.jp_share, 0), COALESCE(a.en_share, 0)
+                            ) DESC,
+                            a.archetype
+                    )
+                    FROM (
+                        SELECT
+                            COALESCE(j.key, e.key) AS archetype,
+                            j.value::float AS jp_share,
+                            e.value::float AS en_share
+                        FROM jsonb_each_text(
+                            COALESCE(jp.archetype_shares, '{}'::jsonb)
+                        ) AS j
+                        FULL JOIN jsonb_each_text(en.archetype_shares) AS e
+                            ON j.key = e.key
+                    ) AS a
+                    WHERE a.archetype <> 'Unknown'
+                ),
+                '[]'::jsonb
+            )
+        FROM meta_snapshots en
+        LEFT JOIN meta_snapshots jp
+            ON jp.snapshot_date = en.snapshot_date
+            AND jp.format = en.format
+            AND jp.tournament_type = en.tournament_type
+            AND jp.region = 'JP'
+            AND jp.best_of = 1
+            AND jp.sample_size > 0
+        WHERE en.region IS NULL AND en.best_of = 3 AND en.sample_size > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("jp_meta_comparisons")
@@ -0,0 +1,87 @@
+"""Create widget_view_rollups table.
+
+Backfilled from the raw widget_views rows, which are no longer written:
+views are now buffered in process and flushed as hourly counts.
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-04-04
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "048"
+down_revision: str | None = "047"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "widget_view_rollups",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("widget_id", sa.String(length=20), nullable=False),
+        sa.Column("hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("referrer_domain", sa.String(length=255), nullable=True),
+        sa.Column("view_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["widget_id"], ["widgets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        """
+        ALTER TABLE widget_view_rollups
+        ADD CONSTRAINT uq_widget_view_rollup UNIQUE NULLS NOT DISTINCT
+            (widget_id, hour, referrer_domain)
+        """
+    )
+
+    # Mirrors widget_view_buffer.referrer_domain
+    op.execute(
+        r"""
+        INSERT INTO widget_view_rollups (
+            id, widget_id, hour, referrer_domain, view_count
+        )
+        SELECT gen_random_uuid(), widget_id, hour, referrer_domain, count(*)
+        FROM (
+            SELECT
+                widget_id,
+                date_trunc('hour', viewed_at, 'UTC') AS hour,
+                left(
+                    regexp_replace(
+                        lower(
+                            substring(
+                                referrer
+                                FROM '^[a-zA-Z][a-zA-Z0-9+.-]*://'
+                                    '(?:[^/?#@]*@)?([^:/?#]+)'
+                            )
+                        ),
+                        '^www\.',
+                        ''
+                    ),
+                    255
+                ) AS referrer_domain
+            FROM widget_views
+        ) AS v
+        GROUP BY widget_id, hour, referrer_domain
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("widget_view_rollups")
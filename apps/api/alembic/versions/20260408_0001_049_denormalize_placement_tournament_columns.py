@@ -0,0 +1,74 @@
+"""Denormalize tournament columns onto tournament_placements.
+
+Adds tournament_date, region, format and best_of copied from the parent
+tournament, plus composite indexes for window queries that no longer
+join tournaments: meta shares and matchups by format window, archetype
+detail pages, and card counts over decklists.
+
+Revision ID: 049
+Revises: 048
+Create Date: 2026-04-08
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "049"
+down_revision: str | None = "048"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = (
+    ("tournament_date", sa.Date()),
+    ("region", sa.String(length=20)),
+    ("format", sa.String(length=50)),
+    ("best_of", sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    for name, type_ in COLUMNS:
+        op.add_column("tournament_placements", sa.Column(name, type_, nullable=True))
+
+    op.execute(
+        """
+        UPDATE tournament_placements tp
+        SET tournament_date = t.date,
+            region = t.region,
+            format = t.format,
+            best_of = t.best_of
+        FROM tournaments t
+        WHERE t.id = tp.tournament_id
+        """
+    )
+
+    for name, _ in COLUMNS:
+        op.alter_column("tournament_placements", name, nullable=False)
+
+    op.execute(
+        "CREATE INDEX ix_tp_format_bestof_date "
+        "ON tournament_placements (format, best_of, tournament_date) "
+        "INCLUDE (region, archetype, placement)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tp_archetype_format_bestof_date "
+        "ON tournament_placements (archetype, format, best_of, tournament_date) "
+        "INCLUDE (region, placement)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tp_decklist_format_bestof_date "
+        "ON tournament_placements (format, best_of, tournament_date) "
+        "INCLUDE (region, archetype) "
+        "WHERE decklist IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_tp_decklist_format_bestof_date")
+    op.execute("DROP INDEX IF EXISTS ix_tp_archetype_format_bestof_date")
+    op.execute("DROP INDEX IF EXISTS ix_tp_format_bestof_date")
+    for name, _ in reversed(COLUMNS):
+        op.drop_column("tournament_placements", name)
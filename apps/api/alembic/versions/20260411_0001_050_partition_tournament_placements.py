@@ -0,0 +1,139 @@
+"""Range-partition tournament_placements by month of tournament_date.
+
+The table is rebuilt as a partitioned table with one partition per
+calendar month (tournament_placements_pYYYYMM) from the oldest placement
+through 24 months ahead, plus a default partition for later dates.
+prune-tournaments drops whole months and keeps a year of partitions
+ahead (src/services/placement_partitions.py).
+
+The primary key becomes (id, tournament_date), since a partitioned
+table's unique constraints must include the partition key. Secondary
+indexes and the card_usage_stats materialized view, which depends on
+the table, are captured and recreated as they were.
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-04-11
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "050"
+down_revision: str | None = "049"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Rebuilds tournament_placements from a renamed copy. {create_table} and
+# {primary_key} differ between directions; {create_partitions} runs after
+# the new table exists and before rows are copied.
+REBUILD = """
+DO $$
+DECLARE
+    view_def text;
+    view_indexes text[];
+    placement_indexes text[];
+    idx text;
+    first_month date;
+    m date;
+BEGIN
+    IF to_regclass('card_usage_stats') IS NOT NULL THEN
+        view_def := rtrim(
+            pg_get_viewdef('card_usage_stats'::regclass), E'; \\n'
+        );
+        SELECT array_agg(indexdef) INTO view_indexes
+        FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = 'card_usage_stats';
+        DROP MATERIALIZED VIEW card_usage_stats;
+    END IF;
+
+    SELECT array_agg(indexdef) INTO placement_indexes
+    FROM pg_indexes
+    WHERE schemaname = current_schema()
+        AND tablename = 'tournament_placements'
+        AND indexname <> 'tournament_placements_pkey';
+
+    ALTER TABLE tournament_placements RENAME TO tournament_placements_old;
+    ALTER TABLE tournament_placements_old
+        RENAME CONSTRAINT tournament_placements_pkey
+        TO tournament_placements_old_pkey;
+
+    {create_table}
+    ALTER TABLE tournament_placements
+        ADD CONSTRAINT tournament_placements_pkey PRIMARY KEY ({primary_key});
+    ALTER TABLE tournament_placements
+        ADD CONSTRAINT tournament_placements_tournament_id_fkey
+        FOREIGN KEY (tournament_id) REFERENCES tournaments (id)
+        ON DELETE CASCADE;
+    ALTER TABLE tournament_placements
+        ADD CONSTRAINT tournament_placements_deck_id_fkey
+        FOREIGN KEY (deck_id) REFERENCES decks (id)
+        ON DELETE SET NULL;
+
+    {create_partitions}
+
+    INSERT INTO tournament_placements SELECT * FROM tournament_placements_old;
+    DROP TABLE tournament_placements_old;
+
+    FOREACH idx IN ARRAY coalesce(placement_indexes, '{{}}') LOOP
+        EXECUTE idx;
+    END LOOP;
+
+    IF view_def IS NOT NULL THEN
+        EXECUTE 'CREATE MATERIALIZED VIEW card_usage_stats AS ' || view_def;
+        FOREACH idx IN ARRAY coalesce(view_indexes, '{{}}') LOOP
+            EXECUTE idx;
+        END LOOP;
+    END IF;
+END
+$$;
+"""
+
+CREATE_PARTITIONS = """
+    SELECT date_trunc('month', coalesce(min(tournament_date), current_date))::date
+    INTO first_month
+    FROM tournament_placements_old;
+
+    m := first_month;
+    WHILE m <= date_trunc('month', current_date + interval '24 months')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF tournament_placements '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'tournament_placements_p' || to_char(m, 'YYYYMM'),
+            m,
+            (m + interval '1 month')::date
+        );
+        m := (m + interval '1 month')::date;
+    END LOOP;
+
+    CREATE TABLE tournament_placements_default
+        PARTITION OF tournament_placements DEFAULT;
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        REBUILD.format(
+            create_table=(
+                "CREATE TABLE tournament_placements (LIKE tournament_placements_old "
+                "INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                "PARTITION BY RANGE (tournament_date);"
+            ),
+            primary_key="id, tournament_date",
+            create_partitions=CREATE_PARTITIONS,
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        REBUILD.format(
+            create_table=(
+                "CREATE TABLE tournament_placements (LIKE tournament_placements_old "
+                "INCLUDING DEFAULTS INCLUDING CONSTRAINTS);"
+            ),
+            primary_key="id",
+            create_partitions="",
+        )
+    )
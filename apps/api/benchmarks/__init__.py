@@ -0,0 +1,5 @@
+"""Benchmarks for the meta, scrape-parse and normalization hot paths.
+
+Run with ``uv run python -m benchmarks`` from ``apps/api``; see
+``benchmarks/__main__.py`` for options.
+"""
@@ -0,0 +1,242 @@
+"""Benchmark cases for the hot paths.
+
+In-memory cases call the code directly on synthetic data; the scrape
+parsers are fed scaled copies of the saved HTML fixtures instead of
+fetching pages. Database cases live in ``benchmarks/db.py``.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from functools import cache
+from typing import Any, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.generators import (
+    FIXTURES_DIR,
+    SyntheticDataset,
+    generate_article,
+    generate_dataset,
+    generate_glossary,
+    generate_meta_snapshots,
+    generate_resolve_inputs,
+    scaled_standings_html,
+)
+from benchmarks.harness import BenchmarkCase
+from benchmarks.imports import run_first_request
+from src.clients.limitless import LimitlessClient
+from src.models.meta_snapshot import MetaSnapshot
+from src.routers.meta import _compute_matchups_from_placements, _snapshot_payload
+from src.services.archetype_detector import ArchetypeDetector
+from src.services.archetype_normalizer import ArchetypeNormalizer
+from src.services.meta_service import MetaService
+from src.services.rotation_engine import (
+    CardLegalityRow,
+    LegalityIndex,
+    build_legality_index,
+    evaluate_archetypes,
+)
+from src.services.translation_service import TranslationService
+from src.utils.json_response import FastJSONResponse
+
+# Standings rows per page and decklists per run at 1x
+STANDINGS_ROWS = 250
+DECKLISTS_PER_RUN = 20
+
+
+@cache
+def dataset(scale: int) -> SyntheticDataset:
+    """Synthetic dataset shared by the cases at one scale."""
+    return generate_dataset(scale)
+
+
+# -- Meta -------------------------------------------------------------------
+
+
+def _meta_service() -> MetaService:
+    # The aggregation helpers never touch the session
+    return MetaService(cast(AsyncSession, None))
+
+
+def _run_card_usage(data: SyntheticDataset) -> Any:
+    return _meta_service()._compute_card_usage(data.placements)
+
+
+def _setup_matchups(scale: int) -> tuple[SyntheticDataset, str]:
+    data = dataset(scale)
+    counts = Counter(p.archetype for p in data.placements)
+    return data, counts.most_common(1)[0][0]
+
+
+def _run_matchups(data: tuple[SyntheticDataset, str]) -> Any:
+    synthetic, archetype = data
+    return _compute_matchups_from_placements(synthetic.placements, archetype)
+
+
+def _run_history_render(snapshots: list[MetaSnapshot]) -> bytes:
+    return FastJSONResponse(
+        {"snapshots": [_snapshot_payload(s) for s in snapshots]}
+    ).body
+
+
+# -- Normalization ----------------------------------------------------------
+
+
+@cache
+def _detector() -> ArchetypeDetector:
+    return ArchetypeDetector()
+
+
+def _setup_resolve(scale: int) -> list[tuple[list[str], str, list[dict] | None]]:
+    return generate_resolve_inputs(dataset(scale))
+
+
+def _run_resolve(inputs: list[tuple[list[str], str, list[dict] | None]]) -> None:
+    # A fresh normalizer per run so its memo starts cold, as in a scrape
+    normalizer = ArchetypeNormalizer(detector=_detector())
+    for sprites, label, decklist in inputs:
+        normalizer.resolve_with_confidence(sprites, label, decklist)
+
+
+# -- Scrape parsing ---------------------------------------------------------
+
+
+async def _client_returning(html: str) -> LimitlessClient:
+    client = LimitlessClient()
+
+    async def fetch(endpoint: str) -> str:
+        return html
+
+    client._get = fetch  # type: ignore[method-assign]
+    client._get_official = fetch  # type: ignore[method-assign]
+    return client
+
+
+async def _setup_standings(scale: int) -> LimitlessClient:
+    html = scaled_standings_html("limitless_standings.html", STANDINGS_ROWS * scale)
+    return await _client_returning(html)
+
+
+async def _run_standings(client: LimitlessClient) -> None:
+    await client.fetch_tournament_placements(
+        f"{client.BASE_URL}/tournament/bench", max_placements=None
+    )
+
+
+async def _setup_jp_standings(scale: int) -> LimitlessClient:
+    html = scaled_standings_html(
+        "jp_tournaments/city_league_tokyo_2025.html", STANDINGS_ROWS * scale
+    )
+    return await _client_returning(html)
+
+
+async def _run_jp_standings(client: LimitlessClient) -> None:
+    await client.fetch_jp_city_league_placements(
+        f"{client.OFFICIAL_BASE_URL}/tournaments/jp/bench", max_placements=None
+    )
+
+
+async def _setup_decklists(scale: int) -> tuple[LimitlessClient, int]:
+    html = (FIXTURES_DIR / "limitless_decklist.html").read_text()
+    return await _client_returning(html), DECKLISTS_PER_RUN * scale
+
+
+async def _run_decklists(data: tuple[LimitlessClient, int]) -> None:
+    client, count = data
+    for i in range(count):
+        await client.fetch_decklist(f"{client.BASE_URL}/decks/bench-{i}")
+
+
+async def _close_client(data: Any) -> None:
+    client = data[0] if isinstance(data, tuple) else data
+    await client.close()
+
+
+# -- Rotation ---------------------------------------------------------------
+
+# Synthetic set prefixes treated as rotating out
+_ROTATING_PREFIXES = ("sv1-", "sv2-", "sv3-")
+
+
+def _setup_rotation(
+    scale: int,
+) -> tuple[list[tuple[str, list[dict] | None]], LegalityIndex]:
+    data = dataset(scale)
+    card_ids = {entry["card_id"] for decklist in data.decklists for entry in decklist}
+    cards = [
+        CardLegalityRow(
+            id=card_id,
+            name=card_id,
+            limitless_id=None,
+            regulation_mark="G" if card_id.startswith(_ROTATING_PREFIXES) else "H",
+            legalities=None,
+        )
+        for card_id in sorted(card_ids)
+    ]
+    rows = [(p.archetype, p.decklist) for p in data.placements]
+    return rows, build_legality_index(cards, [], {"H"})
+
+
+def _run_rotation(
+    data: tuple[list[tuple[str, list[dict] | None]], LegalityIndex],
+) -> Any:
+    rows, index = data
+    return evaluate_archetypes(rows, index)
+
+
+# -- Translation ------------------------------------------------------------
+
+
+def _setup_glossary(scale: int) -> tuple[str, dict[str, str]]:
+    return generate_article(scale), generate_glossary(scale)
+
+
+def _run_glossary(data: tuple[str, dict[str, str]]) -> Any:
+    text, glossary = data
+    service = TranslationService(cast(AsyncSession, None))
+    return service._layer1_glossary_translate(text, glossary)
+
+
+# -- Startup ----------------------------------------------------------------
+
+
+def _setup_startup(scale: int) -> None:
+    # A cold start imports the same code at every data volume
+    return None
+
+
+def _run_first_request(_: None) -> None:
+    run_first_request()
+
+
+MEMORY_CASES = [
+    BenchmarkCase("meta.card_usage", dataset, _run_card_usage),
+    BenchmarkCase("meta.matchups_from_placements", _setup_matchups, _run_matchups),
+    BenchmarkCase("meta.history_render", generate_meta_snapshots, _run_history_render),
+    BenchmarkCase("normalizer.resolve_with_confidence", _setup_resolve, _run_resolve),
+    BenchmarkCase(
+        "limitless.parse_standings",
+        _setup_standings,
+        _run_standings,
+        teardown=_close_client,
+    ),
+    BenchmarkCase(
+        "limitless.parse_jp_standings",
+        _setup_jp_standings,
+        _run_jp_standings,
+        teardown=_close_client,
+    ),
+    BenchmarkCase(
+        "limitless.parse_decklists",
+        _setup_decklists,
+        _run_decklists,
+        teardown=_close_client,
+    ),
+    BenchmarkCase("rotation.evaluate_archetypes", _setup_rotation, _run_rotation),
+    BenchmarkCase("translation.layer1_glossary", _setup_glossary, _run_glossary),
+    # Interpreter start, app import and one request; noisier than the rest
+    BenchmarkCase(
+        "startup.first_request", _setup_startup, _run_first_request, threshold=1.5
+    ),
+]
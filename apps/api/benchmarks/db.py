@@ -0,0 +1,157 @@
+"""Database benchmarks against a throwaway Postgres.
+
+The target database is migrated to head with Alembic, then for each scale
+its tournament tables are truncated and reseeded with the synthetic
+dataset before the meta snapshot queries are timed. Only databases whose
+name marks them as disposable are accepted, since seeding wipes them.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from benchmarks.generators import generate_dataset
+from benchmarks.harness import BenchmarkCase
+from src.models.tournament import Tournament
+from src.models.tournament_placement import TournamentPlacement
+from src.services.meta_service import MetaService
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+# A database name must contain one of these to be used
+THROWAWAY_MARKERS = ("bench", "test", "tmp", "throwaway")
+
+SEED_CHUNK_SIZE = 5000
+
+# Synthetic tournaments span 90 days from 2026-01-01
+SNAPSHOT_DATE = date(2026, 3, 31)
+
+
+def check_throwaway(database_url: str) -> None:
+    """Refuse databases that are not named as disposable."""
+    name = (make_url(database_url).database or "").lower()
+    if not any(marker in name for marker in THROWAWAY_MARKERS):
+        raise ValueError(
+            f"Refusing to seed database {name!r}: benchmarks truncate tables, "
+            f"so the name must contain one of {', '.join(THROWAWAY_MARKERS)}"
+        )
+
+
+def migrate(database_url: str) -> None:
+    """Bring the throwaway database to the latest schema."""
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=API_ROOT,
+        env={**os.environ, "DATABASE_URL": database_url},
+        check=True,
+    )
+
+
+async def seed(engine: AsyncEngine, scale: int) -> None:
+    """Replace tournaments and placements with the synthetic dataset."""
+    data = generate_dataset(scale)
+    tournaments = [
+        {
+            "id": t.id,
+            "name": t.name,
+            "date": t.date,
+            "region": t.region,
+            "format": t.format,
+            "best_of": t.best_of,
+            "participant_count": t.participant_count,
+            "source": t.source,
+            "source_url": t.source_url,
+        }
+        for t in data.tournaments
+    ]
+    placements = [
+        {
+            "id": p.id,
+            "tournament_id": p.tournament_id,
+            "tournament_date": p.tournament_date,
+            "region": p.region,
+            "format": p.format,
+            "best_of": p.best_of,
+            "placement": p.placement,
+            "archetype": p.archetype,
+            "decklist": p.decklist,
+            "raw_archetype": p.raw_archetype,
+            "raw_archetype_sprites": p.raw_archetype_sprites,
+        }
+        for p in data.placements
+    ]
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        await session.execute(
+            text("TRUNCATE tournaments, tournament_placements CASCADE")
+        )
+        for model, rows in (
+            (Tournament, tournaments),
+            (TournamentPlacement, placements),
+        ):
+            for start in range(0, len(rows), SEED_CHUNK_SIZE):
+                await session.execute(
+                    insert(model), rows[start : start + SEED_CHUNK_SIZE]
+                )
+        await session.commit()
+        await session.execute(text("ANALYZE tournaments, tournament_placements"))
+        await session.commit()
+
+
+@dataclass
+class SeededDatabase:
+    engine: AsyncEngine
+    region: str | None
+
+
+def db_cases(database_url: str) -> list[BenchmarkCase]:
+    """Meta snapshot cases against ``database_url`` (checked and migrated)."""
+    check_throwaway(database_url)
+    migrate(database_url)
+
+    def setup_for(region: str | None):
+        async def setup(scale: int) -> SeededDatabase:
+            engine = create_async_engine(database_url)
+            await seed(engine, scale)
+            return SeededDatabase(engine=engine, region=region)
+
+        return setup
+
+    async def run(db: SeededDatabase) -> None:
+        session_factory = async_sessionmaker(db.engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await MetaService(session).compute_meta_snapshot(
+                snapshot_date=SNAPSHOT_DATE,
+                region=db.region,
+                best_of=1 if db.region == "JP" else 3,
+            )
+
+    async def teardown(db: SeededDatabase) -> None:
+        await db.engine.dispose()
+
+    return [
+        BenchmarkCase(
+            "db.meta_snapshot_global",
+            setup_for(None),
+            run,
+            teardown=teardown,
+            group="db",
+        ),
+        BenchmarkCase(
+            "db.meta_snapshot_jp",
+            setup_for("JP"),
+            run,
+            teardown=teardown,
+            group="db",
+        ),
+    ]
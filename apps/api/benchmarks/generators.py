@@ -0,0 +1,237 @@
+"""Synthetic data generators for the benchmarks.
+
+Volumes are expressed as multiples of ``PRODUCTION_VOLUME``, our
+approximate production load for one 90-day meta lookback. Every generator
+is seeded, so a given scale always produces the same data.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from src.data.signature_cards import SIGNATURE_CARDS
+from src.data.tcg_glossary import get_claude_glossary
+from src.models.meta_snapshot import MetaSnapshot
+from src.models.tournament import Tournament
+from src.models.tournament_placement import TournamentPlacement, tournament_columns
+from src.services.archetype_normalizer import SPRITE_ARCHETYPE_MAP
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+# Approximate production volume for one 90-day lookback window
+PRODUCTION_VOLUME = {
+    "tournaments": 300,
+    "placements_per_tournament": 32,
+    "decklist_share": 0.8,
+    "cards_per_decklist": 18,
+    "card_pool": 1200,
+    "article_paragraphs": 40,
+    "glossary_overrides": 50,
+    "history_snapshots": 90,
+    "snapshot_card_usage": 300,
+}
+
+SCALES = (1, 10, 100)
+
+SPRITE_URL_BASE = "https://r2.limitlesstcg.net/pokemon/gen9"
+
+
+@dataclass
+class SyntheticDataset:
+    """Tournaments and placements at one scale."""
+
+    scale: int
+    tournaments: list[Tournament]
+    placements: list[TournamentPlacement]
+
+    @property
+    def decklists(self) -> list[list[dict]]:
+        return [p.decklist for p in self.placements if p.decklist]
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _archetype_weights(archetypes: list[str]) -> list[float]:
+    # Zipf-like: a few decks dominate, with a long tail
+    return [1.0 / (rank + 1) for rank in range(len(archetypes))]
+
+
+def card_pool(size: int) -> list[str]:
+    """Card IDs led by the signature cards, padded with synthetic IDs."""
+    pool = list(SIGNATURE_CARDS)
+    set_codes = ["sv1", "sv2", "sv3", "sv3pt5", "sv4", "sv5", "sv6", "sv7", "sv8"]
+    number = 1
+    while len(pool) < size:
+        pool.append(f"{set_codes[number % len(set_codes)]}-{number}")
+        number += 1
+    return pool[:size]
+
+
+def generate_decklist(
+    rng: random.Random, archetype_cards: list[str], pool: list[str], size: int
+) -> list[dict]:
+    """A decklist of ``size`` entries built around an archetype's core."""
+    core = archetype_cards[: max(1, size // 3)]
+    rest = rng.sample(pool, k=min(len(pool), size - len(core)))
+    cards = list(dict.fromkeys(core + rest))[:size]
+    return [{"card_id": card_id, "quantity": rng.randint(1, 4)} for card_id in cards]
+
+
+def generate_dataset(scale: int = 1, *, seed: int = 0) -> SyntheticDataset:
+    """Build tournaments and placements at ``scale`` x production volume."""
+    rng = random.Random(seed)  # noqa: S311
+    volume = PRODUCTION_VOLUME
+    pool = card_pool(volume["card_pool"])
+
+    sprite_keys = sorted(SPRITE_ARCHETYPE_MAP)
+    weights = _archetype_weights(sprite_keys)
+    signature_by_archetype: dict[str, list[str]] = {}
+    for card_id, archetype in SIGNATURE_CARDS.items():
+        signature_by_archetype.setdefault(archetype, []).append(card_id)
+
+    tournaments: list[Tournament] = []
+    placements: list[TournamentPlacement] = []
+    start = date(2026, 1, 1)
+    for t in range(volume["tournaments"] * scale):
+        region = "JP" if t % 4 == 0 else rng.choice(["NA", "EU", "LATAM", "OCE"])
+        tournament = Tournament(
+            id=_uuid(rng),
+            name=f"Synthetic Tournament {t}",
+            date=start + timedelta(days=t % 90),
+            region=region,
+            format="standard",
+            best_of=1 if region == "JP" else 3,
+            participant_count=rng.randint(32, 512),
+            source="synthetic",
+            source_url=f"https://example.com/tournaments/{t}",
+        )
+        tournaments.append(tournament)
+
+        for place in range(1, volume["placements_per_tournament"] + 1):
+            sprite_key = rng.choices(sprite_keys, weights=weights)[0]
+            archetype = SPRITE_ARCHETYPE_MAP[sprite_key]
+            decklist = None
+            if rng.random() < volume["decklist_share"]:
+                core = signature_by_archetype.get(archetype, [])
+                decklist = generate_decklist(
+                    rng, core, pool, volume["cards_per_decklist"]
+                )
+            placements.append(
+                TournamentPlacement(
+                    id=_uuid(rng),
+                    tournament_id=tournament.id,
+                    **tournament_columns(tournament),
+                    placement=place,
+                    archetype=archetype,
+                    decklist=decklist,
+                    raw_archetype=archetype,
+                    raw_archetype_sprites=[
+                        f"{SPRITE_URL_BASE}/{name}.png"
+                        for name in sprite_key.split("-")
+                    ],
+                )
+            )
+
+    return SyntheticDataset(scale=scale, tournaments=tournaments, placements=placements)
+
+
+def generate_resolve_inputs(
+    dataset: SyntheticDataset, *, unknown_share: float = 0.2, seed: int = 0
+) -> list[tuple[list[str], str, list[dict] | None]]:
+    """Normalizer inputs; a share carry unmapped sprites to reach detection."""
+    rng = random.Random(seed)  # noqa: S311
+    inputs = []
+    for p in dataset.placements:
+        sprites = list(p.raw_archetype_sprites or [])
+        if rng.random() < unknown_share:
+            sprites = [f"{SPRITE_URL_BASE}/unmapped-{rng.randint(0, 500)}.png"]
+        inputs.append((sprites, p.raw_archetype or "", p.decklist))
+    return inputs
+
+
+_TBODY_RE = re.compile(r"(<tbody>)(.*?)(</tbody>)", re.DOTALL)
+_ROW_RE = re.compile(r"<tr>.*?</tr>", re.DOTALL)
+
+
+def scaled_standings_html(fixture: str, rows: int) -> str:
+    """A saved standings fixture with its table rows repeated to ``rows``."""
+    html = (FIXTURES_DIR / fixture).read_text()
+    match = _TBODY_RE.search(html)
+    if match is None:
+        raise ValueError(f"No <tbody> in fixture {fixture}")
+    sample_rows = _ROW_RE.findall(match.group(2))
+    if not sample_rows:
+        raise ValueError(f"No rows in fixture {fixture}")
+
+    repeated = []
+    for i in range(rows):
+        row = sample_rows[i % len(sample_rows)]
+        # Renumber the placement cell so rows stay distinct
+        repeated.append(re.sub(r"<td>\d+</td>", f"<td>{i + 1}</td>", row, count=1))
+    return html[: match.start(2)] + "\n".join(repeated) + html[match.end(2) :]
+
+
+def generate_meta_snapshots(scale: int = 1, *, seed: int = 0) -> list[MetaSnapshot]:
+    """Daily global snapshots as returned by a meta history lookback."""
+    rng = random.Random(seed)  # noqa: S311
+    volume = PRODUCTION_VOLUME
+    archetypes = sorted(set(SPRITE_ARCHETYPE_MAP.values()))
+    pool = card_pool(volume["card_pool"])
+    snapshots = []
+    for day in range(volume["history_snapshots"] * scale):
+        shares = {a: round(rng.random() / len(archetypes), 4) for a in archetypes}
+        snapshots.append(
+            MetaSnapshot(
+                id=_uuid(rng),
+                snapshot_date=date(2026, 1, 1) - timedelta(days=day),
+                region=None,
+                format="standard",
+                best_of=3,
+                tournament_type="all",
+                archetype_shares=shares,
+                card_usage={
+                    card_id: {
+                        "inclusion_rate": round(rng.random(), 4),
+                        "avg_count": round(rng.uniform(1, 4), 2),
+                    }
+                    for card_id in rng.sample(pool, volume["snapshot_card_usage"])
+                },
+                sample_size=rng.randint(500, 5000),
+                tournaments_included=[str(_uuid(rng)) for _ in range(20)],
+                tier_assignments={a: rng.choice("SABC") for a in archetypes[:20]},
+                trends={
+                    a: {"change": 0.01, "direction": "up", "previous_share": 0.1}
+                    for a in archetypes[:20]
+                },
+            )
+        )
+    return snapshots
+
+
+def generate_article(scale: int = 1, *, seed: int = 0) -> str:
+    """Japanese article text dense in glossary terms."""
+    rng = random.Random(seed)  # noqa: S311
+    terms = sorted(get_claude_glossary())
+    filler = ["です。", "を使います。", "が強い。", "に注意。", "と組み合わせる。"]
+    paragraphs = []
+    for _ in range(PRODUCTION_VOLUME["article_paragraphs"] * scale):
+        sentence = "".join(
+            rng.choice(terms) + rng.choice(filler) for _ in range(rng.randint(4, 8))
+        )
+        paragraphs.append(sentence)
+    return "\n".join(paragraphs)
+
+
+def generate_glossary(scale: int = 1) -> dict[str, str]:
+    """The static glossary plus synthetic DB overrides."""
+    glossary = get_claude_glossary()
+    for i in range(PRODUCTION_VOLUME["glossary_overrides"] * scale):
+        glossary[f"用語{i}"] = f"Term {i}"
+    return glossary
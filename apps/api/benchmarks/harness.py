@@ -0,0 +1,178 @@
+"""Timing harness, result files and regression checks.
+
+A ``BenchmarkCase`` builds its input once per scale (untimed) and then
+times ``run(input)`` over several rounds. Results are written as JSON so
+a later run can be compared against a saved baseline: a case regresses
+when its median exceeds the baseline median by more than its threshold.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Median slowdown over baseline tolerated before a case fails
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_ROUNDS = 5
+RESULTS_VERSION = 1
+
+
+@dataclass
+class BenchmarkCase:
+    """One benchmarked code path.
+
+    Attributes:
+        name: Stable identifier used to match results against a baseline.
+        setup: Builds the input for a scale; not timed.
+        run: The timed call; may be a coroutine function.
+        teardown: Releases the input after timing, e.g. closes clients.
+        threshold: Tolerated median slowdown over baseline for this case.
+        group: "memory" cases need no database, "db" cases do.
+    """
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    teardown: Callable[[Any], Any] | None = None
+    threshold: float = DEFAULT_THRESHOLD
+    group: str = "memory"
+
+
+@dataclass
+class CaseResult:
+    """Timings for one case at one scale, in seconds."""
+
+    name: str
+    scale: int
+    rounds: int
+    median: float
+    minimum: float
+    maximum: float
+    stdev: float
+    threshold: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.scale}x"
+
+
+@dataclass
+class Regression:
+    """A case that got slower than its baseline allows."""
+
+    key: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+@dataclass
+class BenchmarkReport:
+    """All results of one benchmark run."""
+
+    results: list[CaseResult] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    python: str = field(default_factory=platform.python_version)
+    machine: str = field(default_factory=platform.machine)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": RESULTS_VERSION,
+            "created_at": self.created_at,
+            "python": self.python,
+            "machine": self.machine,
+            "results": {r.key: asdict(r) for r in self.results},
+        }
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n")
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _time_case(case: BenchmarkCase, scale: int, rounds: int) -> list[float]:
+    data = await _maybe_await(case.setup(scale))
+    try:
+        await _maybe_await(case.run(data))
+
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await _maybe_await(case.run(data))
+            timings.append(time.perf_counter() - started)
+        return timings
+    finally:
+        if case.teardown is not None:
+            await _maybe_await(case.teardown(data))
+
+
+def run_case(
+    case: BenchmarkCase, scale: int, rounds: int = DEFAULT_ROUNDS
+) -> CaseResult:
+    """Time ``case`` at ``scale``, after one untimed warm-up call."""
+    timings = asyncio.run(_time_case(case, scale, rounds))
+    return CaseResult(
+        name=case.name,
+        scale=scale,
+        rounds=rounds,
+        median=statistics.median(timings),
+        minimum=min(timings),
+        maximum=max(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        threshold=case.threshold,
+    )
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    """Results of a saved report, keyed by ``name@scale``."""
+    data = json.loads(path.read_text())
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return data["results"]
+
+
+def find_regressions(
+    report: BenchmarkReport,
+    baseline: dict[str, dict[str, Any]],
+    threshold: float | None = None,
+) -> list[Regression]:
+    """Cases whose median exceeds the baseline by more than the threshold.
+
+    Args:
+        report: The current run.
+        baseline: Saved results from ``load_baseline``.
+        threshold: Overrides every case's own threshold when given.
+    """
+    regressions = []
+    for result in report.results:
+        saved = baseline.get(result.key)
+        if saved is None:
+            continue
+        limit = threshold if threshold is not None else result.threshold
+        if result.median > saved["median"] * limit:
+            regressions.append(
+                Regression(
+                    key=result.key,
+                    baseline=saved["median"],
+                    current=result.median,
+                    threshold=limit,
+                )
+            )
+    return regressions
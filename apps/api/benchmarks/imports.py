@@ -0,0 +1,165 @@
+"""Import-cost audit and cold-start timing for the API.
+
+Every Cloud Run cold start imports ``src.main`` before it can serve a
+request. The audit runs that import in a fresh interpreter under
+``python -X importtime`` and reports the modules with the highest
+cumulative cost. It also flags heavy SDKs that were executed at import
+time instead of being bound with ``src.utils.lazy_imports.lazy_import``.
+
+Usage (from apps/api):
+    uv run python -m benchmarks.imports
+    uv run python -m benchmarks.imports --top 40 --module src.routers.meta
+
+Exits with status 1 when a heavy module is executed by the import.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+API_ROOT = Path(__file__).resolve().parent.parent
+
+# SDKs only some requests use, which must stay deferred at startup
+HEAVY_MODULES = (
+    "anthropic",
+    "bs4",
+    "google.cloud.storage",
+    "google.cloud.tasks_v2",
+    "google.oauth2.id_token",
+    "kernel",
+    "playwright.async_api",
+)
+
+FIRST_REQUEST_PATH = "/api/v1/health"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Prints the heavy modules whose code ran; a lazy module left unloaded is
+# still a ``_LazyModule`` and its attributes must not be touched
+_LOADED_SCRIPT = """
+import importlib, json, sys
+importlib.import_module({module!r})
+loaded = [
+    name for name in {heavy!r}
+    if name in sys.modules and type(sys.modules[name]).__name__ != "_LazyModule"
+]
+print(json.dumps(loaded))
+"""
+
+_FIRST_REQUEST_SCRIPT = """
+import asyncio, httpx
+from src.main import app
+
+async def first_request():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        response = await c.get({path!r})
+    response.raise_for_status()
+
+asyncio.run(first_request())
+"""
+
+
+@dataclass
+class ImportTiming:
+    """One module's line of ``-X importtime`` output, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` stderr, ignoring unrelated lines."""
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=len(indent) // 2,
+            )
+        )
+    return timings
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        cwd=API_ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_imports(module: str = "src.main") -> list[ImportTiming]:
+    """Import ``module`` in a fresh interpreter and time every import."""
+    completed = _run_python("-X", "importtime", "-c", f"import {module}")
+    return parse_importtime(completed.stderr)
+
+
+def loaded_heavy_modules(
+    module: str = "src.main", heavy: tuple[str, ...] = HEAVY_MODULES
+) -> list[str]:
+    """Modules of ``heavy`` executed by importing ``module`` fresh."""
+    script = _LOADED_SCRIPT.format(module=module, heavy=heavy)
+    return json.loads(_run_python("-c", script).stdout)
+
+
+def run_first_request(path: str = FIRST_REQUEST_PATH) -> None:
+    """Start a fresh interpreter, import the app and serve one request.
+
+    The request goes through the ASGI app in process without running its
+    lifespan, so no database or network is needed for cheap routes.
+    """
+    _run_python("-c", _FIRST_REQUEST_SCRIPT.format(path=path))
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.imports")
+    parser.add_argument("--module", default="src.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+
+    timings = measure_imports(args.module)
+    total = next((t for t in timings if t.module == args.module), None)
+    if total is not None:
+        print(f"import {args.module}: {total.cumulative_us / 1000:.1f}ms")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    ranked = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)
+    for t in ranked[: args.top]:
+        print(
+            f"{t.cumulative_us / 1000:10.1f}ms {t.self_us / 1000:8.1f}ms  "
+            f"{'  ' * t.depth}{t.module}"
+        )
+
+    loaded = loaded_heavy_modules(args.module)
+    for name in loaded:
+        print(f"HEAVY {name} is executed at import; bind it with lazy_import")
+    if loaded:
+        return 1
+    print("No heavy modules executed at import")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""CLI script to run the resumable archetype reprocess job.
+
+Unlike the pipeline endpoint, which resolves chunks inside the API
+process, this can resolve them in a local process pool.
+
+Usage:
+    uv run scripts/reprocess-archetypes.py --help
+    uv run scripts/reprocess-archetypes.py                  # JP, missing labels
+    uv run scripts/reprocess-archetypes.py --force --workers 4
+    uv run scripts/reprocess-archetypes.py --restart        # Ignore checkpoint
+    uv run scripts/reprocess-archetypes.py --dry-run        # Preview without changes
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.logging import RichHandler
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipelines.reprocess_archetypes import (
+    REPROCESS_CHUNK_SIZE,
+    run_reprocess_job,
+)
+
+app = typer.Typer(
+    name="reprocess-archetypes",
+    help="Reprocess archetype labels for existing placements.",
+    no_args_is_help=False,
+)
+console = Console()
+
+
+def setup_logging(verbose: bool) -> None:
+    """Configure logging with rich handler.
+
+    Args:
+        verbose: Enable verbose (DEBUG) logging.
+    """
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+    )
+
+
+@app.command()
+def reprocess(
+    region: str = typer.Option(
+        "JP",
+        "--region",
+        "-r",
+        help="Tournament region to reprocess.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Also reprocess placements that already have a detection method.",
+    ),
+    restart: bool = typer.Option(
+        False,
+        "--restart",
+        help="Discard the checkpoint and start from the first placement.",
+    ),
+    job_key: str = typer.Option(
+        None,
+        "--job-key",
+        help="Checkpoint key (default: one job per region and mode).",
+    ),
+    chunk_size: int = typer.Option(
+        REPROCESS_CHUNK_SIZE,
+        "--chunk-size",
+        help="Placements per chunk and bulk update.",
+    ),
+    workers: int = typer.Option(
+        min(4, os.cpu_count() or 1),
+        "--workers",
+        "-w",
+        help="Resolver processes (1 = resolve inline).",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        "-n",
+        help="Resolve without writing updates or the checkpoint.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose logging.",
+    ),
+) -> None:
+    """Reprocess archetype labels until every placement is done.
+
+    Progress is checkpointed per chunk, so an interrupted run resumes
+    where it stopped when started again with the same options.
+    """
+    setup_logging(verbose)
+
+    if dry_run:
+        console.print("[yellow]DRY RUN[/yellow] - No changes will be committed.\n")
+
+    result = asyncio.run(
+        run_reprocess_job(
+            region=region,
+            force=force,
+            dry_run=dry_run,
+            job_key=job_key,
+            restart=restart,
+            chunk_size=chunk_size,
+            workers=max(1, workers),
+        )
+    )
+
+    console.print()
+    if result.completed:
+        console.print("[green]Reprocess complete![/green]")
+    else:
+        console.print("[yellow]Reprocess stopped before the end.[/yellow]")
+
+    console.print("\n[bold]Results:[/bold]")
+    console.print(f"  Job key:      {result.job_key}")
+    console.print(f"  Resumed from: {result.resumed_from or '-'}")
+    console.print(f"  Chunks:       {result.chunks}")
+    console.print(f"  Processed:    {result.processed}")
+    console.print(f"  Updated:      {result.updated}")
+    console.print(f"  Skipped:      {result.skipped}")
+    console.print(f"  Duration:     {result.duration_seconds:.1f}s")
+
+    if result.errors:
+        console.print(f"\n[red]Errors: {len(result.errors)}[/red]")
+        for error in result.errors[:5]:
+            console.print(f"  - {error}")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
@@ -30,6 +30,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from src.db.database import async_session_factory
 from src.fixtures.tournaments import TournamentFixture, normalize_archetype
 from src.models import Tournament, TournamentPlacement
+from src.models.tournament_placement import tournament_columns
 from src.services.tournament_scrape import TournamentScrapeService
 
 app = typer.Typer(
@@ -170,6 +171,7 @@ async def seed_tournament(fixture: TournamentFixture, dry_run: bool = False) ->
             placement = TournamentPlacement(
                 id=uuid4(),
                 tournament_id=tournament_id,
+                **tournament_columns(tournament),
                 placement=placement_data.placement,
                 player_name=placement_data.player_name,
                 archetype=archetype,
@@ -111,15 +111,15 @@ async def run_comparison(
     changes: list[dict] = []
     transition_counts: Counter[str] = Counter()
 
-    for p in placements:
-        sprite_urls = p.raw_archetype_sprites or []
-        html_archetype = p.raw_archetype or p.archetype
+    resolved = normalizer.resolve_batch(
+        [
+            (p.raw_archetype_sprites or [], p.raw_archetype or p.archetype, p.decklist)
+            for p in placements
+        ]
+    )
 
-        new_archetype, _, new_method = normalizer.resolve(
-            sprite_urls,
-            html_archetype,
-            p.decklist,
-        )
+    for p, (new_archetype, _, new_method) in zip(placements, resolved, strict=True):
+        sprite_urls = p.raw_archetype_sprites or []
 
         old_method = p.archetype_detection_method or "unknown"
 
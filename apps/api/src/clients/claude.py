@@ -5,13 +5,15 @@ import json
 import logging
 import secrets
 from dataclasses import dataclass, field
-from typing import Any, Self
-
-import anthropic
-from anthropic import APIConnectionError, APIStatusError, RateLimitError
-from anthropic.types import TextBlock
+from typing import TYPE_CHECKING, Any, Self
 
 from src.config import get_settings
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import anthropic
+else:
+    anthropic = lazy_import("anthropic")
 
 logger = logging.getLogger(__name__)
 
@@ -117,13 +119,13 @@ class ClaudeClient:
                 )
 
                 block = response.content[0]
-                if not isinstance(block, TextBlock):
+                if not isinstance(block, anthropic.types.TextBlock):
                     msg = f"Expected TextBlock, got {type(block)}"
                     raise TypeError(msg)
                 text = block.text
                 return text, usage
 
-            except RateLimitError as e:
+            except anthropic.RateLimitError as e:
                 jitter = secrets.randbelow(int(self._retry_delay * 1000)) / 1000
                 delay = self._retry_delay * (2**attempt) + jitter
                 logger.warning(
@@ -135,7 +137,7 @@ class ClaudeClient:
                 await asyncio.sleep(delay)
                 last_error = e
 
-            except APIConnectionError as e:
+            except anthropic.APIConnectionError as e:
                 jitter = secrets.randbelow(int(self._retry_delay * 1000)) / 1000
                 delay = self._retry_delay * (2**attempt) + jitter
                 logger.warning(
@@ -148,7 +150,7 @@ class ClaudeClient:
                 await asyncio.sleep(delay)
                 last_error = e
 
-            except APIStatusError as e:
+            except anthropic.APIStatusError as e:
                 raise ClaudeError(
                     f"Claude API error {e.status_code}: {e.message}"
                 ) from e
@@ -7,10 +7,16 @@ so we don't need browser binaries in our Cloud Run container.
 
 import logging
 import os
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
-from kernel import AsyncKernel
-from playwright.async_api import async_playwright
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import kernel
+    import playwright.async_api as playwright_api
+else:
+    kernel = lazy_import("kernel")
+    playwright_api = lazy_import("playwright.async_api")
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +45,7 @@ class KernelBrowser:
         key = api_key or os.environ.get("KERNEL_API_KEY")
         if not key:
             raise KernelBrowserError("KERNEL_API_KEY environment variable is required")
-        self._kernel = AsyncKernel(api_key=key)
+        self._kernel = kernel.AsyncKernel(api_key=key)
         self._timeout_ms = timeout_ms
 
     async def __aenter__(self) -> Self:
@@ -82,7 +88,7 @@ class KernelBrowser:
                 url,
             )
 
-            playwright = await async_playwright().start()
+            playwright = await playwright_api.async_playwright().start()
             browser = await playwright.chromium.connect_over_cdp(
                 kernel_browser.cdp_ws_url
             )
@@ -6,16 +6,17 @@ Scrapes tournament data from play.limitlesstcg.com including:
 - Decklists when available
 """
 
+from __future__ import annotations
+
 import asyncio
 import contextlib
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.retry_policy import (
     DEFAULT_MAX_RETRIES,
@@ -25,6 +26,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -469,6 +478,7 @@ class LimitlessClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers=_headers,
             follow_redirects=True,
         )
@@ -476,6 +486,7 @@ class LimitlessClient:
         self._official_client = httpx.AsyncClient(
             base_url=self.OFFICIAL_BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers=_headers,
             follow_redirects=True,
         )
@@ -622,7 +633,7 @@ class LimitlessClient:
             endpoint = f"{base}&format={game_format}&page={page}"
 
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         tournaments: list[LimitlessTournament] = []
 
@@ -795,7 +806,7 @@ class LimitlessClient:
             endpoint = f"{endpoint}/standings"
 
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         placements: list[LimitlessPlacement] = []
 
@@ -915,7 +926,7 @@ class LimitlessClient:
             else:
                 html = await self._get(decklist_url)
 
-            soup = BeautifulSoup(html, "lxml")
+            soup = bs4.BeautifulSoup(html, "lxml")
 
             has_card_links = bool(soup.select("a[href*='/cards/']"))
             logger.info(
@@ -1236,7 +1247,7 @@ class LimitlessClient:
         """
         endpoint = "/tournaments"
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         tournaments: list[LimitlessTournament] = []
 
@@ -1390,7 +1401,7 @@ class LimitlessClient:
             endpoint = tournament_url
 
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         placements: list[LimitlessPlacement] = []
 
@@ -1589,7 +1600,7 @@ class LimitlessClient:
         for page in range(1, max_pages + 1):
             endpoint = f"/tournaments/jp?show=100&page={page}"
             html = await self._get_official(endpoint)
-            soup = BeautifulSoup(html, "lxml")
+            soup = bs4.BeautifulSoup(html, "lxml")
 
             # Find table rows — JP page uses a simple table with tournament links
             rows = soup.select("table tr")
@@ -1754,7 +1765,7 @@ class LimitlessClient:
         endpoint = endpoint.rstrip("/")
 
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         placements: list[LimitlessPlacement] = []
 
@@ -1928,7 +1939,7 @@ class LimitlessClient:
         Returns:
             List of parsed JP cards.
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
         cards: list[LimitlessJPCard] = []
 
         card_elements = soup.select(".card-item, .card, [data-card-id]")
@@ -2150,7 +2161,7 @@ class LimitlessClient:
         """
         endpoint = "/cards/en"
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         set_codes: list[str] = []
         for link in soup.select("a[href*='/cards/en/']"):
@@ -2175,7 +2186,7 @@ class LimitlessClient:
         """
         endpoint = f"/cards/en/{set_code}"
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         cards: list[LimitlessENCard] = []
         seen: set[str] = set()
@@ -2276,7 +2287,7 @@ class LimitlessClient:
         except LimitlessError:
             return None
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
         en_card_id = self._parse_international_prints(soup)
 
         if not en_card_id:
@@ -2348,7 +2359,7 @@ class LimitlessClient:
         """
         endpoint = "/cards/jp"
         html = await self._get_official(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         set_codes: list[str] = []
 
@@ -6,15 +6,16 @@ this client uses Kernel cloud browser to render pages and
 BeautifulSoup to parse the resulting HTML.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.kernel_browser import KernelBrowser, KernelBrowserError
 from src.clients.retry_policy import (
@@ -25,6 +26,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +122,7 @@ class PlayersClubClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={
                 "User-Agent": ("TrainerLab/1.0 (Pokemon TCG Meta Analysis)"),
                 "Accept": "application/json, text/html",
@@ -334,7 +344,7 @@ class PlayersClubClient:
 
     def _parse_event_list_html(self, html: str) -> list[PlayersClubTournament]:
         """Parse the event result list HTML into tournament objects."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = bs4.BeautifulSoup(html, "html.parser")
         tournaments: list[PlayersClubTournament] = []
 
         items = soup.select(".event-list-item")
@@ -487,7 +497,7 @@ class PlayersClubClient:
         self, html: str, event_id: str
     ) -> PlayersClubTournamentDetail:
         """Parse event detail page HTML."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = bs4.BeautifulSoup(html, "html.parser")
 
         # Extract tournament metadata from page header
         name = ""
@@ -6,15 +6,16 @@ Scrapes Japanese Pokemon TCG meta data from pokecabook.com including:
 - Articles about the JP meta
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.kernel_browser import KernelBrowser, KernelBrowserError
 from src.clients.retry_policy import (
@@ -25,6 +26,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -154,6 +163,7 @@ class PokecabookClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={
                 "User-Agent": "TrainerLab/1.0 (Pokemon TCG Meta Analysis)",
                 "Accept": "text/html,application/xhtml+xml",
@@ -308,7 +318,7 @@ class PokecabookClient:
         endpoint = f"/category/{category}/" if category else "/category/pokeca-article/"
 
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         articles: list[PokecabookArticle] = []
         cutoff_date = date.today() - __import__("datetime").timedelta(days=days)
@@ -422,7 +432,7 @@ class PokecabookClient:
             html = await self._get_rendered(endpoint)
         else:
             html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         title_elem = soup.select_one("h1, .entry-title, .post-title")
         title = title_elem.get_text(strip=True) if title_elem else "Untitled"
@@ -455,7 +465,7 @@ class PokecabookClient:
             html = await self._get_rendered(endpoint)
         else:
             html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         entries: list[PokecabookTierEntry] = []
 
@@ -579,7 +589,7 @@ class PokecabookClient:
             endpoint = "/card-usage/"
             html = await self._get(endpoint)
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         entries: list[PokecabookAdoptionEntry] = []
 
@@ -695,7 +705,7 @@ class PokecabookClient:
         """
         endpoint = url[len(self.BASE_URL) :] if url.startswith(self.BASE_URL) else url
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         title_elem = soup.select_one("h1, .entry-title, .post-title")
         title = title_elem.get_text(strip=True) if title_elem else "Untitled"
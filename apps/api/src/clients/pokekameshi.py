@@ -5,15 +5,16 @@ Scrapes Japanese Pokemon TCG tier data from pokekameshi.com including:
 - Meta percentage reports from tournaments
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.kernel_browser import KernelBrowser, KernelBrowserError
 from src.clients.retry_policy import (
@@ -24,6 +25,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +155,7 @@ class PokekameshiClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={
                 "User-Agent": "TrainerLab/1.0 (Pokemon TCG Meta Analysis)",
                 "Accept": "text/html,application/xhtml+xml",
@@ -297,7 +307,7 @@ class PokekameshiClient:
             html = await self._get_rendered(endpoint)
         else:
             html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         entries: list[PokekameshiTierEntry] = []
 
@@ -471,7 +481,7 @@ class PokekameshiClient:
             endpoint = "/share/"
             html = await fetch(endpoint)
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         shares: list[PokekameshiMetaShare] = []
         total_entries = None
@@ -618,7 +628,7 @@ class PokekameshiClient:
         """
         endpoint = url[len(self.BASE_URL) :] if url.startswith(self.BASE_URL) else url
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         title_elem = soup.select_one("h1, .entry-title, .post-title")
         title = title_elem.get_text(strip=True) if title_elem else "Untitled"
@@ -15,10 +15,9 @@ import re
 from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import datetime
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.retry_policy import (
     DEFAULT_MAX_RETRIES,
@@ -28,6 +27,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +104,7 @@ class PokemonEventsClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={
                 "User-Agent": ("TrainerLab/1.0 (Pokemon TCG Meta Analysis)"),
                 "Accept": "application/json,text/html,application/xhtml+xml",
@@ -245,7 +253,7 @@ class PokemonEventsClient:
             logger.warning("Failed to fetch regionals page")
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
         events = self._parse_event_listings(soup, tier="regional")
 
         logger.info("Fetched %d Regional Championships", len(events))
@@ -273,14 +281,14 @@ class PokemonEventsClient:
             logger.warning("Failed to fetch ICs page")
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
         events = self._parse_event_listings(soup, tier="international")
 
         # Also try to find Worlds
         worlds_endpoint = f"{self.EVENTS_PATH}/pokemon-worlds"
         try:
             worlds_html = await self._get(worlds_endpoint)
-            worlds_soup = BeautifulSoup(worlds_html, "lxml")
+            worlds_soup = bs4.BeautifulSoup(worlds_html, "lxml")
             worlds_events = self._parse_event_listings(worlds_soup, tier="worlds")
             events.extend(worlds_events)
         except PokemonEventsError:
@@ -13,10 +13,9 @@ import re
 from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import datetime
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 
 from src.clients.retry_policy import (
     DEFAULT_MAX_RETRIES,
@@ -26,6 +25,14 @@ from src.clients.retry_policy import (
     classify_status,
     is_retryable_status,
 )
+from src.services.pipeline_metrics import http_event_hooks
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import bs4
+    from bs4 import BeautifulSoup, Tag
+else:
+    bs4 = lazy_import("bs4")
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +109,7 @@ class RK9Client:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={
                 "User-Agent": ("TrainerLab/1.0 (Pokemon TCG Meta Analysis)"),
                 "Accept": "text/html,application/xhtml+xml",
@@ -237,7 +245,7 @@ class RK9Client:
         """
         endpoint = "/events/pokemon"
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         events: list[RK9Event] = []
 
@@ -582,7 +590,7 @@ class RK9Client:
             endpoint = event_url
 
         html = await self._get(endpoint)
-        soup = BeautifulSoup(html, "lxml")
+        soup = bs4.BeautifulSoup(html, "lxml")
 
         return self._parse_registration_status(soup)
 
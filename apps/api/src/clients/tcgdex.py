@@ -18,6 +18,7 @@ from src.clients.retry_policy import (
     is_retryable_status,
 )
 from src.config import get_settings
+from src.services.pipeline_metrics import http_event_hooks
 
 logger = logging.getLogger(__name__)
 
@@ -221,6 +222,7 @@ class TCGdexClient:
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=timeout,
+            event_hooks=http_event_hooks(),
             headers={"Accept": "application/json"},
         )
 
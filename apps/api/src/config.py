@@ -84,6 +84,26 @@ class Settings(BaseSettings):
     # Cloud Storage (creator exports)
     exports_bucket: str = "trainerlab-exports"
 
+    # Widget view analytics: seconds between buffered rollup flushes, and
+    # an optional bucket for the compressed raw view event log
+    widget_view_flush_seconds: float = 10.0
+    widget_view_log_bucket: str | None = None
+
+    # Bucket for compressed archives of pruned tournaments and placements
+    prune_archive_bucket: str | None = None
+
+    # Load the in-memory card catalog at startup for query-free card lookups
+    card_catalog_preload: bool = True
+
+    # Gzip responses at least this large when the client accepts it
+    # (0 disables compression)
+    response_gzip_min_bytes: int = 1024
+
+    # Per-request SQL profiling (Server-Timing header + query log line)
+    query_profiling: bool = False
+    # Statement shape repeats per request before it is logged as N+1
+    query_repeat_threshold: int = 5
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -0,0 +1,77 @@
+"""Shared SQL statement timing for the query collectors.
+
+Pipeline run metrics and the request query profiler both need the count
+and duration of every statement run on the engine. One pair of cursor
+event listeners times each statement once and hands it to every
+registered collector that is active in the current context, so enabling
+both never times a statement twice.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+
+# Per-connection stack of statement start times
+_STARTED_KEY = "query_timing_started"
+
+
+@dataclass(frozen=True)
+class QueryCollector:
+    """A consumer of statement timings.
+
+    Attributes:
+        active: Whether the current context wants timings; checked per
+            statement, so it should only read a context variable.
+        record: Called with the statement and its duration in seconds.
+    """
+
+    active: Callable[[], bool]
+    record: Callable[[str, float], None]
+
+
+_collectors: list[QueryCollector] = []
+_installed_engines: set[int] = set()
+
+
+def add_query_collector(collector: QueryCollector) -> None:
+    """Register a collector (once) with the shared listeners."""
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if any(c.active() for c in _collectors):
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    started = conn.info.get(_STARTED_KEY)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    for collector in _collectors:
+        if collector.active():
+            collector.record(statement, elapsed)
+
+
+def install_query_timing(engine: Any = None) -> None:
+    """Attach the timing listeners to an engine (once per engine).
+
+    Args:
+        engine: Async or sync engine; defaults to the shared app engine.
+    """
+    if engine is None:
+        from src.db.database import engine as app_engine
+
+        engine = app_engine
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if id(sync_engine) in _installed_engines:
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    _installed_engines.add(id(sync_engine))
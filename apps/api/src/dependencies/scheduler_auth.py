@@ -7,14 +7,22 @@ pipeline endpoints. Tokens must have:
 """
 
 import logging
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends, Header, HTTPException, status
-from google.auth import exceptions as google_auth_exceptions
-from google.auth.transport import requests
-from google.oauth2 import id_token
 
 from src.config import Settings, get_settings
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    from google.auth import exceptions as google_auth_exceptions
+    from google.auth.transport import requests
+    from google.oauth2 import id_token
+else:
+    # Only pipeline requests verify tokens; read-only instances never do
+    google_auth_exceptions = lazy_import("google.auth.exceptions")
+    requests = lazy_import("google.auth.transport.requests")
+    id_token = lazy_import("google.oauth2.id_token")
 
 logger = logging.getLogger(__name__)
 
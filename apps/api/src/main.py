@@ -10,12 +10,14 @@ from contextvars import ContextVar
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.config import get_settings
+from src.db.database import async_session_factory
 from src.routers import (
     admin_router,
     api_keys_router,
@@ -40,6 +42,9 @@ from src.routers import (
     waitlist_router,
     widgets_router,
 )
+from src.services.card_catalog import load_card_catalog
+from src.services.query_profiler import profile_queries
+from src.services.widget_view_buffer import get_widget_view_buffer
 
 settings = get_settings()
 
@@ -62,6 +67,8 @@ class JSONFormatter(logging.Formatter):
             log_entry["pipeline"] = record.pipeline
         if hasattr(record, "run_id"):
             log_entry["run_id"] = record.run_id
+        if hasattr(record, "query_profile"):
+            log_entry["query_profile"] = record.query_profile
         return json.dumps(log_entry)
 
 
@@ -101,6 +108,39 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class QueryProfilerMiddleware(BaseHTTPMiddleware):
+    """Count and time each request's SQL statements (opt-in).
+
+    Adds a Server-Timing header and logs one line per request, tied to
+    the correlation ID; repeated statement shapes are logged as N+1.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        with profile_queries() as profile:
+            response = await call_next(request)
+
+        threshold = settings.query_repeat_threshold
+        summary = profile.to_dict(threshold)
+        timing = profile.server_timing()
+        existing = response.headers.get("Server-Timing")
+        response.headers["Server-Timing"] = (
+            f"{existing}, {timing}" if existing else timing
+        )
+
+        level = logging.WARNING if summary["repeated"] else logging.INFO
+        logger.log(
+            level,
+            "Query profile %s %s: statements=%d db=%.1fms repeated=%d",
+            request.method,
+            request.url.path,
+            profile.statements,
+            summary["db_ms"],
+            len(summary["repeated"]),
+            extra={"query_profile": summary},
+        )
+        return response
+
+
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Add security headers to all responses."""
 
@@ -126,8 +166,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning(
             "NEXTAUTH_SECRET not configured - API endpoints requiring auth will fail"
         )
+    if settings.card_catalog_preload:
+        try:
+            async with async_session_factory() as session:
+                await load_card_catalog(session)
+        except Exception:
+            logger.warning(
+                "Card catalog preload failed - falling back to card queries",
+                exc_info=True,
+            )
+    widget_views = get_widget_view_buffer()
+    widget_views.start()
     yield
     # Shutdown
+    await widget_views.stop()
 
 
 app = FastAPI(
@@ -143,6 +195,11 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
+# Query profiling (opt-in); added before the correlation ID middleware so
+# it runs inside it and its log line carries the request's correlation ID
+if settings.query_profiling:
+    app.add_middleware(QueryProfilerMiddleware)  # type: ignore[arg-type]
+
 # Correlation ID middleware (outermost — runs first)
 app.add_middleware(CorrelationIDMiddleware)  # type: ignore[arg-type]
 
@@ -158,6 +215,14 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization"],
 )
 
+# Response compression (outermost, so the other middleware see the
+# uncompressed body); negotiated from Accept-Encoding
+if settings.response_gzip_min_bytes > 0:
+    app.add_middleware(
+        GZipMiddleware,  # type: ignore[arg-type]
+        minimum_size=settings.response_gzip_min_bytes,
+    )
+
 # Include routers
 app.include_router(admin_router)
 app.include_router(api_keys_router)
@@ -6,7 +6,10 @@ from src.models.admin_audit_event import AdminAuditEvent
 from src.models.api_key import ApiKey
 from src.models.api_request import ApiRequest
 from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
+from src.models.archetype_key_cards import ArchetypeKeyCards
 from src.models.archetype_prediction import ArchetypePrediction
+from src.models.archetype_reprocess_checkpoint import ArchetypeReprocessCheckpoint
+from src.models.archetype_share_series import ArchetypeShareSeries
 from src.models.archetype_sprite import ArchetypeSprite
 from src.models.card import Card
 from src.models.card_id_mapping import CardIdMapping
@@ -18,6 +21,7 @@ from src.models.format_config import FormatConfig
 from src.models.jp_card_adoption_rate import JPCardAdoptionRate
 from src.models.jp_card_innovation import JPCardInnovation
 from src.models.jp_external_meta_share import JPExternalMetaShare
+from src.models.jp_meta_comparison import JPMetaComparison
 from src.models.jp_new_archetype import JPNewArchetype
 from src.models.jp_set_impact import JPSetImpact
 from src.models.jp_unreleased_card import JPUnreleasedCard
@@ -25,8 +29,10 @@ from src.models.lab_note import LabNote
 from src.models.lab_note_revision import LabNoteRevision
 from src.models.major_format_window import MajorFormatWindow
 from src.models.meta_snapshot import MetaSnapshot
+from src.models.pipeline_run import PipelineRun
 from src.models.placeholder_card import PlaceholderCard
 from src.models.prediction import Prediction
+from src.models.prediction_accuracy_rollup import PredictionAccuracyRollup
 from src.models.rotation_impact import RotationImpact
 from src.models.set import Set
 from src.models.tournament import Tournament
@@ -38,6 +44,7 @@ from src.models.user import User
 from src.models.waitlist import WaitlistEntry
 from src.models.widget import Widget
 from src.models.widget_view import WidgetView
+from src.models.widget_view_rollup import WidgetViewRollup
 
 __all__ = [
     "Adaptation",
@@ -46,7 +53,10 @@ __all__ = [
     "AdminAuditEvent",
     "AccessGrant",
     "ArchetypeEvolutionSnapshot",
+    "ArchetypeKeyCards",
     "ArchetypePrediction",
+    "ArchetypeReprocessCheckpoint",
+    "ArchetypeShareSeries",
     "ArchetypeSprite",
     "Card",
     "CardIdMapping",
@@ -58,6 +68,7 @@ __all__ = [
     "JPCardAdoptionRate",
     "JPCardInnovation",
     "JPExternalMetaShare",
+    "JPMetaComparison",
     "JPNewArchetype",
     "JPSetImpact",
     "JPUnreleasedCard",
@@ -65,8 +76,10 @@ __all__ = [
     "LabNoteRevision",
     "MajorFormatWindow",
     "MetaSnapshot",
+    "PipelineRun",
     "PlaceholderCard",
     "Prediction",
+    "PredictionAccuracyRollup",
     "RotationImpact",
     "Set",
     "Tournament",
@@ -79,4 +92,5 @@ __all__ = [
     "WaitlistEntry",
     "Widget",
     "WidgetView",
+    "WidgetViewRollup",
 ]
@@ -0,0 +1,46 @@
+"""Per-archetype key card rollup."""
+
+from datetime import date as date_type
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class ArchetypeKeyCards(Base, TimestampMixin):
+    """Most-included cards of an archetype in the latest meta snapshot.
+
+    One row per archetype and snapshot dimensions, replaced each time
+    compute-meta saves a newer snapshot. ``key_cards`` is ordered by
+    inclusion rate:
+    [{"card_id": "sv4-6", "inclusion_rate": 0.95, "avg_copies": 3.8}, ...]
+    """
+
+    __tablename__ = "archetype_key_cards"
+    __table_args__ = (
+        UniqueConstraint(
+            "archetype",
+            "format",
+            "best_of",
+            "tournament_type",
+            "region",
+            name="uq_archetype_key_cards",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    archetype: Mapped[str] = mapped_column(String(255), nullable=False)
+    region: Mapped[str | None] = mapped_column(
+        String(20), nullable=True
+    )  # null = global
+    format: Mapped[str] = mapped_column(String(50), nullable=False)
+    best_of: Mapped[int] = mapped_column(Integer, nullable=False)
+    tournament_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    snapshot_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    # Decklists of the archetype the rates were computed from
+    decklist_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    key_cards: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
@@ -55,9 +55,17 @@ class ArchetypePrediction(Base, TimestampMixin):
     confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
     methodology: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # How the numbers were produced: "statistical" (forecaster only),
+    # "narrated" (forecaster numbers, Claude narrative) or "claude"
+    method: Mapped[str | None] = mapped_column(String(20), nullable=True)
+
+    # Statistical forecaster's mid share, scored alongside the prediction
+    baseline_meta_share: Mapped[float | None] = mapped_column(Float, nullable=True)
+
     # Actuals (backfilled after tournament)
     actual_meta_share: Mapped[float | None] = mapped_column(Float, nullable=True)
     accuracy_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    baseline_accuracy_score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # Relationships
     target_tournament: Mapped["Tournament"] = relationship("Tournament")
@@ -0,0 +1,34 @@
+"""Checkpoint model for resumable archetype reprocessing jobs."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class ArchetypeReprocessCheckpoint(Base, TimestampMixin):
+    """Progress of one archetype reprocess job, keyed by job_key.
+
+    Placements are processed in id order, so ``last_placement_id`` is the
+    resume point. It is updated in the same transaction as each chunk's
+    archetype updates.
+    """
+
+    __tablename__ = "archetype_reprocess_checkpoints"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    job_key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    region: Mapped[str] = mapped_column(String(20), nullable=False)
+    force: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # running, completed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="running")
+    last_placement_id: Mapped[UUID | None] = mapped_column(nullable=True)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
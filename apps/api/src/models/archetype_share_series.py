@@ -0,0 +1,47 @@
+"""Per-archetype meta share time series."""
+
+from datetime import date as date_type
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class ArchetypeShareSeries(Base, TimestampMixin):
+    """One archetype's share in one meta snapshot.
+
+    A narrow copy of ``MetaSnapshot.archetype_shares`` written alongside
+    each snapshot, so an archetype's history is a range scan over this
+    table instead of a read of every snapshot's full JSONB.
+    """
+
+    __tablename__ = "archetype_share_series"
+    __table_args__ = (
+        # Column order serves the archetype page: equality on everything
+        # but the date, then a range on snapshot_date.
+        UniqueConstraint(
+            "archetype",
+            "format",
+            "best_of",
+            "tournament_type",
+            "region",
+            "snapshot_date",
+            name="uq_archetype_share_series",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    archetype: Mapped[str] = mapped_column(String(255), nullable=False)
+    region: Mapped[str | None] = mapped_column(
+        String(20), nullable=True
+    )  # null = global
+    format: Mapped[str] = mapped_column(String(50), nullable=False)
+    best_of: Mapped[int] = mapped_column(Integer, nullable=False)
+    tournament_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    snapshot_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    share: Mapped[float] = mapped_column(Float, nullable=False)
+    # Placements in the snapshot the share was computed from
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base, TimestampMixin
+from src.utils.card_ids import canonical_card_id_default
 
 if TYPE_CHECKING:
     from src.models.set import Set
@@ -20,6 +21,14 @@ class Card(Base, TimestampMixin):
     # Primary key (TCGdex ID, e.g., "sv4-6")
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
 
+    # Case- and padding-insensitive form of id (e.g., "sv03-076" -> "sv3-76")
+    canonical_id: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        index=True,
+        default=canonical_card_id_default("id"),
+    )
+
     # Basic info
     local_id: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
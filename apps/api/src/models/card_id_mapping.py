@@ -7,6 +7,7 @@ from sqlalchemy import Boolean, Float, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base, TimestampMixin
+from src.utils.card_ids import canonical_card_id_default
 
 if TYPE_CHECKING:
     from src.models.placeholder_card import PlaceholderCard
@@ -32,6 +33,13 @@ class CardIdMapping(Base, TimestampMixin):
     jp_card_id: Mapped[str] = mapped_column(
         String(50), nullable=False, unique=True, index=True
     )
+    # Case- and padding-insensitive form of jp_card_id
+    jp_canonical_id: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+        index=True,
+        default=canonical_card_id_default("jp_card_id"),
+    )
     en_card_id: Mapped[str] = mapped_column(String(50), nullable=False)
 
     card_name_en: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -0,0 +1,44 @@
+"""Precomputed JP BO1 vs global BO3 meta comparison."""
+
+from datetime import date as date_type
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class JPMetaComparison(Base, TimestampMixin):
+    """JP BO1 snapshot compared against the global BO3 snapshot.
+
+    Written by compute-meta alongside each global BO3 snapshot, so JP
+    signals, the compare endpoint, public endpoints and the comparison
+    widget read one row instead of diffing two full snapshots.
+    """
+
+    __tablename__ = "jp_meta_comparisons"
+    __table_args__ = (
+        UniqueConstraint(
+            "format",
+            "tournament_type",
+            "snapshot_date",
+            name="uq_jp_meta_comparison",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    snapshot_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    format: Mapped[str] = mapped_column(String(50), nullable=False)
+    tournament_type: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    # Placements behind each side; 0 when there is no JP snapshot
+    jp_sample_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    en_sample_size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Every archetype of either side, by max share across sides:
+    # [{"archetype": "Charizard ex", "jp_share": 0.2, "en_share": 0.15,
+    #   "divergence": 0.05, "jp_tier": "S", "en_tier": "S"}, ...]
+    # A side's share and tier are null when the archetype is absent there.
+    archetypes: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
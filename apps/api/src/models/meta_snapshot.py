@@ -25,6 +25,9 @@ class MetaSnapshot(Base, TimestampMixin):
             "best_of",
             "tournament_type",
             name="uq_meta_snapshot",
+            # Global snapshots have region NULL; treat it as a value so
+            # ON CONFLICT (uq_meta_snapshot) upserts them too.
+            postgresql_nulls_not_distinct=True,
         ),
         CheckConstraint(
             "diversity_index >= 0 AND diversity_index <= 1",
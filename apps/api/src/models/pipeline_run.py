@@ -0,0 +1,50 @@
+"""Ledger of pipeline runs with per-step timing and throughput."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import BigInteger, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class PipelineRun(Base, TimestampMixin):
+    """One pipeline run, tagged with the run_id used in its log records.
+
+    Totals cover the whole run; ``steps`` holds the per-step breakdown:
+    [{"name": "compute-NA-standard-BO3-all", "status": "ok",
+      "wall_seconds": 1.2, "cpu_seconds": 0.4, "db_queries": 12,
+      "db_seconds": 0.7, "http_requests": 0, "http_bytes": 0,
+      "error": null}]
+    """
+
+    __tablename__ = "pipeline_runs"
+    __table_args__ = (
+        Index("ix_pipeline_runs_pipeline_started_at", "pipeline", "started_at"),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    run_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    pipeline: Mapped[str] = mapped_column(String(100), nullable=False)
+    # ok, error
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="ok")
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    wall_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    cpu_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    db_queries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    db_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    http_requests: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    http_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    steps: Mapped[list[dict]] = mapped_column(JSONB, nullable=False, default=list)
+    # Steps beyond the stored limit, counted in the totals only
+    steps_dropped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -0,0 +1,45 @@
+"""Precomputed prediction accuracy aggregates."""
+
+from datetime import date as date_type
+from uuid import UUID, uuid4
+
+from sqlalchemy import Date, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class PredictionAccuracyRollup(Base, TimestampMixin):
+    """Accuracy of archetype predictions per archetype, method and month.
+
+    Rebuilt by the score-predictions job. A NULL dimension aggregates over
+    all of its values: the row with all three NULL is the overall summary
+    and rows with only ``method`` set compare methods.
+    """
+
+    __tablename__ = "prediction_accuracy_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "archetype_id",
+            "method",
+            "month",
+            name="uq_prediction_accuracy_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    archetype_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    method: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    # First day of the target tournament's month
+    month: Mapped[date_type | None] = mapped_column(Date, nullable=True)
+
+    prediction_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    scored_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    average_accuracy: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Mean |actual - predicted mid| share over scored predictions
+    mean_absolute_error: Mapped[float | None] = mapped_column(Float, nullable=True)
+    baseline_scored_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    baseline_average_accuracy: Mapped[float | None] = mapped_column(
+        Float, nullable=True
+    )
@@ -1,9 +1,20 @@
 """TournamentPlacement model for tournament results."""
 
+from datetime import date as date_type
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,7 +26,13 @@ if TYPE_CHECKING:
 
 
 class TournamentPlacement(Base, TimestampMixin):
-    """A deck's placement in a tournament."""
+    """A deck's placement in a tournament.
+
+    ``tournament_date``, ``region``, ``format`` and ``best_of`` copy the
+    parent tournament's columns so time-window queries filter and index
+    placements without joining tournaments. Write paths set them from the
+    tournament via ``tournament_columns``.
+    """
 
     __tablename__ = "tournament_placements"
     __table_args__ = (
@@ -25,6 +42,32 @@ class TournamentPlacement(Base, TimestampMixin):
             "OR archetype_detection_method IS NULL",
             name="ck_placement_detection_method",
         ),
+        # Meta shares and matchup spreads over a format window
+        Index(
+            "ix_tp_format_bestof_date",
+            "format",
+            "best_of",
+            "tournament_date",
+            postgresql_include=["region", "archetype", "placement"],
+        ),
+        # Archetype detail pages and per-archetype decklists
+        Index(
+            "ix_tp_archetype_format_bestof_date",
+            "archetype",
+            "format",
+            "best_of",
+            "tournament_date",
+            postgresql_include=["region", "placement"],
+        ),
+        # Card counts over decklists in a window
+        Index(
+            "ix_tp_decklist_format_bestof_date",
+            "format",
+            "best_of",
+            "tournament_date",
+            postgresql_include=["region", "archetype"],
+            postgresql_where=text("decklist IS NOT NULL"),
+        ),
     )
 
     # Primary key
@@ -35,6 +78,12 @@ class TournamentPlacement(Base, TimestampMixin):
         ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
+    # Denormalized from the tournament (see class docstring)
+    tournament_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    region: Mapped[str] = mapped_column(String(20), nullable=False)
+    format: Mapped[str] = mapped_column(String(50), nullable=False)
+    best_of: Mapped[int] = mapped_column(Integer, nullable=False)
+
     # Deck reference (nullable - not all placements have full deck lists)
     deck_id: Mapped[UUID | None] = mapped_column(
         ForeignKey("decks.id", ondelete="SET NULL"), nullable=True
@@ -66,3 +115,13 @@ class TournamentPlacement(Base, TimestampMixin):
     deck: Mapped["Deck | None"] = relationship(
         "Deck", back_populates="tournament_placements"
     )
+
+
+def tournament_columns(tournament: "Tournament") -> dict[str, date_type | str | int]:
+    """Denormalized tournament columns for a placement of ``tournament``."""
+    return {
+        "tournament_date": tournament.date,
+        "region": tournament.region,
+        "format": tournament.format,
+        "best_of": tournament.best_of,
+    }
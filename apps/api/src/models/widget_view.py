@@ -14,7 +14,11 @@ if TYPE_CHECKING:
 
 
 class WidgetView(Base):
-    """Individual widget view for analytics tracking."""
+    """Individual widget view for analytics tracking.
+
+    No longer written: views are buffered in process and flushed to
+    WidgetViewRollup. Kept for views recorded before the rollups.
+    """
 
     __tablename__ = "widget_views"
 
@@ -0,0 +1,38 @@
+"""Hourly widget view counts."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base, TimestampMixin
+
+
+class WidgetViewRollup(Base, TimestampMixin):
+    """Views of a widget per hour and referrer domain.
+
+    Written by the in-process view buffer, which adds each flush's counts
+    to the existing row, so creator analytics never scan raw view events.
+    """
+
+    __tablename__ = "widget_view_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "widget_id",
+            "hour",
+            "referrer_domain",
+            name="uq_widget_view_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    widget_id: Mapped[str] = mapped_column(
+        String(20), ForeignKey("widgets.id", ondelete="CASCADE"), nullable=False
+    )
+    # Start of the UTC hour the views fall in
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Lowercased referrer host without "www."; NULL for direct loads
+    referrer_domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,557 @@
+"""Historical meta snapshot backfill pipeline.
+
+Recomputes enhanced meta snapshots for every date in a range, e.g. after a
+change to archetype normalization or share weighting. Instead of running
+``compute_daily_snapshots`` once per date (a full lookback-window scan each
+time), tournaments and placements for the whole range are loaded once and
+each combo keeps a sliding window: walking dates in order, tournaments
+that enter the window are added to running aggregates and tournaments
+that leave it are subtracted.
+
+Recency weights are ``2^(-days_ago / half_life)``. Since shares are a
+ratio, weights can be kept relative to a fixed anchor date
+(``2^((t - anchor) / half_life)``) and never need recomputing as the
+reference date moves; the common factor cancels out.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Literal
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.database import async_session_factory
+from src.models import (
+    FormatConfig,
+    JPMetaComparison,
+    MetaSnapshot,
+    Tournament,
+    TournamentPlacement,
+)
+from src.pipelines.compute_meta import (
+    FORMATS,
+    REGIONS,
+    SnapshotCombo,
+    plan_snapshot_combos,
+)
+from src.services.meta_service import (
+    EXCLUDED_ARCHETYPES,
+    GRASSROOTS_TIERS,
+    MIN_ARCHETYPE_SHARE,
+    MIN_ARCHETYPE_TOURNAMENTS,
+    OFFICIAL_TIERS,
+    RECENCY_HALF_LIFE_DAYS,
+    ComparisonKey,
+    MetaService,
+    SnapshotContext,
+    SnapshotKey,
+    snapshot_dependencies,
+)
+
+logger = logging.getLogger(__name__)
+
+# Snapshots buffered before each bulk upsert
+BACKFILL_BATCH_SIZE = 500
+
+
+@dataclass
+class BackfillMetaSnapshotsResult:
+    """Result of a historical meta snapshot backfill."""
+
+    dates_processed: int = 0
+    tournaments_loaded: int = 0
+    snapshots_computed: int = 0
+    snapshots_saved: int = 0
+    snapshots_skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+
+@dataclass
+class TournamentContribution:
+    """Placements of one tournament, pre-aggregated for window updates."""
+
+    tournament_id: UUID
+    date: date
+    region: str | None
+    tier: str | None
+    placements: int = 0
+    archetypes: dict[str, int] = field(default_factory=dict)
+    decklists: int = 0
+    card_appearances: dict[str, int] = field(default_factory=dict)
+    card_totals: dict[str, int] = field(default_factory=dict)
+
+    def add_placement(self, archetype: str | None, decklist: list | None) -> None:
+        """Fold one placement in, with the same rules as ``MetaService``."""
+        self.placements += 1
+        if archetype and archetype.strip():
+            self.archetypes[archetype] = self.archetypes.get(archetype, 0) + 1
+        if not decklist:
+            return
+
+        self.decklists += 1
+        seen: set[str] = set()
+        for entry in decklist:
+            if not isinstance(entry, dict):
+                continue
+            card_id = entry.get("card_id", "")
+            if not card_id:
+                continue
+            try:
+                quantity = int(entry.get("quantity", 1))
+            except (TypeError, ValueError):
+                continue
+            if quantity < 1:
+                continue
+            if card_id not in seen:
+                seen.add(card_id)
+                self.card_appearances[card_id] = (
+                    self.card_appearances.get(card_id, 0) + 1
+                )
+            self.card_totals[card_id] = self.card_totals.get(card_id, 0) + quantity
+
+
+def matches_combo(contribution: TournamentContribution, combo: SnapshotCombo) -> bool:
+    """Whether a tournament falls under a combo's region and tier filters.
+
+    Format and best-of are filtered when loading.
+    """
+    if combo.region and contribution.region != combo.region:
+        return False
+    if combo.tournament_type == "official":
+        return contribution.tier in OFFICIAL_TIERS
+    if combo.tournament_type == "grassroots":
+        return contribution.tier is None or contribution.tier in GRASSROOTS_TIERS
+    return True
+
+
+def _bump(counts: dict[str, int], key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        del counts[key]
+
+
+class SlidingMetaWindow:
+    """Running meta aggregates over tournaments in a moving date window.
+
+    ``advance`` must be called with non-decreasing window bounds.
+    """
+
+    def __init__(
+        self,
+        tournaments: Iterable[TournamentContribution],
+        anchor: date,
+        half_life: int = RECENCY_HALF_LIFE_DAYS,
+    ) -> None:
+        self._pending = sorted(tournaments, key=lambda t: t.date)
+        self._next = 0
+        self._active: deque[TournamentContribution] = deque()
+        self._anchor = anchor
+        self._half_life = half_life
+
+        self._placements = 0
+        self._weights: dict[str, float] = {}
+        self._archetype_tournaments: dict[str, int] = {}
+        self._decklists = 0
+        self._card_appearances: dict[str, int] = {}
+        self._card_totals: dict[str, int] = {}
+
+    def advance(self, start: date, end: date) -> None:
+        """Move the window to cover ``start <= tournament.date <= end``."""
+        while self._next < len(self._pending) and self._pending[self._next].date <= end:
+            tournament = self._pending[self._next]
+            self._next += 1
+            if tournament.date >= start:
+                self._active.append(tournament)
+                self._apply(tournament, 1)
+
+        while self._active and self._active[0].date < start:
+            self._apply(self._active.popleft(), -1)
+
+    def _apply(self, tournament: TournamentContribution, sign: int) -> None:
+        self._placements += sign * tournament.placements
+        weight = math.pow(2, (tournament.date - self._anchor).days / self._half_life)
+        for archetype, count in tournament.archetypes.items():
+            _bump(self._archetype_tournaments, archetype, sign)
+            if archetype in self._archetype_tournaments:
+                self._weights[archetype] = (
+                    self._weights.get(archetype, 0.0) + sign * count * weight
+                )
+            else:
+                self._weights.pop(archetype, None)
+
+        self._decklists += sign * tournament.decklists
+        for card_id, count in tournament.card_appearances.items():
+            _bump(self._card_appearances, card_id, sign * count)
+        for card_id, count in tournament.card_totals.items():
+            _bump(self._card_totals, card_id, sign * count)
+
+    @property
+    def tournament_ids(self) -> list[UUID]:
+        return [t.tournament_id for t in self._active]
+
+    @property
+    def sample_size(self) -> int:
+        return self._placements
+
+    def archetype_shares(
+        self, min_tournaments: int = MIN_ARCHETYPE_TOURNAMENTS
+    ) -> dict[str, float]:
+        """Recency-weighted archetype shares, as ``_compute_archetype_shares``."""
+        total = sum(self._weights.values())
+        if total <= 0:
+            return {}
+        return {
+            archetype: weighted / total
+            for archetype, weighted in sorted(
+                self._weights.items(), key=lambda x: x[1], reverse=True
+            )
+            if archetype not in EXCLUDED_ARCHETYPES
+            and weighted / total >= MIN_ARCHETYPE_SHARE
+            and self._archetype_tournaments[archetype] >= min_tournaments
+        }
+
+    def card_usage(self) -> dict[str, dict[str, float]]:
+        """Card inclusion rates and average counts, as ``_compute_card_usage``."""
+        if not self._decklists:
+            return {}
+        usage = {
+            card_id: {
+                "inclusion_rate": round(appearances / self._decklists, 4),
+                "avg_count": round(self._card_totals[card_id] / appearances, 2),
+            }
+            for card_id, appearances in self._card_appearances.items()
+        }
+        return dict(
+            sorted(usage.items(), key=lambda x: x[1]["inclusion_rate"], reverse=True)
+        )
+
+
+def jp_floor_for_date(
+    format_starts: Sequence[tuple[date, str]],
+    snapshot_date: date,
+    lookback_days: int,
+) -> tuple[date | None, str | None]:
+    """In-memory equivalent of ``compute_meta._derive_jp_floor``.
+
+    Args:
+        format_starts: ``(start_date, name)`` of current format configs.
+    """
+    cutoff = snapshot_date - timedelta(days=lookback_days)
+    candidates = [(s, n) for s, n in format_starts if cutoff <= s <= snapshot_date]
+    if not candidates:
+        return None, None
+    start, name = max(candidates)
+    return start, f"post-{name}"
+
+
+def build_snapshot(
+    window: SlidingMetaWindow,
+    combo: SnapshotCombo,
+    snapshot_date: date,
+    *,
+    start_date: date,
+    start_date_floor: date | None,
+    era_label: str | None,
+) -> MetaSnapshot:
+    """Build the base snapshot ``compute_meta_snapshot`` would return."""
+    snapshot = MetaSnapshot(
+        id=uuid4(),
+        snapshot_date=snapshot_date,
+        region=combo.region,
+        format=combo.game_format,
+        best_of=combo.best_of,
+        tournament_type=combo.tournament_type,
+        archetype_shares={},
+        card_usage=None,
+        sample_size=0,
+        tournaments_included=[],
+        diversity_index=None,
+        tier_assignments=None,
+        jp_signals=None,
+        trends=None,
+        era_label=era_label,
+    )
+    if window.sample_size == 0:
+        return snapshot
+
+    # Lower min tournament threshold for short post-rotation windows
+    min_tournaments = MIN_ARCHETYPE_TOURNAMENTS
+    if start_date_floor and (snapshot_date - start_date).days < 45:
+        min_tournaments = 2
+
+    snapshot.archetype_shares = window.archetype_shares(min_tournaments)
+    snapshot.card_usage = window.card_usage() or None
+    snapshot.sample_size = window.sample_size
+    snapshot.tournaments_included = [str(t) for t in window.tournament_ids]
+    return snapshot
+
+
+async def _load_contributions(
+    session: AsyncSession,
+    game_format: Literal["standard", "expanded"],
+    best_of: Literal[1, 3],
+    start_date: date,
+    end_date: date,
+) -> list[TournamentContribution]:
+    """Load and pre-aggregate every tournament in range in two queries."""
+    filters = (
+        Tournament.format == game_format,
+        Tournament.best_of == best_of,
+        Tournament.date >= start_date,
+        Tournament.date <= end_date,
+    )
+    tournament_rows = await session.execute(
+        select(Tournament.id, Tournament.date, Tournament.region, Tournament.tier)
+        .where(*filters)
+        .order_by(Tournament.date)
+    )
+    contributions = {
+        row.id: TournamentContribution(
+            tournament_id=row.id, date=row.date, region=row.region, tier=row.tier
+        )
+        for row in tournament_rows
+    }
+
+    placement_rows = await session.execute(
+        select(
+            TournamentPlacement.tournament_id,
+            TournamentPlacement.archetype,
+            TournamentPlacement.decklist,
+        ).where(
+            TournamentPlacement.format == game_format,
+            TournamentPlacement.best_of == best_of,
+            TournamentPlacement.tournament_date >= start_date,
+            TournamentPlacement.tournament_date <= end_date,
+        )
+    )
+    for row in placement_rows:
+        contribution = contributions.get(row.tournament_id)
+        if contribution is not None:
+            contribution.add_placement(row.archetype, row.decklist)
+
+    return list(contributions.values())
+
+
+async def _load_jp_format_starts(session: AsyncSession) -> list[tuple[date, str]]:
+    rows = await session.execute(
+        select(FormatConfig.start_date, FormatConfig.name).where(
+            FormatConfig.is_current.is_(True),
+            FormatConfig.start_date.is_not(None),
+        )
+    )
+    return [(row.start_date, row.name) for row in rows]
+
+
+async def backfill_meta_snapshots(
+    start_date: date,
+    end_date: date | None = None,
+    *,
+    dry_run: bool = False,
+    lookback_days: int = 90,
+    regions: list[str | None] | None = None,
+    formats: list[Literal["standard", "expanded"]] | None = None,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> BackfillMetaSnapshotsResult:
+    """Recompute enhanced meta snapshots for every date in a range.
+
+    Produces the same snapshots as ``compute_daily_snapshots`` for each
+    date (JP start-date floors included), but scans the data once and
+    writes in bulk upserts of ``batch_size`` snapshots. Trends for the
+    first week read existing snapshots from the database; later dates use
+    the snapshots computed earlier in the backfill.
+
+    Args:
+        start_date: First snapshot date to compute.
+        end_date: Last snapshot date to compute. Defaults to today.
+        dry_run: If True, compute but don't save to database.
+        lookback_days: Days to look back for tournament data.
+        regions: Override regions to compute. Defaults to all.
+        formats: Override formats to compute. Defaults to all.
+        batch_size: Snapshots per bulk upsert.
+
+    Returns:
+        BackfillMetaSnapshotsResult with stats and any errors.
+    """
+    if end_date is None:
+        end_date = date.today()
+
+    result = BackfillMetaSnapshotsResult()
+    if start_date > end_date:
+        result.errors.append(f"start_date {start_date} is after end_date {end_date}")
+        return result
+
+    started = time.perf_counter()
+    target_regions = regions if regions is not None else REGIONS
+    target_formats = formats if formats is not None else FORMATS
+    combos = plan_snapshot_combos(target_regions, target_formats)
+    planned = {combo.key for combo in combos}
+    # JP/global snapshots that JP signals need but this run does not compute
+    external_deps = {
+        dep
+        for combo in combos
+        for dep in snapshot_dependencies(combo.key)
+        if dep not in planned
+    }
+    load_from = start_date - timedelta(days=lookback_days)
+
+    logger.info(
+        "Starting meta snapshot backfill: %s..%s, combos=%d, dry_run=%s",
+        start_date,
+        end_date,
+        len(combos),
+        dry_run,
+    )
+
+    async with async_session_factory() as session:
+        service = MetaService(session)
+        windows: dict[SnapshotKey, SlidingMetaWindow] = {}
+        history: dict[date, dict[SnapshotKey, MetaSnapshot]] = {}
+
+        try:
+            for game_format, best_of in dict.fromkeys(
+                (c.game_format, c.best_of) for c in combos
+            ):
+                contributions = await _load_contributions(
+                    session, game_format, best_of, load_from, end_date
+                )
+                result.tournaments_loaded += len(contributions)
+                for combo in combos:
+                    if (combo.game_format, combo.best_of) == (game_format, best_of):
+                        windows[combo.key] = SlidingMetaWindow(
+                            (t for t in contributions if matches_combo(t, combo)),
+                            anchor=start_date,
+                        )
+
+            format_starts = (
+                await _load_jp_format_starts(session) if "JP" in target_regions else []
+            )
+
+            for offset in range(7, 0, -1):
+                previous_date = start_date - timedelta(days=offset)
+                history[previous_date] = await service.get_snapshots_for_date(
+                    previous_date
+                )
+        except SQLAlchemyError as e:
+            error_msg = f"Error loading backfill data: {e}"
+            logger.error(error_msg, exc_info=True)
+            result.errors.append(error_msg)
+            return result
+
+        pending: list[MetaSnapshot] = []
+        pending_comparisons: dict[ComparisonKey, JPMetaComparison | None] = {}
+
+        async def _flush() -> bool:
+            if not pending:
+                return True
+            if dry_run:
+                pending.clear()
+                pending_comparisons.clear()
+                return True
+            try:
+                result.snapshots_saved += await service.save_snapshots(
+                    pending, jp_comparisons=pending_comparisons
+                )
+            except SQLAlchemyError as e:
+                error_msg = (
+                    f"Error saving {len(pending)} snapshots through "
+                    f"{pending[-1].snapshot_date}: {e}"
+                )
+                logger.error(error_msg, exc_info=True)
+                result.errors.append(error_msg)
+                return False
+            finally:
+                pending.clear()
+                pending_comparisons.clear()
+            return True
+
+        snapshot_date = start_date
+        while snapshot_date <= end_date:
+            context = SnapshotContext(
+                previous=history.pop(snapshot_date - timedelta(days=7), {})
+            )
+            jp_floor, jp_era = jp_floor_for_date(
+                format_starts, snapshot_date, lookback_days
+            )
+            if external_deps:
+                try:
+                    stored = await service.get_snapshots_for_date(snapshot_date)
+                except SQLAlchemyError as e:
+                    error_msg = f"Error loading snapshots for {snapshot_date}: {e}"
+                    logger.error(error_msg, exc_info=True)
+                    result.errors.append(error_msg)
+                    break
+                context.current.update({key: stored.get(key) for key in external_deps})
+
+            for combo in combos:
+                floor = jp_floor if combo.region == "JP" else None
+                window_start = snapshot_date - timedelta(days=lookback_days)
+                if floor and window_start < floor:
+                    window_start = floor
+                window = windows[combo.key]
+                window.advance(window_start, snapshot_date)
+
+                snapshot = build_snapshot(
+                    window,
+                    combo,
+                    snapshot_date,
+                    start_date=window_start,
+                    start_date_floor=floor,
+                    era_label=jp_era if combo.region == "JP" else None,
+                )
+                snapshot = await service.enhance_snapshot(
+                    snapshot,
+                    snapshot_date=snapshot_date,
+                    region=combo.region,
+                    game_format=combo.game_format,
+                    best_of=combo.best_of,
+                    lookback_days=lookback_days,
+                    tournament_type=combo.tournament_type,
+                    context=context,
+                )
+                result.snapshots_computed += 1
+                if snapshot.sample_size == 0:
+                    result.snapshots_skipped += 1
+                else:
+                    pending.append(snapshot)
+
+            pending_comparisons.update(context.jp_comparisons)
+            history[snapshot_date] = {
+                key: snapshot
+                for key, snapshot in context.current.items()
+                if snapshot is not None
+            }
+            result.dates_processed += 1
+
+            if len(pending) >= batch_size and not await _flush():
+                break
+            snapshot_date += timedelta(days=1)
+
+        await _flush()
+
+    result.duration_seconds = round(time.perf_counter() - started, 3)
+    logger.info(
+        "Meta snapshot backfill complete: dates=%d, computed=%d, saved=%d, "
+        "skipped=%d, errors=%d, duration=%.1fs",
+        result.dates_processed,
+        result.snapshots_computed,
+        result.snapshots_saved,
+        result.snapshots_skipped,
+        len(result.errors),
+        result.duration_seconds,
+    )
+    return result
@@ -27,11 +27,15 @@ from src.services.evolution_article_generator import (
     ArticleGeneratorError,
     EvolutionArticleGenerator,
 )
+from src.services.pipeline_metrics import pipeline_step, track_pipeline
 from src.services.pipeline_resilience import retry_commit, with_timeout
 from src.services.prediction_engine import PredictionEngine, PredictionEngineError
 
 # Timeout for individual Claude API calls (seconds)
 CLAUDE_CALL_TIMEOUT = 60
+# Archetypes per tournament whose forecast Claude narrates; the rest
+# get the statistical baseline only
+NARRATED_PREDICTIONS = 8
 
 logger = logging.getLogger(__name__)
 
@@ -72,33 +76,47 @@ async def compute_evolution_intelligence(
     run_id = str(uuid4())
     _extra = {"pipeline": "compute-evolution", "run_id": run_id}
 
-    try:
-        async with ClaudeClient() as claude, async_session_factory() as session:
-            classifier = AdaptationClassifier(session, claude)
-            prediction_engine = PredictionEngine(session, claude)
-            article_generator = EvolutionArticleGenerator(session, claude)
-
-            # Step 1: Classify unclassified adaptations
-            await _classify_adaptations(session, classifier, result, dry_run)
-
-            # Step 2: Generate meta context for snapshots missing it
-            await _generate_meta_contexts(session, classifier, result, dry_run)
+    async with track_pipeline(
+        "compute-evolution", run_id, None if dry_run else async_session_factory
+    ) as run:
+        try:
+            async with ClaudeClient() as claude, async_session_factory() as session:
+                classifier = AdaptationClassifier(session, claude)
+                prediction_engine = PredictionEngine(session, claude)
+                article_generator = EvolutionArticleGenerator(session, claude)
+
+                # Step 1: Classify unclassified adaptations
+                with pipeline_step("classify-adaptations"):
+                    await _classify_adaptations(session, classifier, result, dry_run)
+
+                # Step 2: Generate meta context for snapshots missing it
+                with pipeline_step("generate-meta-contexts"):
+                    await _generate_meta_contexts(session, classifier, result, dry_run)
+
+                # Step 3: Generate predictions for upcoming tournaments
+                with pipeline_step("generate-predictions"):
+                    await _generate_predictions(
+                        session, prediction_engine, result, dry_run
+                    )
 
-            # Step 3: Generate predictions for upcoming tournaments
-            await _generate_predictions(session, prediction_engine, result, dry_run)
+                # Step 4: Generate evolution articles
+                with pipeline_step("generate-articles"):
+                    await _generate_articles(
+                        session, article_generator, result, dry_run
+                    )
 
-            # Step 4: Generate evolution articles
-            await _generate_articles(session, article_generator, result, dry_run)
+        except SQLAlchemyError as e:
+            logger.error("Database error in evolution pipeline: %s", e, exc_info=True)
+            result.errors.append(f"Database error: {e}")
+        except ClaudeError as e:
+            logger.error("Claude API error in evolution pipeline: %s", e, exc_info=True)
+            result.errors.append(f"Claude API error: {e}")
+        except Exception as e:
+            logger.error("Unexpected error in evolution pipeline: %s", e, exc_info=True)
+            result.errors.append(f"Unexpected error: {e}")
 
-    except SQLAlchemyError as e:
-        logger.error("Database error in evolution pipeline: %s", e, exc_info=True)
-        result.errors.append(f"Database error: {e}")
-    except ClaudeError as e:
-        logger.error("Claude API error in evolution pipeline: %s", e, exc_info=True)
-        result.errors.append(f"Claude API error: {e}")
-    except Exception as e:
-        logger.error("Unexpected error in evolution pipeline: %s", e, exc_info=True)
-        result.errors.append(f"Unexpected error: {e}")
+        if result.errors:
+            run.fail(result.errors[0])
 
     logger.info(
         "Evolution pipeline complete: classified=%d, contexts=%d, "
@@ -200,7 +218,11 @@ async def _generate_predictions(
     result: ComputeEvolutionResult,
     dry_run: bool,
 ) -> None:
-    """Generate predictions for upcoming major tournaments."""
+    """Generate predictions for upcoming major tournaments.
+
+    Forecasts every archetype statistically per tournament, then asks
+    Claude to narrate only the ``NARRATED_PREDICTIONS`` largest forecasts.
+    """
     today = date_type.today()
     query = select(Tournament).where(
         Tournament.date > today,
@@ -244,31 +266,63 @@ async def _generate_predictions(
     )
 
     for tournament in tournaments:
-        for archetype in archetypes:
-            if (archetype, tournament.id) in existing_predictions:
+        pending = [
+            archetype
+            for archetype in archetypes
+            if (archetype, tournament.id) not in existing_predictions
+        ]
+        if not pending:
+            continue
+
+        if dry_run:
+            result.predictions_generated += len(pending)
+            continue
+
+        forecasts = await engine.forecast(tournament.date)
+        narrated = {
+            f.archetype
+            for f in sorted(
+                forecasts.values(),
+                key=lambda f: f.meta_share["mid"],
+                reverse=True,
+            )[:NARRATED_PREDICTIONS]
+        }
+
+        for archetype in pending:
+            forecast = forecasts.get(archetype)
+            if forecast is None:
+                logger.info(
+                    "No recent history to forecast %s at tournament %s",
+                    archetype,
+                    tournament.id,
+                )
                 continue
 
-            try:
-                if not dry_run:
+            prediction = None
+            if archetype in narrated:
+                try:
                     prediction = await with_timeout(
-                        engine.predict(archetype, tournament.id),
+                        engine.predict(archetype, tournament.id, forecast=forecast),
                         CLAUDE_CALL_TIMEOUT,
                         pipeline="compute-evolution",
                         step=f"predict-{archetype}",
                     )
-                    session.add(prediction)
-                result.predictions_generated += 1
-            except (PredictionEngineError, ClaudeError, TimeoutError) as e:
-                logger.warning(
-                    "Failed to predict %s at tournament %s: %s",
-                    archetype,
-                    tournament.id,
-                    e,
-                    exc_info=True,
-                )
-                result.errors.append(
-                    f"Prediction failed for {archetype} at {tournament.id}: {e}"
+                except (PredictionEngineError, ClaudeError, TimeoutError) as e:
+                    # The statistical forecast stands on its own; save it
+                    # without narration rather than skip the archetype
+                    logger.warning(
+                        "Narration failed for %s at tournament %s, saving baseline: %s",
+                        archetype,
+                        tournament.id,
+                        e,
+                        exc_info=True,
+                    )
+            if prediction is None:
+                prediction = engine.baseline_prediction(
+                    archetype, tournament.id, forecast
                 )
+            session.add(prediction)
+            result.predictions_generated += 1
 
     if not dry_run:
         await retry_commit(session, context="generate-predictions")
@@ -21,6 +21,7 @@ from src.models.jp_card_adoption_rate import JPCardAdoptionRate
 from src.models.jp_card_innovation import JPCardInnovation
 from src.models.jp_new_archetype import JPNewArchetype
 from src.models.meta_snapshot import MetaSnapshot
+from src.services.card_catalog import CatalogCard, get_card_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -208,17 +209,23 @@ async def compute_card_innovations(
         )
         return 0, 0
 
+    catalog = get_card_catalog()
     found = 0
     for rate in rates:
-        # Try to match to a Card record
-        card = None
-        if rate.card_name_en:
+        # Try to match to a Card record (in memory when the catalog is loaded)
+        card: Card | CatalogCard | None = None
+        if catalog is not None:
+            card = catalog.find_by_name(
+                rate.card_name_en
+            ) or catalog.find_by_japanese_name(rate.card_name_jp)
+
+        if not card and catalog is None and rate.card_name_en:
             card_result = await session.execute(
                 select(Card).where(Card.name == rate.card_name_en).limit(1)
             )
             card = card_result.scalar_one_or_none()
 
-        if not card and rate.card_name_jp:
+        if not card and catalog is None and rate.card_name_jp:
             card_result = await session.execute(
                 select(Card).where(Card.japanese_name == rate.card_name_jp).limit(1)
             )
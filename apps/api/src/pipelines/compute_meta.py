@@ -3,21 +3,32 @@
 Computes daily meta snapshots for all region/format/best_of combinations.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable, Coroutine
 from dataclasses import dataclass, field
-from datetime import date
-from typing import Literal
+from datetime import date, timedelta
+from graphlib import TopologicalSorter
+from typing import Any, Literal
 from uuid import uuid4
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.database import async_session_factory
-from src.models import FormatConfig
-from src.services.meta_service import MetaService
+from src.models import FormatConfig, MetaSnapshot
+from src.services.meta_service import (
+    MetaService,
+    SnapshotContext,
+    SnapshotKey,
+    snapshot_dependencies,
+)
+from src.services.pipeline_metrics import track_pipeline
 from src.services.pipeline_resilience import with_timeout
 
-SNAPSHOT_TIMEOUT = 60  # seconds per snapshot compute + save
+SNAPSHOT_TIMEOUT = 60  # seconds per snapshot compute
 
 # Tournament type variants to compute per region/format/best_of combo
 TOURNAMENT_TYPES: list[Literal["all", "official", "grassroots"]] = [
@@ -46,6 +57,22 @@ REGION_BEST_OF: dict[str | None, list[Literal[1, 3]]] = {
 }
 
 
+@dataclass
+class ComboTiming:
+    """Timing breakdown for one snapshot combo.
+
+    ``status`` is one of pending, computed (not saved: dry run), skipped
+    (no data), saved or error. ``wait_seconds`` is time spent waiting on
+    dependencies and a free session slot in concurrent mode.
+    """
+
+    combo: str
+    status: str = "pending"
+    wait_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    save_seconds: float = 0.0
+
+
 @dataclass
 class ComputeMetaResult:
     """Result of compute_meta pipeline."""
@@ -54,12 +81,278 @@ class ComputeMetaResult:
     snapshots_saved: int = 0
     snapshots_skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    combo_timings: list[ComboTiming] = field(default_factory=list)
+    duration_seconds: float = 0.0
 
     @property
     def success(self) -> bool:
         return len(self.errors) == 0
 
 
+@dataclass(frozen=True)
+class SnapshotCombo:
+    """One region × format × best_of × tournament_type snapshot to compute."""
+
+    region: str | None
+    game_format: Literal["standard", "expanded"]
+    best_of: Literal[1, 3]
+    tournament_type: Literal["all", "official", "grassroots"]
+
+    @property
+    def key(self) -> SnapshotKey:
+        return (self.region, self.game_format, self.best_of, self.tournament_type)
+
+    @property
+    def label(self) -> str:
+        return (
+            f"{self.region or 'global'}/{self.game_format}"
+            f"/BO{self.best_of}/{self.tournament_type}"
+        )
+
+
+def plan_snapshot_combos(
+    regions: list[str | None],
+    formats: list[Literal["standard", "expanded"]],
+) -> list[SnapshotCombo]:
+    """Order snapshot combos so dependencies are computed first.
+
+    Builds the dependency graph from ``snapshot_dependencies`` (JP BO1 and
+    global BO3 feed the JP signals of other BO3 snapshots) and returns a
+    topological order. Dependencies outside the requested combos are
+    ignored; those snapshots are read from the database instead. Ties keep
+    the region/format/tournament-type iteration order.
+    """
+    combos = [
+        SnapshotCombo(region, game_format, best_of, tournament_type)
+        for region in regions
+        for game_format in formats
+        for best_of in REGION_BEST_OF.get(region, [3])
+        for tournament_type in TOURNAMENT_TYPES
+    ]
+    by_key = {combo.key: combo for combo in combos}
+
+    sorter: TopologicalSorter[SnapshotKey] = TopologicalSorter()
+    for combo in combos:
+        deps = [d for d in snapshot_dependencies(combo.key) if d in by_key]
+        sorter.add(combo.key, *deps)
+
+    position = {combo.key: i for i, combo in enumerate(combos)}
+    ordered: list[SnapshotCombo] = []
+    sorter.prepare()
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready(), key=position.__getitem__)
+        ordered.extend(by_key[key] for key in ready)
+        sorter.done(*ready)
+    return ordered
+
+
+async def _derive_jp_floor(
+    session: AsyncSession,
+    snapshot_date: date,
+    lookback_days: int,
+) -> tuple[date | None, str | None]:
+    """Derive the JP start-date floor and era label from FormatConfig."""
+    try:
+        floor_cutoff = date.fromordinal(snapshot_date.toordinal() - lookback_days)
+        fc_query = (
+            select(FormatConfig)
+            .where(
+                FormatConfig.is_current.is_(True),
+                FormatConfig.start_date >= floor_cutoff,
+                FormatConfig.start_date <= snapshot_date,
+            )
+            .order_by(FormatConfig.start_date.desc())
+            .limit(1)
+        )
+        fc_result = await session.execute(fc_query)
+        fc = fc_result.scalar_one_or_none()
+        if fc:
+            era = f"post-{fc.name}"
+            logger.info(
+                "JP floor derived from FormatConfig: %s (start=%s, era=%s)",
+                fc.name,
+                fc.start_date,
+                era,
+            )
+            return fc.start_date, era
+    except Exception:
+        logger.warning(
+            "Failed to derive JP floor from FormatConfig",
+            exc_info=True,
+        )
+    return None, None
+
+
+ComputeFn = Callable[[MetaService, SnapshotCombo], Awaitable[MetaSnapshot]]
+
+# Errors recorded per combo instead of aborting the run
+COMBO_ERRORS = (SQLAlchemyError, ValueError, TypeError, TimeoutError)
+
+
+def _record_computed(
+    result: ComputeMetaResult,
+    timing: ComboTiming,
+    combo: SnapshotCombo,
+    snapshot: MetaSnapshot,
+) -> bool:
+    """Count a computed snapshot; return whether it should be saved."""
+    result.snapshots_computed += 1
+    if snapshot.sample_size == 0:
+        logger.info("Skipping empty snapshot: %s", combo.label)
+        result.snapshots_skipped += 1
+        timing.status = "skipped"
+        return False
+
+    logger.info(
+        "Computed snapshot: %s (sample_size=%d, diversity=%.4f)",
+        combo.label,
+        snapshot.sample_size,
+        float(snapshot.diversity_index or 0),
+    )
+    timing.status = "computed"
+    return True
+
+
+def _record_error(
+    result: ComputeMetaResult,
+    timing: ComboTiming,
+    message: str,
+) -> None:
+    logger.error(message, exc_info=True)
+    result.errors.append(message)
+    timing.status = "error"
+
+
+async def _run_combos_serially(
+    service: MetaService,
+    combos: list[SnapshotCombo],
+    compute: ComputeFn,
+    result: ComputeMetaResult,
+    *,
+    dry_run: bool,
+    context: SnapshotContext | None = None,
+) -> None:
+    """Compute combos one by one in a single session, then bulk-save."""
+    to_save: list[tuple[ComboTiming, MetaSnapshot]] = []
+
+    for combo in combos:
+        timing = ComboTiming(combo=combo.label)
+        result.combo_timings.append(timing)
+        started = time.perf_counter()
+        try:
+            logger.info("Computing snapshot: %s", combo.label)
+            snapshot = await compute(service, combo)
+            if _record_computed(result, timing, combo, snapshot):
+                to_save.append((timing, snapshot))
+        except COMBO_ERRORS as e:
+            _record_error(result, timing, f"Error computing {combo.label}: {e}")
+        finally:
+            timing.compute_seconds = round(time.perf_counter() - started, 3)
+
+    if not to_save:
+        return
+    if dry_run:
+        for timing, _ in to_save:
+            logger.info("DRY RUN - would save snapshot: %s", timing.combo)
+        return
+
+    started = time.perf_counter()
+    try:
+        result.snapshots_saved = await service.save_snapshots(
+            [snapshot for _, snapshot in to_save],
+            key_cards=context.key_cards if context else None,
+            jp_comparisons=context.jp_comparisons if context else None,
+        )
+        logger.info("Saved %d snapshots", result.snapshots_saved)
+        for timing, _ in to_save:
+            timing.status = "saved"
+    except SQLAlchemyError as e:
+        error_msg = f"Error saving {len(to_save)} snapshots: {e}"
+        logger.error(error_msg, exc_info=True)
+        result.errors.append(error_msg)
+        for timing, _ in to_save:
+            timing.status = "error"
+    # One shared transaction: attribute its cost evenly across combos
+    save_seconds = round((time.perf_counter() - started) / len(to_save), 3)
+    for timing, _ in to_save:
+        timing.save_seconds = save_seconds
+
+
+async def _run_combos_concurrently(
+    combos: list[SnapshotCombo],
+    compute: ComputeFn,
+    result: ComputeMetaResult,
+    *,
+    dry_run: bool,
+    concurrency: int,
+    context: SnapshotContext | None = None,
+) -> None:
+    """Compute combos across a bounded pool of sessions.
+
+    Each combo waits for its in-plan dependencies, then computes and saves
+    in its own session and transaction.
+    """
+    done: dict[SnapshotKey, asyncio.Event] = {
+        combo.key: asyncio.Event() for combo in combos
+    }
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _run(combo: SnapshotCombo, timing: ComboTiming) -> None:
+        queued = time.perf_counter()
+        try:
+            for dep in snapshot_dependencies(combo.key):
+                if dep in done:
+                    await done[dep].wait()
+            async with slots:
+                timing.wait_seconds = round(time.perf_counter() - queued, 3)
+                async with async_session_factory() as session:
+                    service = MetaService(session)
+                    started = time.perf_counter()
+                    try:
+                        logger.info("Computing snapshot: %s", combo.label)
+                        snapshot = await compute(service, combo)
+                        should_save = _record_computed(result, timing, combo, snapshot)
+                    except COMBO_ERRORS as e:
+                        _record_error(
+                            result, timing, f"Error computing {combo.label}: {e}"
+                        )
+                        return
+                    finally:
+                        timing.compute_seconds = round(time.perf_counter() - started, 3)
+
+                    if not should_save:
+                        return
+                    if dry_run:
+                        logger.info("DRY RUN - would save snapshot: %s", combo.label)
+                        return
+
+                    started = time.perf_counter()
+                    try:
+                        result.snapshots_saved += await service.save_snapshots(
+                            [snapshot],
+                            key_cards=context.key_cards if context else None,
+                            jp_comparisons=(
+                                context.jp_comparisons if context else None
+                            ),
+                        )
+                        timing.status = "saved"
+                        logger.info("Saved snapshot: %s", combo.label)
+                    except SQLAlchemyError as e:
+                        _record_error(
+                            result, timing, f"Error saving {combo.label}: {e}"
+                        )
+                    finally:
+                        timing.save_seconds = round(time.perf_counter() - started, 3)
+        finally:
+            done[combo.key].set()
+
+    timings = [ComboTiming(combo=combo.label) for combo in combos]
+    result.combo_timings.extend(timings)
+    await asyncio.gather(
+        *(_run(combo, timing) for combo, timing in zip(combos, timings, strict=True))
+    )
+
+
 async def compute_daily_snapshots(
     snapshot_date: date | None = None,
     dry_run: bool = False,
@@ -67,21 +360,34 @@ async def compute_daily_snapshots(
     regions: list[str | None] | None = None,
     formats: list[Literal["standard", "expanded"]] | None = None,
     start_date_floor: date | None = None,
+    concurrency: int = 1,
 ) -> ComputeMetaResult:
     """Compute and save daily meta snapshots for all combinations.
 
     Computes enhanced meta snapshots (with diversity index, tiers, trends)
     for each region × format × best_of combination.
 
+    Combos run in dependency order (see ``plan_snapshot_combos``) and share
+    a ``SnapshotContext``: JP signals read the JP and global snapshots
+    computed earlier in the run, and trends read previous-week snapshots
+    prefetched in a single query.
+
+    With ``concurrency == 1`` all combos run in one session and are written
+    with one bulk upsert at the end. With ``concurrency > 1`` up to that
+    many combos run at once, each in its own session and transaction, so a
+    failed save does not affect other combos; a combo starts only after the
+    combos it depends on have finished.
+
     Args:
         snapshot_date: Date for the snapshot. Defaults to today.
         dry_run: If True, compute but don't save to database.
         lookback_days: Days to look back for tournament data.
         regions: Override regions to compute. Defaults to all.
         formats: Override formats to compute. Defaults to all.
+        concurrency: Maximum number of combos computed at once.
 
     Returns:
-        ComputeMetaResult with stats and any errors.
+        ComputeMetaResult with stats, per-combo timings and any errors.
     """
     if snapshot_date is None:
         snapshot_date = date.today()
@@ -92,153 +398,120 @@ async def compute_daily_snapshots(
     result = ComputeMetaResult()
     run_id = str(uuid4())
     _extra = {"pipeline": "compute-meta", "run_id": run_id}
+    run_started = time.perf_counter()
 
     logger.info(
-        "Starting daily meta computation: date=%s, dry_run=%s, lookback=%d",
+        "Starting daily meta computation: date=%s, dry_run=%s, lookback=%d, "
+        "concurrency=%d",
         snapshot_date,
         dry_run,
         lookback_days,
+        concurrency,
         extra=_extra,
     )
 
-    async with async_session_factory() as session:
-        service = MetaService(session)
-
-        for region in target_regions:
-            best_of_options = REGION_BEST_OF.get(region, [3])
+    async with track_pipeline(
+        "compute-meta", run_id, None if dry_run else async_session_factory
+    ) as run:
+        combos = plan_snapshot_combos(target_regions, target_formats)
+        context = SnapshotContext()
+
+        async with async_session_factory() as session:
+            service = MetaService(session)
+
+            try:
+                context.previous = await service.get_snapshots_for_date(
+                    snapshot_date - timedelta(days=7)
+                )
+            except SQLAlchemyError:
+                logger.warning(
+                    "Failed to prefetch previous-week snapshots; "
+                    "trends will query per combo",
+                    exc_info=True,
+                )
 
             # Auto-derive start_date_floor for JP
-            region_floor = start_date_floor
-            region_era = None
-            if region == "JP" and region_floor is None:
-                try:
-                    floor_cutoff = date.fromordinal(
-                        snapshot_date.toordinal() - lookback_days
-                    )
-                    fc_query = (
-                        select(FormatConfig)
-                        .where(
-                            FormatConfig.is_current.is_(True),
-                            FormatConfig.start_date >= floor_cutoff,
-                            FormatConfig.start_date <= snapshot_date,
-                        )
-                        .order_by(FormatConfig.start_date.desc())
-                        .limit(1)
-                    )
-                    fc_result = await session.execute(fc_query)
-                    fc = fc_result.scalar_one_or_none()
-                    if fc:
-                        region_floor = fc.start_date
-                        region_era = f"post-{fc.name}"
-                        logger.info(
-                            "JP floor derived from FormatConfig: %s (start=%s, era=%s)",
-                            fc.name,
-                            fc.start_date,
-                            region_era,
-                        )
-                except Exception:
-                    logger.warning(
-                        "Failed to derive JP floor from FormatConfig",
-                        exc_info=True,
-                    )
-
-            for game_format in target_formats:
-                for best_of in best_of_options:
-                    for tournament_type in TOURNAMENT_TYPES:
-                        combo = (
-                            f"{region or 'global'}/{game_format}"
-                            f"/BO{best_of}/{tournament_type}"
-                        )
-
-                        try:
-                            logger.info("Computing snapshot: %s", combo)
-
-                            snapshot = await with_timeout(
-                                service.compute_enhanced_meta_snapshot(
-                                    snapshot_date=snapshot_date,
-                                    region=region,
-                                    game_format=game_format,
-                                    best_of=best_of,
-                                    lookback_days=lookback_days,
-                                    start_date_floor=region_floor,
-                                    era_label=region_era,
-                                    tournament_type=tournament_type,
-                                ),
-                                SNAPSHOT_TIMEOUT,
-                                pipeline="compute-meta",
-                                step=f"compute-{combo}",
-                            )
-
-                            result.snapshots_computed += 1
-
-                            if snapshot.sample_size == 0:
-                                logger.info("Skipping empty snapshot: %s", combo)
-                                result.snapshots_skipped += 1
-                                continue
-
-                            logger.info(
-                                "Computed snapshot: %s "
-                                "(sample_size=%d, diversity=%.4f)",
-                                combo,
-                                snapshot.sample_size,
-                                float(snapshot.diversity_index or 0),
-                            )
-
-                            if not dry_run:
-                                await service.save_snapshot(snapshot)
-                                result.snapshots_saved += 1
-                                logger.info("Saved snapshot: %s", combo)
-                            else:
-                                logger.info(
-                                    "DRY RUN - would save snapshot: %s",
-                                    combo,
-                                )
-
-                        except (
-                            SQLAlchemyError,
-                            ValueError,
-                            TypeError,
-                            TimeoutError,
-                        ) as e:
-                            error_msg = f"Error computing {combo}: {e}"
-                            logger.error(error_msg, exc_info=True)
-                            result.errors.append(error_msg)
-
-    logger.info(
-        "Meta computation complete: computed=%d, saved=%d, skipped=%d, errors=%d",
-        result.snapshots_computed,
-        result.snapshots_saved,
-        result.snapshots_skipped,
-        len(result.errors),
-        extra=_extra,
-    )
-
-    # Tail step: compute JP intelligence (non-fatal)
-    if not dry_run:
-        try:
-            from src.pipelines.compute_jp_intelligence import (
-                compute_jp_intelligence,
-            )
-
-            jp_result = await compute_jp_intelligence(dry_run=False)
-            logger.info(
-                "JP intelligence tail step: archetypes=%d/%d, "
-                "innovations=%d/%d, errors=%d",
-                jp_result.new_archetypes_found,
-                jp_result.new_archetypes_removed,
-                jp_result.innovations_found,
-                jp_result.innovations_removed,
-                len(jp_result.errors),
-                extra=_extra,
-            )
-        except Exception:
-            logger.warning(
-                "JP intelligence tail step failed (non-fatal)",
-                exc_info=True,
-                extra=_extra,
-            )
-
-    return result
+            jp_floor: date | None = start_date_floor
+            jp_era: str | None = None
+            if "JP" in target_regions and start_date_floor is None:
+                jp_floor, jp_era = await _derive_jp_floor(
+                    session, snapshot_date, lookback_days
+                )
+
+            def _compute(
+                service: MetaService, combo: SnapshotCombo
+            ) -> Coroutine[Any, Any, MetaSnapshot]:
+                is_jp = combo.region == "JP"
+                return with_timeout(
+                    service.compute_enhanced_meta_snapshot(
+                        snapshot_date=snapshot_date,
+                        region=combo.region,
+                        game_format=combo.game_format,
+                        best_of=combo.best_of,
+                        lookback_days=lookback_days,
+                        start_date_floor=jp_floor if is_jp else start_date_floor,
+                        era_label=jp_era if is_jp else None,
+                        tournament_type=combo.tournament_type,
+                        context=context,
+                    ),
+                    SNAPSHOT_TIMEOUT,
+                    pipeline="compute-meta",
+                    step=f"compute-{combo.label}",
+                )
+
+            if concurrency > 1:
+                await _run_combos_concurrently(
+                    combos,
+                    _compute,
+                    result,
+                    dry_run=dry_run,
+                    concurrency=concurrency,
+                    context=context,
+                )
+            else:
+                await _run_combos_serially(
+                    service, combos, _compute, result, dry_run=dry_run, context=context
+                )
+
+        result.duration_seconds = round(time.perf_counter() - run_started, 3)
+        if result.errors:
+            run.fail("; ".join(result.errors))
+
+        logger.info(
+            "Meta computation complete: computed=%d, saved=%d, skipped=%d, errors=%d",
+            result.snapshots_computed,
+            result.snapshots_saved,
+            result.snapshots_skipped,
+            len(result.errors),
+            extra=_extra,
+        )
+
+        # Tail step: compute JP intelligence (non-fatal)
+        if not dry_run:
+            try:
+                from src.pipelines.compute_jp_intelligence import (
+                    compute_jp_intelligence,
+                )
+
+                jp_result = await compute_jp_intelligence(dry_run=False)
+                logger.info(
+                    "JP intelligence tail step: archetypes=%d/%d, "
+                    "innovations=%d/%d, errors=%d",
+                    jp_result.new_archetypes_found,
+                    jp_result.new_archetypes_removed,
+                    jp_result.innovations_found,
+                    jp_result.innovations_removed,
+                    len(jp_result.errors),
+                    extra=_extra,
+                )
+            except Exception:
+                logger.warning(
+                    "JP intelligence tail step failed (non-fatal)",
+                    exc_info=True,
+                    extra=_extra,
+                )
+
+        return result
 
 
 async def compute_single_snapshot(
@@ -0,0 +1,286 @@
+"""Rotation impact pipeline.
+
+Rates how every recent archetype survives a format transition:
+- Rotating cards: names with no printing legal in the target format,
+  derived from card regulation marks, set codes and legalities
+- Survival: each archetype's decklists evaluated against those cards
+
+Only computed columns are written; manual analysis and JP evidence on
+existing RotationImpact rows are kept. Archetypes with too few lists to
+rate are not saved, and computed rows of archetypes no longer played are
+removed unless they carry analysis. The pipeline is cheap enough to
+rerun whenever placeholder cards or legalities change.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data.signature_cards import SIGNATURE_CARDS
+from src.db.database import async_session_factory
+from src.models.card import Card
+from src.models.format_config import FormatConfig
+from src.models.placeholder_card import PlaceholderCard
+from src.models.rotation_impact import RotationImpact
+from src.models.tournament_placement import TournamentPlacement
+from src.services.pipeline_metrics import pipeline_step, track_pipeline
+from src.services.rotation_engine import (
+    MIN_DECKLISTS,
+    ArchetypeRotation,
+    CardLegalityRow,
+    archetype_slug,
+    build_legality_index,
+    evaluate_archetypes,
+    legal_regulation_marks,
+    signature_masks,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKBACK_DAYS = 90
+# Column width of RotationImpact archetype_id/archetype_name
+_ARCHETYPE_MAX_LENGTH = 100
+
+
+@dataclass
+class ComputeRotationImpactResult:
+    """Result of rotation impact computation."""
+
+    format_transition: str | None = None
+    rotating_cards: int = 0
+    decklists_evaluated: int = 0
+    archetypes_evaluated: int = 0
+    impacts_saved: int = 0
+    impacts_removed: int = 0
+    ratings: dict[str, int] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+
+async def _resolve_formats(
+    session: AsyncSession,
+    from_format: str | None,
+    to_format: str | None,
+) -> tuple[FormatConfig | None, FormatConfig | None]:
+    """Look up the transition's formats, defaulting to current -> upcoming."""
+    if from_format:
+        from_query = select(FormatConfig).where(FormatConfig.name == from_format)
+    else:
+        from_query = select(FormatConfig).where(FormatConfig.is_current.is_(True))
+    if to_format:
+        to_query = select(FormatConfig).where(FormatConfig.name == to_format)
+    else:
+        to_query = select(FormatConfig).where(FormatConfig.is_upcoming.is_(True))
+
+    source = (await session.execute(from_query.limit(1))).scalar_one_or_none()
+    target = (await session.execute(to_query.limit(1))).scalar_one_or_none()
+    return source, target
+
+
+async def _load_cards(session: AsyncSession) -> list[CardLegalityRow]:
+    rows = await session.execute(
+        select(
+            Card.id,
+            Card.name,
+            Card.limitless_id,
+            Card.regulation_mark,
+            Card.legalities,
+        )
+    )
+    return [CardLegalityRow(*row) for row in rows.all()]
+
+
+async def _load_placeholder_names(session: AsyncSession) -> list[str]:
+    rows = await session.execute(
+        select(PlaceholderCard.name_en).where(PlaceholderCard.is_unreleased.is_(True))
+    )
+    return [name for name in rows.scalars().all() if name]
+
+
+async def _load_decklists(
+    session: AsyncSession, since: date
+) -> list[tuple[str, list[dict] | None]]:
+    """(archetype, decklist) of recent international BO3 standard lists."""
+    rows = await session.execute(
+        select(TournamentPlacement.archetype, TournamentPlacement.decklist).where(
+            TournamentPlacement.tournament_date >= since,
+            TournamentPlacement.format == "standard",
+            TournamentPlacement.best_of == 3,
+            TournamentPlacement.decklist.is_not(None),
+        )
+    )
+    return [(archetype, decklist) for archetype, decklist in rows.all()]
+
+
+async def _save_impacts(
+    session: AsyncSession,
+    transition: str,
+    evaluations: list[ArchetypeRotation],
+) -> tuple[int, int]:
+    """Upsert computed columns, keeping manual analysis and JP evidence.
+
+    Returns:
+        (saved, removed): rows upserted, and stale computed rows deleted.
+    """
+    values = []
+    seen: set[str] = set()
+    for evaluation in evaluations:
+        # One-off rogue lists would only add "unknown" rows to the listing
+        if evaluation.decklists < MIN_DECKLISTS:
+            continue
+        archetype_id = archetype_slug(evaluation.archetype)[:_ARCHETYPE_MAX_LENGTH]
+        if not archetype_id or archetype_id in seen:
+            continue
+        seen.add(archetype_id)
+        values.append(
+            {
+                "id": uuid4(),
+                "format_transition": transition,
+                "archetype_id": archetype_id,
+                "archetype_name": evaluation.archetype[:_ARCHETYPE_MAX_LENGTH],
+                "survival_rating": evaluation.survival_rating,
+                "rotating_cards": evaluation.rotating_cards,
+            }
+        )
+    if not values:
+        # No rateable archetypes means missing data, not an empty meta
+        return 0, 0
+
+    stmt = pg_insert(RotationImpact).values(values)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_rotation_impact",
+        set_={
+            "archetype_name": stmt.excluded.archetype_name,
+            "survival_rating": stmt.excluded.survival_rating,
+            "rotating_cards": stmt.excluded.rotating_cards,
+        },
+    )
+    await session.execute(stmt)
+
+    removed = await session.execute(
+        delete(RotationImpact)
+        .where(
+            RotationImpact.format_transition == transition,
+            RotationImpact.archetype_id.not_in(seen),
+            RotationImpact.analysis.is_(None),
+            RotationImpact.jp_evidence.is_(None),
+        )
+        .returning(RotationImpact.id)
+    )
+    return len(values), len(removed.all())
+
+
+async def compute_rotation_impact(
+    from_format: str | None = None,
+    to_format: str | None = None,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+    dry_run: bool = False,
+) -> ComputeRotationImpactResult:
+    """Compute RotationImpact rows for a format transition.
+
+    Args:
+        from_format: Format rotating away; defaults to the current format.
+        to_format: Format rotating in; defaults to the upcoming format.
+        lookback_days: Days of placements whose decklists are evaluated.
+        dry_run: If True, evaluate but don't persist.
+
+    Returns:
+        ComputeRotationImpactResult with statistics.
+    """
+    result = ComputeRotationImpactResult()
+
+    async with (
+        track_pipeline(
+            "compute-rotation-impact",
+            str(uuid4()),
+            None if dry_run else async_session_factory,
+        ) as run,
+        async_session_factory() as session,
+    ):
+        try:
+            source, target = await _resolve_formats(session, from_format, to_format)
+            if source is None or target is None:
+                msg = (
+                    "Format transition not found: "
+                    f"from={from_format or 'current'}, to={to_format or 'upcoming'}"
+                )
+                logger.warning(msg)
+                result.errors.append(msg)
+                run.fail(msg)
+                return result
+
+            transition = f"{source.name}-to-{target.name}"
+            result.format_transition = transition
+            rotating_sets = (target.rotation_details or {}).get(
+                "rotating_out_sets"
+            ) or sorted(set(source.legal_sets) - set(target.legal_sets))
+
+            with pipeline_step("build-legality-index"):
+                cards = await _load_cards(session)
+                marks = legal_regulation_marks(cards, target.legal_sets, rotating_sets)
+                index = build_legality_index(
+                    cards,
+                    target.legal_sets,
+                    marks,
+                    await _load_placeholder_names(session),
+                )
+            result.rotating_cards = index.rotating_count
+
+            with pipeline_step("load-decklists"):
+                since = date.today() - timedelta(days=lookback_days)
+                if source.start_date and source.start_date > since:
+                    since = source.start_date
+                rows = await _load_decklists(session, since)
+            result.decklists_evaluated = sum(1 for _, decklist in rows if decklist)
+
+            with pipeline_step("evaluate-archetypes"):
+                evaluations = evaluate_archetypes(
+                    rows, index, signature_masks(SIGNATURE_CARDS, index)
+                )
+            result.archetypes_evaluated = len(evaluations)
+            for evaluation in evaluations:
+                rating = evaluation.survival_rating
+                result.ratings[rating] = result.ratings.get(rating, 0) + 1
+
+            if dry_run:
+                logger.info(
+                    "DRY RUN: Would save %d rotation impacts for %s",
+                    len(evaluations),
+                    transition,
+                )
+                return result
+
+            with pipeline_step("save-impacts"):
+                (
+                    result.impacts_saved,
+                    result.impacts_removed,
+                ) = await _save_impacts(session, transition, evaluations)
+                await session.commit()
+        except Exception as e:
+            msg = f"Error computing rotation impact: {e}"
+            logger.error(msg, exc_info=True)
+            result.errors.append(msg)
+            run.fail(msg)
+
+    logger.info(
+        "Rotation impact complete: transition=%s, rotating_cards=%d, "
+        "decklists=%d, archetypes=%d, saved=%d, removed=%d, ratings=%s, "
+        "errors=%d",
+        result.format_transition,
+        result.rotating_cards,
+        result.decklists_evaluated,
+        result.archetypes_evaluated,
+        result.impacts_saved,
+        result.impacts_removed,
+        result.ratings,
+        len(result.errors),
+    )
+    return result
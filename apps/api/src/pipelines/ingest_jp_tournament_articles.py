@@ -18,6 +18,7 @@ from src.clients.pokekameshi import (
 )
 from src.db.database import async_session_factory
 from src.models import Tournament, TournamentPlacement
+from src.models.tournament_placement import tournament_columns
 from src.services.archetype_normalizer import ArchetypeNormalizer
 
 logger = logging.getLogger(__name__)
@@ -189,6 +190,7 @@ async def _persist_tournament(
         placement = TournamentPlacement(
             id=uuid4(),
             tournament_id=tournament_id,
+            **tournament_columns(tournament),
             placement=p_data["placement"],
             player_name=p_data.get("player_name"),
             archetype=archetype,
@@ -1,17 +1,58 @@
-"""Pipeline to prune tournaments before a cutoff date."""
+"""Pipeline to prune tournaments before a cutoff date.
 
+Tournaments are pruned oldest first in batches of ``batch_size``: each
+batch deletes its placements and then its tournaments and commits on its
+own, so locks and WAL stay bounded however wide the date range is. A run
+that exceeds ``time_budget_seconds`` stops between batches with
+``completed=False``; pruned rows are gone, so calling again with the same
+arguments resumes where it stopped.
+
+With ``archive``, each batch is first written to ``prune_archive_bucket``
+as one gzip-compressed NDJSON object, a line per tournament holding its
+row and its placement rows, for historical reprocessing. Objects are
+named after the batch's first tournament, so a batch retried after an
+interruption overwrites its own object instead of duplicating it.
+
+When tournament_placements is partitioned by month and the prune covers
+every region, whole months before the cutoff are dropped as partitions:
+up front when nothing is archived, or once the batches have emptied them
+when it is. Placements in dropped months count toward
+``placements_dropped`` and the run's throughput. Each run also creates
+the partitions for the year ahead.
+"""
+
+import asyncio
+import gzip
+import json
 import logging
-from datetime import date
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
 
 from pydantic import BaseModel
 from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import get_settings
 from src.db.database import async_session_factory
 from src.models.tournament import Tournament
 from src.models.tournament_placement import TournamentPlacement
+from src.services.placement_partitions import (
+    drop_month_partitions,
+    ensure_month_partitions,
+)
+from src.services.storage_service import StorageService
 
 logger = logging.getLogger(__name__)
 
+# How far ahead of today monthly placement partitions are kept
+PARTITION_LOOKAHEAD = timedelta(days=365)
+
+# Tournaments deleted (and archived) per transaction
+PRUNE_BATCH_SIZE = 100
+
 
 class PruneTournamentsResult(BaseModel):
     tournaments_deleted: int
@@ -19,6 +60,62 @@ class PruneTournamentsResult(BaseModel):
     tournaments_remaining: int
     errors: list[str]
     success: bool
+    batches: int = 0
+    partitions_dropped: list[str] = []
+    placements_dropped: int = 0
+    archived_objects: list[str] = []
+    completed: bool = True
+    duration_seconds: float = 0.0
+    placements_per_second: float = 0.0
+
+
+def archive_blob_path(
+    before_date: date, region: str | None, first: dict[str, Any]
+) -> str:
+    """Archive object for the batch starting at tournament row ``first``."""
+    return (
+        f"prune-archive/before-{before_date}/{region or 'all'}/"
+        f"{first['date']}-{first['id']}.ndjson.gz"
+    )
+
+
+async def _archive_batch(
+    session: AsyncSession,
+    bucket: str,
+    blob_path: str,
+    tournaments: list[dict[str, Any]],
+    ids: list[UUID],
+    before_date: date,
+) -> None:
+    """Upload a batch's tournaments and placements as gzip NDJSON."""
+    result = await session.execute(
+        select(TournamentPlacement.__table__).where(
+            TournamentPlacement.tournament_id.in_(ids),
+            TournamentPlacement.tournament_date < before_date,
+        )
+    )
+    placements: dict[UUID, list[dict[str, Any]]] = defaultdict(list)
+    for row in result.mappings():
+        placements[row["tournament_id"]].append(dict(row))
+
+    body = "".join(
+        json.dumps(
+            {"tournament": t, "placements": placements[t["id"]]},
+            default=str,
+        )
+        + "\n"
+        for t in tournaments
+    )
+    data = await asyncio.to_thread(gzip.compress, body.encode())
+    await StorageService(bucket).upload_ndjson(data, blob_path)
+
+
+async def _count_remaining(session: AsyncSession, region: str | None) -> int:
+    remaining_q = select(func.count()).select_from(Tournament)
+    if region:
+        remaining_q = remaining_q.where(Tournament.region == region)
+    result = await session.execute(remaining_q)
+    return result.scalar() or 0
 
 
 async def prune_tournaments(
@@ -26,103 +123,193 @@ async def prune_tournaments(
     before_date: date,
     region: str | None = None,
     dry_run: bool = False,
+    archive: bool = False,
+    batch_size: int = PRUNE_BATCH_SIZE,
+    time_budget_seconds: float | None = None,
 ) -> PruneTournamentsResult:
-    """Delete tournaments (and their placements) before a cutoff date."""
-    errors: list[str] = []
+    """Delete tournaments (and their placements) before a cutoff date.
+
+    Args:
+        before_date: Prune tournaments dated before this day.
+        region: Only prune this region; None prunes every region.
+        dry_run: Count what would be pruned without deleting anything.
+        archive: Upload each batch to ``prune_archive_bucket`` before
+            deleting it.
+        batch_size: Tournaments per batch and transaction.
+        time_budget_seconds: Stop starting new batches after this long.
+
+    Returns:
+        PruneTournamentsResult with counts and throughput for this call.
+    """
+    started = time.perf_counter()
+
+    # Build filter
+    filters = [Tournament.date < before_date]
+    if region:
+        filters.append(Tournament.region == region)
 
     async with async_session_factory() as session:
-        try:
-            # Build filter
-            filters = [Tournament.date < before_date]
-            if region:
-                filters.append(Tournament.region == region)
-
-            # Count what we'll delete
-            count_q = select(func.count()).select_from(Tournament).where(*filters)
-            result = await session.execute(count_q)
-            tournaments_to_delete = result.scalar() or 0
-
-            # Count placements that will cascade
-            placement_count_q = (
-                select(func.count())
-                .select_from(TournamentPlacement)
-                .join(Tournament)
-                .where(*filters)
-            )
-            result = await session.execute(placement_count_q)
-            placements_to_delete = result.scalar() or 0
-
-            logger.info(
-                "Pruning %d tournaments (%d placements) before %s%s",
-                tournaments_to_delete,
-                placements_to_delete,
-                before_date,
-                f" region={region}" if region else "",
-            )
+        if dry_run:
+            try:
+                # Count what we'll delete
+                count_q = select(func.count()).select_from(Tournament).where(*filters)
+                counted = await session.execute(count_q)
+                tournaments_to_delete = counted.scalar() or 0
 
-            if dry_run:
-                remaining_q = select(func.count()).select_from(Tournament)
+                placement_filters = [TournamentPlacement.tournament_date < before_date]
                 if region:
-                    remaining_q = remaining_q.where(Tournament.region == region)
-                result = await session.execute(remaining_q)
-                total = result.scalar() or 0
-                remaining = total - tournaments_to_delete
+                    placement_filters.append(TournamentPlacement.region == region)
+                placement_count_q = (
+                    select(func.count())
+                    .select_from(TournamentPlacement)
+                    .where(*placement_filters)
+                )
+                counted = await session.execute(placement_count_q)
+                placements_to_delete = counted.scalar() or 0
 
+                logger.info(
+                    "Would prune %d tournaments (%d placements) before %s%s",
+                    tournaments_to_delete,
+                    placements_to_delete,
+                    before_date,
+                    f" region={region}" if region else "",
+                )
+
+                total = await _count_remaining(session, region)
                 return PruneTournamentsResult(
                     tournaments_deleted=0,
                     placements_deleted=0,
-                    tournaments_remaining=remaining,
+                    tournaments_remaining=total - tournaments_to_delete,
                     errors=[],
                     success=True,
                 )
-
-            # Delete placements first (explicit, avoids relying on CASCADE)
-            del_placements = delete(TournamentPlacement).where(
-                TournamentPlacement.tournament_id.in_(
-                    select(Tournament.id).where(*filters)
+            except Exception as e:
+                msg = f"Prune failed: {e}"
+                logger.exception(msg)
+                return PruneTournamentsResult(
+                    tournaments_deleted=0,
+                    placements_deleted=0,
+                    tournaments_remaining=0,
+                    errors=[msg],
+                    success=False,
                 )
+
+        bucket = get_settings().prune_archive_bucket
+        if archive and not bucket:
+            return PruneTournamentsResult(
+                tournaments_deleted=0,
+                placements_deleted=0,
+                tournaments_remaining=0,
+                errors=["Archive requested but PRUNE_ARCHIVE_BUCKET is not set"],
+                success=False,
             )
-            await session.execute(del_placements)
-            placements_deleted = placements_to_delete
 
-            # Delete tournaments
-            del_tournaments = delete(Tournament).where(*filters)
-            await session.execute(del_tournaments)
-            tournaments_deleted = tournaments_to_delete
+        result = PruneTournamentsResult(
+            tournaments_deleted=0,
+            placements_deleted=0,
+            tournaments_remaining=0,
+            errors=[],
+            success=False,
+            completed=False,
+        )
+        try:
+            # Partitions span every region, so only an all-region prune
+            # can drop whole months
+            if not region and not archive:
+                dropped = await drop_month_partitions(session, before_date)
+                result.partitions_dropped = list(dropped)
+                result.placements_dropped = sum(dropped.values())
+                await session.commit()
 
-            await session.commit()
+            while True:
+                batch_q = (
+                    select(Tournament.__table__)
+                    .where(*filters)
+                    .order_by(Tournament.date, Tournament.id)
+                    .limit(batch_size)
+                )
+                tournaments = [
+                    dict(row) for row in (await session.execute(batch_q)).mappings()
+                ]
+                if not tournaments:
+                    result.completed = True
+                    break
+                ids = [t["id"] for t in tournaments]
 
-            # Count remaining
-            remaining_q = select(func.count()).select_from(Tournament)
-            if region:
-                remaining_q = remaining_q.where(Tournament.region == region)
-            result = await session.execute(remaining_q)
-            remaining = result.scalar() or 0
-
-            logger.info(
-                "Pruned %d tournaments (%d placements), %d remaining",
-                tournaments_deleted,
-                placements_deleted,
-                remaining,
-            )
+                if archive and bucket:
+                    blob_path = archive_blob_path(before_date, region, tournaments[0])
+                    await _archive_batch(
+                        session, bucket, blob_path, tournaments, ids, before_date
+                    )
+                    result.archived_objects.append(blob_path)
 
-            return PruneTournamentsResult(
-                tournaments_deleted=tournaments_deleted,
-                placements_deleted=placements_deleted,
-                tournaments_remaining=remaining,
-                errors=[],
-                success=True,
-            )
+                # Delete placements first (explicit, avoids relying on
+                # CASCADE); the date bound lets Postgres prune partitions
+                deleted = await session.execute(
+                    delete(TournamentPlacement)
+                    .where(
+                        TournamentPlacement.tournament_id.in_(ids),
+                        TournamentPlacement.tournament_date < before_date,
+                    )
+                    .returning(TournamentPlacement.id)
+                )
+                placements_deleted = len(deleted.all())
+                await session.execute(delete(Tournament).where(Tournament.id.in_(ids)))
+                await session.commit()
+
+                result.batches += 1
+                result.tournaments_deleted += len(ids)
+                result.placements_deleted += placements_deleted
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    "Pruned batch %d through %s: %d tournaments, "
+                    "%d placements (%.0f placements/s)",
+                    result.batches,
+                    tournaments[-1]["date"],
+                    result.tournaments_deleted,
+                    result.placements_deleted,
+                    (result.placements_deleted + result.placements_dropped) / elapsed
+                    if elapsed
+                    else 0.0,
+                )
+
+                if time_budget_seconds is not None and elapsed >= time_budget_seconds:
+                    break
+
+            if result.completed and not region and archive:
+                # Batches have archived and emptied these months
+                dropped = await drop_month_partitions(session, before_date)
+                result.partitions_dropped = list(dropped)
+                result.placements_dropped = sum(dropped.values())
+            await ensure_month_partitions(session, date.today() + PARTITION_LOOKAHEAD)
+            await session.commit()
+
+            result.tournaments_remaining = await _count_remaining(session, region)
+            result.success = True
 
         except Exception as e:
             await session.rollback()
             msg = f"Prune failed: {e}"
             logger.exception(msg)
-            errors.append(msg)
-            return PruneTournamentsResult(
-                tournaments_deleted=0,
-                placements_deleted=0,
-                tournaments_remaining=0,
-                errors=errors,
-                success=False,
-            )
+            result.errors.append(msg)
+            result.completed = False
+
+    result.duration_seconds = round(time.perf_counter() - started, 3)
+    if result.duration_seconds:
+        result.placements_per_second = round(
+            (result.placements_deleted + result.placements_dropped)
+            / result.duration_seconds,
+            1,
+        )
+    logger.info(
+        "Pruned %d tournaments (%d placements, %d in dropped partitions) "
+        "in %d batches, %.1fs, %d remaining%s",
+        result.tournaments_deleted,
+        result.placements_deleted,
+        result.placements_dropped,
+        result.batches,
+        result.duration_seconds,
+        result.tournaments_remaining,
+        "" if result.completed else " (incomplete, rerun to resume)",
+    )
+    return result
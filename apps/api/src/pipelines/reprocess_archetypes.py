@@ -1,18 +1,46 @@
-"""Reprocess archetype labels for existing tournament placements."""
+"""Reprocess archetype labels for existing tournament placements.
 
+Two entry points:
+
+- ``reprocess_archetypes``: one cursor page per call, for Cloud Tasks
+  orchestration.
+- ``run_reprocess_job``: a resumable set-based job. It streams placement
+  tuples through a server-side cursor, resolves chunks in process (or in a
+  process pool from the CLI), writes each chunk's changes with one
+  ``UPDATE ... FROM (VALUES ...)`` and checkpoints progress in
+  ``archetype_reprocess_checkpoints`` in the same transaction.
+
+Two runs of the same job key may be triggered at once. Loading the
+checkpoint takes a transaction-scoped advisory lock on the key, and each
+chunk locks the checkpoint row and checks that no other run advanced it
+since; the run that finds it moved stops with an error.
+"""
+
+import asyncio
 import logging
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import String, Text, Uuid, column, func, select, update, values
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.database import async_session_factory
-from src.models.tournament import Tournament
+from src.models.archetype_reprocess_checkpoint import ArchetypeReprocessCheckpoint
 from src.models.tournament_placement import TournamentPlacement
 from src.services.archetype_normalizer import ArchetypeNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Placements per streamed chunk, resolve task and UPDATE statement
+REPROCESS_CHUNK_SIZE = 1000
+
 
 @dataclass
 class ReprocessArchetypesResult:
@@ -64,11 +92,7 @@ async def reprocess_archetypes(
         await normalizer.load_db_sprites(session)
 
         # Build query for placements to process
-        query = (
-            select(TournamentPlacement)
-            .join(Tournament)
-            .where(Tournament.region == region)
-        )
+        query = select(TournamentPlacement).where(TournamentPlacement.region == region)
 
         if not force:
             query = query.where(
@@ -91,8 +115,7 @@ async def reprocess_archetypes(
         count_query = (
             select(func.count())
             .select_from(TournamentPlacement)
-            .join(Tournament)
-            .where(Tournament.region == region)
+            .where(TournamentPlacement.region == region)
         )
         if not force:
             count_query = count_query.where(
@@ -164,3 +187,349 @@ async def reprocess_archetypes(
             result.total_remaining = remaining
 
     return result
+
+
+# --- Set-based resumable job ---
+
+# (id, raw_archetype_sprites, raw_archetype, archetype,
+#  archetype_detection_method, decklist)
+ReprocessRow = tuple[
+    UUID, list[str] | None, str | None, str, str | None, list[dict] | None
+]
+
+
+@dataclass
+class ReprocessJobResult:
+    """Result of a run_reprocess_job invocation."""
+
+    job_key: str
+    processed: int = 0
+    updated: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    resumed_from: str | None = None
+    completed: bool = False
+    errors: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+
+class ReprocessJobConflictError(Exception):
+    """Another run of the same job advanced the checkpoint."""
+
+
+@dataclass
+class ResolvedChunk:
+    """Outcome of resolving one chunk of placements."""
+
+    last_id: UUID
+    processed: int
+    skipped: int
+    # (placement_id, archetype, detection_method)
+    changes: list[tuple[UUID, str, str]]
+
+
+def resolve_chunk(
+    normalizer: ArchetypeNormalizer, rows: Sequence[ReprocessRow]
+) -> ResolvedChunk:
+    """Resolve a chunk of placements, keeping only changed rows.
+
+    Same rules as ``reprocess_archetypes``: placements without stored
+    sprites are skipped.
+    """
+    with_sprites = [row for row in rows if row[1]]
+    resolved = normalizer.resolve_batch(
+        [
+            (sprites or [], raw_archetype or archetype, decklist)
+            for _id, sprites, raw_archetype, archetype, _method, decklist in (
+                with_sprites
+            )
+        ]
+    )
+    changes: list[tuple[UUID, str, str]] = [
+        (row[0], new_archetype, new_method)
+        for row, (new_archetype, _raw, new_method) in zip(
+            with_sprites, resolved, strict=True
+        )
+        if new_archetype != row[3] or new_method != row[4]
+    ]
+    skipped = len(rows) - len(changes)
+    return ResolvedChunk(
+        last_id=rows[-1][0],
+        processed=len(rows),
+        skipped=skipped,
+        changes=changes,
+    )
+
+
+_worker_normalizer: ArchetypeNormalizer | None = None
+
+
+def _init_worker(sprite_map: dict[str, str]) -> None:
+    global _worker_normalizer
+    _worker_normalizer = ArchetypeNormalizer(sprite_map=sprite_map)
+
+
+def _resolve_in_worker(rows: list[ReprocessRow]) -> ResolvedChunk:
+    assert _worker_normalizer is not None, "worker not initialized"
+    return resolve_chunk(_worker_normalizer, rows)
+
+
+def bulk_update_statement(changes: Sequence[tuple[UUID, str, str]]) -> Any:
+    """``UPDATE tournament_placements ... FROM (VALUES ...)`` for changes."""
+    changed = values(
+        column("id", Uuid),
+        column("archetype", String),
+        column("method", Text),
+        name="changed",
+    ).data(list(changes))
+    return (
+        update(TournamentPlacement)
+        .where(TournamentPlacement.id == changed.c.id)
+        .values(
+            archetype=changed.c.archetype,
+            archetype_detection_method=changed.c.method,
+        )
+    )
+
+
+def reprocess_job_key(region: str, force: bool) -> str:
+    """Default checkpoint key: one job per region and mode."""
+    return f"reprocess-archetypes:{region}:{'force' if force else 'missing'}"
+
+
+async def _load_checkpoint(
+    session: AsyncSession,
+    job_key: str,
+    region: str,
+    force: bool,
+    restart: bool,
+    lock: bool = True,
+) -> ArchetypeReprocessCheckpoint:
+    """Fetch the job checkpoint, resetting it for a fresh pass if needed.
+
+    A completed checkpoint (or ``restart``) starts a new pass from the
+    first placement. With ``lock``, concurrent loads of the same key are
+    serialized until this transaction ends, covering a row not yet created.
+    """
+    if lock:
+        await session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(job_key)))
+        )
+    result = await session.execute(
+        select(ArchetypeReprocessCheckpoint).where(
+            ArchetypeReprocessCheckpoint.job_key == job_key
+        )
+    )
+    checkpoint = result.scalar_one_or_none()
+    if checkpoint is None:
+        checkpoint = ArchetypeReprocessCheckpoint(job_key=job_key)
+        session.add(checkpoint)
+        restart = True
+    elif checkpoint.status == "completed":
+        restart = True
+
+    checkpoint.region = region
+    checkpoint.force = force
+    if restart:
+        checkpoint.status = "running"
+        checkpoint.last_placement_id = None
+        checkpoint.processed = 0
+        checkpoint.updated = 0
+        checkpoint.skipped = 0
+        checkpoint.completed_at = None
+    return checkpoint
+
+
+async def _claim_checkpoint(
+    session: AsyncSession, job_key: str, expected_last_id: UUID | None
+) -> None:
+    """Lock the checkpoint row and check it is still where this run left it.
+
+    Raises:
+        ReprocessJobConflictError: If another run advanced or reset it.
+    """
+    current = await session.scalar(
+        select(ArchetypeReprocessCheckpoint.last_placement_id)
+        .where(ArchetypeReprocessCheckpoint.job_key == job_key)
+        .with_for_update()
+    )
+    if current != expected_last_id:
+        raise ReprocessJobConflictError(
+            f"Checkpoint {job_key} was moved by another run "
+            f"(expected {expected_last_id}, found {current})"
+        )
+
+
+async def run_reprocess_job(
+    region: str = "JP",
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    job_key: str | None = None,
+    restart: bool = False,
+    chunk_size: int = REPROCESS_CHUNK_SIZE,
+    workers: int = 1,
+    time_budget_seconds: float | None = None,
+) -> ReprocessJobResult:
+    """Reprocess archetype labels for all matching placements, resumably.
+
+    Streams placement tuples in id order through a server-side cursor on
+    a read session. Chunks are resolved inline, or in a process pool when
+    ``workers > 1`` (meant for the CLI; the API process should not fork),
+    and applied in order on a separate write session: one bulk UPDATE plus
+    the checkpoint per chunk, committed together. A call that
+    runs out of ``time_budget_seconds`` stops after the chunks in flight;
+    the next call with the same key resumes from the checkpoint.
+
+    Args:
+        region: Tournament region to reprocess.
+        force: If True, include placements with a detection method.
+        dry_run: If True, resolve but write neither updates nor checkpoint.
+        job_key: Checkpoint key. Defaults to ``reprocess_job_key``.
+        restart: Discard the checkpoint and start from the first placement.
+        chunk_size: Placements per chunk.
+        workers: Resolver processes; 1 resolves in the event loop process.
+        time_budget_seconds: Stop reading new chunks after this long.
+
+    Returns:
+        ReprocessJobResult with counts for this invocation.
+    """
+    started = time.perf_counter()
+    result = ReprocessJobResult(job_key=job_key or reprocess_job_key(region, force))
+
+    async with async_session_factory() as reader, async_session_factory() as writer:
+        normalizer = ArchetypeNormalizer()
+        await normalizer.load_db_sprites(reader)
+
+        try:
+            checkpoint = await _load_checkpoint(
+                writer, result.job_key, region, force, restart, lock=not dry_run
+            )
+        except SQLAlchemyError as e:
+            result.errors.append(f"Checkpoint load failed: {e}")
+            return result
+        if checkpoint.last_placement_id is not None:
+            result.resumed_from = str(checkpoint.last_placement_id)
+
+        query = (
+            select(
+                TournamentPlacement.id,
+                TournamentPlacement.raw_archetype_sprites,
+                TournamentPlacement.raw_archetype,
+                TournamentPlacement.archetype,
+                TournamentPlacement.archetype_detection_method,
+                TournamentPlacement.decklist,
+            )
+            .where(TournamentPlacement.region == region)
+            .order_by(TournamentPlacement.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        if not force:
+            query = query.where(
+                TournamentPlacement.archetype_detection_method.is_(None)
+            )
+        if checkpoint.last_placement_id is not None:
+            query = query.where(TournamentPlacement.id > checkpoint.last_placement_id)
+
+        loop = asyncio.get_running_loop()
+        pool: Executor | None = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(normalizer.sprite_map,),
+            )
+        in_flight: deque[asyncio.Future[ResolvedChunk]] = deque()
+
+        async def _apply(chunk: ResolvedChunk) -> None:
+            if not dry_run:
+                await _claim_checkpoint(
+                    writer, result.job_key, checkpoint.last_placement_id
+                )
+            result.chunks += 1
+            result.processed += chunk.processed
+            result.updated += len(chunk.changes)
+            result.skipped += chunk.skipped
+            checkpoint.last_placement_id = chunk.last_id
+            checkpoint.processed += chunk.processed
+            checkpoint.updated += len(chunk.changes)
+            checkpoint.skipped += chunk.skipped
+            if dry_run:
+                return
+            if chunk.changes:
+                await writer.execute(bulk_update_statement(chunk.changes))
+            await writer.commit()
+
+        exhausted = False
+        try:
+            stream = await reader.stream(query)
+            async for partition in stream.partitions(chunk_size):
+                rows: list[ReprocessRow] = [tuple(row) for row in partition]
+                if pool is not None:
+                    in_flight.append(
+                        loop.run_in_executor(pool, _resolve_in_worker, rows)
+                    )
+                    if len(in_flight) >= workers * 2:
+                        await _apply(await in_flight.popleft())
+                else:
+                    await _apply(resolve_chunk(normalizer, rows))
+
+                if (
+                    time_budget_seconds is not None
+                    and time.perf_counter() - started >= time_budget_seconds
+                ):
+                    break
+            else:
+                exhausted = True
+            while in_flight:
+                await _apply(await in_flight.popleft())
+        except ReprocessJobConflictError as e:
+            logger.warning("reprocess_job_conflict: %s", e)
+            result.errors.append(str(e))
+            await writer.rollback()
+        except SQLAlchemyError as e:
+            logger.error("reprocess_job_failed", exc_info=True)
+            result.errors.append(f"Reprocess job failed: {e}")
+            await writer.rollback()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        if exhausted and not result.errors:
+            try:
+                if not dry_run:
+                    await _claim_checkpoint(
+                        writer, result.job_key, checkpoint.last_placement_id
+                    )
+                checkpoint.status = "completed"
+                checkpoint.completed_at = datetime.now(UTC)
+                if not dry_run:
+                    await writer.commit()
+                result.completed = True
+            except ReprocessJobConflictError as e:
+                result.errors.append(str(e))
+                await writer.rollback()
+            except SQLAlchemyError as e:
+                result.errors.append(f"Checkpoint commit failed: {e}")
+
+    result.duration_seconds = round(time.perf_counter() - started, 3)
+    logger.info(
+        "reprocess_job_finished",
+        extra={
+            "job_key": result.job_key,
+            "processed": result.processed,
+            "updated": result.updated,
+            "skipped": result.skipped,
+            "chunks": result.chunks,
+            "completed": result.completed,
+            "dry_run": dry_run,
+            "duration_seconds": result.duration_seconds,
+        },
+    )
+    return result
@@ -0,0 +1,82 @@
+"""Prediction scoring pipeline.
+
+Scores every archetype prediction whose target tournament has completed
+against the tournament's placements, then rebuilds the accuracy rollups
+served by the evolution accuracy endpoint.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+from src.db.database import async_session_factory
+from src.services.pipeline_metrics import pipeline_step, track_pipeline
+from src.services.prediction_scoring import (
+    rebuild_accuracy_rollups,
+    score_completed_predictions,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScorePredictionsResult:
+    """Result of prediction scoring."""
+
+    predictions_scored: int = 0
+    tournaments_scored: int = 0
+    rollups_written: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+
+async def score_predictions(dry_run: bool = False) -> ScorePredictionsResult:
+    """Score completed predictions and rebuild accuracy rollups.
+
+    Args:
+        dry_run: If True, score and roll up but roll back instead of
+            committing.
+
+    Returns:
+        ScorePredictionsResult with statistics.
+    """
+    result = ScorePredictionsResult()
+
+    async with (
+        track_pipeline(
+            "score-predictions",
+            str(uuid4()),
+            None if dry_run else async_session_factory,
+        ) as run,
+        async_session_factory() as session,
+    ):
+        try:
+            with pipeline_step("score-predictions"):
+                scored, tournaments = await score_completed_predictions(session)
+            result.predictions_scored = scored
+            result.tournaments_scored = tournaments
+
+            with pipeline_step("rebuild-rollups"):
+                result.rollups_written = await rebuild_accuracy_rollups(session)
+
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+        except Exception as e:
+            msg = f"Error scoring predictions: {e}"
+            logger.error(msg, exc_info=True)
+            result.errors.append(msg)
+            run.fail(msg)
+
+    logger.info(
+        "Prediction scoring complete: scored=%d, tournaments=%d, rollups=%d, errors=%d",
+        result.predictions_scored,
+        result.tournaments_scored,
+        result.rollups_written,
+        len(result.errors),
+    )
+    return result
@@ -9,6 +9,7 @@ Supports two modes:
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import date
 from uuid import UUID, uuid4
@@ -17,11 +18,15 @@ import httpx
 
 from src.clients.limitless import LimitlessClient, LimitlessError, LimitlessTournament
 from src.db.database import async_session_factory
-from src.services.cloud_tasks import CloudTasksService
+from src.services.cloud_tasks import CloudTasksService, LocalTaskQueue
+from src.services.pipeline_metrics import pipeline_step, track_pipeline
 from src.services.tournament_scrape import ScrapeResult, TournamentScrapeService
 
 logger = logging.getLogger(__name__)
 
+# Concurrent process_single_tournament workers when processing locally
+LOCAL_PROCESS_WORKERS = 4
+
 
 @dataclass
 class DiscoverResult:
@@ -31,6 +36,8 @@ class DiscoverResult:
     tasks_enqueued: int = 0
     tournaments_skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    # Seconds per phase: fetch_listings, existence_check, enqueue/process
+    phase_timings: dict[str, float] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -50,6 +57,56 @@ def _tournament_to_task_payload(t: LimitlessTournament) -> dict:
     }
 
 
+async def _dispatch_payloads(
+    tasks_service: CloudTasksService,
+    payloads: list[dict],
+    result: DiscoverResult,
+    *,
+    auto_process: bool,
+    max_auto_process: int,
+    extra: dict,
+) -> None:
+    """Enqueue discovered tournaments, or process them locally.
+
+    With Cloud Tasks configured, all payloads go out through one bulk
+    enqueue. In local dev with ``auto_process``, up to
+    ``max_auto_process`` tournaments are processed by a local worker pool.
+    """
+    if not tasks_service.is_configured and auto_process:
+        batch = payloads[:max_auto_process]
+        logger.info(
+            "Cloud Tasks not configured, processing %d tournaments locally "
+            "with %d workers",
+            len(batch),
+            LOCAL_PROCESS_WORKERS,
+            extra=extra,
+        )
+        queue = LocalTaskQueue(process_single_tournament, LOCAL_PROCESS_WORKERS)
+        outcomes = await queue.run(batch)
+        for payload, outcome in zip(batch, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                error_msg = f"Failed to process {payload['name']}: {outcome}"
+                logger.error(error_msg)
+                result.errors.append(error_msg)
+            elif outcome.success and outcome.tournaments_saved > 0:
+                result.tasks_enqueued += 1  # Count as "processed"
+            else:
+                result.tournaments_skipped += 1
+                if outcome.errors:
+                    result.errors.extend(outcome.errors)
+        return
+
+    # Use Cloud Tasks (production mode); not configured means local dev
+    bulk = await tasks_service.enqueue_tournaments(payloads)
+    result.tasks_enqueued += len(bulk.enqueued)
+    result.tournaments_skipped += len(bulk.cached) + len(bulk.not_configured)
+    names = {payload["source_url"]: payload["name"] for payload in payloads}
+    for source_url, error in bulk.errors:
+        error_msg = f"Failed to enqueue {names[source_url]}: {error}"
+        logger.error(error_msg)
+        result.errors.append(error_msg)
+
+
 async def discover_en_tournaments(
     lookback_days: int = 90,
     game_format: str = "standard",
@@ -63,9 +120,9 @@ async def discover_en_tournaments(
     Args:
         lookback_days: Number of days to look back.
         game_format: Game format to scrape.
-        auto_process: Process synchronously if Cloud Tasks
-            not configured.
-        max_auto_process: Maximum tournaments to process synchronously.
+        auto_process: Process locally with a worker pool if Cloud
+            Tasks is not configured.
+        max_auto_process: Maximum tournaments to process locally.
 
     Returns:
         DiscoverResult with discovery statistics.
@@ -75,75 +132,63 @@ async def discover_en_tournaments(
     run_id = str(uuid4())
     _extra = {"pipeline": "discover-en", "run_id": run_id}
 
-    async with LimitlessClient() as client, async_session_factory() as session:
-        service = TournamentScrapeService(session, client)
+    async with track_pipeline("discover-en", run_id, async_session_factory) as run:
+        with pipeline_step("discover"):
+            async with LimitlessClient() as client, async_session_factory() as session:
+                service = TournamentScrapeService(session, client)
 
-        # Discover grassroots tournaments
-        grassroots = await service.discover_new_tournaments(
-            region="en",
-            game_format=game_format,
-            lookback_days=lookback_days,
-        )
+                # Discover grassroots tournaments
+                grassroots = await service.discover_new_tournaments(
+                    region="en",
+                    game_format=game_format,
+                    lookback_days=lookback_days,
+                )
 
-        # Discover official tournaments
-        official = await service.discover_official_tournaments(
-            game_format=game_format,
-            lookback_days=lookback_days,
-        )
+                # Discover official tournaments
+                official = await service.discover_official_tournaments(
+                    game_format=game_format,
+                    lookback_days=lookback_days,
+                )
 
-    all_new = grassroots + official
-    result.tournaments_discovered = len(all_new)
+                result.phase_timings.update(service.phase_timings)
 
-    # Check if we're in local dev mode (Cloud Tasks not configured)
-    if not tasks_service.is_configured and auto_process:
-        logger.info(
-            "Cloud Tasks not configured, processing %d tournaments synchronously",
-            min(len(all_new), max_auto_process),
-            extra=_extra,
-        )
+        all_new = grassroots + official
+        official_urls = {t.source_url for t in official}
+        result.tournaments_discovered = len(all_new)
+        dispatch_started = time.perf_counter()
 
-        for tournament in all_new[:max_auto_process]:
-            payload = _tournament_to_task_payload(tournament)
-            payload["is_official"] = tournament in official
-            try:
-                scrape_result = await process_single_tournament(payload)
-                if scrape_result.success and scrape_result.tournaments_saved > 0:
-                    result.tasks_enqueued += 1  # Count as "processed"
-                else:
-                    result.tournaments_skipped += 1
-                    if scrape_result.errors:
-                        result.errors.extend(scrape_result.errors)
-            except Exception as e:
-                error_msg = f"Failed to process {tournament.name}: {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
-    else:
-        # Use Cloud Tasks (production mode)
+        payloads = []
         for tournament in all_new:
             payload = _tournament_to_task_payload(tournament)
-            payload["is_official"] = tournament in official
-            try:
-                task_name = await tasks_service.enqueue_tournament(payload)
-                if task_name:
-                    result.tasks_enqueued += 1
-                else:
-                    # Cloud Tasks not configured (local dev) — skip
-                    result.tournaments_skipped += 1
-            except Exception as e:
-                error_msg = f"Failed to enqueue {tournament.name}: {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
+            payload["is_official"] = tournament.source_url in official_urls
+            payloads.append(payload)
+
+        with pipeline_step("dispatch"):
+            await _dispatch_payloads(
+                tasks_service,
+                payloads,
+                result,
+                auto_process=auto_process,
+                max_auto_process=max_auto_process,
+                extra=_extra,
+            )
 
-    logger.info(
-        "EN discovery complete: discovered=%d, "
-        "enqueued/processed=%d, skipped=%d, errors=%d",
-        result.tournaments_discovered,
-        result.tasks_enqueued,
-        result.tournaments_skipped,
-        len(result.errors),
-        extra=_extra,
-    )
-    return result
+        result.phase_timings["enqueue"] = round(
+            time.perf_counter() - dispatch_started, 4
+        )
+        if result.errors:
+            run.fail("; ".join(result.errors))
+
+        logger.info(
+            "EN discovery complete: discovered=%d, "
+            "enqueued/processed=%d, skipped=%d, errors=%d",
+            result.tournaments_discovered,
+            result.tasks_enqueued,
+            result.tournaments_skipped,
+            len(result.errors),
+            extra=_extra,
+        )
+        return result
 
 
 async def discover_jp_tournaments(
@@ -158,9 +203,9 @@ async def discover_jp_tournaments(
 
     Args:
         lookback_days: Number of days to look back.
-        auto_process: Process synchronously if Cloud Tasks
-            not configured.
-        max_auto_process: Maximum tournaments to process synchronously.
+        auto_process: Process locally with a worker pool if Cloud
+            Tasks is not configured.
+        max_auto_process: Maximum tournaments to process locally.
         min_date: Only discover tournaments on or after this date.
 
     Returns:
@@ -171,78 +216,64 @@ async def discover_jp_tournaments(
     run_id = str(uuid4())
     _extra = {"pipeline": "discover-jp", "run_id": run_id}
 
-    async with LimitlessClient() as client, async_session_factory() as session:
-        service = TournamentScrapeService(session, client)
+    async with track_pipeline("discover-jp", run_id, async_session_factory) as run:
+        with pipeline_step("discover"):
+            async with LimitlessClient() as client, async_session_factory() as session:
+                service = TournamentScrapeService(session, client)
 
-        jp_tournaments = await service.discover_jp_city_leagues(
-            lookback_days=lookback_days,
-            min_date=min_date,
-        )
+                jp_tournaments = await service.discover_jp_city_leagues(
+                    lookback_days=lookback_days,
+                    min_date=min_date,
+                )
 
-        # Also discover official JP tournaments (Champions League, etc.)
-        jp_official = await service.discover_official_tournaments(
-            region="JP",
-            lookback_days=lookback_days,
-        )
+                # Also discover official JP tournaments (Champions League, etc.)
+                jp_official = await service.discover_official_tournaments(
+                    region="JP",
+                    lookback_days=lookback_days,
+                )
 
-    all_jp = jp_tournaments + jp_official
-    result.tournaments_discovered = len(all_jp)
+                result.phase_timings.update(service.phase_timings)
 
-    # Check if we're in local dev mode (Cloud Tasks not configured)
-    if not tasks_service.is_configured and auto_process:
-        logger.info(
-            "Cloud Tasks not configured, processing %d JP tournaments synchronously",
-            min(len(all_jp), max_auto_process),
-            extra=_extra,
-        )
+        all_jp = jp_tournaments + jp_official
+        official_urls = {t.source_url for t in jp_official}
+        result.tournaments_discovered = len(all_jp)
+        dispatch_started = time.perf_counter()
 
-        for tournament in all_jp[:max_auto_process]:
-            payload = _tournament_to_task_payload(tournament)
-            if tournament in jp_official:
-                payload["is_official"] = True
-            else:
-                payload["is_jp_city_league"] = True
-            try:
-                scrape_result = await process_single_tournament(payload)
-                if scrape_result.success and scrape_result.tournaments_saved > 0:
-                    result.tasks_enqueued += 1  # Count as "processed"
-                else:
-                    result.tournaments_skipped += 1
-                    if scrape_result.errors:
-                        result.errors.extend(scrape_result.errors)
-            except Exception as e:
-                error_msg = f"Failed to process {tournament.name}: {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
-    else:
-        # Use Cloud Tasks (production mode)
+        payloads = []
         for tournament in all_jp:
             payload = _tournament_to_task_payload(tournament)
-            if tournament in jp_official:
+            if tournament.source_url in official_urls:
                 payload["is_official"] = True
             else:
                 payload["is_jp_city_league"] = True
-            try:
-                task_name = await tasks_service.enqueue_tournament(payload)
-                if task_name:
-                    result.tasks_enqueued += 1
-                else:
-                    result.tournaments_skipped += 1
-            except Exception as e:
-                error_msg = f"Failed to enqueue {tournament.name}: {e}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
+            payloads.append(payload)
+
+        with pipeline_step("dispatch"):
+            await _dispatch_payloads(
+                tasks_service,
+                payloads,
+                result,
+                auto_process=auto_process,
+                max_auto_process=max_auto_process,
+                extra=_extra,
+            )
 
-    logger.info(
-        "JP discovery complete: discovered=%d, "
-        "enqueued/processed=%d, skipped=%d, errors=%d",
-        result.tournaments_discovered,
-        result.tasks_enqueued,
-        result.tournaments_skipped,
-        len(result.errors),
-        extra=_extra,
-    )
-    return result
+        result.phase_timings["enqueue"] = round(
+            time.perf_counter() - dispatch_started, 4
+        )
+        if result.errors:
+            run.fail("; ".join(result.errors))
+
+        logger.info(
+            "JP discovery complete: discovered=%d, "
+            "enqueued/processed=%d, skipped=%d, errors=%d",
+            result.tournaments_discovered,
+            result.tasks_enqueued,
+            result.tournaments_skipped,
+            len(result.errors),
+            extra=_extra,
+        )
+        return result
 
 
 async def process_single_tournament(payload: dict) -> ScrapeResult:
@@ -268,47 +299,53 @@ async def process_single_tournament(payload: dict) -> ScrapeResult:
         extra=_extra,
     )
 
-    async with LimitlessClient() as client, async_session_factory() as session:
-        service = TournamentScrapeService(session, client)
-        result = await service.process_tournament_by_url(
-            source_url=source_url,
-            name=payload["name"],
-            tournament_date=tournament_date,
-            region=payload["region"],
-            game_format=payload.get("game_format", "standard"),
-            best_of=payload.get("best_of", 3),
-            participant_count=payload.get("participant_count", 0),
-            is_official=payload.get("is_official", False),
-            is_jp_city_league=payload.get("is_jp_city_league", False),
-        )
-
-    logger.info(
-        "Processing complete for %s: saved=%d, skipped=%d, errors=%d",
-        payload["name"],
-        result.tournaments_saved,
-        result.tournaments_skipped,
-        len(result.errors),
-        extra=_extra,
-    )
-
-    # Trigger evolution snapshot computation for qualifying tournaments
-    if result.tournaments_saved > 0:
-        tier = payload.get("tier")
-        participant_count = payload.get("participant_count", 0)
-        if tier in ("major", "premier") or participant_count >= 64:
-            try:
-                await compute_evolution_for_tournament(
-                    tournament_id=None,
+    async with track_pipeline(
+        "process-tournament", run_id, async_session_factory
+    ) as run:
+        with pipeline_step("process"):
+            async with LimitlessClient() as client, async_session_factory() as session:
+                service = TournamentScrapeService(session, client)
+                result = await service.process_tournament_by_url(
                     source_url=source_url,
+                    name=payload["name"],
+                    tournament_date=tournament_date,
+                    region=payload["region"],
+                    game_format=payload.get("game_format", "standard"),
+                    best_of=payload.get("best_of", 3),
+                    participant_count=payload.get("participant_count", 0),
+                    is_official=payload.get("is_official", False),
+                    is_jp_city_league=payload.get("is_jp_city_league", False),
                 )
-            except Exception:
-                logger.error(
-                    "Evolution snapshot computation failed for %s",
-                    payload["name"],
-                    exc_info=True,
-                )
+        if result.errors:
+            run.fail("; ".join(result.errors))
 
-    return result
+        logger.info(
+            "Processing complete for %s: saved=%d, skipped=%d, errors=%d",
+            payload["name"],
+            result.tournaments_saved,
+            result.tournaments_skipped,
+            len(result.errors),
+            extra=_extra,
+        )
+
+        # Trigger evolution snapshot computation for qualifying tournaments
+        if result.tournaments_saved > 0:
+            tier = payload.get("tier")
+            participant_count = payload.get("participant_count", 0)
+            if tier in ("major", "premier") or participant_count >= 64:
+                try:
+                    await compute_evolution_for_tournament(
+                        tournament_id=None,
+                        source_url=source_url,
+                    )
+                except Exception:
+                    logger.error(
+                        "Evolution snapshot computation failed for %s",
+                        payload["name"],
+                        exc_info=True,
+                    )
+
+        return result
 
 
 async def scrape_en_tournaments(
@@ -675,7 +712,8 @@ async def compute_evolution_for_tournament(
     """Compute evolution snapshots for all archetypes in a tournament.
 
     For each archetype with >= 3 decklists, computes a snapshot and
-    adaptations (diff only, no Claude API calls).
+    adaptations (diff only, no Claude API calls). The tournament's
+    placements are loaded once and everything is saved in one transaction.
 
     Args:
         tournament_id: Tournament UUID (if known).
@@ -684,14 +722,11 @@ async def compute_evolution_for_tournament(
     Returns:
         Number of snapshots created.
     """
-    from sqlalchemy import func, select
+    from sqlalchemy import select
 
     from src.models.tournament import Tournament
-    from src.models.tournament_placement import TournamentPlacement
     from src.services.evolution_service import EvolutionService
 
-    snapshots_created = 0
-
     async with async_session_factory() as session:
         # Resolve tournament_id from source_url if needed
         if tournament_id is None and source_url:
@@ -711,65 +746,24 @@ async def compute_evolution_for_tournament(
             logger.warning("Cannot compute evolution: no tournament_id or source_url")
             return 0
 
-        # Get archetypes with their decklist counts for this tournament
-        archetype_query = (
-            select(
-                TournamentPlacement.archetype,
-                func.count(TournamentPlacement.id).label("total"),
-                func.count(TournamentPlacement.decklist).label("with_decklist"),
-            )
-            .where(TournamentPlacement.tournament_id == tournament_id)
-            .group_by(TournamentPlacement.archetype)
-        )
-
-        result = await session.execute(archetype_query)
-        archetype_rows = result.all()
-
         service = EvolutionService(session)
+        try:
+            evolution = await service.compute_tournament_evolution(tournament_id)
+        except Exception:
+            logger.error(
+                "Failed to compute evolution for tournament %s",
+                tournament_id,
+                exc_info=True,
+            )
+            return 0
 
-        for archetype_name, _total_count, decklist_count in archetype_rows:
-            if decklist_count < 3:
-                logger.debug(
-                    "Skipping %s: only %d decklists (need 3+)",
-                    archetype_name,
-                    decklist_count,
-                )
-                continue
-
-            try:
-                # Compute snapshot
-                snapshot = await service.compute_tournament_snapshot(
-                    archetype_name, tournament_id
-                )
-                await service.save_snapshot(snapshot)
-                snapshots_created += 1
-
-                # Find previous snapshot and compute adaptations
-                previous = await service.get_previous_snapshot(
-                    archetype_name, tournament_id
-                )
-                if previous and previous.consensus_list:
-                    adaptations = await service.compute_adaptations(
-                        previous.id, snapshot.id
-                    )
-                    for adaptation in adaptations:
-                        session.add(adaptation)
-                    await session.commit()
-
-                logger.info(
-                    "Evolution snapshot created: %s (tournament %s, %d decklists)",
-                    archetype_name,
-                    tournament_id,
-                    decklist_count,
-                )
-
-            except Exception:
-                logger.error(
-                    "Failed to compute evolution for %s in tournament %s",
-                    archetype_name,
-                    tournament_id,
-                    exc_info=True,
-                )
+        for archetype_name, decklist_count in evolution.skipped.items():
+            logger.debug(
+                "Skipping %s: only %d decklists (need 3+)",
+                archetype_name,
+                decklist_count,
+            )
+        snapshots_created = len(evolution.snapshots)
 
     logger.info(
         "Evolution computation complete: %d snapshots created for tournament %s",
@@ -14,6 +14,7 @@ from src.clients.players_club import (
 )
 from src.db.database import async_session_factory
 from src.models import Tournament, TournamentPlacement
+from src.models.tournament_placement import tournament_columns
 from src.services.archetype_normalizer import (
     ArchetypeNormalizer,
 )
@@ -172,6 +173,7 @@ async def _process_tournament(
         placement = TournamentPlacement(
             id=uuid4(),
             tournament_id=tournament_id,
+            **tournament_columns(db_tournament),
             placement=p.placement,
             player_name=p.player_name,
             archetype=archetype,
@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass, field
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,6 +12,7 @@ from src.clients.limitless import LimitlessClient, LimitlessError
 from src.db.database import async_session_factory
 from src.models import CardIdMapping
 from src.pipelines.sync_jp_adoption_rates import backfill_adoption_card_ids
+from src.services.card_catalog import reload_card_catalog_if_loaded
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,9 @@ async def sync_card_mappings_for_set(
                 "en_card_id": stmt.excluded.en_card_id,
                 "card_name_en": stmt.excluded.card_name_en,
                 "en_set_id": stmt.excluded.en_set_id,
+                # onupdate does not fire for ON CONFLICT; the card catalog
+                # version stamp relies on updated_at moving
+                "updated_at": func.now(),
             },
         )
 
@@ -151,6 +155,8 @@ async def sync_all_card_mappings(
                     result.errors.append(error_msg)
                     continue
 
+            await reload_card_catalog_if_loaded(session)
+
             try:
                 result.adoption_rows_backfilled = await backfill_adoption_card_ids(
                     session
@@ -6,6 +6,7 @@ import httpx
 
 from src.clients.tcgdex import TCGdexClient, TCGdexError
 from src.db.database import async_session_factory
+from src.services.card_catalog import reload_card_catalog_if_loaded
 from src.services.card_sync import CardSyncService, SyncResult
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,7 @@ async def sync_english_cards(dry_run: bool = False) -> SyncResult:
     async with TCGdexClient() as client, async_session_factory() as session:
         service = CardSyncService(session, client)
         result = await service.sync_all_english()
+        await reload_card_catalog_if_loaded(session)
         return result
 
 
@@ -85,6 +87,7 @@ async def sync_japanese_names(dry_run: bool = False) -> int:
         service = CardSyncService(session, client)
         updated_count = await service.update_japanese_names(name_map)
         await session.commit()
+        await reload_card_catalog_if_loaded(session)
 
     logger.info(f"Japanese name sync complete. Updated {updated_count} cards.")
     return updated_count
@@ -112,6 +115,7 @@ async def sync_japanese_cards(dry_run: bool = False) -> SyncResult:
     async with TCGdexClient() as client, async_session_factory() as session:
         service = CardSyncService(session, client)
         result = await service.sync_all_japanese()
+        await reload_card_catalog_if_loaded(session)
         return result
 
 
@@ -24,6 +24,8 @@ from src.models.card import Card
 from src.models.card_id_mapping import CardIdMapping
 from src.models.jp_card_adoption_rate import JPCardAdoptionRate
 from src.models.set import Set
+from src.services.card_catalog import CardCatalog, get_card_catalog
+from src.services.pipeline_metrics import pipeline_step, track_pipeline
 from src.services.pipeline_resilience import retry_commit, with_timeout
 
 FETCH_TIMEOUT = 30  # seconds for external HTTP call
@@ -86,7 +88,13 @@ async def _resolve_card_for_adoption_entry(
     card_name_en: str | None,
     cache: dict[tuple[str, str], CardResolution | None],
 ) -> CardResolution:
-    """Resolve adoption entry to canonical card ID using fallback chain."""
+    """Resolve adoption entry to canonical card ID using fallback chain.
+
+    Resolves in memory when the process-wide card catalog is loaded.
+    """
+    catalog = get_card_catalog()
+    if catalog is not None:
+        return _resolve_from_catalog(catalog, card_name_jp, card_name_en)
 
     def _cache_key(source: str, value: str | None) -> tuple[str, str] | None:
         normalized = _normalize_card_name(value)
@@ -164,6 +172,39 @@ async def _resolve_card_for_adoption_entry(
     )
 
 
+def _resolve_from_catalog(
+    catalog: CardCatalog,
+    card_name_jp: str | None,
+    card_name_en: str | None,
+) -> CardResolution:
+    """Resolve an adoption entry against the in-memory card catalog."""
+    card = catalog.find_by_name(card_name_en)
+    if card is not None:
+        return CardResolution(
+            card_id=card.id, method="card_name_en", set_id=card.set_id
+        )
+
+    card = catalog.find_by_japanese_name(card_name_jp)
+    if card is not None:
+        return CardResolution(
+            card_id=card.id, method="card_name_jp", set_id=card.set_id
+        )
+
+    mapping = catalog.find_mapping_by_name(card_name_en)
+    if mapping is not None:
+        en_card_id, en_set_id = mapping
+        return CardResolution(
+            card_id=en_card_id, method="mapping_name_en", set_id=en_set_id
+        )
+
+    fallback_name = card_name_jp or card_name_en or "unknown"
+    return CardResolution(
+        card_id=_generate_card_id(fallback_name),
+        method="generated_hash",
+        set_id=None,
+    )
+
+
 async def backfill_adoption_card_ids(
     session: AsyncSession,
     lookback_days: int = 90,
@@ -218,140 +259,166 @@ async def sync_adoption_rates(
         SyncAdoptionRatesResult with statistics.
     """
     result = SyncAdoptionRatesResult()
+    run_id = str(uuid4())
 
     logger.info("Starting adoption rate sync: dry_run=%s", dry_run)
 
-    try:
-        async with PokecabookClient() as pokecabook:
-            adoption_data = await with_timeout(
-                pokecabook.fetch_adoption_rates(),
-                FETCH_TIMEOUT,
-                pipeline="sync-jp-adoption-rates",
-                step="fetch-adoption-rates",
-            )
-
-            result.rates_fetched = len(adoption_data.entries)
-            logger.info("Fetched %d adoption rate entries", len(adoption_data.entries))
+    async with track_pipeline(
+        "sync-jp-adoption-rates",
+        run_id,
+        None if dry_run else async_session_factory,
+    ) as run:
+        try:
+            async with PokecabookClient() as pokecabook:
+                adoption_data = await with_timeout(
+                    pokecabook.fetch_adoption_rates(),
+                    FETCH_TIMEOUT,
+                    pipeline="sync-jp-adoption-rates",
+                    step="fetch-adoption-rates",
+                )
 
-            if dry_run:
+                result.rates_fetched = len(adoption_data.entries)
                 logger.info(
-                    "DRY RUN: Would sync %d adoption rate entries",
-                    len(adoption_data.entries),
+                    "Fetched %d adoption rate entries", len(adoption_data.entries)
                 )
-                return result
-
-            async with async_session_factory() as session:
-                today = date.today()
-                period_start = today - timedelta(days=7)
-                period_end = today
-                resolution_cache: dict[tuple[str, str], CardResolution | None] = {}
-
-                for entry in adoption_data.entries:
-                    try:
-                        if not entry.card_name_jp or entry.inclusion_rate <= 0:
-                            result.rates_skipped += 1
-                            continue
-
-                        resolution = await _resolve_card_for_adoption_entry(
-                            session,
-                            entry.card_name_jp,
-                            entry.card_name_en,
-                            resolution_cache,
-                        )
-                        card_id = resolution.card_id
 
-                        result.mapped_by_method[resolution.method] = (
-                            result.mapped_by_method.get(resolution.method, 0) + 1
-                        )
-                        if resolution.method == "generated_hash":
-                            result.mapping_unresolved += 1
-                            source_key = adoption_data.source_url or "unknown"
-                            result.unmapped_by_source[source_key] = (
-                                result.unmapped_by_source.get(source_key, 0) + 1
+                if dry_run:
+                    logger.info(
+                        "DRY RUN: Would sync %d adoption rate entries",
+                        len(adoption_data.entries),
+                    )
+                    return result
+
+                with pipeline_step("store-adoption-rates"):
+                    async with async_session_factory() as session:
+                        today = date.today()
+                        period_start = today - timedelta(days=7)
+                        period_end = today
+                        resolution_cache: dict[
+                            tuple[str, str], CardResolution | None
+                        ] = {}
+
+                        for entry in adoption_data.entries:
+                            try:
+                                if not entry.card_name_jp or entry.inclusion_rate <= 0:
+                                    result.rates_skipped += 1
+                                    continue
+
+                                resolution = await _resolve_card_for_adoption_entry(
+                                    session,
+                                    entry.card_name_jp,
+                                    entry.card_name_en,
+                                    resolution_cache,
+                                )
+                                card_id = resolution.card_id
+
+                                result.mapped_by_method[resolution.method] = (
+                                    result.mapped_by_method.get(resolution.method, 0)
+                                    + 1
+                                )
+                                if resolution.method == "generated_hash":
+                                    result.mapping_unresolved += 1
+                                    source_key = adoption_data.source_url or "unknown"
+                                    result.unmapped_by_source[source_key] = (
+                                        result.unmapped_by_source.get(source_key, 0) + 1
+                                    )
+                                    set_key = resolution.set_id or "unknown"
+                                    result.unmapped_by_set[set_key] = (
+                                        result.unmapped_by_set.get(set_key, 0) + 1
+                                    )
+
+                                    sample_name = (
+                                        entry.card_name_jp
+                                        or entry.card_name_en
+                                        or card_id
+                                    )
+                                    if (
+                                        sample_name
+                                        and sample_name
+                                        not in result.unmapped_card_samples
+                                        and len(result.unmapped_card_samples) < 25
+                                    ):
+                                        result.unmapped_card_samples.append(sample_name)
+                                else:
+                                    result.mapping_resolved += 1
+
+                                existing_query = select(JPCardAdoptionRate).where(
+                                    JPCardAdoptionRate.card_id == card_id,
+                                    JPCardAdoptionRate.period_start == period_start,
+                                    JPCardAdoptionRate.period_end == period_end,
+                                )
+                                existing_result = await session.execute(existing_query)
+                                existing = existing_result.scalar_one_or_none()
+
+                                if existing:
+                                    existing.inclusion_rate = entry.inclusion_rate
+                                    existing.avg_copies = entry.avg_copies
+                                    existing.archetype_context = entry.archetype
+                                    existing.source_url = adoption_data.source_url
+                                    existing.raw_data = {
+                                        "mapping_method": resolution.method,
+                                        "mapped_set_id": resolution.set_id,
+                                    }
+                                    result.rates_updated += 1
+                                else:
+                                    new_rate = JPCardAdoptionRate(
+                                        id=uuid4(),
+                                        card_id=card_id,
+                                        card_name_jp=entry.card_name_jp,
+                                        card_name_en=entry.card_name_en,
+                                        inclusion_rate=entry.inclusion_rate,
+                                        avg_copies=entry.avg_copies,
+                                        archetype_context=entry.archetype,
+                                        period_start=period_start,
+                                        period_end=period_end,
+                                        source="pokecabook",
+                                        source_url=adoption_data.source_url,
+                                        raw_data={
+                                            "mapping_method": resolution.method,
+                                            "mapped_set_id": resolution.set_id,
+                                        },
+                                    )
+                                    session.add(new_rate)
+                                    result.rates_created += 1
+
+                            except SQLAlchemyError as e:
+                                error_msg = (
+                                    f"Error saving rate for {entry.card_name_jp}: {e}"
+                                )
+                                logger.warning(error_msg)
+                                result.errors.append(error_msg)
+
+                        try:
+                            result.rates_backfilled = await backfill_adoption_card_ids(
+                                session
                             )
-                            set_key = resolution.set_id or "unknown"
-                            result.unmapped_by_set[set_key] = (
-                                result.unmapped_by_set.get(set_key, 0) + 1
+                        except Exception:
+                            logger.warning(
+                                "Adoption backfill failed (non-fatal)", exc_info=True
                             )
+                            result.rates_backfilled = 0
 
-                            sample_name = (
-                                entry.card_name_jp or entry.card_name_en or card_id
-                            )
-                            if (
-                                sample_name
-                                and sample_name not in result.unmapped_card_samples
-                                and len(result.unmapped_card_samples) < 25
-                            ):
-                                result.unmapped_card_samples.append(sample_name)
-                        else:
-                            result.mapping_resolved += 1
-
-                        existing_query = select(JPCardAdoptionRate).where(
-                            JPCardAdoptionRate.card_id == card_id,
-                            JPCardAdoptionRate.period_start == period_start,
-                            JPCardAdoptionRate.period_end == period_end,
+                        total_considered = (
+                            result.mapping_resolved + result.mapping_unresolved
                         )
-                        existing_result = await session.execute(existing_query)
-                        existing = existing_result.scalar_one_or_none()
-
-                        if existing:
-                            existing.inclusion_rate = entry.inclusion_rate
-                            existing.avg_copies = entry.avg_copies
-                            existing.archetype_context = entry.archetype
-                            existing.source_url = adoption_data.source_url
-                            existing.raw_data = {
-                                "mapping_method": resolution.method,
-                                "mapped_set_id": resolution.set_id,
-                            }
-                            result.rates_updated += 1
-                        else:
-                            new_rate = JPCardAdoptionRate(
-                                id=uuid4(),
-                                card_id=card_id,
-                                card_name_jp=entry.card_name_jp,
-                                card_name_en=entry.card_name_en,
-                                inclusion_rate=entry.inclusion_rate,
-                                avg_copies=entry.avg_copies,
-                                archetype_context=entry.archetype,
-                                period_start=period_start,
-                                period_end=period_end,
-                                source="pokecabook",
-                                source_url=adoption_data.source_url,
-                                raw_data={
-                                    "mapping_method": resolution.method,
-                                    "mapped_set_id": resolution.set_id,
-                                },
+                        if total_considered > 0:
+                            result.mapping_coverage = (
+                                result.mapping_resolved / total_considered
                             )
-                            session.add(new_rate)
-                            result.rates_created += 1
-
-                    except SQLAlchemyError as e:
-                        error_msg = f"Error saving rate for {entry.card_name_jp}: {e}"
-                        logger.warning(error_msg)
-                        result.errors.append(error_msg)
-
-                try:
-                    result.rates_backfilled = await backfill_adoption_card_ids(session)
-                except Exception:
-                    logger.warning(
-                        "Adoption backfill failed (non-fatal)", exc_info=True
-                    )
-                    result.rates_backfilled = 0
-
-                total_considered = result.mapping_resolved + result.mapping_unresolved
-                if total_considered > 0:
-                    result.mapping_coverage = result.mapping_resolved / total_considered
-
-                await retry_commit(session, context="sync-adoption-rates")
-
-    except PokecabookError as e:
-        error_msg = f"Error fetching adoption rates: {e}"
-        logger.error(error_msg)
-        result.errors.append(error_msg)
-    except Exception as e:
-        error_msg = f"Pipeline error: {e}"
-        logger.error(error_msg, exc_info=True)
-        result.errors.append(error_msg)
+
+                        await retry_commit(session, context="sync-adoption-rates")
+
+        except PokecabookError as e:
+            error_msg = f"Error fetching adoption rates: {e}"
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+        except Exception as e:
+            error_msg = f"Pipeline error: {e}"
+            logger.error(error_msg, exc_info=True)
+            result.errors.append(error_msg)
+
+        if result.errors:
+            run.fail(result.errors[0])
 
     logger.info(
         "Adoption sync complete: fetched=%d created=%d updated=%d "
@@ -15,6 +15,7 @@ from src.clients.limitless import (
 from src.db.database import async_session_factory
 from src.models.card import Card
 from src.routers.meta import _generate_card_id_variants
+from src.services.card_catalog import reload_card_catalog_if_loaded
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +190,7 @@ async def sync_limitless_cards(
                 logger.info("Dry run — rolled back all changes")
             else:
                 await session.commit()
+                await reload_card_catalog_if_loaded(session)
                 logger.info(
                     "Committed: %d cards mapped across %d sets",
                     result.cards_mapped,
@@ -1,7 +1,8 @@
 """Pipeline to wipe tournament, meta, card, and reference data.
 
 Preserves user data (users, decks, waitlist, api_keys, api_requests,
-lab_notes, lab_note_revisions, widgets, widget_views, data_exports).
+lab_notes, lab_note_revisions, widgets, widget_views,
+widget_view_rollups, data_exports).
 """
 
 import logging
@@ -61,6 +62,7 @@ PRESERVED_TABLES = {
     "lab_note_revisions",
     "widgets",
     "widget_views",
+    "widget_view_rollups",
     "data_exports",
     "alembic_version",
 }
@@ -23,7 +23,7 @@ from src.models.meta_snapshot import MetaSnapshot
 from src.models.placeholder_card import PlaceholderCard
 from src.models.set import Set
 from src.models.tournament import Tournament
-from src.models.tournament_placement import TournamentPlacement
+from src.models.tournament_placement import TournamentPlacement, tournament_columns
 from src.models.translated_content import TranslatedContent
 from src.models.user import User
 from src.schemas.access_grants import AccessGrantResponse, AccessGrantUpdateRequest
@@ -54,6 +54,11 @@ from src.schemas.placeholder import (
 from src.schemas.readiness import TPCIReadinessResponse
 from src.services.archetype_normalizer import ArchetypeNormalizer
 from src.services.audit import record_admin_audit_event
+from src.services.health_service import PipelineHealthService
+from src.services.normalizer_registry import (
+    get_normalizer,
+    invalidate_sprite_index,
+)
 from src.services.placeholder_service import PlaceholderService
 from src.services.readiness import evaluate_tpci_post_major_readiness
 
@@ -520,6 +525,7 @@ async def create_archetype_sprite(
             status_code=400,
             detail=f"Sprite key already exists: {data.sprite_key}",
         ) from None
+    invalidate_sprite_index()
     await db.refresh(sprite)
     return ArchetypeSpriteResponse.model_validate(sprite)
 
@@ -546,6 +552,7 @@ async def update_archetype_sprite(
     if data.display_name is not None:
         sprite.display_name = data.display_name or None
     await db.commit()
+    invalidate_sprite_index()
     await db.refresh(sprite)
     return ArchetypeSpriteResponse.model_validate(sprite)
 
@@ -567,6 +574,7 @@ async def delete_archetype_sprite(
         raise HTTPException(status_code=404, detail="Sprite mapping not found")
     await db.delete(sprite)
     await db.commit()
+    invalidate_sprite_index()
     return {"deleted": sprite_key}
 
 
@@ -581,6 +589,7 @@ async def seed_archetype_sprites(
     try:
         inserted = await ArchetypeNormalizer.seed_db_sprites(db)
         await db.commit()
+        invalidate_sprite_index()
     except IntegrityError:
         await db.rollback()
         raise HTTPException(
@@ -816,7 +825,7 @@ async def get_pipeline_health(
     db: Annotated[AsyncSession, Depends(get_db)],
     _admin_user: AdminUser,
 ) -> PipelineHealthResponse:
-    """Check freshness of each data pipeline."""
+    """Check freshness of each data pipeline and list its recent runs."""
     today = datetime.now(UTC).date()
     pipelines: list[PipelineHealthItem] = []
 
@@ -962,9 +971,12 @@ async def get_pipeline_health(
         )
     )
 
+    recent_runs = await PipelineHealthService(db).get_recent_runs()
+
     return PipelineHealthResponse(
         pipelines=pipelines,
         checked_at=datetime.now(UTC).isoformat(),
+        recent_runs=recent_runs,
     )
 
 
@@ -1486,8 +1498,7 @@ async def create_tournament(
     db.add(tournament)
 
     archetypes_detected = 0
-    normalizer = ArchetypeNormalizer()
-    await normalizer.load_db_sprites(db)
+    normalizer = await get_normalizer(db)
 
     for p_data in data.placements:
         archetype = p_data.archetype or "Unknown"
@@ -1514,6 +1525,7 @@ async def create_tournament(
         placement = TournamentPlacement(
             id=uuid4(),
             tournament_id=tournament_id,
+            **tournament_columns(tournament),
             placement=p_data.placement,
             player_name=p_data.player_name,
             archetype=archetype,
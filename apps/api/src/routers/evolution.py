@@ -19,6 +19,7 @@ from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
 from src.models.archetype_prediction import ArchetypePrediction
 from src.models.evolution_article import EvolutionArticle
 from src.models.evolution_article_snapshot import EvolutionArticleSnapshot
+from src.models.prediction_accuracy_rollup import PredictionAccuracyRollup
 from src.models.tournament import Tournament
 from src.schemas.evolution import (
     AdaptationResponse,
@@ -235,36 +236,31 @@ async def get_prediction_accuracy(
         int,
         Query(ge=1, le=100, description="Maximum scored predictions to include"),
     ] = 20,
+    offset: Annotated[
+        int,
+        Query(ge=0, description="Number of scored predictions to skip"),
+    ] = 0,
 ) -> PredictionAccuracyResponse:
     """Get prediction accuracy tracking summary.
 
-    Returns overall accuracy statistics and recent scored predictions.
+    Returns overall accuracy statistics, precomputed by the
+    score-predictions job, and a page of recent scored predictions.
     """
     try:
-        # Get total and scored counts
-        total_result = await db.execute(select(func.count(ArchetypePrediction.id)))
-        total = total_result.scalar() or 0
-
-        scored_result = await db.execute(
-            select(func.count(ArchetypePrediction.id)).where(
-                ArchetypePrediction.accuracy_score.is_not(None)
-            )
-        )
-        scored = scored_result.scalar() or 0
-
-        # Get average accuracy
-        avg_result = await db.execute(
-            select(func.avg(ArchetypePrediction.accuracy_score)).where(
-                ArchetypePrediction.accuracy_score.is_not(None)
+        rollup_result = await db.execute(
+            select(PredictionAccuracyRollup).where(
+                PredictionAccuracyRollup.archetype_id.is_(None),
+                PredictionAccuracyRollup.method.is_(None),
+                PredictionAccuracyRollup.month.is_(None),
             )
         )
-        avg_accuracy = avg_result.scalar()
+        rollup = rollup_result.scalar_one_or_none()
 
-        # Get recent scored predictions
         predictions_result = await db.execute(
             select(ArchetypePrediction)
             .where(ArchetypePrediction.accuracy_score.is_not(None))
             .order_by(ArchetypePrediction.created_at.desc())
+            .offset(offset)
             .limit(limit)
         )
         predictions = list(predictions_result.scalars().all())
@@ -279,10 +275,15 @@ async def get_prediction_accuracy(
             detail="Unable to retrieve prediction accuracy.",
         ) from None
 
+    average = rollup.average_accuracy if rollup else None
+    baseline_average = rollup.baseline_average_accuracy if rollup else None
     return PredictionAccuracyResponse(
-        total_predictions=total,
-        scored_predictions=scored,
-        average_accuracy=round(float(avg_accuracy), 4) if avg_accuracy else None,
+        total_predictions=rollup.prediction_count if rollup else 0,
+        scored_predictions=rollup.scored_count if rollup else 0,
+        average_accuracy=round(average, 4) if average is not None else None,
+        baseline_average_accuracy=(
+            round(baseline_average, 4) if baseline_average is not None else None
+        ),
         predictions=[
             PredictionResponse(
                 id=p.id,
@@ -18,13 +18,10 @@ from src.models import (
     JPNewArchetype,
     JPSetImpact,
     Prediction,
-    Tournament,
     TournamentPlacement,
     TranslatedContent,
 )
 from src.schemas.japan import (
-    CardCountDataPoint,
-    CardCountEvolution,
     CardCountEvolutionResponse,
     CityLeagueResult,
     JPCardInnovationDetailResponse,
@@ -41,6 +38,7 @@ from src.schemas.japan import (
     PredictionListResponse,
     PredictionResponse,
 )
+from src.utils.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -457,7 +455,11 @@ async def list_predictions(
     )
 
 
-@router.get("/card-count-evolution")
+@router.get(
+    "/card-count-evolution",
+    response_model=CardCountEvolutionResponse,
+    response_class=FastJSONResponse,
+)
 async def get_card_count_evolution(
     db: Annotated[AsyncSession, Depends(get_db)],
     archetype: Annotated[str, Query(description="Archetype name")],
@@ -467,11 +469,13 @@ async def get_card_count_evolution(
     top_cards: Annotated[
         int, Query(ge=1, le=30, description="Number of cards to track")
     ] = 10,
-) -> CardCountEvolutionResponse:
+) -> FastJSONResponse:
     """Get card count evolution for an archetype over time.
 
     Computes how average copies of cards change across weekly buckets,
-    based on JP City League tournament placements.
+    based on JP City League tournament placements. Points are kept as
+    tuples for every card seen and turned into dicts only for the cards
+    returned.
     """
     cutoff_date = date.today() - timedelta(days=days)
 
@@ -480,17 +484,16 @@ async def get_card_count_evolution(
         select(
             TournamentPlacement.tournament_id,
             TournamentPlacement.decklist,
-            Tournament.date,
+            TournamentPlacement.tournament_date,
         )
-        .join(Tournament, TournamentPlacement.tournament_id == Tournament.id)
         .where(
             TournamentPlacement.archetype == archetype,
-            Tournament.region == "JP",
-            Tournament.best_of == 1,
-            Tournament.date >= cutoff_date,
+            TournamentPlacement.region == "JP",
+            TournamentPlacement.best_of == 1,
+            TournamentPlacement.tournament_date >= cutoff_date,
             TournamentPlacement.decklist.isnot(None),
         )
-        .order_by(Tournament.date)
+        .order_by(TournamentPlacement.tournament_date)
     )
 
     try:
@@ -508,10 +511,8 @@ async def get_card_count_evolution(
         ) from None
 
     if not rows:
-        return CardCountEvolutionResponse(
-            archetype=archetype,
-            cards=[],
-            tournaments_analyzed=0,
+        return FastJSONResponse(
+            {"archetype": archetype, "cards": [], "tournaments_analyzed": 0}
         )
 
     # Group placements into weekly buckets and track aggregate card counts.
@@ -557,9 +558,10 @@ async def get_card_count_evolution(
         except SQLAlchemyError:
             logger.warning("Could not resolve card names", exc_info=True)
 
-    # Compute per-card evolution data
+    # Compute per-card evolution data as
+    # (week, avg_copies, inclusion_rate, sample_size) points
     sorted_weeks = sorted(week_total_decks.keys())
-    card_evolutions: dict[str, list[CardCountDataPoint]] = defaultdict(list)
+    card_evolutions: dict[str, list[tuple[date, float, float, int]]] = defaultdict(list)
 
     for week in sorted_weeks:
         total_decks = week_total_decks[week]
@@ -575,13 +577,11 @@ async def get_card_count_evolution(
             avg_copies = total_qty / total_decks
 
             card_evolutions[card_id].append(
-                CardCountDataPoint(
-                    snapshot_date=week,
-                    avg_copies=round(avg_copies, 2),
-                    inclusion_rate=(
-                        round(included / total_decks, 4) if total_decks > 0 else 0.0
-                    ),
-                    sample_size=total_decks,
+                (
+                    week,
+                    round(avg_copies, 2),
+                    round(included / total_decks, 4) if total_decks > 0 else 0.0,
+                    total_decks,
                 )
             )
 
@@ -590,8 +590,8 @@ async def get_card_count_evolution(
     for card_id, data_points in card_evolutions.items():
         if len(data_points) < 2:
             continue
-        first_avg = data_points[0].avg_copies
-        last_avg = data_points[-1].avg_copies
+        first_avg = data_points[0][1]
+        last_avg = data_points[-1][1]
         total_change = last_avg - first_avg
         card_changes.append((card_id, abs(total_change), total_change))
 
@@ -604,7 +604,7 @@ async def get_card_count_evolution(
         top_set = set(top_card_ids)
         # Sort by latest avg copies descending
         other_cards = [
-            (cid, dp[-1].avg_copies)
+            (cid, dp[-1][1])
             for cid, dp in card_evolutions.items()
             if cid not in top_set and dp
         ]
@@ -612,26 +612,36 @@ async def get_card_count_evolution(
         top_card_ids.extend(c[0] for c in other_cards[:remaining])
 
     # Build response
-    cards: list[CardCountEvolution] = []
+    cards = []
     for card_id in top_card_ids:
         data_points = card_evolutions.get(card_id, [])
-        first_avg = data_points[0].avg_copies if data_points else 0.0
-        last_avg = data_points[-1].avg_copies if data_points else 0.0
+        first_avg = data_points[0][1] if data_points else 0.0
+        last_avg = data_points[-1][1] if data_points else 0.0
 
         cards.append(
-            CardCountEvolution(
-                card_id=card_id,
-                card_name=card_names.get(card_id, card_id),
-                data_points=data_points,
-                total_change=round(last_avg - first_avg, 2),
-                current_avg=round(last_avg, 2),
-            )
+            {
+                "card_id": card_id,
+                "card_name": card_names.get(card_id, card_id),
+                "data_points": [
+                    {
+                        "snapshot_date": week,
+                        "avg_copies": avg_copies,
+                        "inclusion_rate": inclusion_rate,
+                        "sample_size": sample_size,
+                    }
+                    for week, avg_copies, inclusion_rate, sample_size in data_points
+                ],
+                "total_change": round(last_avg - first_avg, 2),
+                "current_avg": round(last_avg, 2),
+            }
         )
 
-    return CardCountEvolutionResponse(
-        archetype=archetype,
-        cards=cards,
-        tournaments_analyzed=len(tournament_ids),
+    return FastJSONResponse(
+        {
+            "archetype": archetype,
+            "cards": cards,
+            "tournaments_analyzed": len(tournament_ids),
+        }
     )
 
 
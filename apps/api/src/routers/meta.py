@@ -16,7 +16,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.database import get_db
 from src.dependencies.beta import require_beta
-from src.models import MetaSnapshot, Tournament, TournamentPlacement
+from src.models import (
+    ArchetypeKeyCards,
+    ArchetypeShareSeries,
+    MetaSnapshot,
+    Tournament,
+    TournamentPlacement,
+)
 from src.models.archetype_sprite import ArchetypeSprite
 from src.models.card import Card
 from src.models.card_id_mapping import CardIdMapping
@@ -25,10 +31,8 @@ from src.schemas import (
     ArchetypeHistoryPoint,
     ArchetypeResponse,
     BestOf,
-    CardUsageSummary,
     FormatForecastResponse,
     FormatNotes,
-    JPSignals,
     KeyCardResponse,
     MatchupResponse,
     MatchupSpreadResponse,
@@ -36,11 +40,13 @@ from src.schemas import (
     MetaHistoryResponse,
     MetaSnapshotResponse,
     SampleDeckResponse,
-    TrendInfo,
 )
 from src.schemas.freshness import CadenceProfile
+from src.services.card_catalog import refresh_card_catalog
 from src.services.freshness import build_data_freshness
 from src.services.meta_service import MetaService, TournamentType
+from src.utils.card_ids import canonical_card_id
+from src.utils.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +57,9 @@ router = APIRouter(
 )
 limiter = Limiter(key_func=get_remote_address)
 
+# Sample decklists shown on an archetype page
+SAMPLE_DECK_LIMIT = 10
+
 
 # Format notes for Japan BO1
 JAPAN_BO1_FORMAT_NOTES = FormatNotes(
@@ -96,84 +105,124 @@ async def _load_display_overrides(
         return {}
 
 
-def _snapshot_to_response(
+def _snapshot_payload(
     snapshot: MetaSnapshot,
     include_format_notes: bool = True,
     display_overrides: dict[str, str] | None = None,
     card_info: dict[str, tuple[str | None, str | None]] | None = None,
     cadence_profile: CadenceProfile = "default_cadence",
     latest_tpci_event_end_date: date | None = None,
-) -> MetaSnapshotResponse:
-    """Convert a MetaSnapshot model to response schema."""
+) -> dict[str, Any]:
+    """Build a MetaSnapshotResponse-shaped dict from a MetaSnapshot.
+
+    Used directly by the history endpoint's fast serialization path and
+    validated into a MetaSnapshotResponse everywhere else.
+    """
     overrides = display_overrides or {}
-    archetype_breakdown: list[ArchetypeResponse] = []
-    for raw_name, share in (snapshot.archetype_shares or {}).items():
-        name = str(raw_name)
-        archetype_breakdown.append(
-            ArchetypeResponse(
-                name=overrides.get(name, name),
-                share=share,
-            )
-        )
+    archetype_breakdown = [
+        {
+            "name": overrides.get(str(name), str(name)),
+            "share": share,
+            "sample_decks": None,
+            "key_cards": None,
+        }
+        for name, share in (snapshot.archetype_shares or {}).items()
+    ]
 
     card_info_map = card_info or {}
     card_usage = []
-    if snapshot.card_usage:
-        for card_id, usage_data in snapshot.card_usage.items():
-            ci = card_info_map.get(card_id)
-            card_usage.append(
-                CardUsageSummary(
-                    card_id=card_id,
-                    card_name=ci[0] if ci else None,
-                    image_small=ci[1] if ci else None,
-                    inclusion_rate=usage_data.get("inclusion_rate", 0.0),
-                    avg_copies=usage_data.get("avg_count", 0.0),
-                )
-            )
+    for card_id, usage_data in (snapshot.card_usage or {}).items():
+        ci = card_info_map.get(card_id)
+        card_usage.append(
+            {
+                "card_id": card_id,
+                "card_name": ci[0] if ci else None,
+                "image_small": ci[1] if ci else None,
+                "inclusion_rate": usage_data.get("inclusion_rate", 0.0),
+                "avg_copies": usage_data.get("avg_count", 0.0),
+            }
+        )
 
     format_notes = None
     if include_format_notes:
         format_notes = _get_format_notes(snapshot.best_of, snapshot.region)
 
-    # Convert enhanced fields from raw DB dicts to typed schemas
+    # Enhanced fields are stored as raw dicts; keep only schema keys
     jp_signals = None
     if snapshot.jp_signals:
-        jp_signals = JPSignals.model_validate(snapshot.jp_signals)
+        jp_signals = {
+            "rising": snapshot.jp_signals.get("rising", []),
+            "falling": snapshot.jp_signals.get("falling", []),
+            "divergent": [
+                {
+                    "archetype": d["archetype"],
+                    "jp_share": d["jp_share"],
+                    "en_share": d["en_share"],
+                    "diff": d["diff"],
+                }
+                for d in snapshot.jp_signals.get("divergent", [])
+            ],
+        }
 
     trends = None
     if snapshot.trends:
         trends = {
-            name: TrendInfo.model_validate(data)
+            name: {
+                "change": data["change"],
+                "direction": data["direction"],
+                "previous_share": data.get("previous_share"),
+            }
             for name, data in snapshot.trends.items()
         }
 
-    return MetaSnapshotResponse(
-        snapshot_date=snapshot.snapshot_date,
-        region=snapshot.region,
-        format=snapshot.format,  # type: ignore[arg-type]
-        best_of=snapshot.best_of,
-        tournament_type=snapshot.tournament_type,  # type: ignore[arg-type]
-        archetype_breakdown=archetype_breakdown,
-        card_usage=card_usage,
-        sample_size=snapshot.sample_size,
-        tournaments_included=snapshot.tournaments_included,
-        format_notes=format_notes,
-        diversity_index=(
+    return {
+        "snapshot_date": snapshot.snapshot_date,
+        "region": snapshot.region,
+        "format": snapshot.format,
+        "best_of": snapshot.best_of,
+        "tournament_type": snapshot.tournament_type,
+        "archetype_breakdown": archetype_breakdown,
+        "card_usage": card_usage,
+        "sample_size": snapshot.sample_size,
+        "tournaments_included": snapshot.tournaments_included,
+        "format_notes": format_notes,
+        "diversity_index": (
             float(snapshot.diversity_index)
             if snapshot.diversity_index is not None
             else None
         ),
-        tier_assignments=snapshot.tier_assignments,
-        jp_signals=jp_signals,
-        trends=trends,
-        era_label=snapshot.era_label,
-        freshness=build_data_freshness(
+        "tier_assignments": snapshot.tier_assignments,
+        "jp_signals": jp_signals,
+        "trends": trends,
+        "era_label": snapshot.era_label,
+        "freshness": build_data_freshness(
             cadence_profile=cadence_profile,
             snapshot_date=snapshot.snapshot_date,
             sample_size=snapshot.sample_size,
             latest_tpci_event_end_date=latest_tpci_event_end_date,
             source_coverage=_source_coverage_for_meta(cadence_profile),
         ),
+    }
+
+
+def _snapshot_to_response(
+    snapshot: MetaSnapshot,
+    include_format_notes: bool = True,
+    display_overrides: dict[str, str] | None = None,
+    card_info: dict[str, tuple[str | None, str | None]] | None = None,
+    cadence_profile: CadenceProfile = "default_cadence",
+    latest_tpci_event_end_date: date | None = None,
+) -> MetaSnapshotResponse:
+    """Convert a MetaSnapshot model to response schema."""
+    return MetaSnapshotResponse.model_validate(
+        _snapshot_payload(
+            snapshot,
+            include_format_notes=include_format_notes,
+            display_overrides=display_overrides,
+            card_info=card_info,
+            cadence_profile=cadence_profile,
+            latest_tpci_event_end_date=latest_tpci_event_end_date,
+        )
     )
 
 
@@ -312,7 +361,11 @@ async def get_current_meta(
     )
 
 
-@router.get("/history")
+@router.get(
+    "/history",
+    response_model=MetaHistoryResponse,
+    response_class=FastJSONResponse,
+)
 @limiter.limit("30/minute")
 async def get_meta_history(
     request: Request,
@@ -352,11 +405,12 @@ async def get_meta_history(
         TournamentType,
         Query(description="Tournament type (all, official, grassroots)"),
     ] = "all",
-) -> MetaHistoryResponse:
+) -> FastJSONResponse:
     """Get historical meta snapshots.
 
     Returns meta snapshots within the specified date range,
-    ordered by snapshot date descending (newest first).
+    ordered by snapshot date descending (newest first). Built as plain
+    dicts and encoded directly, since this is the largest meta payload.
     """
     start_date = start_date_param or date.today() - timedelta(days=days)
 
@@ -410,17 +464,19 @@ async def get_meta_history(
         all_card_ids.update((s.card_usage or {}).keys())
     ci = await _batch_lookup_cards(list(all_card_ids), db)
 
-    return MetaHistoryResponse(
-        snapshots=[
-            _snapshot_to_response(
-                s,
-                display_overrides=overrides,
-                card_info=ci,
-                cadence_profile=cadence_profile,
-                latest_tpci_event_end_date=latest_tpci_date,
-            )
-            for s in snapshots
-        ]
+    return FastJSONResponse(
+        {
+            "snapshots": [
+                _snapshot_payload(
+                    s,
+                    display_overrides=overrides,
+                    card_info=ci,
+                    cadence_profile=cadence_profile,
+                    latest_tpci_event_end_date=latest_tpci_date,
+                )
+                for s in snapshots
+            ]
+        }
     )
 
 
@@ -537,24 +593,33 @@ async def get_archetype_detail(
     """
     start_date = date.today() - timedelta(days=days)
 
-    # Get historical snapshots for archetype share over time
-    snapshot_query = select(MetaSnapshot).where(
-        MetaSnapshot.format == format,
-        MetaSnapshot.best_of == best_of,
-        MetaSnapshot.snapshot_date >= start_date,
-        MetaSnapshot.tournament_type == tournament_type,
+    # Share history: one range scan over the archetype's series
+    series_query = select(ArchetypeShareSeries).where(
+        ArchetypeShareSeries.archetype == name,
+        ArchetypeShareSeries.format == format,
+        ArchetypeShareSeries.best_of == best_of,
+        ArchetypeShareSeries.tournament_type == tournament_type,
+        ArchetypeShareSeries.snapshot_date >= start_date,
+    )
+    key_cards_query = select(ArchetypeKeyCards).where(
+        ArchetypeKeyCards.archetype == name,
+        ArchetypeKeyCards.format == format,
+        ArchetypeKeyCards.best_of == best_of,
+        ArchetypeKeyCards.tournament_type == tournament_type,
     )
 
     if region is None:
-        snapshot_query = snapshot_query.where(MetaSnapshot.region.is_(None))
+        series_query = series_query.where(ArchetypeShareSeries.region.is_(None))
+        key_cards_query = key_cards_query.where(ArchetypeKeyCards.region.is_(None))
     else:
-        snapshot_query = snapshot_query.where(MetaSnapshot.region == region)
+        series_query = series_query.where(ArchetypeShareSeries.region == region)
+        key_cards_query = key_cards_query.where(ArchetypeKeyCards.region == region)
 
-    snapshot_query = snapshot_query.order_by(MetaSnapshot.snapshot_date.desc())
+    series_query = series_query.order_by(ArchetypeShareSeries.snapshot_date.desc())
 
     try:
-        result = await db.execute(snapshot_query)
-        snapshots = result.scalars().all()
+        result = await db.execute(series_query)
+        points = result.scalars().all()
     except SQLAlchemyError:
         logger.error(
             "Database error fetching archetype history: name=%s, region=%s, format=%s",
@@ -568,53 +633,63 @@ async def get_archetype_detail(
             detail="Unable to retrieve archetype details. Please try again later.",
         ) from None
 
-    # Build history from snapshots
-    history: list[ArchetypeHistoryPoint] = []
-    current_share: float | None = None
-    found = False
-
-    for snapshot in snapshots:
-        archetype_shares = snapshot.archetype_shares or {}
-        if name in archetype_shares:
-            found = True
-            share = archetype_shares[name]
-            history.append(
-                ArchetypeHistoryPoint(
-                    snapshot_date=snapshot.snapshot_date,
-                    share=share,
-                    sample_size=snapshot.sample_size,
-                )
-            )
-            # Set current_share from first (most recent) snapshot only
-            if current_share is None:
-                current_share = share
-
-    if not found:
+    if not points:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Archetype '{name}' not found in meta snapshots",
         )
 
-    # Get recent tournament placements for this archetype to compute key cards
-    placement_query = (
-        select(TournamentPlacement)
-        .join(Tournament)
-        .where(
-            TournamentPlacement.archetype == name,
-            Tournament.format == format,
-            Tournament.best_of == best_of,
-            Tournament.date >= start_date,
+    history = [
+        ArchetypeHistoryPoint(
+            snapshot_date=point.snapshot_date,
+            share=point.share,
+            sample_size=point.sample_size,
+        )
+        for point in points
+    ]
+
+    # Key cards rolled up by compute-meta from the latest snapshot
+    try:
+        key_cards_result = await db.execute(key_cards_query)
+        rollup = key_cards_result.scalar_one_or_none()
+    except SQLAlchemyError:
+        logger.error(
+            "Database error fetching archetype key cards: name=%s, region=%s, "
+            "format=%s, best_of=%s",
+            name,
+            region,
+            format,
+            best_of,
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to retrieve archetype details. Please try again later.",
+        ) from None
+
+    key_cards = [
+        KeyCardResponse(
+            card_id=card["card_id"],
+            inclusion_rate=card["inclusion_rate"],
+            avg_copies=card["avg_copies"],
         )
+        for card in (rollup.key_cards if rollup else [])
+    ]
+
+    # Top recent placements for the sample decks
+    placement_query = select(TournamentPlacement).where(
+        TournamentPlacement.archetype == name,
+        TournamentPlacement.format == format,
+        TournamentPlacement.best_of == best_of,
+        TournamentPlacement.tournament_date >= start_date,
     )
 
-    if region is None:
-        placement_query = placement_query.where(Tournament.region.is_(None))
-    else:
-        placement_query = placement_query.where(Tournament.region == region)
+    if region is not None:
+        placement_query = placement_query.where(TournamentPlacement.region == region)
 
     placement_query = placement_query.order_by(
         TournamentPlacement.placement.asc()
-    ).limit(100)
+    ).limit(SAMPLE_DECK_LIMIT)
 
     try:
         placement_result = await db.execute(placement_query)
@@ -634,77 +709,20 @@ async def get_archetype_detail(
             detail="Unable to retrieve archetype details. Please try again later.",
         ) from None
 
-    # Compute key cards from placements with decklists
-    key_cards = _compute_key_cards(placements)
-
     # Enrich key cards with names and images
     await _enrich_key_cards(key_cards, db)
 
-    # Build sample decks from top placements
-    sample_decks = await _build_sample_decks(placements[:10], db)
+    sample_decks = await _build_sample_decks(placements, db)
 
     return ArchetypeDetailResponse(
         name=name,
-        current_share=current_share if current_share is not None else 0.0,
+        current_share=history[0].share,
         history=history,
         key_cards=key_cards,
         sample_decks=sample_decks,
     )
 
 
-def _compute_key_cards(
-    placements: Sequence[TournamentPlacement],
-) -> list[KeyCardResponse]:
-    """Compute key cards from tournament placements."""
-    placements_with_lists = [p for p in placements if p.decklist]
-
-    if not placements_with_lists:
-        return []
-
-    total = len(placements_with_lists)
-    card_appearances: dict[str, int] = defaultdict(int)
-    card_total_count: dict[str, int] = defaultdict(int)
-
-    for placement in placements_with_lists:
-        seen_cards: set[str] = set()
-        for card_entry in placement.decklist or []:
-            if not isinstance(card_entry, dict):
-                continue
-
-            card_id = card_entry.get("card_id", "")
-            if not card_id:
-                continue
-
-            try:
-                quantity = int(card_entry.get("quantity", 1))
-                if quantity < 1:
-                    continue
-            except (TypeError, ValueError):
-                continue
-
-            if card_id not in seen_cards:
-                card_appearances[card_id] += 1
-                seen_cards.add(card_id)
-
-            card_total_count[card_id] += quantity
-
-    key_cards = []
-    for card_id in card_appearances:
-        inclusion_rate = card_appearances[card_id] / total
-        avg_copies = card_total_count[card_id] / card_appearances[card_id]
-        key_cards.append(
-            KeyCardResponse(
-                card_id=card_id,
-                inclusion_rate=round(inclusion_rate, 4),
-                avg_copies=round(avg_copies, 2),
-            )
-        )
-
-    # Sort by inclusion rate descending
-    key_cards.sort(key=lambda c: c.inclusion_rate, reverse=True)
-    return key_cards[:20]  # Return top 20 key cards
-
-
 def _generate_card_id_variants(card_id: str) -> list[str]:
     """Generate padded/unpadded variants for both set and card numbers.
 
@@ -765,13 +783,18 @@ async def _batch_lookup_cards(
     """Batch lookup card names and images from the cards table.
 
     Returns dict of card_id -> (card_name, image_small).
-    Generates padded/unpadded ID variants to handle format mismatches
+    Matches on the indexed canonical card ID to handle format mismatches
     between Limitless (sv3-125) and TCGdex (sv03-125).
     Falls back to card_id_mappings for IDs that remain unresolved after
-    the variant lookup, bridging JP card IDs to their EN equivalents.
+    the canonical lookup, bridging JP card IDs to their EN equivalents.
+
+    When the in-memory card catalog is loaded, resolves without queries.
     """
     if not card_ids:
         return {}
+    catalog = await refresh_card_catalog(db)
+    if catalog is not None:
+        return catalog.batch_lookup(card_ids)
     try:
         card_info: dict[str, tuple[str | None, str | None]] = {}
 
@@ -795,26 +818,23 @@ async def _batch_lookup_cards(
         if not remaining_ids:
             return card_info
 
-        # Build variant-to-originals mapping so we can map DB results
-        # back to ALL card IDs the caller originally requested.
-        # Multiple original IDs can share a variant (e.g. sv3-125 and
-        # sv03-125 both generate {sv3-125, sv03-125}).
-        variant_to_originals: dict[str, list[str]] = {}
-        all_variants: set[str] = set()
+        # Group requested IDs by canonical form so DB results map back to
+        # ALL card IDs the caller asked for (sv3-125 and sv03-125 share one).
+        canonical_to_originals: dict[str, list[str]] = {}
         for cid in remaining_ids:
-            for variant in _generate_card_id_variants(cid):
-                variant_to_originals.setdefault(variant, []).append(cid)
-                all_variants.add(variant)
+            canonical_to_originals.setdefault(canonical_card_id(cid), []).append(cid)
 
-        # Step 1: Direct lookup in cards table using all variants
+        # Step 1: Canonical lookup in cards table; exact IDs win ties
         query = select(Card.id, Card.name, Card.japanese_name, Card.image_small).where(
-            Card.id.in_(list(all_variants))
+            Card.canonical_id.in_(list(canonical_to_originals))
         )
         result = await db.execute(query)
         for row in result.all():
             info = (row.name or row.japanese_name, row.image_small)
-            for original_id in variant_to_originals.get(row.id, []):
-                if original_id not in card_info:
+            for original_id in canonical_to_originals.get(
+                canonical_card_id(row.id), []
+            ):
+                if original_id not in card_info or original_id == row.id:
                     card_info[original_id] = info
 
         # Step 2: For missing IDs, check card_id_mappings
@@ -822,19 +842,15 @@ async def _batch_lookup_cards(
         if not missing_ids:
             return card_info
 
-        # Build variant-to-originals for JP mapping lookup
-        jp_variant_to_originals: dict[str, list[str]] = {}
-        all_jp_variants: set[str] = set()
+        jp_canonical_to_originals: dict[str, list[str]] = {}
         for cid in missing_ids:
-            for variant in _generate_card_id_variants(cid):
-                jp_variant_to_originals.setdefault(variant, []).append(cid)
-                all_jp_variants.add(variant)
+            jp_canonical_to_originals.setdefault(canonical_card_id(cid), []).append(cid)
 
         mapping_query = select(
-            CardIdMapping.jp_card_id,
+            CardIdMapping.jp_canonical_id,
             CardIdMapping.en_card_id,
             CardIdMapping.card_name_en,
-        ).where(CardIdMapping.jp_card_id.in_(list(all_jp_variants)))
+        ).where(CardIdMapping.jp_canonical_id.in_(list(jp_canonical_to_originals)))
         mapping_result = await db.execute(mapping_query)
         mappings = mapping_result.all()
 
@@ -844,34 +860,27 @@ async def _batch_lookup_cards(
         # Map DB hits back to original JP IDs
         jp_to_en: dict[str, Any] = {}
         for m in mappings:
-            for orig_id in jp_variant_to_originals.get(m.jp_card_id, []):
+            for orig_id in jp_canonical_to_originals.get(m.jp_canonical_id, []):
                 if orig_id not in jp_to_en:
                     jp_to_en[orig_id] = m
 
-        # Step 3: Look up EN cards with variants, map back to JP IDs
-        en_variant_to_originals: dict[str, list[str]] = {}
-        all_en_variants: set[str] = set()
-        for jp_id, mapping in jp_to_en.items():
-            for variant in _generate_card_id_variants(mapping.en_card_id):
-                en_variant_to_originals.setdefault(variant, []).append(jp_id)
-                all_en_variants.add(variant)
-
+        # Step 3: Look up EN cards by canonical ID, map back to JP IDs
+        exact_en_ids = {mapping.en_card_id for mapping in jp_to_en.values()}
         en_query = select(
             Card.id,
             Card.name,
             Card.japanese_name,
             Card.image_small,
-        ).where(Card.id.in_(list(all_en_variants)))
+        ).where(Card.canonical_id.in_({canonical_card_id(i) for i in exact_en_ids}))
         en_result = await db.execute(en_query)
-        en_cards = {row.id: row for row in en_result.all()}
+        en_cards: dict[str, Any] = {}
+        for row in en_result.all():
+            key = canonical_card_id(row.id)
+            if key not in en_cards or row.id in exact_en_ids:
+                en_cards[key] = row
 
         for jp_id, mapping in jp_to_en.items():
-            # Check all EN variants for this mapping
-            en_card = None
-            for variant in _generate_card_id_variants(mapping.en_card_id):
-                if variant in en_cards:
-                    en_card = en_cards[variant]
-                    break
+            en_card = en_cards.get(canonical_card_id(mapping.en_card_id))
             if en_card:
                 card_info[jp_id] = (
                     en_card.name or en_card.japanese_name,
@@ -1087,18 +1096,14 @@ async def get_archetype_matchups(
     start_date = date.today() - timedelta(days=days)
 
     # Get all placements from relevant tournaments
-    placement_query = (
-        select(TournamentPlacement)
-        .join(Tournament)
-        .where(
-            Tournament.format == format,
-            Tournament.best_of == best_of,
-            Tournament.date >= start_date,
-        )
+    placement_query = select(TournamentPlacement).where(
+        TournamentPlacement.format == format,
+        TournamentPlacement.best_of == best_of,
+        TournamentPlacement.tournament_date >= start_date,
     )
 
     if region is not None:
-        placement_query = placement_query.where(Tournament.region == region)
+        placement_query = placement_query.where(TournamentPlacement.region == region)
 
     try:
         result = await db.execute(placement_query)
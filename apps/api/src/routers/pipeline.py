@@ -15,6 +15,12 @@ from src.pipelines.backfill_major_format_windows import (
 from src.pipelines.backfill_major_format_windows import (
     backfill_major_format_windows,
 )
+from src.pipelines.backfill_meta_snapshots import (
+    BackfillMetaSnapshotsResult as BackfillMetaSnapshotsResultInternal,
+)
+from src.pipelines.backfill_meta_snapshots import (
+    backfill_meta_snapshots,
+)
 from src.pipelines.compute_evolution import (
     ComputeEvolutionResult as ComputeEvolutionResultInternal,
 )
@@ -33,6 +39,12 @@ from src.pipelines.compute_meta import (
 from src.pipelines.compute_meta import (
     compute_daily_snapshots,
 )
+from src.pipelines.compute_rotation_impact import (
+    ComputeRotationImpactResult as ComputeRotationImpactResultInternal,
+)
+from src.pipelines.compute_rotation_impact import (
+    compute_rotation_impact,
+)
 from src.pipelines.ingest_jp_tournament_articles import (
     ingest_jp_tournament_article,
 )
@@ -51,8 +63,18 @@ from src.pipelines.prune_tournaments import (
 from src.pipelines.reprocess_archetypes import (
     ReprocessArchetypesResult as ReprocessArchetypesResultInternal,
 )
+from src.pipelines.reprocess_archetypes import (
+    ReprocessJobResult as ReprocessJobResultInternal,
+)
 from src.pipelines.reprocess_archetypes import (
     reprocess_archetypes,
+    run_reprocess_job,
+)
+from src.pipelines.score_predictions import (
+    ScorePredictionsResult as ScorePredictionsResultInternal,
+)
+from src.pipelines.score_predictions import (
+    score_predictions,
 )
 from src.pipelines.scrape_limitless import (
     DiscoverResult as DiscoverResultInternal,
@@ -134,14 +156,19 @@ from src.pipelines.wipe_data import (
 from src.schemas.pipeline import (
     BackfillMajorFormatWindowsRequest,
     BackfillMajorFormatWindowsResult,
+    BackfillMetaSnapshotsRequest,
+    BackfillMetaSnapshotsResult,
     CleanupExportsRequest,
     CleanupExportsResult,
     ComputeEvolutionRequest,
     ComputeEvolutionResult,
     ComputeJPIntelligenceRequest,
     ComputeJPIntelligenceResult,
+    ComputeMetaComboTiming,
     ComputeMetaRequest,
     ComputeMetaResult,
+    ComputeRotationImpactRequest,
+    ComputeRotationImpactResult,
     DiscoverPokecabookRequest,
     DiscoverPokecabookResult,
     DiscoverRequest,
@@ -153,10 +180,14 @@ from src.schemas.pipeline import (
     ProcessTournamentRequest,
     PruneTournamentsRequest,
     PruneTournamentsResult,
+    ReprocessArchetypesJobRequest,
+    ReprocessArchetypesJobResult,
     ReprocessArchetypesRequest,
     ReprocessArchetypesResult,
     RescrapeJPRequest,
     RescrapeJPResult,
+    ScorePredictionsRequest,
+    ScorePredictionsResult,
     ScrapePlayersClubRequest,
     ScrapePlayersClubResult,
     ScrapePokekameshiRequest,
@@ -214,6 +245,17 @@ def _convert_meta_result(internal: ComputeMetaResultInternal) -> ComputeMetaResu
         snapshots_skipped=internal.snapshots_skipped,
         errors=internal.errors,
         success=internal.success,
+        combo_timings=[
+            ComputeMetaComboTiming(
+                combo=t.combo,
+                status=t.status,
+                wait_seconds=t.wait_seconds,
+                compute_seconds=t.compute_seconds,
+                save_seconds=t.save_seconds,
+            )
+            for t in internal.combo_timings
+        ],
+        duration_seconds=internal.duration_seconds,
     )
 
 
@@ -239,6 +281,7 @@ def _convert_discover_result(internal: DiscoverResultInternal) -> DiscoverResult
         tournaments_skipped=internal.tournaments_skipped,
         errors=internal.errors,
         success=internal.success,
+        phase_timings=internal.phase_timings,
     )
 
 
@@ -362,6 +405,7 @@ async def compute_meta_endpoint(
         snapshot_date=request.snapshot_date,
         dry_run=request.dry_run,
         lookback_days=request.lookback_days,
+        concurrency=request.concurrency,
     )
 
     logger.info(
@@ -421,6 +465,87 @@ async def compute_jp_intelligence_endpoint(
     return _convert_jp_intelligence_result(result)
 
 
+def _convert_rotation_impact_result(
+    internal: ComputeRotationImpactResultInternal,
+) -> ComputeRotationImpactResult:
+    """Convert internal ComputeRotationImpactResult to API schema."""
+    return ComputeRotationImpactResult(
+        format_transition=internal.format_transition,
+        rotating_cards=internal.rotating_cards,
+        decklists_evaluated=internal.decklists_evaluated,
+        archetypes_evaluated=internal.archetypes_evaluated,
+        impacts_saved=internal.impacts_saved,
+        impacts_removed=internal.impacts_removed,
+        ratings=internal.ratings,
+        errors=internal.errors,
+        success=internal.success,
+    )
+
+
+@router.post(
+    "/compute-rotation-impact",
+    response_model=ComputeRotationImpactResult,
+)
+async def compute_rotation_impact_endpoint(
+    request: ComputeRotationImpactRequest,
+) -> ComputeRotationImpactResult:
+    """Compute per-archetype rotation impact for a format transition.
+
+    Rates each recent archetype's survival against the cards rotating
+    out. Runs daily after compute-meta, and can be triggered manually
+    after placeholder cards or legalities change.
+    """
+    logger.info(
+        "Starting rotation impact pipeline: from=%s, to=%s, lookback=%d, dry_run=%s",
+        request.from_format,
+        request.to_format,
+        request.lookback_days,
+        request.dry_run,
+    )
+
+    result = await compute_rotation_impact(
+        from_format=request.from_format,
+        to_format=request.to_format,
+        lookback_days=request.lookback_days,
+        dry_run=request.dry_run,
+    )
+
+    return _convert_rotation_impact_result(result)
+
+
+def _convert_score_predictions_result(
+    internal: ScorePredictionsResultInternal,
+) -> ScorePredictionsResult:
+    """Convert internal ScorePredictionsResult to API schema."""
+    return ScorePredictionsResult(
+        predictions_scored=internal.predictions_scored,
+        tournaments_scored=internal.tournaments_scored,
+        rollups_written=internal.rollups_written,
+        errors=internal.errors,
+        success=internal.success,
+    )
+
+
+@router.post(
+    "/score-predictions",
+    response_model=ScorePredictionsResult,
+)
+async def score_predictions_endpoint(
+    request: ScorePredictionsRequest,
+) -> ScorePredictionsResult:
+    """Score predictions for completed tournaments and rebuild rollups.
+
+    Scores every unscored prediction whose target tournament has
+    placements, then recomputes the accuracy rollups read by the
+    evolution accuracy endpoint.
+    """
+    logger.info("Starting prediction scoring: dry_run=%s", request.dry_run)
+
+    result = await score_predictions(dry_run=request.dry_run)
+
+    return _convert_score_predictions_result(result)
+
+
 @router.post("/sync-cards", response_model=SyncCardsResult)
 async def sync_cards_endpoint(
     request: SyncCardsRequest,
@@ -897,6 +1022,66 @@ async def reprocess_archetypes_endpoint(
     return _convert_reprocess_result(result)
 
 
+def _convert_reprocess_job_result(
+    internal: ReprocessJobResultInternal,
+) -> ReprocessArchetypesJobResult:
+    """Convert internal ReprocessJobResult to API schema."""
+    return ReprocessArchetypesJobResult(
+        job_key=internal.job_key,
+        processed=internal.processed,
+        updated=internal.updated,
+        skipped=internal.skipped,
+        chunks=internal.chunks,
+        resumed_from=internal.resumed_from,
+        completed=internal.completed,
+        errors=internal.errors,
+        duration_seconds=internal.duration_seconds,
+        success=internal.success,
+    )
+
+
+@router.post(
+    "/reprocess-archetypes-job",
+    response_model=ReprocessArchetypesJobResult,
+)
+async def reprocess_archetypes_job_endpoint(
+    request: ReprocessArchetypesJobRequest,
+) -> ReprocessArchetypesJobResult:
+    """Reprocess archetype labels for a whole region in one resumable job.
+
+    Runs until all placements are processed or the time budget is spent.
+    Call again with the same job_key until completed is true; progress is
+    checkpointed per chunk. Chunks are resolved in this process; use
+    ``scripts/reprocess-archetypes.py --workers`` for a process pool.
+    """
+    logger.info(
+        "Starting archetype reprocess job: region=%s, force=%s, restart=%s, dry_run=%s",
+        request.region,
+        request.force,
+        request.restart,
+        request.dry_run,
+    )
+
+    result = await run_reprocess_job(
+        region=request.region,
+        force=request.force,
+        dry_run=request.dry_run,
+        job_key=request.job_key,
+        restart=request.restart,
+        chunk_size=request.chunk_size,
+        time_budget_seconds=request.time_budget_seconds,
+    )
+
+    logger.info(
+        "Reprocess job call complete: processed=%d, updated=%d, completed=%s",
+        result.processed,
+        result.updated,
+        result.completed,
+    )
+
+    return _convert_reprocess_job_result(result)
+
+
 # Rescrape JP tournaments pipeline
 
 
@@ -1034,6 +1219,58 @@ async def backfill_major_format_windows_endpoint(
     return _convert_backfill_major_windows_result(result)
 
 
+def _convert_backfill_meta_snapshots_result(
+    internal: BackfillMetaSnapshotsResultInternal,
+) -> BackfillMetaSnapshotsResult:
+    """Convert internal meta snapshot backfill result to API schema."""
+    return BackfillMetaSnapshotsResult(
+        dates_processed=internal.dates_processed,
+        tournaments_loaded=internal.tournaments_loaded,
+        snapshots_computed=internal.snapshots_computed,
+        snapshots_saved=internal.snapshots_saved,
+        snapshots_skipped=internal.snapshots_skipped,
+        errors=internal.errors,
+        success=internal.success,
+        duration_seconds=internal.duration_seconds,
+    )
+
+
+@router.post(
+    "/backfill-meta-snapshots",
+    response_model=BackfillMetaSnapshotsResult,
+)
+async def backfill_meta_snapshots_endpoint(
+    request: BackfillMetaSnapshotsRequest,
+) -> BackfillMetaSnapshotsResult:
+    """Recompute historical meta snapshots over a date range.
+
+    Run manually after changing archetype normalization or share weighting.
+    """
+    logger.info(
+        "Starting meta snapshot backfill: %s..%s, dry_run=%s, lookback=%d",
+        request.start_date,
+        request.end_date,
+        request.dry_run,
+        request.lookback_days,
+    )
+
+    result = await backfill_meta_snapshots(
+        request.start_date,
+        request.end_date,
+        dry_run=request.dry_run,
+        lookback_days=request.lookback_days,
+    )
+
+    logger.info(
+        "Meta snapshot backfill complete: dates=%d, saved=%d, errors=%d",
+        result.dates_processed,
+        result.snapshots_saved,
+        len(result.errors),
+    )
+
+    return _convert_backfill_meta_snapshots_result(result)
+
+
 # Prune tournaments pipeline
 
 
@@ -1045,6 +1282,13 @@ def _convert_prune_result(
         tournaments_deleted=internal.tournaments_deleted,
         placements_deleted=internal.placements_deleted,
         tournaments_remaining=internal.tournaments_remaining,
+        batches=internal.batches,
+        partitions_dropped=internal.partitions_dropped,
+        placements_dropped=internal.placements_dropped,
+        archived_objects=internal.archived_objects,
+        completed=internal.completed,
+        duration_seconds=internal.duration_seconds,
+        placements_per_second=internal.placements_per_second,
         errors=internal.errors,
         success=internal.success,
     )
@@ -1057,26 +1301,36 @@ async def prune_tournaments_endpoint(
     """Delete tournaments before a cutoff date.
 
     Removes tournaments and their placements that fall before
-    the specified date. Optionally filter by region.
+    the specified date in bounded batches, optionally archiving them
+    first. Optionally filter by region. Returns completed=false when the
+    time budget runs out; call again to resume.
     """
     logger.warning(
-        "Starting prune-tournaments: before=%s, region=%s, dry_run=%s",
+        "Starting prune-tournaments: before=%s, region=%s, dry_run=%s, archive=%s",
         request.before_date,
         request.region,
         request.dry_run,
+        request.archive,
     )
 
     result = await prune_tournaments(
         before_date=request.before_date,
         region=request.region,
         dry_run=request.dry_run,
+        archive=request.archive,
+        batch_size=request.batch_size,
+        time_budget_seconds=request.time_budget_seconds,
     )
 
     logger.warning(
-        "Prune complete: deleted=%d tournaments, %d placements, %d remaining",
+        "Prune %s: deleted=%d tournaments, %d placements, %d remaining "
+        "(%d batches, %.0f placements/s)",
+        "complete" if result.completed else "paused",
         result.tournaments_deleted,
         result.placements_deleted,
         result.tournaments_remaining,
+        result.batches,
+        result.placements_per_second,
     )
 
     return _convert_prune_result(result)
@@ -21,13 +21,14 @@ from src.schemas.public import (
     PublicArchetypeShare,
     PublicHomeTeaser,
     PublicJPComparison,
-    PublicMetaHistoryPoint,
     PublicMetaHistoryResponse,
     PublicMetaSnapshot,
     PublicTeaserArchetype,
     PublicTournamentListResponse,
     PublicTournamentSummary,
 )
+from src.services.meta_service import MetaService
+from src.utils.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,6 @@ PUBLIC_TEASER_DELAY_DAYS = 14
 PUBLIC_TEASER_TOP_N = 5
 PUBLIC_TEASER_MIN_SAMPLE_SIZE = 50
 PUBLIC_ROUNDING_STEP = 0.005
-PUBLIC_TEASER_LOOKBACK_LIMIT = 30
 
 
 def _round_share_for_public(share: float) -> float:
@@ -58,44 +58,19 @@ async def get_home_teaser(
     """
     cutoff_date = date.today() - timedelta(days=PUBLIC_TEASER_DELAY_DAYS)
 
-    global_query = (
-        select(MetaSnapshot)
-        .where(MetaSnapshot.format == format)
-        .where(MetaSnapshot.best_of == 3)
-        .where(MetaSnapshot.region.is_(None))
-        .where(MetaSnapshot.snapshot_date <= cutoff_date)
-        .where(MetaSnapshot.sample_size >= PUBLIC_TEASER_MIN_SAMPLE_SIZE)
-        .order_by(MetaSnapshot.snapshot_date.desc())
-        .limit(PUBLIC_TEASER_LOOKBACK_LIMIT)
-    )
-
-    jp_query = (
-        select(MetaSnapshot)
-        .where(MetaSnapshot.format == format)
-        .where(MetaSnapshot.best_of == 1)
-        .where(MetaSnapshot.region == "JP")
-        .where(MetaSnapshot.snapshot_date <= cutoff_date)
-        .order_by(MetaSnapshot.snapshot_date.desc())
-        .limit(1)
+    comparison = await MetaService(db).get_jp_comparison(
+        game_format=format,
+        on_or_before=cutoff_date,
+        min_en_sample_size=PUBLIC_TEASER_MIN_SAMPLE_SIZE,
+        min_jp_sample_size=1,
     )
 
-    global_result = await db.execute(global_query)
-    global_candidates = list(global_result.scalars().all())
-    global_snapshot = next(
-        (
-            snapshot
-            for snapshot in global_candidates
-            if snapshot.sample_size >= PUBLIC_TEASER_MIN_SAMPLE_SIZE
-            and snapshot.archetype_shares
-            and len(snapshot.archetype_shares) > 0
-        ),
-        None,
-    )
-
-    jp_result = await db.execute(jp_query)
-    jp_snapshot = jp_result.scalar_one_or_none()
-
-    if not global_snapshot:
+    global_entries = [
+        entry
+        for entry in (comparison.archetypes if comparison else [])
+        if entry["en_share"] is not None
+    ]
+    if not comparison or not global_entries:
         return PublicHomeTeaser(
             snapshot_date=None,
             delay_days=PUBLIC_TEASER_DELAY_DAYS,
@@ -103,27 +78,23 @@ async def get_home_teaser(
             top_archetypes=[],
         )
 
-    jp_map = jp_snapshot.archetype_shares if jp_snapshot else {}
     top_archetypes: list[PublicTeaserArchetype] = []
 
-    sorted_global = sorted(
-        global_snapshot.archetype_shares.items(), key=lambda x: x[1], reverse=True
-    )[:PUBLIC_TEASER_TOP_N]
+    global_entries.sort(key=lambda e: e["en_share"], reverse=True)
+    sorted_global = global_entries[:PUBLIC_TEASER_TOP_N]
 
-    for name, global_share_raw in sorted_global:
-        global_share = _round_share_for_public(float(global_share_raw))
+    for entry in sorted_global:
+        global_share = _round_share_for_public(entry["en_share"])
 
-        jp_raw = jp_map.get(name)
-        jp_share = (
-            _round_share_for_public(float(jp_raw)) if jp_raw is not None else None
-        )
+        jp_raw = entry["jp_share"]
+        jp_share = _round_share_for_public(jp_raw) if jp_raw is not None else None
         divergence_pp = None
         if jp_share is not None:
             divergence_pp = round((jp_share - global_share) * 100, 1)
 
         top_archetypes.append(
             PublicTeaserArchetype(
-                name=name,
+                name=entry["archetype"],
                 global_share=global_share,
                 jp_share=jp_share,
                 divergence_pp=divergence_pp,
@@ -131,9 +102,9 @@ async def get_home_teaser(
         )
 
     return PublicHomeTeaser(
-        snapshot_date=global_snapshot.snapshot_date.isoformat(),
+        snapshot_date=comparison.snapshot_date.isoformat(),
         delay_days=PUBLIC_TEASER_DELAY_DAYS,
-        sample_size=global_snapshot.sample_size,
+        sample_size=comparison.en_sample_size,
         top_archetypes=top_archetypes,
     )
 
@@ -211,7 +182,11 @@ async def get_meta_snapshot(
     )
 
 
-@router.get("/meta/history")
+@router.get(
+    "/meta/history",
+    response_model=PublicMetaHistoryResponse,
+    response_class=FastJSONResponse,
+)
 async def get_meta_history(
     db: Annotated[AsyncSession, Depends(get_db)],
     api_key: ApiKeyAuth,
@@ -219,14 +194,20 @@ async def get_meta_history(
     format: Annotated[Literal["standard", "expanded"], Query()] = "standard",
     best_of: Annotated[Literal[1, 3], Query()] = 3,
     days: Annotated[int, Query(ge=1, le=90)] = 30,
-) -> PublicMetaHistoryResponse:
+) -> FastJSONResponse:
     """Get meta history over time.
 
     Returns daily meta snapshots for the specified period.
     Requires API key authentication.
     """
+    # Only the columns the history needs; card_usage and the other
+    # JSONB columns stay in the database
     query = (
-        select(MetaSnapshot)
+        select(
+            MetaSnapshot.snapshot_date,
+            MetaSnapshot.archetype_shares,
+            MetaSnapshot.sample_size,
+        )
         .where(MetaSnapshot.format == format)
         .where(MetaSnapshot.best_of == best_of)
     )
@@ -239,27 +220,25 @@ async def get_meta_history(
     query = query.order_by(MetaSnapshot.snapshot_date.desc()).limit(days)
 
     result = await db.execute(query)
-    snapshots = list(result.scalars().all())
+    rows = result.all()
 
     history = []
-    for snapshot in reversed(snapshots):  # Chronological order
+    for snapshot_date, archetype_shares, sample_size in reversed(rows):
+        # Chronological order
         top_archetypes = sorted(
-            snapshot.archetype_shares.items(), key=lambda x: x[1], reverse=True
+            archetype_shares.items(), key=lambda x: x[1], reverse=True
         )[:10]
 
         history.append(
-            PublicMetaHistoryPoint(
-                date=snapshot.snapshot_date.isoformat(),
-                archetypes={name: float(share) for name, share in top_archetypes},
-                sample_size=snapshot.sample_size,
-            )
+            {
+                "date": snapshot_date.isoformat(),
+                "archetypes": {name: float(share) for name, share in top_archetypes},
+                "sample_size": sample_size,
+            }
         )
 
-    return PublicMetaHistoryResponse(
-        region=region,
-        format=format,
-        days=days,
-        history=history,
+    return FastJSONResponse(
+        {"region": region, "format": format, "days": days, "history": history}
     )
 
 
@@ -392,63 +371,26 @@ async def get_jp_comparison(
     Compares Japan BO1 meta with global BO3 meta.
     Requires API key authentication.
     """
-    # Get JP snapshot (BO1)
-    jp_query = (
-        select(MetaSnapshot)
-        .where(MetaSnapshot.format == format)
-        .where(MetaSnapshot.best_of == 1)
-        .where(MetaSnapshot.region == "JP")
-        .order_by(MetaSnapshot.snapshot_date.desc())
-        .limit(1)
+    comparison = await MetaService(db).get_jp_comparison(
+        game_format=format, min_jp_sample_size=1
     )
-
-    jp_result = await db.execute(jp_query)
-    jp_snapshot = jp_result.scalar_one_or_none()
-
-    # Get global snapshot (BO3)
-    en_query = (
-        select(MetaSnapshot)
-        .where(MetaSnapshot.format == format)
-        .where(MetaSnapshot.best_of == 3)
-        .where(MetaSnapshot.region.is_(None))
-        .order_by(MetaSnapshot.snapshot_date.desc())
-        .limit(1)
-    )
-
-    en_result = await db.execute(en_query)
-    en_snapshot = en_result.scalar_one_or_none()
-
-    # Build comparison
-    all_archetypes = set()
-    if jp_snapshot:
-        all_archetypes.update(jp_snapshot.archetype_shares.keys())
-    if en_snapshot:
-        all_archetypes.update(en_snapshot.archetype_shares.keys())
-
-    comparisons = []
-    for archetype in all_archetypes:
-        jp_share = (
-            float(jp_snapshot.archetype_shares.get(archetype, 0)) if jp_snapshot else 0
-        )
-        en_share = (
-            float(en_snapshot.archetype_shares.get(archetype, 0)) if en_snapshot else 0
+    if comparison is None:
+        return PublicJPComparison(
+            format=format, jp_date=None, en_date=None, comparisons=[]
         )
-        comparisons.append(
-            {
-                "archetype": archetype,
-                "jp_share": jp_share,
-                "en_share": en_share,
-                "divergence": jp_share - en_share,
-            }
-        )
-
-    # Sort by max share and take top N
-    comparisons.sort(key=lambda x: max(x["jp_share"], x["en_share"]), reverse=True)
-    comparisons = comparisons[:top_n]
 
+    snapshot_date = comparison.snapshot_date.isoformat()
     return PublicJPComparison(
         format=format,
-        jp_date=jp_snapshot.snapshot_date.isoformat() if jp_snapshot else None,
-        en_date=en_snapshot.snapshot_date.isoformat() if en_snapshot else None,
-        comparisons=comparisons,
+        jp_date=snapshot_date,
+        en_date=snapshot_date,
+        comparisons=[
+            {
+                "archetype": entry["archetype"],
+                "jp_share": entry["jp_share"] or 0.0,
+                "en_share": entry["en_share"] or 0.0,
+                "divergence": entry["divergence"],
+            }
+            for entry in comparison.archetypes[:top_n]
+        ],
     )
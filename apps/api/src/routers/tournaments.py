@@ -1,6 +1,7 @@
 """Tournament endpoints."""
 
 import logging
+import math
 from collections import Counter
 from datetime import date, timedelta
 from typing import Annotated, Literal
@@ -15,7 +16,7 @@ from sqlalchemy.orm import MappedColumn, selectinload
 from src.db.database import get_db
 from src.dependencies.beta import require_beta
 from src.models import Card, PlaceholderCard, Set, Tournament, TournamentPlacement
-from src.schemas import BestOf, PaginatedResponse, TopPlacement, TournamentSummary
+from src.schemas import BestOf, PaginatedResponse, TournamentSummary
 from src.schemas.freshness import CadenceProfile
 from src.schemas.tournament import (
     ArchetypeMeta,
@@ -27,6 +28,7 @@ from src.schemas.tournament import (
 )
 from src.services.freshness import build_data_freshness
 from src.services.major_format_windows import OFFICIAL_MAJOR_TIERS
+from src.utils.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +64,11 @@ def _tournament_cadence_profile(
     return "default_cadence"
 
 
-@router.get("")
+@router.get(
+    "",
+    response_model=PaginatedResponse[TournamentSummary],
+    response_class=FastJSONResponse,
+)
 async def list_tournaments(
     db: Annotated[AsyncSession, Depends(get_db)],
     region: Annotated[
@@ -117,7 +123,7 @@ async def list_tournaments(
         int,
         Query(ge=1, le=100, description="Items per page"),
     ] = 20,
-) -> PaginatedResponse[TournamentSummary]:
+) -> FastJSONResponse:
     """List tournaments with pagination and filters.
 
     Returns tournaments ordered by date descending (most recent first).
@@ -232,8 +238,9 @@ async def list_tournaments(
             detail="Unable to retrieve tournaments. Please try again later.",
         ) from None
 
-    # Build response
-    items: list[TournamentSummary] = []
+    # Build response as plain dicts; the route's response_model documents
+    # the shape
+    items = []
     for tournament in tournaments:
         # Get top 8 placements
         top_placements = sorted(
@@ -242,43 +249,47 @@ async def list_tournaments(
         )[:8]
 
         items.append(
-            TournamentSummary(
-                id=str(tournament.id),
-                name=tournament.name,
-                date=tournament.date,
-                region=tournament.region,
-                country=tournament.country,
-                format=tournament.format,
-                best_of=tournament.best_of,
-                tier=tournament.tier,
-                participant_count=tournament.participant_count,
-                major_format_key=tournament.major_format_key,
-                major_format_label=tournament.major_format_label,
-                top_placements=[
-                    TopPlacement(
-                        placement=p.placement,
-                        player_name=p.player_name,
-                        archetype=p.archetype,
-                    )
+            {
+                "id": str(tournament.id),
+                "name": tournament.name,
+                "date": tournament.date,
+                "region": tournament.region,
+                "country": tournament.country,
+                "format": tournament.format,
+                "best_of": tournament.best_of,
+                "tier": tournament.tier,
+                "participant_count": tournament.participant_count,
+                "major_format_key": tournament.major_format_key,
+                "major_format_label": tournament.major_format_label,
+                "top_placements": [
+                    {
+                        "placement": p.placement,
+                        "player_name": p.player_name,
+                        "archetype": p.archetype,
+                    }
                     for p in top_placements
                 ],
-            )
+            }
         )
 
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        limit=limit,
-        has_next=offset + len(items) < total,
-        has_prev=page > 1,
-        freshness=build_data_freshness(
-            cadence_profile=_tournament_cadence_profile(region, best_of, tier),
-            snapshot_date=latest_tournament_date,
-            sample_size=total,
-            latest_tpci_event_end_date=latest_tournament_date,
-            source_coverage=_source_coverage_for_tournaments(region, tier),
-        ),
+    return FastJSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "has_next": offset + len(items) < total,
+            "has_prev": page > 1,
+            "next_cursor": None,
+            "freshness": build_data_freshness(
+                cadence_profile=_tournament_cadence_profile(region, best_of, tier),
+                snapshot_date=latest_tournament_date,
+                sample_size=total,
+                latest_tpci_event_end_date=latest_tournament_date,
+                source_coverage=_source_coverage_for_tournaments(region, tier),
+            ),
+            "total_pages": math.ceil(total / limit),
+        }
     )
 
 
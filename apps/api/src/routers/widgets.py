@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
 from src.dependencies import CreatorUser
 from src.schemas.widget import (
+    WidgetAnalyticsResponse,
     WidgetCreate,
     WidgetDataResponse,
     WidgetEmbedCodeResponse,
@@ -105,12 +106,6 @@ async def get_widget_data(
     """
     service = WidgetService(db)
 
-    # Record view
-    referrer = request.headers.get("referer")
-    ip_address = request.client.host if request.client else None
-    user_agent = request.headers.get("user-agent")
-    await service.record_view(widget_id, referrer, ip_address, user_agent)
-
     # Resolve data
     data = await service.get_widget_data(widget_id)
     if "error" in data and data.get("error") == "Widget not found":
@@ -118,9 +113,38 @@ async def get_widget_data(
             status_code=status.HTTP_404_NOT_FOUND, detail="Widget not found"
         )
 
+    # Record view (buffered; no database write on the request path)
+    referrer = request.headers.get("referer")
+    ip_address = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+    service.record_view(widget_id, referrer, ip_address, user_agent)
+
     return WidgetDataResponse(**data)
 
 
+@router.get("/{widget_id}/analytics")
+async def get_widget_analytics(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: CreatorUser,
+    widget_id: str,
+    days: Annotated[int, Query(ge=1, le=90)] = 30,
+) -> WidgetAnalyticsResponse:
+    """Get daily views and top referrers for a widget.
+
+    Requires creator access and ownership. Served from hourly rollups,
+    which trail live traffic by up to one flush interval.
+    """
+    service = WidgetService(db)
+    widget = await service.get_widget_for_owner(widget_id, current_user)
+    if widget is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Widget not found"
+        )
+
+    analytics = await service.get_view_analytics(widget, days=days)
+    return WidgetAnalyticsResponse(**analytics)
+
+
 @router.get("/{widget_id}/embed-code")
 async def get_embed_code(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -83,6 +83,7 @@ from src.schemas.pagination import PaginatedResponse
 from src.schemas.pipeline import (
     ComputeEvolutionRequest,
     ComputeEvolutionResult,
+    ComputeMetaComboTiming,
     ComputeMetaRequest,
     ComputeMetaResult,
     PipelineRequest,
@@ -149,6 +150,7 @@ __all__ = [
     "AdaptationResponse",
     "ComputeEvolutionRequest",
     "ComputeEvolutionResult",
+    "ComputeMetaComboTiming",
     "ComputeMetaRequest",
     "ComputeMetaResult",
     "EvolutionArticleListItem",
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel
 
+from src.schemas.health import PipelineRunDetail
+
 
 class TableInfo(BaseModel):
     """Row count and freshness info for a database table."""
@@ -64,3 +66,4 @@ class PipelineHealthResponse(BaseModel):
 
     pipelines: list[PipelineHealthItem]
     checked_at: str
+    recent_runs: list[PipelineRunDetail] = []
@@ -177,6 +177,12 @@ class PredictionAccuracyResponse(BaseModel):
     average_accuracy: float | None = Field(
         default=None, ge=0.0, le=1.0, description="Average accuracy score (0-1)"
     )
+    baseline_average_accuracy: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Average accuracy of the statistical baseline forecasts (0-1)",
+    )
     predictions: list[PredictionResponse] = Field(
         default_factory=list, description="Recent scored predictions"
     )
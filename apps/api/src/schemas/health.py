@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ScrapeHealthDetail(BaseModel):
@@ -86,6 +86,41 @@ class SourceHealthDetail(BaseModel):
     failure_reason: str | None = None
 
 
+class PipelineStepDetail(BaseModel):
+    """Timing and throughput of one step of a pipeline run."""
+
+    name: str
+    status: str
+    wall_seconds: float
+    cpu_seconds: float
+    db_queries: int
+    db_seconds: float
+    http_requests: int
+    http_bytes: int
+    error: str | None = None
+
+
+class PipelineRunDetail(BaseModel):
+    """A recorded pipeline run with its per-step breakdown."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    run_id: str
+    pipeline: str
+    status: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    wall_seconds: float
+    cpu_seconds: float
+    db_queries: int
+    db_seconds: float
+    http_requests: int
+    http_bytes: int
+    steps: list[PipelineStepDetail] = []
+    steps_dropped: int = 0
+    error: str | None = None
+
+
 class PipelineHealthResponse(BaseModel):
     """Full pipeline health response."""
 
@@ -96,3 +131,4 @@ class PipelineHealthResponse(BaseModel):
     sources: list[SourceHealthDetail] = []
     checked_at: datetime
     verbose: VerboseArchetypeDetail | None = None
+    recent_runs: list[PipelineRunDetail] = []
@@ -53,6 +53,12 @@ class ComputeMetaRequest(PipelineRequest):
         le=365,
         description="Days to look back for tournament data",
     )
+    concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Snapshot combos computed at once (1 = single session)",
+    )
 
 
 class SyncCardsRequest(PipelineRequest):
@@ -73,6 +79,18 @@ class ScrapeResult(BaseModel):
     success: bool = Field(description="Whether pipeline completed without errors")
 
 
+class ComputeMetaComboTiming(BaseModel):
+    """Timing breakdown for one compute meta snapshot combo."""
+
+    combo: str = Field(description="Combo label (region/format/BO)")
+    status: str = Field(description="pending, computed, skipped, saved or error")
+    wait_seconds: float = Field(
+        ge=0, description="Time waiting on dependencies or a session slot"
+    )
+    compute_seconds: float = Field(ge=0, description="Time computing the snapshot")
+    save_seconds: float = Field(ge=0, description="Time saving the snapshot")
+
+
 class ComputeMetaResult(BaseModel):
     """Result from compute meta pipeline."""
 
@@ -81,6 +99,12 @@ class ComputeMetaResult(BaseModel):
     snapshots_skipped: int = Field(ge=0, description="Snapshots skipped (no data)")
     errors: list[str] = Field(default_factory=list, description="Error messages")
     success: bool = Field(description="Whether pipeline completed without errors")
+    combo_timings: list[ComputeMetaComboTiming] = Field(
+        default_factory=list, description="Per-combo timing breakdown"
+    )
+    duration_seconds: float = Field(
+        default=0.0, ge=0, description="Total snapshot computation time"
+    )
 
 
 class DiscoverRequest(PipelineRequest):
@@ -122,6 +146,10 @@ class DiscoverResult(BaseModel):
     )
     errors: list[str] = Field(default_factory=list, description="Error messages")
     success: bool = Field(description="Whether pipeline completed without errors")
+    phase_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds spent per phase (listing fetch, existence check, enqueue)",
+    )
 
 
 class ProcessTournamentRequest(BaseModel):
@@ -340,6 +368,63 @@ class ComputeJPIntelligenceResult(BaseModel):
     success: bool = Field(description="Whether pipeline completed without errors")
 
 
+class ComputeRotationImpactRequest(PipelineRequest):
+    """Request for rotation impact pipeline."""
+
+    from_format: str | None = Field(
+        default=None,
+        description="Format rotating away (defaults to the current format)",
+    )
+    to_format: str | None = Field(
+        default=None,
+        description="Format rotating in (defaults to the upcoming format)",
+    )
+    lookback_days: int = Field(
+        default=90,
+        ge=1,
+        le=365,
+        description="Days of placements whose decklists are evaluated",
+    )
+
+
+class ComputeRotationImpactResult(BaseModel):
+    """Result from rotation impact pipeline."""
+
+    format_transition: str | None = Field(
+        default=None, description="Transition computed (e.g., 'svi-asc-to-tef-asc')"
+    )
+    rotating_cards: int = Field(ge=0, description="Card names rotating out")
+    decklists_evaluated: int = Field(ge=0, description="Decklists evaluated")
+    archetypes_evaluated: int = Field(ge=0, description="Archetypes rated")
+    impacts_saved: int = Field(ge=0, description="RotationImpact rows upserted")
+    impacts_removed: int = Field(
+        ge=0, description="Stale computed RotationImpact rows deleted"
+    )
+    ratings: dict[str, int] = Field(
+        default_factory=dict, description="Archetype count per survival rating"
+    )
+    errors: list[str] = Field(default_factory=list, description="Error messages")
+    success: bool = Field(description="Whether pipeline completed without errors")
+
+
+class ScorePredictionsRequest(PipelineRequest):
+    """Request for prediction scoring pipeline."""
+
+    pass
+
+
+class ScorePredictionsResult(BaseModel):
+    """Result from prediction scoring pipeline."""
+
+    predictions_scored: int = Field(ge=0, description="Predictions scored")
+    tournaments_scored: int = Field(
+        ge=0, description="Completed tournaments predictions were scored against"
+    )
+    rollups_written: int = Field(ge=0, description="Accuracy rollup rows written")
+    errors: list[str] = Field(default_factory=list, description="Error messages")
+    success: bool = Field(description="Whether pipeline completed without errors")
+
+
 class RescrapeJPRequest(PipelineRequest):
     """Request for JP rescrape pipeline."""
 
@@ -404,6 +489,56 @@ class ReprocessArchetypesResult(BaseModel):
     success: bool = Field(description="Whether pipeline succeeded")
 
 
+class ReprocessArchetypesJobRequest(PipelineRequest):
+    """Request for resumable set-based archetype reprocess job."""
+
+    region: str = Field(
+        default="JP",
+        description="Tournament region to reprocess",
+    )
+    force: bool = Field(
+        default=False,
+        description="Re-run even if detection_method is populated",
+    )
+    job_key: str | None = Field(
+        default=None,
+        max_length=100,
+        description="Checkpoint key (defaults to one job per region and mode)",
+    )
+    restart: bool = Field(
+        default=False,
+        description="Discard the checkpoint and start from the beginning",
+    )
+    chunk_size: int = Field(
+        default=1000,
+        ge=100,
+        le=5000,
+        description="Placements per chunk and bulk update",
+    )
+    time_budget_seconds: float | None = Field(
+        default=1500,
+        gt=0,
+        description="Stop after this long; the next call resumes",
+    )
+
+
+class ReprocessArchetypesJobResult(BaseModel):
+    """Result from resumable archetype reprocess job."""
+
+    job_key: str = Field(description="Checkpoint key")
+    processed: int = Field(ge=0, description="Placements processed this call")
+    updated: int = Field(ge=0, description="Placements updated this call")
+    skipped: int = Field(ge=0, description="Placements unchanged this call")
+    chunks: int = Field(ge=0, description="Chunks applied this call")
+    resumed_from: str | None = Field(
+        default=None, description="Placement ID the call resumed after"
+    )
+    completed: bool = Field(description="Whether the job reached the end")
+    errors: list[str] = Field(default_factory=list)
+    duration_seconds: float = Field(default=0.0, ge=0, description="Run time")
+    success: bool = Field(description="Whether pipeline succeeded")
+
+
 class PruneTournamentsRequest(PipelineRequest):
     """Request for tournament pruning pipeline."""
 
@@ -414,14 +549,50 @@ class PruneTournamentsRequest(PipelineRequest):
         default=None,
         description="Filter by region (e.g. JP). None = all regions.",
     )
+    archive: bool = Field(
+        default=False,
+        description="Archive pruned rows to PRUNE_ARCHIVE_BUCKET before deleting",
+    )
+    batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=5000,
+        description="Tournaments deleted per batch and transaction",
+    )
+    time_budget_seconds: float | None = Field(
+        default=1500,
+        gt=0,
+        description="Stop starting new batches after this long; rerun to resume",
+    )
 
 
 class PruneTournamentsResult(BaseModel):
     """Result from tournament pruning pipeline."""
 
     tournaments_deleted: int = Field(ge=0, description="Tournaments deleted")
-    placements_deleted: int = Field(ge=0, description="Placements deleted")
+    placements_deleted: int = Field(
+        ge=0, description="Placements deleted row by row (not in dropped partitions)"
+    )
     tournaments_remaining: int = Field(ge=0, description="Tournaments remaining")
+    batches: int = Field(default=0, ge=0, description="Batches committed")
+    partitions_dropped: list[str] = Field(
+        default_factory=list, description="Monthly placement partitions dropped"
+    )
+    placements_dropped: int = Field(
+        default=0, ge=0, description="Placements in the dropped partitions"
+    )
+    archived_objects: list[str] = Field(
+        default_factory=list, description="Archive objects written"
+    )
+    completed: bool = Field(
+        default=True, description="Whether every matching tournament was pruned"
+    )
+    duration_seconds: float = Field(default=0.0, ge=0, description="Run time")
+    placements_per_second: float = Field(
+        default=0.0,
+        ge=0,
+        description="Placements removed per second, deleted or dropped",
+    )
     errors: list[str] = Field(default_factory=list, description="Error messages")
     success: bool = Field(description="Whether prune completed without errors")
 
@@ -534,6 +705,35 @@ class BackfillMajorFormatWindowsResult(BaseModel):
     success: bool = Field(description="Whether pipeline completed without errors")
 
 
+class BackfillMetaSnapshotsRequest(PipelineRequest):
+    """Request for historical meta snapshot backfill pipeline."""
+
+    start_date: date = Field(description="First snapshot date to recompute")
+    end_date: date | None = Field(
+        default=None,
+        description="Last snapshot date to recompute (defaults to today)",
+    )
+    lookback_days: int = Field(
+        default=90,
+        ge=7,
+        le=365,
+        description="Days to look back for tournament data",
+    )
+
+
+class BackfillMetaSnapshotsResult(BaseModel):
+    """Result from historical meta snapshot backfill pipeline."""
+
+    dates_processed: int = Field(ge=0, description="Snapshot dates processed")
+    tournaments_loaded: int = Field(ge=0, description="Tournaments loaded")
+    snapshots_computed: int = Field(ge=0, description="Snapshots computed")
+    snapshots_saved: int = Field(ge=0, description="Snapshots saved to database")
+    snapshots_skipped: int = Field(ge=0, description="Snapshots skipped (no data)")
+    errors: list[str] = Field(default_factory=list, description="Error messages")
+    success: bool = Field(description="Whether pipeline completed without errors")
+    duration_seconds: float = Field(default=0.0, ge=0, description="Total run time")
+
+
 class ScrapePokekameshiRequest(PipelineRequest):
     """Request for Pokekameshi meta scrape pipeline."""
 
@@ -1,6 +1,6 @@
 """Widget-related Pydantic schemas."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -81,6 +81,30 @@ class WidgetEmbedCodeResponse(BaseModel):
     script_code: str
 
 
+class WidgetViewsPoint(BaseModel):
+    """Views of a widget on one UTC day."""
+
+    date: date
+    views: int
+
+
+class WidgetReferrerViews(BaseModel):
+    """Views of a widget from one referrer domain."""
+
+    domain: str | None = Field(None, description="Referrer domain; null for direct")
+    views: int
+
+
+class WidgetAnalyticsResponse(BaseModel):
+    """Schema for widget view analytics."""
+
+    widget_id: str
+    days: int
+    total_views: int
+    daily: list[WidgetViewsPoint]
+    top_referrers: list[WidgetReferrerViews]
+
+
 class WidgetListResponse(BaseModel):
     """Schema for paginated widget list."""
 
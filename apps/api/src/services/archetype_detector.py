@@ -8,9 +8,40 @@ before matching against signature cards.
 """
 
 from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 
 from src.data.signature_cards import SIGNATURE_CARDS, normalize_archetype
 
+# Card code for IDs that are not a signature card of any archetype
+_NO_ARCHETYPE = -1
+
+
+@dataclass(frozen=True)
+class DetectionResult:
+    """Batch detection outcome for one decklist.
+
+    ``archetype`` and ``scores`` match ``detect`` and
+    ``detect_with_confidence`` for the same decklist.
+    """
+
+    archetype: str
+    scores: dict[str, int] = field(default_factory=dict)
+    runner_up: str | None = None
+    top_score: int = 0
+    runner_up_score: int = 0
+
+    @property
+    def margin(self) -> int:
+        """Signature-card quantity lead over the runner-up."""
+        return self.top_score - self.runner_up_score
+
+    @property
+    def share(self) -> float:
+        """Fraction of matched signature quantity held by the winner."""
+        total = sum(self.scores.values())
+        return self.top_score / total if total else 0.0
+
 
 class ArchetypeDetector:
     """Detects deck archetypes from decklists.
@@ -26,7 +57,7 @@ class ArchetypeDetector:
     def __init__(
         self,
         signature_cards: dict[str, str] | None = None,
-        jp_to_en_mapping: dict[str, str] | None = None,
+        jp_to_en_mapping: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize the detector.
 
@@ -39,6 +70,12 @@ class ArchetypeDetector:
         """
         self.signature_cards = signature_cards or SIGNATURE_CARDS
         self.jp_to_en_mapping = jp_to_en_mapping or {}
+        # Batch detection index: archetype codes and raw card ID -> code
+        self._archetype_names = list(dict.fromkeys(self.signature_cards.values()))
+        self._archetype_codes = {
+            name: code for code, name in enumerate(self._archetype_names)
+        }
+        self._card_codes: dict[str, int] = {}
 
     def detect(self, decklist: list[dict]) -> str:
         """Detect the archetype of a decklist.
@@ -125,6 +162,83 @@ class ArchetypeDetector:
         most_common = archetype_counts.most_common(1)
         return most_common[0][0], dict(archetype_counts)
 
+    def detect_batch(
+        self, decklists: Iterable[list[dict] | None]
+    ) -> list[DetectionResult]:
+        """Detect archetypes for many decklists in one pass.
+
+        Card IDs are interned once per detector into integer codes that
+        index a signature-card column (code -> archetype), so each
+        decklist is scored as a sparse row of (code, quantity) pairs
+        against that column instead of translating and looking up every
+        entry again. Ties resolve to the archetype seen first, exactly as
+        ``Counter.most_common`` does in ``detect``.
+
+        Args:
+            decklists: Decklists with "card_id" and "quantity" keys.
+
+        Returns:
+            One DetectionResult per decklist, in input order.
+        """
+        codes = self._card_codes
+        archetypes = self._archetype_names
+        results: list[DetectionResult] = []
+
+        for decklist in decklists:
+            if not decklist:
+                results.append(DetectionResult(archetype="Rogue"))
+                continue
+
+            # Sparse row x signature column; dict keeps first-seen order
+            row: dict[int, int] = {}
+            for card_entry in decklist:
+                if not isinstance(card_entry, dict):
+                    continue
+                card_id = card_entry.get("card_id", "")
+                if not card_id:
+                    continue
+                code = codes.get(card_id)
+                if code is None:
+                    code = self._intern_card(card_id)
+                if code == _NO_ARCHETYPE:
+                    continue
+                quantity = self._parse_quantity(card_entry.get("quantity", 1))
+                row[code] = row.get(code, 0) + quantity
+
+            results.append(self._rank(row, archetypes))
+
+        return results
+
+    @staticmethod
+    def _rank(row: dict[int, int], archetypes: list[str]) -> DetectionResult:
+        """Pick the winner and runner-up from one deck's archetype scores."""
+        if not row:
+            return DetectionResult(archetype="Rogue")
+
+        top = runner_up = _NO_ARCHETYPE
+        top_score = runner_up_score = 0
+        for code, score in row.items():
+            if score > top_score:
+                runner_up, runner_up_score = top, top_score
+                top, top_score = code, score
+            elif score > runner_up_score:
+                runner_up, runner_up_score = code, score
+
+        return DetectionResult(
+            archetype=archetypes[top],
+            scores={archetypes[code]: score for code, score in row.items()},
+            runner_up=archetypes[runner_up] if runner_up != _NO_ARCHETYPE else None,
+            top_score=top_score,
+            runner_up_score=runner_up_score,
+        )
+
+    def _intern_card(self, card_id: str) -> int:
+        """Translate a raw card ID once and cache its archetype code."""
+        archetype = self.signature_cards.get(self._translate_card_id(card_id))
+        code = self._archetype_codes.get(archetype, _NO_ARCHETYPE)
+        self._card_codes[card_id] = code
+        return code
+
     def detect_from_existing_archetype(
         self, decklist: list[dict], existing_archetype: str
     ) -> str:
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Literal
 
 from src.data.signature_cards import normalize_archetype
@@ -228,6 +229,11 @@ SPRITE_ARCHETYPE_MAP: dict[str, str] = {
     "sharpedo-mega": "Mega Sharpedo ex",
 }
 
+# Upper bound on memoized resolutions per normalizer before the cache resets
+RESOLUTION_CACHE_SIZE = 8192
+
+DecklistSignature = tuple[tuple[str, str], ...]
+
 # Only matches .png sprite URLs. If Limitless migrates to .webp or adds
 # query parameters, this regex and tests must be updated. See
 # test_archetype_edge_cases.py for documented limitation tests.
@@ -266,20 +272,57 @@ def _split_mega_aware(sprite_key: str) -> list[str]:
     return filenames
 
 
+def decklist_signature(decklist: list[dict] | None) -> DecklistSignature | None:
+    """Reduce a decklist to the (card_id, quantity) pairs detection reads.
+
+    Entry order is kept because signature-card ties resolve to the
+    archetype seen first.
+    """
+    if not decklist:
+        return None
+    return tuple(
+        (str(entry.get("card_id", "")), str(entry.get("quantity", 1)))
+        for entry in decklist
+        if isinstance(entry, dict)
+    )
+
+
 class ArchetypeNormalizer:
-    """Resolves archetype labels through a priority chain."""
+    """Resolves archetype labels through a priority chain.
+
+    Resolutions are memoized per (sprite_key, raw label, decklist
+    signature), so placements repeating the same deck across a tournament
+    or a run are resolved once. Reuse one instance per run; the
+    normalizer registry hands out instances over a shared sprite index.
+    """
 
     def __init__(
         self,
         detector: ArchetypeDetector | None = None,
-        sprite_map: dict[str, str] | None = None,
+        sprite_map: Mapping[str, str] | None = None,
+        sprite_version: str = "",
     ) -> None:
         self.detector = detector or ArchetypeDetector()
         # Copy so DB overrides don't mutate the module-level constant.
         self.sprite_map: dict[str, str] = dict(
             sprite_map if sprite_map is not None else SPRITE_ARCHETYPE_MAP
         )
+        self.sprite_version = sprite_version
         self._db_loaded = False
+        self._sprite_keys: dict[tuple[str, ...], str] = {}
+        self._derived_names: dict[str, str] = {}
+        self._resolutions: dict[
+            tuple[str, str, DecklistSignature | None],
+            tuple[str, DetectionMethod, float],
+        ] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def clear_cache(self) -> None:
+        """Drop memoized resolutions, e.g. after the sprite map changes."""
+        self._sprite_keys.clear()
+        self._derived_names.clear()
+        self._resolutions.clear()
 
     async def load_db_sprites(self, session: AsyncSession) -> int:
         """Load sprite mappings from the archetype_sprites DB table.
@@ -315,6 +358,7 @@ class ArchetypeNormalizer:
         for sprite_key, archetype_name, display_name in rows:
             self.sprite_map[sprite_key] = display_name or archetype_name
         self._db_loaded = True
+        self.clear_cache()
         logger.info(
             "loaded_db_sprites",
             extra={"count": len(rows)},
@@ -432,64 +476,197 @@ class ArchetypeNormalizer:
         Returns:
             Tuple of (archetype, raw_archetype, detection_method, confidence).
         """
-        raw_archetype = html_archetype
+        sprite_key, resolved = self._resolve_from_sprites(sprite_urls, html_archetype)
+        if resolved is not None:
+            return resolved
+
+        # Priorities 3 and 4 depend on the decklist and raw label
+        cache_key = (sprite_key, html_archetype, decklist_signature(decklist))
+        cached = self._resolutions.get(cache_key)
+        if cached is not None:
+            self.cache_hits += 1
+            archetype, method, confidence = cached
+            return archetype, html_archetype, method, confidence
+
+        self.cache_misses += 1
+        archetype, method, confidence = self._resolve_from_deck_or_label(
+            sprite_key, html_archetype, decklist
+        )
+        self._remember(cache_key, (archetype, method, confidence))
+        return archetype, html_archetype, method, confidence
+
+    def resolve_batch(
+        self,
+        items: Sequence[tuple[list[str], str, list[dict] | None]],
+    ) -> list[tuple[str, str, DetectionMethod]]:
+        """Resolve many placements, detecting signature cards in one batch.
+
+        Gives the same results as calling ``resolve`` per item. Placements
+        that fall through to signature-card detection are deduplicated by
+        memo key and scored together with ``ArchetypeDetector.detect_batch``.
+
+        Args:
+            items: (sprite_urls, html_archetype, decklist) per placement.
+
+        Returns:
+            (archetype, raw_archetype, detection_method) per item, in order.
+        """
+        results: list[tuple[str, str, DetectionMethod]] = []
+        resolved: dict[
+            tuple[str, str, DecklistSignature | None],
+            tuple[str, DetectionMethod, float],
+        ] = {}
+        pending: dict[tuple[str, str, DecklistSignature | None], list[dict] | None] = {}
+        keys: list[tuple[str, str, DecklistSignature | None] | None] = []
+
+        for sprite_urls, html_archetype, decklist in items:
+            sprite_key, by_sprite = self._resolve_from_sprites(
+                sprite_urls, html_archetype
+            )
+            if by_sprite is not None:
+                results.append(by_sprite[:3])
+                keys.append(None)
+                continue
+
+            cache_key = (sprite_key, html_archetype, decklist_signature(decklist))
+            cached = self._resolutions.get(cache_key)
+            if cached is not None:
+                resolved[cache_key] = cached
+            if cached is not None or cache_key in pending:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                pending[cache_key] = decklist
+            # Placeholder until the pending decklists have been detected
+            results.append((html_archetype, html_archetype, "text_label"))
+            keys.append(cache_key)
+
+        detected = self._detect_pending(list(pending.values()))
+        for (cache_key, decklist), archetype in zip(
+            pending.items(), detected, strict=True
+        ):
+            sprite_key, html_archetype, _signature = cache_key
+            resolution = self._resolve_from_deck_or_label(
+                sprite_key, html_archetype, decklist, detected=archetype
+            )
+            resolved[cache_key] = resolution
+            self._remember(cache_key, resolution)
+
+        for i, cache_key in enumerate(keys):
+            if cache_key is not None:
+                archetype, method, _confidence = resolved[cache_key]
+                results[i] = (archetype, cache_key[1], method)
+        return results
+
+    def _detect_pending(self, decklists: list[list[dict] | None]) -> list[str | None]:
+        """Batch-detect decklists; None means detect per item instead."""
+        with_decks = [decklist for decklist in decklists if decklist]
+        if not with_decks:
+            return [None] * len(decklists)
+        try:
+            batch = iter(self.detector.detect_batch(with_decks))
+            return [
+                next(batch).archetype if decklist else None for decklist in decklists
+            ]
+        except Exception:
+            logger.warning("signature_card_batch_detection_failed", exc_info=True)
+            return [None] * len(decklists)
+
+    def _remember(
+        self,
+        cache_key: tuple[str, str, DecklistSignature | None],
+        resolution: tuple[str, DetectionMethod, float],
+    ) -> None:
+        if len(self._resolutions) >= RESOLUTION_CACHE_SIZE:
+            self._resolutions.clear()
+        self._resolutions[cache_key] = resolution
+
+    def _resolve_from_sprites(
+        self, sprite_urls: list[str], raw_archetype: str
+    ) -> tuple[str, tuple[str, str, DetectionMethod, float] | None]:
+        """Resolve via sprite lookup, then auto-derive.
+
+        Returns:
+            The sprite key, plus the resolution when either step matched.
+        """
         sprite_key = ""
-        archetype: str
-        method: DetectionMethod
 
-        # Priority 1: sprite_lookup
         if sprite_urls:
-            sprite_key = self.build_sprite_key(sprite_urls)
+            url_key = tuple(sprite_urls)
+            sprite_key = self._sprite_keys.get(url_key, "")
+            if url_key not in self._sprite_keys:
+                sprite_key = self.build_sprite_key(sprite_urls)
+                self._sprite_keys[url_key] = sprite_key
+
+            # Priority 1: sprite_lookup
             if sprite_key and sprite_key in self.sprite_map:
                 archetype = self.sprite_map[sprite_key]
-                method = "sprite_lookup"
                 logger.debug(
                     "archetype_resolved",
                     extra={
                         "sprite_key": sprite_key,
                         "archetype": archetype,
-                        "method": method,
+                        "method": "sprite_lookup",
                         "raw": raw_archetype,
                     },
                 )
-                return (
+                return sprite_key, (
                     archetype,
                     raw_archetype,
-                    method,
-                    CONFIDENCE_SCORES[method],
+                    "sprite_lookup",
+                    CONFIDENCE_SCORES["sprite_lookup"],
                 )
 
             # Priority 2: auto_derive
             if sprite_key:
-                derived = self.derive_name_from_key(sprite_key)
+                derived = self._derived_names.get(sprite_key)
+                if derived is None:
+                    derived = self.derive_name_from_key(sprite_key)
+                    self._derived_names[sprite_key] = derived
+                    if derived:
+                        logger.info(
+                            "archetype_resolved",
+                            extra={
+                                "sprite_key": sprite_key,
+                                "archetype": derived,
+                                "method": "auto_derive",
+                                "raw": raw_archetype,
+                            },
+                        )
                 if derived:
-                    logger.info(
-                        "archetype_resolved",
-                        extra={
-                            "sprite_key": sprite_key,
-                            "archetype": derived,
-                            "method": "auto_derive",
-                            "raw": raw_archetype,
-                        },
-                    )
-                    return (
+                    return sprite_key, (
                         derived,
                         raw_archetype,
                         "auto_derive",
                         CONFIDENCE_SCORES["auto_derive"],
                     )
 
+        return sprite_key, None
+
+    def _resolve_from_deck_or_label(
+        self,
+        sprite_key: str,
+        html_archetype: str,
+        decklist: list[dict] | None,
+        detected: str | None = None,
+    ) -> tuple[str, DetectionMethod, float]:
+        """Resolve via signature cards, then the text label.
+
+        ``detected`` is a signature-card result already computed in a
+        batch; when None the decklist is detected here.
+        """
         # Priority 3: signature_card
         if decklist:
             try:
-                detected = self.detector.detect(decklist)
+                if detected is None:
+                    detected = self.detector.detect(decklist)
             except Exception:
                 logger.warning(
                     "signature_card_detection_failed",
                     exc_info=True,
                     extra={
                         "sprite_key": sprite_key,
-                        "raw": raw_archetype,
+                        "raw": html_archetype,
                     },
                 )
                 detected = "Rogue"
@@ -500,12 +677,11 @@ class ArchetypeNormalizer:
                         "sprite_key": sprite_key,
                         "archetype": detected,
                         "method": "signature_card",
-                        "raw": raw_archetype,
+                        "raw": html_archetype,
                     },
                 )
                 return (
                     detected,
-                    raw_archetype,
                     "signature_card",
                     CONFIDENCE_SCORES["signature_card"],
                 )
@@ -521,10 +697,10 @@ class ArchetypeNormalizer:
                 "sprite_key": sprite_key,
                 "archetype": normalized,
                 "method": "text_label",
-                "raw": raw_archetype,
+                "raw": html_archetype,
             },
         )
-        return normalized, raw_archetype, "text_label", confidence
+        return normalized, "text_label", confidence
 
     @staticmethod
     def build_sprite_key(sprite_urls: list[str]) -> str:
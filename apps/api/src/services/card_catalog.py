@@ -0,0 +1,438 @@
+"""Process-wide in-memory card catalog for card ID resolution.
+
+Card IDs reach us in many shapes: TCGdex IDs (``sv03-076``), unpadded
+Limitless decklist IDs (``sv3-76``), Limitless set-code IDs (``OBF-125``),
+JP card IDs that only resolve through ``card_id_mappings`` (``SV7-18``)
+and bare card names from adoption-rate sources. This module loads the
+``cards`` and ``card_id_mappings`` tables once into compact interned
+arrays plus dict indexes for every ID form, so hot paths resolve cards
+in O(1) without issuing queries.
+
+The catalog is keyed by a version stamp derived from row counts and the
+latest ``updated_at`` of both tables. ``load_card_catalog`` rebuilds only
+when the stamp changes, and ``refresh_card_catalog`` rechecks the stamp
+at most every ``VERSION_CHECK_INTERVAL`` seconds, so other instances pick
+up card syncs without a restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Card, CardIdMapping, Set
+from src.utils.card_ids import canonical_card_id
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between version-stamp checks on the request path
+VERSION_CHECK_INTERVAL = 60.0
+
+
+def _name_key(name: str | None) -> str:
+    """Normalize a card name for case-insensitive lookups."""
+    if not name:
+        return ""
+    normalized = name.casefold().replace("’", "'")
+    return " ".join(normalized.split())
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value else value
+
+
+@dataclass(frozen=True)
+class CatalogCard:
+    """Lightweight view of one catalog entry."""
+
+    id: str
+    name: str | None
+    japanese_name: str | None
+    image_small: str | None
+    set_id: str
+    limitless_id: str | None
+
+    @property
+    def display_name(self) -> str | None:
+        return self.name or self.japanese_name
+
+
+class CardCatalog:
+    """Immutable, indexed snapshot of cards and JP-to-EN mappings.
+
+    Card attributes are stored column-wise in parallel lists addressed by
+    an integer row index; every ID form maps to that index through a plain
+    dict, so lookups never allocate intermediate objects.
+    """
+
+    def __init__(
+        self,
+        cards: Iterable[Sequence[Any]],
+        mappings: Iterable[Sequence[Any]],
+        version: str = "",
+    ) -> None:
+        """Build the catalog from raw rows.
+
+        Args:
+            cards: Rows of (id, name, japanese_name, image_small, set_id,
+                number, limitless_id, release_date, release_date_jp).
+            mappings: Rows of (jp_card_id, en_card_id, card_name_en,
+                en_set_id, confidence).
+            version: Version stamp the rows were read at.
+        """
+        self.version = version
+
+        self._ids: list[str] = []
+        self._names: list[str | None] = []
+        self._japanese_names: list[str | None] = []
+        self._images: list[str | None] = []
+        self._set_ids: list[str] = []
+        self._limitless_ids: list[str | None] = []
+
+        self._by_id: dict[str, int] = {}
+        self._by_key: dict[str, int] = {}
+        self._by_limitless: dict[str, int] = {}
+        self._by_set_number: dict[tuple[str, str], int] = {}
+        self._by_name: dict[str, int] = {}
+        self._by_japanese_name: dict[str, int] = {}
+
+        name_rank: dict[str, tuple[date, str]] = {}
+        jp_name_rank: dict[str, tuple[date, str]] = {}
+
+        for row in cards:
+            (
+                card_id,
+                name,
+                japanese_name,
+                image_small,
+                set_id,
+                number,
+                limitless_id,
+                release_date,
+                release_date_jp,
+            ) = row
+            idx = len(self._ids)
+            self._ids.append(sys.intern(card_id))
+            self._names.append(name)
+            self._japanese_names.append(japanese_name)
+            self._images.append(image_small)
+            self._set_ids.append(sys.intern(set_id or ""))
+            self._limitless_ids.append(_intern(limitless_id))
+
+            self._by_id[card_id] = idx
+            # Exact IDs win over padding-insensitive matches
+            self._by_key.setdefault(canonical_card_id(card_id), idx)
+            if limitless_id:
+                self._by_limitless.setdefault(limitless_id, idx)
+            if set_id and number:
+                self._by_set_number.setdefault((set_id.lower(), number), idx)
+
+            # Name indexes prefer the most recent printing, then lowest ID,
+            # matching the ORDER BY of the adoption-rate resolver.
+            en_key = _name_key(name)
+            if en_key:
+                rank = (release_date or date.min, card_id)
+                if self._prefer(name_rank.get(en_key), rank):
+                    name_rank[en_key] = rank
+                    self._by_name[en_key] = idx
+            jp_key = _name_key(japanese_name)
+            if jp_key:
+                rank = (release_date_jp or date.min, card_id)
+                if self._prefer(jp_name_rank.get(jp_key), rank):
+                    jp_name_rank[jp_key] = rank
+                    self._by_japanese_name[jp_key] = idx
+
+        self._jp_to_en: dict[str, str] = {}
+        self._jp_exact: dict[str, str] = {}
+        self._jp_names: dict[str, str | None] = {}
+        self._mapping_by_name: dict[str, tuple[str, str | None]] = {}
+        mapping_confidence: dict[str, float] = {}
+
+        for jp_card_id, en_card_id, card_name_en, en_set_id, confidence in mappings:
+            en_card_id = sys.intern(en_card_id)
+            self._jp_exact.setdefault(jp_card_id, en_card_id)
+            key = canonical_card_id(jp_card_id)
+            if key not in self._jp_to_en:
+                self._jp_to_en[key] = en_card_id
+                self._jp_names[key] = card_name_en
+            name_key = _name_key(card_name_en)
+            if name_key:
+                score = confidence if confidence is not None else 1.0
+                if score > mapping_confidence.get(name_key, -1.0):
+                    mapping_confidence[name_key] = score
+                    self._mapping_by_name[name_key] = (en_card_id, en_set_id)
+
+    @staticmethod
+    def _prefer(current: tuple[date, str] | None, candidate: tuple[date, str]) -> bool:
+        if current is None:
+            return True
+        if candidate[0] != current[0]:
+            return candidate[0] > current[0]
+        return candidate[1] < current[1]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def mapping_count(self) -> int:
+        return len(self._jp_exact)
+
+    def _card(self, idx: int) -> CatalogCard:
+        return CatalogCard(
+            id=self._ids[idx],
+            name=self._names[idx],
+            japanese_name=self._japanese_names[idx],
+            image_small=self._images[idx],
+            set_id=self._set_ids[idx],
+            limitless_id=self._limitless_ids[idx],
+        )
+
+    def _index_for(self, card_id: str) -> int | None:
+        """Resolve a card ID in any EN form to a row index."""
+        idx = self._by_id.get(card_id)
+        if idx is None:
+            idx = self._by_limitless.get(card_id)
+        if idx is None:
+            idx = self._by_key.get(canonical_card_id(card_id))
+        return idx
+
+    def get(self, card_id: str) -> CatalogCard | None:
+        """Look up a card by TCGdex ID, Limitless ID or padding variant."""
+        if not card_id:
+            return None
+        idx = self._index_for(card_id)
+        return self._card(idx) if idx is not None else None
+
+    def resolve_id(self, card_id: str) -> str | None:
+        """Return the stored ``cards.id`` for any EN form of a card ID."""
+        if not card_id:
+            return None
+        idx = self._index_for(card_id)
+        return self._ids[idx] if idx is not None else None
+
+    def jp_to_en(self, jp_card_id: str) -> str | None:
+        """Map a JP card ID to its EN card ID via ``card_id_mappings``."""
+        if not jp_card_id:
+            return None
+        en_card_id = self._jp_exact.get(jp_card_id)
+        if en_card_id is None:
+            en_card_id = self._jp_to_en.get(canonical_card_id(jp_card_id))
+        return en_card_id
+
+    def jp_to_en_mapping(self) -> JPToENMapping:
+        """Return a read-only JP-to-EN mapping view."""
+        return JPToENMapping(self)
+
+    def find_by_set_number(self, set_code: str, number: str) -> str | None:
+        """Find a card ID by case-insensitive set ID and collector number."""
+        idx = self._by_set_number.get((set_code.lower(), number))
+        return self._ids[idx] if idx is not None else None
+
+    def find_by_name(self, name: str | None) -> CatalogCard | None:
+        """Find the newest printing of a card by English name."""
+        idx = self._by_name.get(_name_key(name))
+        return self._card(idx) if idx is not None else None
+
+    def find_by_japanese_name(self, name: str | None) -> CatalogCard | None:
+        """Find the newest JP printing of a card by Japanese name."""
+        idx = self._by_japanese_name.get(_name_key(name))
+        return self._card(idx) if idx is not None else None
+
+    def find_mapping_by_name(self, name: str | None) -> tuple[str, str | None] | None:
+        """Find the highest-confidence (en_card_id, en_set_id) for an EN name."""
+        return self._mapping_by_name.get(_name_key(name))
+
+    def batch_lookup(
+        self, card_ids: Iterable[str]
+    ) -> dict[str, tuple[str | None, str | None]]:
+        """Resolve card IDs to (card_name, image_small).
+
+        Mirrors the resolution order of the query-based lookup: Limitless
+        ID, then TCGdex ID variants, then JP-to-EN mapping. JP IDs whose
+        EN card is not in the catalog fall back to the mapping's name.
+        """
+        card_info: dict[str, tuple[str | None, str | None]] = {}
+        for cid in card_ids:
+            if not cid or cid in card_info:
+                continue
+            idx = self._index_for(cid)
+            if idx is None:
+                en_card_id = self.jp_to_en(cid)
+                if en_card_id is None:
+                    continue
+                idx = self._index_for(en_card_id)
+                if idx is None:
+                    card_info[cid] = (self._jp_names.get(canonical_card_id(cid)), None)
+                    continue
+            card_info[cid] = (
+                self._names[idx] or self._japanese_names[idx],
+                self._images[idx],
+            )
+        return card_info
+
+
+class JPToENMapping(Mapping[str, str]):
+    """Read-only JP-to-EN mapping view backed by a catalog.
+
+    Drop-in replacement for the variant-expanded mapping dicts consumed by
+    ``ArchetypeDetector``: misses on the exact JP ID fall back to the
+    padding-insensitive key instead of pre-expanding every variant.
+    """
+
+    def __init__(self, catalog: CardCatalog) -> None:
+        self._catalog = catalog
+
+    def __getitem__(self, key: str) -> str:
+        en_card_id = self._catalog.jp_to_en(key)
+        if en_card_id is None:
+            raise KeyError(key)
+        return en_card_id
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._catalog.jp_to_en(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._catalog._jp_exact)
+
+    def __len__(self) -> int:
+        return self._catalog.mapping_count
+
+
+_catalog: CardCatalog | None = None
+_last_checked: float = 0.0
+
+
+async def _read_version(session: AsyncSession) -> str:
+    """Compute the version stamp of the card tables."""
+    cards_row = (
+        await session.execute(select(func.count(Card.id), func.max(Card.updated_at)))
+    ).one()
+    mappings_row = (
+        await session.execute(
+            select(func.count(CardIdMapping.id), func.max(CardIdMapping.updated_at))
+        )
+    ).one()
+    return f"{cards_row[0]}:{cards_row[1]}|{mappings_row[0]}:{mappings_row[1]}"
+
+
+async def _build(session: AsyncSession, version: str) -> CardCatalog:
+    cards_query = select(
+        Card.id,
+        Card.name,
+        Card.japanese_name,
+        Card.image_small,
+        Card.set_id,
+        Card.number,
+        Card.limitless_id,
+        Set.release_date,
+        Set.release_date_jp,
+    ).join(Set, Card.set_id == Set.id, isouter=True)
+    mappings_query = select(
+        CardIdMapping.jp_card_id,
+        CardIdMapping.en_card_id,
+        CardIdMapping.card_name_en,
+        CardIdMapping.en_set_id,
+        CardIdMapping.confidence,
+    ).order_by(CardIdMapping.confidence.desc(), CardIdMapping.updated_at.desc())
+
+    card_rows = (await session.execute(cards_query)).all()
+    mapping_rows = (await session.execute(mappings_query)).all()
+    return CardCatalog(card_rows, mapping_rows, version=version)
+
+
+def get_card_catalog() -> CardCatalog | None:
+    """Return the process-wide catalog, or None if it was never loaded."""
+    return _catalog
+
+
+async def load_card_catalog(
+    session: AsyncSession, *, force: bool = False
+) -> CardCatalog:
+    """Load or rebuild the process-wide catalog.
+
+    Rebuilds only when the version stamp has changed since the last load,
+    unless ``force`` is set.
+
+    Args:
+        session: Database session.
+        force: Rebuild even if the version stamp is unchanged.
+
+    Returns:
+        The current catalog.
+    """
+    global _catalog, _last_checked
+
+    started = time.monotonic()
+    version = await _read_version(session)
+    _last_checked = time.monotonic()
+    if _catalog is not None and not force and _catalog.version == version:
+        return _catalog
+
+    catalog = await _build(session, version)
+    _catalog = catalog
+    logger.info(
+        "Loaded card catalog: cards=%d, mappings=%d, version=%s, %.0fms",
+        len(catalog),
+        catalog.mapping_count,
+        version,
+        (time.monotonic() - started) * 1000,
+    )
+    return catalog
+
+
+async def refresh_card_catalog(session: AsyncSession) -> CardCatalog | None:
+    """Return the loaded catalog, rechecking its version when due.
+
+    Cheap on the request path: no query is issued unless the catalog is
+    loaded and ``VERSION_CHECK_INTERVAL`` has elapsed. Returns None when
+    the catalog was never loaded so callers can fall back to queries.
+
+    The check runs in a savepoint of the caller's session, so a failed
+    check leaves the request's transaction usable; the stale catalog is
+    then kept for another interval before rechecking.
+    """
+    global _last_checked
+
+    if _catalog is None:
+        return None
+    if time.monotonic() - _last_checked < VERSION_CHECK_INTERVAL:
+        return _catalog
+    try:
+        async with session.begin_nested():
+            return await load_card_catalog(session)
+    except Exception:
+        _last_checked = time.monotonic()
+        logger.warning("Card catalog version check failed", exc_info=True)
+        return _catalog
+
+
+async def reload_card_catalog_if_loaded(session: AsyncSession) -> None:
+    """Rebuild the catalog after a card or mapping sync, if it is in use.
+
+    The rebuild is forced: the version stamp only covers row counts and
+    ``updated_at``, which a sync may leave unchanged. Failures are logged
+    and swallowed: a stale catalog is preferable to failing the sync that
+    triggered the reload.
+    """
+    if _catalog is None:
+        return
+    try:
+        async with session.begin_nested():
+            await load_card_catalog(session, force=True)
+    except Exception:
+        logger.warning("Card catalog reload failed", exc_info=True)
+
+
+def invalidate_card_catalog() -> None:
+    """Drop the process-wide catalog."""
+    global _catalog, _last_checked
+    _catalog = None
+    _last_checked = 0.0
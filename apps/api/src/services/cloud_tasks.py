@@ -1,15 +1,75 @@
 """Cloud Tasks service for enqueuing tournament processing tasks."""
 
+from __future__ import annotations
+
+import asyncio
 import hashlib
 import json
 import logging
-
-from google.cloud import tasks_v2
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from src.config import get_settings
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    from google.cloud import tasks_v2
+else:
+    tasks_v2 = lazy_import("google.cloud.tasks_v2")
 
 logger = logging.getLogger(__name__)
 
+# Concurrent create_task RPCs per bulk enqueue
+ENQUEUE_CONCURRENCY = 10
+
+# Seconds a task ID stays in the recently-enqueued set. Cloud Tasks keeps
+# rejecting a reused task name for about an hour, so re-sending within
+# this window can only produce ALREADY_EXISTS.
+RECENT_TASK_TTL = 3600.0
+
+# Process-wide task_id -> monotonic time of the successful enqueue
+_recently_enqueued: dict[str, float] = {}
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _was_recently_enqueued(task_id: str) -> bool:
+    enqueued_at = _recently_enqueued.get(task_id)
+    if enqueued_at is None:
+        return False
+    if time.monotonic() - enqueued_at > RECENT_TASK_TTL:
+        del _recently_enqueued[task_id]
+        return False
+    return True
+
+
+def _mark_enqueued(task_id: str) -> None:
+    _recently_enqueued[task_id] = time.monotonic()
+
+
+def reset_recently_enqueued() -> None:
+    """Forget all recently enqueued task IDs."""
+    _recently_enqueued.clear()
+
+
+@dataclass
+class BulkEnqueueResult:
+    """Outcome of enqueuing a batch of tournaments.
+
+    Each list holds source URLs. ``cached`` counts payloads skipped
+    without an RPC because the task was enqueued recently or appeared
+    earlier in the same batch.
+    """
+
+    enqueued: list[str] = field(default_factory=list)
+    cached: list[str] = field(default_factory=list)
+    not_configured: list[str] = field(default_factory=list)
+    # (source_url, error message)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
 
 class CloudTasksService:
     """Service for enqueuing tournament processing tasks via Cloud Tasks."""
@@ -26,6 +86,61 @@ class CloudTasksService:
         """Check if Cloud Tasks is configured (vs local dev)."""
         return bool(self.queue_path and self.cloud_run_url)
 
+    async def enqueue_tournaments(
+        self,
+        payloads: Sequence[dict],
+        concurrency: int = ENQUEUE_CONCURRENCY,
+    ) -> BulkEnqueueResult:
+        """Enqueue many tournaments with concurrent create_task RPCs.
+
+        Payloads whose task ID was enqueued recently by this process, or
+        that repeat a source URL earlier in the batch, are skipped without
+        an RPC. At most ``concurrency`` RPCs are in flight at once.
+
+        Args:
+            payloads: Tournament data dicts with at least 'source_url'.
+            concurrency: Maximum concurrent create_task calls.
+
+        Returns:
+            BulkEnqueueResult grouping the payloads by outcome.
+        """
+        result = BulkEnqueueResult()
+        if not self.is_configured:
+            result.not_configured = [p["source_url"] for p in payloads]
+            return result
+
+        to_send: list[dict] = []
+        seen: set[str] = set()
+        for payload in payloads:
+            task_id = self._task_id_from_url(payload["source_url"])
+            if task_id in seen or _was_recently_enqueued(task_id):
+                result.cached.append(payload["source_url"])
+                continue
+            seen.add(task_id)
+            to_send.append(payload)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def send(payload: dict) -> str | None:
+            async with semaphore:
+                return await self.enqueue_tournament(payload)
+
+        outcomes = await asyncio.gather(
+            *(send(payload) for payload in to_send), return_exceptions=True
+        )
+        for payload, outcome in zip(to_send, outcomes, strict=True):
+            source_url = payload["source_url"]
+            if isinstance(outcome, BaseException):
+                result.errors.append((source_url, str(outcome)))
+            elif outcome:
+                result.enqueued.append(source_url)
+            else:
+                result.not_configured.append(source_url)
+
+        if result.cached:
+            logger.info("Skipped %d recently enqueued tournaments", len(result.cached))
+        return result
+
     async def enqueue_tournament(self, tournament_metadata: dict) -> str | None:
         """Enqueue a single tournament for processing via Cloud Tasks.
 
@@ -70,11 +185,13 @@ class CloudTasksService:
                 task=task,
             )
             logger.info("Enqueued task %s for %s", task_id, source_url)
+            _mark_enqueued(task_id)
             return created.name
         except Exception as e:
             # AlreadyExists means dedup worked — task was already enqueued
             if "ALREADY_EXISTS" in str(e):
                 logger.info("Task already exists (dedup): %s", task_id)
+                _mark_enqueued(task_id)
                 return task_id
             logger.error("Failed to enqueue task for %s: %s", source_url, e)
             raise
@@ -93,3 +210,40 @@ class CloudTasksService:
         """
         url_hash = hashlib.sha256(source_url.encode()).hexdigest()[:16]
         return f"tournament-{url_hash}"
+
+
+class LocalTaskQueue(Generic[T, R]):
+    """In-memory task queue drained by a pool of async workers.
+
+    Stands in for Cloud Tasks in local development: each item is handed
+    to ``handler`` by one of ``workers`` concurrent workers.
+    """
+
+    def __init__(self, handler: Callable[[T], Awaitable[R]], workers: int = 4) -> None:
+        self.handler = handler
+        self.workers = max(1, workers)
+
+    async def run(self, items: Sequence[T]) -> list[R | BaseException]:
+        """Process all items and return results in input order.
+
+        A handler exception is returned in place of that item's result
+        and does not stop the other workers.
+        """
+        queue: asyncio.Queue[tuple[int, T]] = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+        results: dict[int, R | BaseException] = {}
+
+        async def worker() -> None:
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await self.handler(item)
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(items)))))
+        return [results[index] for index in range(len(items))]
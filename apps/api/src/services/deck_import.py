@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.card import Card
 from src.schemas import CardInDeck, DeckImportResponse, UnmatchedCard
+from src.services.card_catalog import refresh_card_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +146,18 @@ class DeckImportService:
         matched: list[CardInDeck] = []
         unmatched: list[UnmatchedCard] = []
 
+        catalog = await refresh_card_catalog(self.session)
+        if catalog is not None:
+            for parsed in parsed_cards:
+                card_id = catalog.find_by_set_number(parsed.set_code, parsed.number)
+                if card_id:
+                    matched.append(
+                        CardInDeck(card_id=card_id, quantity=parsed.quantity)
+                    )
+                else:
+                    unmatched.append(self._unmatched(parsed))
+            return matched, unmatched
+
         # Build a list of (set_id, number) tuples to query
         # We need to match by set_id (lowercase) and number
         conditions = []
@@ -187,14 +200,16 @@ class DeckImportService:
             if db_card:
                 matched.append(CardInDeck(card_id=db_card.id, quantity=parsed.quantity))
             else:
-                unmatched.append(
-                    UnmatchedCard(
-                        line=parsed.line,
-                        name=parsed.name,
-                        set_code=parsed.set_code.upper(),
-                        number=parsed.number,
-                        quantity=parsed.quantity,
-                    )
-                )
+                unmatched.append(self._unmatched(parsed))
 
         return matched, unmatched
+
+    @staticmethod
+    def _unmatched(parsed: ParsedCard) -> UnmatchedCard:
+        return UnmatchedCard(
+            line=parsed.line,
+            name=parsed.name,
+            set_code=parsed.set_code.upper(),
+            number=parsed.number,
+            quantity=parsed.quantity,
+        )
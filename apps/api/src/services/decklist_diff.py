@@ -4,6 +4,7 @@ Pure logic module with no DB or async dependencies.
 Works at card_name level so reprints across sets are treated as the same card.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from statistics import median
 
@@ -36,6 +37,98 @@ class DecklistDiffResult:
         return bool(self.added or self.removed or self.changed)
 
 
+def _weighted_median(values: Sequence[float], weights: Sequence[float]) -> float:
+    """Weighted median; equals ``statistics.median`` for equal weights.
+
+    When the cumulative weight lands exactly on half the total, the two
+    neighbouring values are averaged, as the unweighted median does for
+    an even count.
+    """
+    pairs = sorted(zip(values, weights, strict=True))
+    half = sum(weights) / 2
+    cumulative = 0.0
+    for i, (value, weight) in enumerate(pairs):
+        cumulative += weight
+        if cumulative > half:
+            return value
+        if cumulative == half:
+            return (value + pairs[i + 1][0]) / 2 if i + 1 < len(pairs) else value
+    return pairs[-1][0]
+
+
+@dataclass
+class CardColumn:
+    """One card's column of the consensus matrix, stored sparsely.
+
+    ``rows`` are the indices of the decklists that include the card and
+    ``quantities`` the aggregated counts in those decklists.
+    """
+
+    name: str
+    rows: list[int] = field(default_factory=list)
+    quantities: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ConsensusMatrix:
+    """Decklist x card quantity matrix built once per set of decklists.
+
+    Columns are kept in first-seen card order, so consensus lists built
+    from the matrix match the row-by-row computation.
+    """
+
+    deck_count: int
+    columns: list[CardColumn]
+
+    def card_stats(
+        self, weights: Sequence[float] | None = None
+    ) -> list[tuple[str, float, float]]:
+        """Compute (name, inclusion_rate, median_quantity) per card.
+
+        Args:
+            weights: Optional per-decklist weights (e.g. by placement or
+                recency). Unweighted when None.
+        """
+        if weights is None:
+            return [
+                (
+                    column.name,
+                    len(column.rows) / self.deck_count,
+                    median(column.quantities),
+                )
+                for column in self.columns
+            ]
+
+        if len(weights) != self.deck_count:
+            raise ValueError(f"Expected {self.deck_count} weights, got {len(weights)}")
+        total_weight = sum(weights)
+        if total_weight <= 0:
+            raise ValueError("Weights must sum to a positive value")
+
+        stats: list[tuple[str, float, float]] = []
+        for column in self.columns:
+            column_weights = [weights[row] for row in column.rows]
+            column_weight = sum(column_weights)
+            quantity = (
+                _weighted_median(column.quantities, column_weights)
+                if column_weight > 0
+                else median(column.quantities)
+            )
+            stats.append((column.name, column_weight / total_weight, quantity))
+        return stats
+
+    def card_usage(self) -> dict[str, dict]:
+        """Per-card average count and inclusion rate across decklists."""
+        return {
+            column.name: {
+                "name": column.name,
+                "avg_count": round(sum(column.quantities) / len(column.quantities), 2),
+                "inclusion_rate": round(len(column.rows) / self.deck_count, 3),
+            }
+            for column in self.columns
+        }
+
+
 class DecklistDiffEngine:
     """Engine for computing consensus decklists and diffs between snapshots.
 
@@ -81,8 +174,9 @@ class DecklistDiffEngine:
 
     def compute_consensus_list(
         self,
-        decklists: list[list[dict]],
+        decklists: list[list[dict]] | ConsensusMatrix,
         inclusion_threshold: float = 0.5,
+        weights: Sequence[float] | None = None,
     ) -> list[dict]:
         """Compute a consensus decklist from multiple decklists.
 
@@ -93,40 +187,92 @@ class DecklistDiffEngine:
         Only cards above the inclusion threshold are included.
 
         Args:
-            decklists: List of decklists, each being a list of card dicts.
+            decklists: List of decklists, each being a list of card dicts, or
+                a matrix already built from them.
             inclusion_threshold: Minimum fraction of decklists a card must
                 appear in to be included in the consensus (default 0.5 = 50%).
+            weights: Optional per-decklist weights (e.g. by placement or
+                recency); inclusion rates and medians become weighted.
 
         Returns:
             Sorted list of consensus card dicts with name, quantity, inclusion_rate.
         """
-        if not decklists:
-            return []
-
-        total_lists = len(decklists)
-
-        # Aggregate each decklist and collect counts per card
-        card_counts: dict[str, list[int]] = {}
-        for decklist in decklists:
-            aggregated = self._aggregate_decklist(decklist)
-            for card_name, quantity in aggregated.items():
-                if card_name not in card_counts:
-                    card_counts[card_name] = []
-                card_counts[card_name].append(quantity)
-
-        # Build consensus
-        consensus: list[dict] = []
-        for card_name, counts in card_counts.items():
-            inclusion_rate = len(counts) / total_lists
-            if inclusion_rate >= inclusion_threshold:
-                median_count = median(counts)
-                consensus.append(
-                    {
-                        "name": card_name,
-                        "quantity": round(median_count),
-                        "inclusion_rate": round(inclusion_rate, 3),
-                    }
-                )
+        return self.compute_consensus_lists(decklists, [inclusion_threshold], weights)[
+            inclusion_threshold
+        ]
+
+    def compute_consensus_lists(
+        self,
+        decklists: list[list[dict]] | ConsensusMatrix,
+        inclusion_thresholds: Sequence[float],
+        weights: Sequence[float] | None = None,
+    ) -> dict[float, list[dict]]:
+        """Compute consensus lists for several thresholds in one pass.
+
+        The quantity matrix and per-card statistics are computed once and
+        filtered per threshold.
+
+        Args:
+            decklists: Decklists, or a matrix already built from them.
+            inclusion_thresholds: Minimum inclusion rates to build lists for.
+            weights: Optional per-decklist weights (e.g. by placement or
+                recency); inclusion rates and medians become weighted.
+
+        Returns:
+            Dict mapping each threshold to its consensus list.
+
+        Raises:
+            ValueError: If weights don't match the decklists or sum to zero.
+        """
+        matrix = (
+            decklists
+            if isinstance(decklists, ConsensusMatrix)
+            else self.build_matrix(decklists)
+        )
+        if matrix.deck_count == 0:
+            return {threshold: [] for threshold in inclusion_thresholds}
+
+        stats = matrix.card_stats(weights)
+        return {
+            threshold: self._consensus_from_stats(stats, threshold)
+            for threshold in inclusion_thresholds
+        }
+
+    def build_matrix(self, decklists: list[list[dict]]) -> ConsensusMatrix:
+        """Build the decklist x card quantity matrix.
+
+        Args:
+            decklists: List of decklists, each being a list of card dicts.
+
+        Returns:
+            ConsensusMatrix with one column per canonical card name.
+        """
+        columns: dict[str, CardColumn] = {}
+        for row, decklist in enumerate(decklists):
+            for card_name, quantity in self._aggregate_decklist(decklist).items():
+                column = columns.get(card_name)
+                if column is None:
+                    column = columns[card_name] = CardColumn(card_name)
+                column.rows.append(row)
+                column.quantities.append(quantity)
+        return ConsensusMatrix(
+            deck_count=len(decklists), columns=list(columns.values())
+        )
+
+    @staticmethod
+    def _consensus_from_stats(
+        stats: list[tuple[str, float, float]], inclusion_threshold: float
+    ) -> list[dict]:
+        """Filter card statistics into a sorted consensus list."""
+        consensus: list[dict] = [
+            {
+                "name": card_name,
+                "quantity": round(quantity),
+                "inclusion_rate": round(inclusion_rate, 3),
+            }
+            for card_name, inclusion_rate, quantity in stats
+            if inclusion_rate >= inclusion_threshold
+        ]
 
         # Sort by inclusion rate (desc), then quantity (desc), then name
         consensus.sort(key=lambda c: (-c["inclusion_rate"], -c["quantity"], c["name"]))
@@ -5,9 +5,12 @@ adaptation detection between consecutive snapshots.
 """
 
 import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,6 +31,16 @@ class EvolutionSnapshotNotFoundError(EvolutionError):
     """Raised when a requested snapshot does not exist."""
 
 
+@dataclass
+class TournamentEvolutionResult:
+    """Snapshots and adaptations computed for one tournament."""
+
+    snapshots: list[ArchetypeEvolutionSnapshot] = field(default_factory=list)
+    adaptations: list[Adaptation] = field(default_factory=list)
+    # Archetype -> decklist count, for archetypes below the minimum
+    skipped: dict[str, int] = field(default_factory=dict)
+
+
 class EvolutionService:
     """Service for computing and managing archetype evolution data."""
 
@@ -63,45 +76,169 @@ class EvolutionService:
         if not tournament:
             raise EvolutionError(f"Tournament {tournament_id} not found")
 
-        # Get placements for this archetype
+        # Get placements for this archetype (only the columns we read)
         placements_result = await self.session.execute(
-            select(TournamentPlacement).where(
+            select(TournamentPlacement.placement, TournamentPlacement.decklist).where(
                 TournamentPlacement.tournament_id == tournament_id,
                 TournamentPlacement.archetype == archetype,
             )
         )
-        placements = list(placements_result.scalars().all())
+        placements = placements_result.all()
 
         if not placements:
             msg = f"No placements for '{archetype}' in tournament {tournament_id}"
             raise EvolutionError(msg)
 
-        # Compute total placements in tournament for meta share
+        # Total placements in tournament for meta share
         total_result = await self.session.execute(
-            select(TournamentPlacement).where(
+            select(func.count(TournamentPlacement.id)).where(
                 TournamentPlacement.tournament_id == tournament_id,
             )
         )
-        total_placements = list(total_result.scalars().all())
-        total_count = len(total_placements)
+        total_count = total_result.scalar_one()
+
+        return self._build_snapshot(
+            archetype,
+            tournament_id,
+            [p.placement for p in placements],
+            [p.decklist for p in placements if p.decklist],
+            total_count,
+        )
+
+    async def compute_tournament_evolution(
+        self,
+        tournament_id: UUID,
+        min_decklists: int = 3,
+    ) -> TournamentEvolutionResult:
+        """Compute and save snapshots for every archetype in a tournament.
+
+        Loads the tournament's placements once, groups them by archetype,
+        and answers all previous-snapshot lookups with a single query.
+        Snapshots and diff adaptations are saved in one transaction;
+        recomputing a tournament updates its snapshots in place and
+        replaces their diff adaptations.
+
+        Args:
+            tournament_id: Tournament to compute snapshots for.
+            min_decklists: Minimum decklists an archetype needs.
+
+        Returns:
+            TournamentEvolutionResult with the saved records.
+
+        Raises:
+            EvolutionError: If the tournament does not exist.
+            SQLAlchemyError: If the save fails (rolled back).
+        """
+        date_result = await self.session.execute(
+            select(Tournament.date).where(Tournament.id == tournament_id)
+        )
+        row = date_result.one_or_none()
+        if not row:
+            raise EvolutionError(f"Tournament {tournament_id} not found")
+        tournament_date = row[0]
+
+        placements_result = await self.session.execute(
+            select(
+                TournamentPlacement.archetype,
+                TournamentPlacement.placement,
+                TournamentPlacement.decklist,
+            ).where(TournamentPlacement.tournament_id == tournament_id)
+        )
+        rows = placements_result.all()
+
+        by_archetype: dict[str, list[tuple[int, list[dict] | None]]] = defaultdict(list)
+        for archetype, placement, decklist in rows:
+            by_archetype[archetype].append((placement, decklist))
+
+        result = TournamentEvolutionResult()
+        built: dict[str, ArchetypeEvolutionSnapshot] = {}
+        for archetype, entries in by_archetype.items():
+            # Same qualification as COUNT(decklist): any non-null decklist
+            decklist_count = sum(1 for _p, d in entries if d is not None)
+            if decklist_count < min_decklists:
+                result.skipped[archetype] = decklist_count
+                continue
+            built[archetype] = self._build_snapshot(
+                archetype,
+                tournament_id,
+                [placement for placement, _d in entries],
+                [decklist for _p, decklist in entries if decklist],
+                len(rows),
+            )
+
+        if not built:
+            return result
+
+        names = list(built)
+        existing_result = await self.session.execute(
+            select(ArchetypeEvolutionSnapshot).where(
+                ArchetypeEvolutionSnapshot.tournament_id == tournament_id,
+                ArchetypeEvolutionSnapshot.archetype.in_(names),
+            )
+        )
+        existing = {s.archetype: s for s in existing_result.scalars().all()}
+        previous = await self.get_previous_snapshots(names, tournament_date)
+
+        try:
+            if existing:
+                await self.session.execute(
+                    delete(Adaptation).where(
+                        Adaptation.snapshot_id.in_([s.id for s in existing.values()]),
+                        Adaptation.source == "diff",
+                    )
+                )
+
+            for archetype, snapshot in built.items():
+                current = existing.get(archetype)
+                if current is not None:
+                    self._copy_snapshot(snapshot, current)
+                    snapshot = current
+                else:
+                    self.session.add(snapshot)
+                result.snapshots.append(snapshot)
+
+                prior = previous.get(archetype)
+                if prior is not None and prior.consensus_list:
+                    adaptations = self._diff_adaptations(
+                        snapshot.id,
+                        prior.consensus_list,
+                        snapshot.consensus_list or [],
+                    )
+                    self.session.add_all(adaptations)
+                    result.adaptations.extend(adaptations)
+
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+        return result
 
+    def _build_snapshot(
+        self,
+        archetype: str,
+        tournament_id: UUID,
+        placements: list[int],
+        decklists: list[list[dict]],
+        total_count: int,
+    ) -> ArchetypeEvolutionSnapshot:
+        """Build a snapshot from an archetype's placements and decklists."""
         # Performance metrics
         deck_count = len(placements)
         meta_share = deck_count / total_count if total_count > 0 else 0.0
-        best_placement = min(p.placement for p in placements)
+        best_placement = min(placements)
 
         # Top cut conversion (top 8 out of this archetype's entries)
-        top_cut = sum(1 for p in placements if p.placement <= 8)
+        top_cut = sum(1 for p in placements if p <= 8)
         top_cut_conversion = top_cut / deck_count if deck_count > 0 else 0.0
 
-        # Build consensus decklist from available decklists
-        decklists = [p.decklist for p in placements if p.decklist]
-        consensus_list = (
-            self.diff_engine.compute_consensus_list(decklists) if decklists else None
-        )
-
-        # Card usage stats
-        card_usage = self._compute_card_usage(decklists) if decklists else None
+        # Consensus decklist and card usage share one quantity matrix
+        consensus_list = None
+        card_usage = None
+        if decklists:
+            matrix = self.diff_engine.build_matrix(decklists)
+            consensus_list = self.diff_engine.compute_consensus_list(matrix)
+            card_usage = matrix.card_usage()
 
         return ArchetypeEvolutionSnapshot(
             id=uuid4(),
@@ -115,6 +252,19 @@ class EvolutionService:
             card_usage=card_usage,
         )
 
+    @staticmethod
+    def _copy_snapshot(
+        source: ArchetypeEvolutionSnapshot, target: ArchetypeEvolutionSnapshot
+    ) -> None:
+        """Copy computed fields onto an existing snapshot row."""
+        target.meta_share = source.meta_share
+        target.top_cut_conversion = source.top_cut_conversion
+        target.best_placement = source.best_placement
+        target.deck_count = source.deck_count
+        target.consensus_list = source.consensus_list
+        target.card_usage = source.card_usage
+        target.meta_context = source.meta_context
+
     def _compute_card_usage(self, decklists: list[list[dict]]) -> dict:
         """Compute per-card usage statistics across decklists.
 
@@ -126,28 +276,7 @@ class EvolutionService:
         """
         if not decklists:
             return {}
-
-        total = len(decklists)
-        card_data: dict[str, list[int]] = {}
-
-        for decklist in decklists:
-            aggregated = self.diff_engine._aggregate_decklist(decklist)
-            for card_name, quantity in aggregated.items():
-                if card_name not in card_data:
-                    card_data[card_name] = []
-                card_data[card_name].append(quantity)
-
-        usage: dict[str, dict] = {}
-        for card_name, counts in card_data.items():
-            avg_count = sum(counts) / len(counts)
-            inclusion_rate = len(counts) / total
-            usage[card_name] = {
-                "name": card_name,
-                "avg_count": round(avg_count, 2),
-                "inclusion_rate": round(inclusion_rate, 3),
-            }
-
-        return usage
+        return self.diff_engine.build_matrix(decklists).card_usage()
 
     async def compute_adaptations(
         self,
@@ -172,9 +301,19 @@ class EvolutionService:
         from_snapshot = await self._get_snapshot(from_snapshot_id)
         to_snapshot = await self._get_snapshot(to_snapshot_id)
 
-        old_consensus = from_snapshot.consensus_list or []
-        new_consensus = to_snapshot.consensus_list or []
+        return self._diff_adaptations(
+            to_snapshot_id,
+            from_snapshot.consensus_list or [],
+            to_snapshot.consensus_list or [],
+        )
 
+    def _diff_adaptations(
+        self,
+        to_snapshot_id: UUID,
+        old_consensus: list[dict],
+        new_consensus: list[dict],
+    ) -> list[Adaptation]:
+        """Create unclassified adaptations from a consensus list diff."""
         diff_result = self.diff_engine.diff(old_consensus, new_consensus)
 
         adaptations: list[Adaptation] = []
@@ -295,6 +434,47 @@ class EvolutionService:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_previous_snapshots(
+        self,
+        archetypes: list[str],
+        before: date,
+    ) -> dict[str, ArchetypeEvolutionSnapshot]:
+        """Get each archetype's most recent snapshot before a date.
+
+        Args:
+            archetypes: Normalized archetype names.
+            before: Only snapshots from tournaments before this date count.
+
+        Returns:
+            Dict mapping archetype to its previous snapshot, for archetypes
+            that have one.
+        """
+        if not archetypes:
+            return {}
+        ranked = (
+            select(
+                ArchetypeEvolutionSnapshot.id,
+                func.row_number()
+                .over(
+                    partition_by=ArchetypeEvolutionSnapshot.archetype,
+                    order_by=Tournament.date.desc(),
+                )
+                .label("rank"),
+            )
+            .join(Tournament, ArchetypeEvolutionSnapshot.tournament_id == Tournament.id)
+            .where(
+                ArchetypeEvolutionSnapshot.archetype.in_(archetypes),
+                Tournament.date < before,
+            )
+            .subquery()
+        )
+        query = select(ArchetypeEvolutionSnapshot).join(
+            ranked,
+            (ArchetypeEvolutionSnapshot.id == ranked.c.id) & (ranked.c.rank == 1),
+        )
+        result = await self.session.execute(query)
+        return {s.archetype: s for s in result.scalars().all()}
+
     async def save_snapshot(self, snapshot: ArchetypeEvolutionSnapshot) -> None:
         """Save a snapshot, handling upsert on unique constraint.
 
@@ -316,13 +496,7 @@ class EvolutionService:
 
             if existing:
                 # Update existing snapshot
-                existing.meta_share = snapshot.meta_share
-                existing.top_cut_conversion = snapshot.top_cut_conversion
-                existing.best_placement = snapshot.best_placement
-                existing.deck_count = snapshot.deck_count
-                existing.consensus_list = snapshot.consensus_list
-                existing.card_usage = snapshot.card_usage
-                existing.meta_context = snapshot.meta_context
+                self._copy_snapshot(snapshot, existing)
                 await self.session.commit()
             else:
                 self.session.add(snapshot)
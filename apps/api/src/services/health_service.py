@@ -1,7 +1,7 @@
 """Pipeline health service.
 
 Queries database for scrape freshness, meta snapshot staleness,
-and archetype detection quality metrics.
+archetype detection quality metrics, and recorded pipeline runs.
 """
 
 from __future__ import annotations
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.card import Card
 from src.models.meta_snapshot import MetaSnapshot
+from src.models.pipeline_run import PipelineRun
 from src.models.tournament import Tournament
 from src.models.tournament_placement import TournamentPlacement
 from src.models.translated_content import TranslatedContent
@@ -24,6 +25,7 @@ from src.schemas.health import (
     MetaHealthDetail,
     MethodTrendDetail,
     PipelineHealthResponse,
+    PipelineRunDetail,
     ScrapeHealthDetail,
     SourceHealthDetail,
     TextLabelFallbackDetail,
@@ -46,6 +48,8 @@ SOURCE_STALE_DAYS = 21
 LIMITLESS_SOURCE_OK_DAYS = 3
 LIMITLESS_SOURCE_STALE_DAYS = 14
 
+RECENT_RUNS_LIMIT = 20
+
 
 class PipelineHealthService:
     """Checks pipeline health across scrape, meta, and archetype."""
@@ -411,6 +415,30 @@ class PipelineHealthService:
             method_trends=method_trends,
         )
 
+    async def get_recent_runs(
+        self,
+        pipeline: str | None = None,
+        limit: int = RECENT_RUNS_LIMIT,
+    ) -> list[PipelineRunDetail]:
+        """Most recent recorded pipeline runs, newest first.
+
+        Args:
+            pipeline: Only runs of this pipeline (e.g. "compute-meta").
+            limit: Maximum runs to return.
+        """
+        stmt = select(PipelineRun).order_by(PipelineRun.started_at.desc()).limit(limit)
+        if pipeline is not None:
+            stmt = stmt.where(PipelineRun.pipeline == pipeline)
+
+        try:
+            result = await self.session.execute(stmt)
+            runs = result.scalars().all()
+        except Exception:
+            logger.exception("Pipeline run query failed")
+            return []
+
+        return [PipelineRunDetail.model_validate(run) for run in runs]
+
     async def get_pipeline_health(
         self,
         verbose: bool = False,
@@ -452,8 +480,10 @@ class PipelineHealthService:
             overall = "unhealthy"
 
         verbose_detail = None
+        recent_runs: list[PipelineRunDetail] = []
         if verbose:
             verbose_detail = await self.get_verbose_archetype_detail()
+            recent_runs = await self.get_recent_runs()
 
         return PipelineHealthResponse(
             status=overall,
@@ -463,4 +493,5 @@ class PipelineHealthService:
             sources=sources,
             checked_at=datetime.now(UTC),
             verbose=verbose_detail,
+            recent_runs=recent_runs,
         )
@@ -0,0 +1,250 @@
+"""Deterministic statistical meta forecaster.
+
+Forecasts every archetype's next-tournament meta share, day-2 rate and
+tier from its per-tournament history in ``archetype_evolution_snapshots``,
+shrunk toward the latest global meta snapshot:
+
+- Trend: damped Holt smoothing (exponentially weighted level and slope)
+  over the archetype's tournament shares, projected one tournament ahead.
+- Smoothing: the projection counts as evidence worth the archetype's
+  recent field sizes in decklists, combined with the meta snapshot share
+  as a Dirichlet prior of ``PRIOR_STRENGTH`` pseudo-decklists, then
+  renormalized so shares across archetypes sum to 1.
+- Day-2 rate: deck-weighted, exponentially decayed top-cut conversion,
+  shrunk toward the field's average conversion (beta-binomial).
+
+Ranges are ``mid +/- Z * sd`` from the posterior variance plus the
+trend's one-step residual error. Everything is plain arithmetic over
+in-memory rows, so the whole meta is forecast in milliseconds and
+serves as the numeric baseline that Claude predictions narrate.
+"""
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+
+from src.services.meta_service import (
+    EXCLUDED_ARCHETYPES,
+    TIER_A_THRESHOLD,
+    TIER_B_THRESHOLD,
+    TIER_C_THRESHOLD,
+    TIER_S_THRESHOLD,
+)
+
+# Holt smoothing factors for level and trend, and trend damping
+LEVEL_ALPHA = 0.5
+TREND_BETA = 0.3
+TREND_DAMPING = 0.8
+# Pseudo-decklists behind the meta snapshot prior
+PRIOR_STRENGTH = 100.0
+# Cap on decklists of evidence from an archetype's own history
+MAX_EVIDENCE = 400.0
+# Pseudo-decklists behind the field-average day-2 rate
+DAY2_PRIOR_STRENGTH = 20.0
+# z-score of the reported low/high range (80% interval)
+RANGE_Z = 1.28
+# Observations at which confidence reaches one half
+CONFIDENCE_HALF_OBSERVATIONS = 3
+MAX_CONFIDENCE = 0.9
+PRIOR_ONLY_CONFIDENCE = 0.1
+
+
+@dataclass(frozen=True)
+class ShareObservation:
+    """One archetype's result at one tournament."""
+
+    archetype: str
+    observed_on: date
+    meta_share: float | None
+    top_cut_conversion: float | None
+    deck_count: int
+
+
+@dataclass(frozen=True)
+class ArchetypeForecast:
+    """Statistical forecast for one archetype's next tournament."""
+
+    archetype: str
+    meta_share: dict[str, float]
+    day2_rate: dict[str, float] | None
+    tier: str
+    confidence: float
+    observations: int
+    trend: float
+
+    def to_context(self) -> dict:
+        """Forecast as a JSON-ready dict for prompts and methodology."""
+        return {
+            "predicted_meta_share": self.meta_share,
+            "predicted_day2_rate": self.day2_rate,
+            "predicted_tier": self.tier,
+            "confidence": self.confidence,
+            "observations": self.observations,
+            "share_trend_per_event": self.trend,
+        }
+
+
+def share_tier(share: float) -> str:
+    """Tier of a meta share, using the meta snapshot thresholds."""
+    if share > TIER_S_THRESHOLD:
+        return "S"
+    if share > TIER_A_THRESHOLD:
+        return "A"
+    if share > TIER_B_THRESHOLD:
+        return "B"
+    if share > TIER_C_THRESHOLD:
+        return "C"
+    return "Rogue"
+
+
+@dataclass
+class _Trend:
+    projected: float
+    slope: float
+    residual_sd: float
+    evidence: float
+    observations: int
+
+
+def _fit_trend(history: list[ShareObservation]) -> _Trend | None:
+    """Damped Holt fit over an archetype's shares, oldest first."""
+    shares = [o for o in history if o.meta_share is not None]
+    if not shares:
+        return None
+
+    level = shares[0].meta_share or 0.0
+    slope = 0.0
+    squared_errors = 0.0
+    evidence = 0.0
+    weight_total = 0.0
+    for step, obs in enumerate(shares):
+        share = obs.meta_share or 0.0
+        if step > 0:
+            expected = level + TREND_DAMPING * slope
+            squared_errors += (share - expected) ** 2
+            previous = level
+            level = LEVEL_ALPHA * share + (1 - LEVEL_ALPHA) * expected
+            slope = (
+                TREND_BETA * (level - previous)
+                + (1 - TREND_BETA) * TREND_DAMPING * slope
+            )
+        # Field size of the tournament, weighted toward recent events
+        weight = (1 - LEVEL_ALPHA) ** (len(shares) - 1 - step)
+        if share > 0 and obs.deck_count > 0:
+            evidence += weight * obs.deck_count / share
+            weight_total += weight
+
+    residual_sd = (
+        math.sqrt(squared_errors / (len(shares) - 1)) if len(shares) > 1 else 0.0
+    )
+    return _Trend(
+        projected=max(0.0, level + TREND_DAMPING * slope),
+        slope=slope,
+        residual_sd=residual_sd,
+        evidence=min(MAX_EVIDENCE, evidence / weight_total) if weight_total else 0.0,
+        observations=len(shares),
+    )
+
+
+def _day2_rate(
+    history: list[ShareObservation], field_rate: float
+) -> dict[str, float] | None:
+    """Shrunk, recency-weighted top-cut conversion with its range."""
+    weighted_hits = 0.0
+    weighted_decks = 0.0
+    for back, obs in enumerate(reversed(history)):
+        if obs.top_cut_conversion is None or obs.deck_count <= 0:
+            continue
+        weight = (1 - LEVEL_ALPHA) ** back * obs.deck_count
+        weighted_hits += weight * obs.top_cut_conversion
+        weighted_decks += weight
+    if weighted_decks == 0:
+        return None
+
+    total = weighted_decks + DAY2_PRIOR_STRENGTH
+    mid = (weighted_hits + DAY2_PRIOR_STRENGTH * field_rate) / total
+    sd = math.sqrt(mid * (1 - mid) / (total + 1))
+    return _range(mid, sd)
+
+
+def _range(mid: float, sd: float) -> dict[str, float]:
+    return {
+        "low": round(max(0.0, mid - RANGE_Z * sd), 4),
+        "mid": round(mid, 4),
+        "high": round(min(1.0, mid + RANGE_Z * sd), 4),
+    }
+
+
+def forecast_meta(
+    observations: Iterable[ShareObservation],
+    prior_shares: Mapping[str, float] | None = None,
+) -> dict[str, ArchetypeForecast]:
+    """Forecast every archetype's next-tournament performance at once.
+
+    Args:
+        observations: Per-tournament results, in any order.
+        prior_shares: Archetype shares of the latest global meta snapshot.
+
+    Returns:
+        Forecasts keyed by archetype, for every archetype with history or
+        a prior share.
+    """
+    prior_shares = prior_shares or {}
+    histories: dict[str, list[ShareObservation]] = defaultdict(list)
+    conversion_hits = 0.0
+    conversion_decks = 0
+    for obs in observations:
+        if obs.archetype in EXCLUDED_ARCHETYPES:
+            continue
+        histories[obs.archetype].append(obs)
+        if obs.top_cut_conversion is not None and obs.deck_count > 0:
+            conversion_hits += obs.top_cut_conversion * obs.deck_count
+            conversion_decks += obs.deck_count
+    field_rate = conversion_hits / conversion_decks if conversion_decks else 0.0
+
+    archetypes = set(histories) | {
+        a for a in prior_shares if a not in EXCLUDED_ARCHETYPES
+    }
+    trends: dict[str, _Trend | None] = {}
+    posterior: dict[str, float] = {}
+    for archetype in archetypes:
+        history = sorted(histories.get(archetype, []), key=lambda o: o.observed_on)
+        histories[archetype] = history
+        trend = _fit_trend(history)
+        trends[archetype] = trend
+        prior = prior_shares.get(archetype, 0.0)
+        if trend is None:
+            posterior[archetype] = prior
+        else:
+            posterior[archetype] = (
+                trend.evidence * trend.projected + PRIOR_STRENGTH * prior
+            ) / (trend.evidence + PRIOR_STRENGTH)
+
+    total = sum(posterior.values())
+    forecasts: dict[str, ArchetypeForecast] = {}
+    for archetype in archetypes:
+        mid = posterior[archetype] / total if total > 0 else 0.0
+        trend = trends[archetype]
+        evidence = trend.evidence if trend else 0.0
+        residual_sd = trend.residual_sd if trend else 0.0
+        observed = trend.observations if trend else 0
+        sd = math.sqrt(
+            mid * (1 - mid) / (evidence + PRIOR_STRENGTH + 1) + residual_sd**2
+        )
+        confidence = (
+            min(MAX_CONFIDENCE, observed / (observed + CONFIDENCE_HALF_OBSERVATIONS))
+            if observed
+            else PRIOR_ONLY_CONFIDENCE
+        )
+        forecasts[archetype] = ArchetypeForecast(
+            archetype=archetype,
+            meta_share=_range(mid, sd),
+            day2_rate=_day2_rate(histories[archetype], field_rate),
+            tier=share_tier(mid),
+            confidence=round(confidence, 2),
+            observations=observed,
+            trend=round(trend.slope, 4) if trend else 0.0,
+        )
+    return forecasts
@@ -7,17 +7,27 @@ card inclusion rates, and other meta statistics.
 import logging
 import math
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Literal
 from uuid import UUID, uuid4
 
-from sqlalchemy import or_, select
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import ArchetypeSprite, MetaSnapshot, Tournament, TournamentPlacement
+from src.models import (
+    ArchetypeKeyCards,
+    ArchetypeShareSeries,
+    ArchetypeSprite,
+    JPMetaComparison,
+    MetaSnapshot,
+    Tournament,
+    TournamentPlacement,
+)
 from src.schemas.meta import (
     ArchetypeComparison,
     ConfidenceIndicator,
@@ -63,6 +73,207 @@ GRASSROOTS_TIERS = ("league", "premier", "grassroots")
 # Valid tournament types
 TournamentType = Literal["all", "official", "grassroots"]
 
+# Snapshot dimensions: (region, format, best_of, tournament_type)
+SnapshotKey = tuple[str | None, str, int, str]
+
+# JP comparison dimensions: (snapshot_date, format, tournament_type)
+ComparisonKey = tuple[date, str, str]
+
+# Columns overwritten when an upsert hits uq_meta_snapshot
+SNAPSHOT_UPSERT_COLUMNS = (
+    "archetype_shares",
+    "card_usage",
+    "sample_size",
+    "tournaments_included",
+    "diversity_index",
+    "tier_assignments",
+    "jp_signals",
+    "trends",
+    "era_label",
+)
+
+# Columns overwritten when an upsert hits uq_jp_meta_comparison
+JP_COMPARISON_UPSERT_COLUMNS = ("jp_sample_size", "en_sample_size", "archetypes")
+
+# Key cards kept per archetype in the archetype_key_cards rollup
+KEY_CARDS_LIMIT = 20
+
+# Rows per rollup upsert, well under the asyncpg bind-parameter limit
+ROLLUP_UPSERT_CHUNK = 2000
+
+
+def snapshot_key(snapshot: MetaSnapshot) -> SnapshotKey:
+    """Return the dimension key of a snapshot."""
+    return (
+        snapshot.region,
+        snapshot.format,
+        snapshot.best_of,
+        snapshot.tournament_type,
+    )
+
+
+def snapshot_dependencies(key: SnapshotKey) -> list[SnapshotKey]:
+    """Snapshots (same date) that must be computed before ``key``.
+
+    Non-JP BO3 snapshots compare the JP BO1 snapshot against the global
+    BO3 snapshot for their JP signals. The global snapshot supplies its
+    own shares, so it only depends on JP.
+    """
+    region, game_format, best_of, tournament_type = key
+    if region == "JP" or best_of != 3:
+        return []
+    deps: list[SnapshotKey] = [("JP", game_format, 1, tournament_type)]
+    if region is not None:
+        deps.append((None, game_format, 3, tournament_type))
+    return deps
+
+
+def _comparison_entries(
+    jp_shares: Mapping[str, float],
+    en_shares: Mapping[str, float],
+    jp_tiers: Mapping[str, str],
+    en_tiers: Mapping[str, str],
+) -> list[dict]:
+    """Per-archetype comparison entries, by max share across sides."""
+    names = (set(jp_shares) | set(en_shares)) - EXCLUDED_ARCHETYPES
+    ranked = sorted(
+        names,
+        key=lambda n: (-max(jp_shares.get(n, 0.0), en_shares.get(n, 0.0)), n),
+    )
+    entries = []
+    for name in ranked:
+        jp_share = jp_shares.get(name)
+        en_share = en_shares.get(name)
+        entries.append(
+            {
+                "archetype": name,
+                "jp_share": round(jp_share, 4) if jp_share is not None else None,
+                "en_share": round(en_share, 4) if en_share is not None else None,
+                "divergence": round((jp_share or 0.0) - (en_share or 0.0), 4),
+                "jp_tier": jp_tiers.get(name),
+                "en_tier": en_tiers.get(name),
+            }
+        )
+    return entries
+
+
+def build_jp_comparison(
+    jp_snapshot: MetaSnapshot | None,
+    en_snapshot: MetaSnapshot,
+    *,
+    snapshot_date: date,
+    game_format: str,
+    tournament_type: str,
+) -> JPMetaComparison:
+    """Compare a JP BO1 snapshot (if any) against a global BO3 snapshot.
+
+    Shares are rounded to 4 places once here, so every consumer of the
+    comparison reports the same numbers.
+    """
+    return JPMetaComparison(
+        id=uuid4(),
+        snapshot_date=snapshot_date,
+        format=game_format,
+        tournament_type=tournament_type,
+        jp_sample_size=jp_snapshot.sample_size if jp_snapshot else 0,
+        en_sample_size=en_snapshot.sample_size,
+        archetypes=_comparison_entries(
+            (jp_snapshot.archetype_shares or {}) if jp_snapshot else {},
+            en_snapshot.archetype_shares or {},
+            (jp_snapshot.tier_assignments or {}) if jp_snapshot else {},
+            en_snapshot.tier_assignments or {},
+        ),
+    )
+
+
+def _comparison_side(
+    comparison: JPMetaComparison, side: Literal["jp", "en"]
+) -> tuple[dict[str, float], dict[str, str]]:
+    """Shares and tiers of one side of a comparison."""
+    entries = [e for e in comparison.archetypes if e[f"{side}_share"] is not None]
+    return (
+        {e["archetype"]: e[f"{side}_share"] for e in entries},
+        {e["archetype"]: e[f"{side}_tier"] for e in entries if e[f"{side}_tier"]},
+    )
+
+
+def lagged_jp_comparison_entries(
+    lagged: JPMetaComparison, current: JPMetaComparison
+) -> list[dict]:
+    """Entries comparing the JP side of ``lagged`` with ``current``'s global side."""
+    jp_shares, jp_tiers = _comparison_side(lagged, "jp")
+    en_shares, en_tiers = _comparison_side(current, "en")
+    return _comparison_entries(jp_shares, en_shares, jp_tiers, en_tiers)
+
+
+def jp_signals_from_comparison(comparison: JPMetaComparison) -> dict | None:
+    """Archetypes whose JP and global shares differ by more than 5%.
+
+    Returns:
+        Dict with rising/falling/divergent lists, or None if the
+        comparison has no JP side or nothing diverges.
+    """
+    if not comparison.jp_sample_size:
+        return None
+
+    divergent = sorted(
+        (
+            DivergentArchetype(
+                archetype=entry["archetype"],
+                jp_share=entry["jp_share"] or 0.0,
+                en_share=entry["en_share"] or 0.0,
+                diff=entry["divergence"],
+            )
+            for entry in comparison.archetypes
+            if abs(entry["divergence"]) > JP_SIGNAL_THRESHOLD
+        ),
+        key=lambda d: abs(d.diff),
+        reverse=True,
+    )
+    if not divergent:
+        return None
+
+    return {
+        "rising": [d.archetype for d in divergent if d.diff > 0],
+        "falling": [d.archetype for d in divergent if d.diff < 0],
+        "divergent": [d.model_dump() for d in divergent],
+    }
+
+
+@dataclass
+class ArchetypeKeyCardRollup:
+    """Key cards of one archetype, as stored in ``archetype_key_cards``."""
+
+    decklist_count: int
+    key_cards: list[dict]
+
+
+@dataclass
+class SnapshotContext:
+    """Snapshots shared in memory across one compute-meta run.
+
+    Attributes:
+        current: Snapshots computed this run for the snapshot date. A None
+            value records a combo that was computed but had no data, so
+            dependents do not fall back to a stale row from the database.
+        previous: Snapshots for ``snapshot_date - 7 days`` prefetched for
+            trend computation, or None if they were not prefetched.
+        key_cards: Per-archetype key cards of each snapshot computed this
+            run, saved alongside the snapshots.
+        jp_comparisons: JP vs global comparison per date, format and
+            tournament type, built once for the JP signals of every BO3
+            snapshot and saved alongside the global BO3 snapshot.
+    """
+
+    current: dict[SnapshotKey, MetaSnapshot | None] = field(default_factory=dict)
+    previous: dict[SnapshotKey, MetaSnapshot] | None = None
+    key_cards: dict[SnapshotKey, dict[str, ArchetypeKeyCardRollup]] = field(
+        default_factory=dict
+    )
+    jp_comparisons: dict[ComparisonKey, JPMetaComparison | None] = field(
+        default_factory=dict
+    )
+
 
 class MetaService:
     """Service for computing and storing meta snapshots."""
@@ -81,6 +292,7 @@ class MetaService:
         start_date_floor: date | None = None,
         era_label: str | None = None,
         tournament_type: TournamentType = "all",
+        context: SnapshotContext | None = None,
     ) -> MetaSnapshot:
         """Compute a meta snapshot from tournament placements.
 
@@ -97,6 +309,8 @@ class MetaService:
             lookback_days: Number of days to look back for tournament data.
             start_date_floor: If provided, clamp start_date to be no earlier.
             era_label: Optional era tag for the snapshot.
+            context: When given, the key cards of each archetype in the
+                snapshot are recorded in ``context.key_cards``.
 
         Returns:
             MetaSnapshot with computed stats.
@@ -168,9 +382,19 @@ class MetaService:
         tournament_dates = {t.id: t.date for t in tournaments}
 
         try:
+            # The denormalized tournament columns repeat the tournament
+            # filters so Postgres can scan ix_tp_format_bestof_date
             placement_query = select(TournamentPlacement).where(
-                TournamentPlacement.tournament_id.in_(tournament_ids)
+                TournamentPlacement.tournament_id.in_(tournament_ids),
+                TournamentPlacement.tournament_date >= start_date,
+                TournamentPlacement.tournament_date <= snapshot_date,
+                TournamentPlacement.format == game_format,
+                TournamentPlacement.best_of == best_of,
             )
+            if region:
+                placement_query = placement_query.where(
+                    TournamentPlacement.region == region
+                )
             placement_result = await self.session.execute(placement_query)
             placements = placement_result.scalars().all()
         except SQLAlchemyError:
@@ -205,6 +429,11 @@ class MetaService:
             reference_date=snapshot_date,
         )
         card_usage = self._compute_card_usage(placements)
+        if context is not None:
+            key = (region, game_format, best_of, tournament_type)
+            context.key_cards[key] = self.compute_archetype_key_cards(
+                placements, archetype_shares
+            )
 
         snapshot = MetaSnapshot(
             id=uuid4(),
@@ -274,11 +503,13 @@ class MetaService:
                 existing.jp_signals = snapshot.jp_signals
                 existing.trends = snapshot.trends
                 existing.era_label = snapshot.era_label
+                await self._upsert_archetype_rollups([snapshot])
                 await retry_commit(self.session, context="save-snapshot-update")
                 await self.session.refresh(existing)
                 return existing
             else:
                 self.session.add(snapshot)
+                await self._upsert_archetype_rollups([snapshot])
                 await retry_commit(self.session, context="save-snapshot-insert")
                 await self.session.refresh(snapshot)
                 return snapshot
@@ -343,6 +574,230 @@ class MetaService:
             )
             raise
 
+    async def get_snapshots_for_date(
+        self, snapshot_date: date
+    ) -> dict[SnapshotKey, MetaSnapshot]:
+        """Get every snapshot for a date in one query, keyed by dimensions.
+
+        Raises:
+            SQLAlchemyError: If database query fails.
+        """
+        query = select(MetaSnapshot).where(MetaSnapshot.snapshot_date == snapshot_date)
+        try:
+            result = await self.session.execute(query)
+            return {snapshot_key(s): s for s in result.scalars().all()}
+        except SQLAlchemyError:
+            logger.error(
+                "Failed to get snapshots for date=%s", snapshot_date, exc_info=True
+            )
+            raise
+
+    async def save_snapshots(
+        self,
+        snapshots: Sequence[MetaSnapshot],
+        key_cards: Mapping[SnapshotKey, Mapping[str, ArchetypeKeyCardRollup]]
+        | None = None,
+        jp_comparisons: Mapping[ComparisonKey, JPMetaComparison | None] | None = None,
+    ) -> int:
+        """Upsert many snapshots in one statement and one transaction.
+
+        Uses ``INSERT ... ON CONFLICT ON CONSTRAINT uq_meta_snapshot DO
+        UPDATE`` instead of selecting each existing row first. The
+        archetype share series, key cards and JP comparisons are written
+        in the same transaction (see ``_upsert_archetype_rollups``).
+
+        Args:
+            snapshots: Snapshots to save. Dimensions must be unique.
+            key_cards: Per-archetype key cards by snapshot dimensions, as
+                collected in ``SnapshotContext.key_cards``.
+            jp_comparisons: JP comparisons by date, format and tournament
+                type, as collected in ``SnapshotContext.jp_comparisons``;
+                each is saved with its global BO3 snapshot.
+
+        Returns:
+            Number of snapshots written.
+
+        Raises:
+            SQLAlchemyError: If database operation fails.
+        """
+        if not snapshots:
+            return 0
+
+        rows = []
+        for snapshot in snapshots:
+            snapshot_warnings = validate_snapshot(snapshot)
+            if snapshot_warnings:
+                logger.warning(
+                    "Saving snapshot with %d quality warnings: %s",
+                    len(snapshot_warnings),
+                    snapshot_warnings,
+                )
+            rows.append(
+                {
+                    "id": snapshot.id or uuid4(),
+                    "snapshot_date": snapshot.snapshot_date,
+                    "region": snapshot.region,
+                    "format": snapshot.format,
+                    "best_of": snapshot.best_of,
+                    "tournament_type": snapshot.tournament_type or "all",
+                    **{col: getattr(snapshot, col) for col in SNAPSHOT_UPSERT_COLUMNS},
+                }
+            )
+
+        stmt = pg_insert(MetaSnapshot).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_meta_snapshot",
+            set_={
+                **{col: stmt.excluded[col] for col in SNAPSHOT_UPSERT_COLUMNS},
+                # onupdate does not fire for ON CONFLICT; cache stamps read
+                # max(updated_at)
+                "updated_at": func.now(),
+            },
+        )
+
+        try:
+            await self.session.execute(stmt)
+            await self._upsert_archetype_rollups(snapshots, key_cards, jp_comparisons)
+            await retry_commit(self.session, context="save-snapshots-bulk")
+        except SQLAlchemyError:
+            logger.error(
+                "Failed to bulk save %d meta snapshots", len(rows), exc_info=True
+            )
+            await self.session.rollback()
+            raise
+        return len(rows)
+
+    async def _upsert_archetype_rollups(
+        self,
+        snapshots: Sequence[MetaSnapshot],
+        key_cards: Mapping[SnapshotKey, Mapping[str, ArchetypeKeyCardRollup]]
+        | None = None,
+        jp_comparisons: Mapping[ComparisonKey, JPMetaComparison | None] | None = None,
+    ) -> None:
+        """Write the series, key cards and JP comparisons of ``snapshots``.
+
+        Runs in the caller's transaction, without committing. Series rows
+        of archetypes no longer in a recomputed snapshot are removed. Key
+        cards are only replaced by rollups from the same or a later date,
+        so backfilling old snapshots keeps the current ones.
+
+        Raises:
+            SQLAlchemyError: If database operation fails.
+        """
+        series_rows: list[dict] = []
+        key_card_rows: list[dict] = []
+        comparison_rows: list[dict] = []
+        stale_series = []
+        for snapshot in snapshots:
+            dims = {
+                "region": snapshot.region,
+                "format": snapshot.format,
+                "best_of": snapshot.best_of,
+                "tournament_type": snapshot.tournament_type or "all",
+                "snapshot_date": snapshot.snapshot_date,
+            }
+            shares = snapshot.archetype_shares or {}
+            series_rows.extend(
+                {
+                    "id": uuid4(),
+                    "archetype": archetype,
+                    **dims,
+                    "share": share,
+                    "sample_size": snapshot.sample_size,
+                }
+                for archetype, share in shares.items()
+            )
+            region_clause = (
+                ArchetypeShareSeries.region.is_(None)
+                if snapshot.region is None
+                else ArchetypeShareSeries.region == snapshot.region
+            )
+            stale_series.append(
+                and_(
+                    ArchetypeShareSeries.format == dims["format"],
+                    ArchetypeShareSeries.best_of == dims["best_of"],
+                    ArchetypeShareSeries.tournament_type == dims["tournament_type"],
+                    region_clause,
+                    ArchetypeShareSeries.snapshot_date == dims["snapshot_date"],
+                    ArchetypeShareSeries.archetype.not_in(list(shares)),
+                )
+            )
+
+            rollups = (key_cards or {}).get(snapshot_key(snapshot), {})
+            key_card_rows.extend(
+                {
+                    "id": uuid4(),
+                    "archetype": archetype,
+                    **dims,
+                    "decklist_count": rollup.decklist_count,
+                    "key_cards": rollup.key_cards,
+                }
+                for archetype, rollup in rollups.items()
+            )
+
+            if snapshot.region is None and snapshot.best_of == 3:
+                comparison = (jp_comparisons or {}).get(
+                    (snapshot.snapshot_date, snapshot.format, dims["tournament_type"])
+                )
+                if comparison is not None:
+                    comparison_rows.append(
+                        {
+                            "id": uuid4(),
+                            "snapshot_date": comparison.snapshot_date,
+                            "format": comparison.format,
+                            "tournament_type": comparison.tournament_type,
+                            **{
+                                col: getattr(comparison, col)
+                                for col in JP_COMPARISON_UPSERT_COLUMNS
+                            },
+                        }
+                    )
+
+        if stale_series:
+            await self.session.execute(
+                delete(ArchetypeShareSeries).where(or_(*stale_series))
+            )
+
+        for start in range(0, len(series_rows), ROLLUP_UPSERT_CHUNK):
+            series_stmt = pg_insert(ArchetypeShareSeries).values(
+                series_rows[start : start + ROLLUP_UPSERT_CHUNK]
+            )
+            series_stmt = series_stmt.on_conflict_do_update(
+                constraint="uq_archetype_share_series",
+                set_={
+                    "share": series_stmt.excluded.share,
+                    "sample_size": series_stmt.excluded.sample_size,
+                },
+            )
+            await self.session.execute(series_stmt)
+
+        for start in range(0, len(key_card_rows), ROLLUP_UPSERT_CHUNK):
+            cards_stmt = pg_insert(ArchetypeKeyCards).values(
+                key_card_rows[start : start + ROLLUP_UPSERT_CHUNK]
+            )
+            cards_stmt = cards_stmt.on_conflict_do_update(
+                constraint="uq_archetype_key_cards",
+                set_={
+                    "snapshot_date": cards_stmt.excluded.snapshot_date,
+                    "decklist_count": cards_stmt.excluded.decklist_count,
+                    "key_cards": cards_stmt.excluded.key_cards,
+                },
+                where=ArchetypeKeyCards.snapshot_date
+                <= cards_stmt.excluded.snapshot_date,
+            )
+            await self.session.execute(cards_stmt)
+
+        if comparison_rows:
+            comparison_stmt = pg_insert(JPMetaComparison).values(comparison_rows)
+            comparison_stmt = comparison_stmt.on_conflict_do_update(
+                constraint="uq_jp_meta_comparison",
+                set_={
+                    col: comparison_stmt.excluded[col]
+                    for col in JP_COMPARISON_UPSERT_COLUMNS
+                },
+            )
+            await self.session.execute(comparison_stmt)
+
     @staticmethod
     def _recency_weight(
         days_ago: int,
@@ -427,12 +882,15 @@ class MetaService:
         return shares
 
     def _compute_card_usage(
-        self, placements: Sequence[TournamentPlacement]
+        self,
+        placements: Sequence[TournamentPlacement],
+        log_quality: bool = True,
     ) -> dict[str, dict[str, float]]:
         """Compute card usage rates from placements with decklists.
 
         Args:
             placements: Sequence of tournament placements.
+            log_quality: Whether to log a summary of malformed entries.
 
         Returns:
             Dict mapping card_id to usage stats (values are rounded):
@@ -487,7 +945,7 @@ class MetaService:
             or invalid_quantity_count > 0
             or empty_card_id_count > 0
         )
-        if has_issues:
+        if has_issues and log_quality:
             logger.warning(
                 "Data quality issues in card_usage computation: "
                 "invalid_entries=%d, invalid_quantities=%d, empty_card_ids=%d, "
@@ -513,6 +971,44 @@ class MetaService:
             )
         )
 
+    def compute_archetype_key_cards(
+        self,
+        placements: Sequence[TournamentPlacement],
+        archetypes: Iterable[str],
+    ) -> dict[str, ArchetypeKeyCardRollup]:
+        """Compute the most-included cards of each archetype.
+
+        Args:
+            placements: Placements the snapshot was computed from.
+            archetypes: Archetypes to roll up, usually the snapshot's shares.
+
+        Returns:
+            Dict mapping archetype to its top ``KEY_CARDS_LIMIT`` cards by
+            inclusion rate. Archetypes without decklists are omitted.
+        """
+        wanted = set(archetypes)
+        by_archetype: dict[str, list[TournamentPlacement]] = defaultdict(list)
+        for placement in placements:
+            if placement.decklist and placement.archetype in wanted:
+                by_archetype[placement.archetype].append(placement)
+
+        rollups = {}
+        for archetype, group in by_archetype.items():
+            # Malformed entries were already reported for the whole snapshot
+            usage = self._compute_card_usage(group, log_quality=False)
+            rollups[archetype] = ArchetypeKeyCardRollup(
+                decklist_count=len(group),
+                key_cards=[
+                    {
+                        "card_id": card_id,
+                        "inclusion_rate": stats["inclusion_rate"],
+                        "avg_copies": stats["avg_count"],
+                    }
+                    for card_id, stats in list(usage.items())[:KEY_CARDS_LIMIT]
+                ],
+            )
+        return rollups
+
     def _create_empty_snapshot(
         self,
         snapshot_date: date,
@@ -599,6 +1095,7 @@ class MetaService:
         game_format: Literal["standard", "expanded"] = "standard",
         lookback_days: int = 90,
         tournament_type: TournamentType = "all",
+        context: SnapshotContext | None = None,
     ) -> dict | None:
         """Compute JP vs EN meta divergence signals.
 
@@ -609,79 +1106,120 @@ class MetaService:
             snapshot_date: Reference date for comparison.
             game_format: Game format to compare.
             lookback_days: Days to look back for data.
+            context: Snapshots already computed this run; read from the
+                database only for combos it does not cover. The
+                comparison is built once per run and recorded in
+                ``context.jp_comparisons``.
 
         Returns:
             Dict with rising/falling/divergent lists, or None if insufficient data.
         """
+        comparison_key: ComparisonKey = (snapshot_date, game_format, tournament_type)
+        if context is not None and comparison_key in context.jp_comparisons:
+            comparison = context.jp_comparisons[comparison_key]
+        else:
+            comparison = await self._build_jp_comparison(
+                snapshot_date, game_format, tournament_type, context
+            )
+            if context is not None:
+                context.jp_comparisons[comparison_key] = comparison
+
+        if comparison is None:
+            return None
+        return jp_signals_from_comparison(comparison)
+
+    async def _build_jp_comparison(
+        self,
+        snapshot_date: date,
+        game_format: Literal["standard", "expanded"],
+        tournament_type: TournamentType,
+        context: SnapshotContext | None,
+    ) -> JPMetaComparison | None:
+        """Build the JP comparison for a date from its two snapshots."""
+        jp_key: SnapshotKey = ("JP", game_format, 1, tournament_type)
+        en_key: SnapshotKey = (None, game_format, 3, tournament_type)
+
         # Get JP snapshot (BO1)
-        jp_snapshot = await self.get_snapshot(
-            snapshot_date=snapshot_date,
-            region="JP",
-            game_format=game_format,
-            best_of=1,
-            tournament_type=tournament_type,
-        )
+        if context is not None and jp_key in context.current:
+            jp_snapshot = context.current[jp_key]
+        else:
+            jp_snapshot = await self.get_snapshot(
+                snapshot_date=snapshot_date,
+                region="JP",
+                game_format=game_format,
+                best_of=1,
+                tournament_type=tournament_type,
+            )
 
         # Get global/EN snapshot (BO3)
-        en_snapshot = await self.get_snapshot(
+        if context is not None and en_key in context.current:
+            en_snapshot = context.current[en_key]
+        else:
+            en_snapshot = await self.get_snapshot(
+                snapshot_date=snapshot_date,
+                region=None,  # Global includes EN data
+                game_format=game_format,
+                best_of=3,
+                tournament_type=tournament_type,
+            )
+
+        if not en_snapshot:
+            return None
+
+        return build_jp_comparison(
+            jp_snapshot,
+            en_snapshot,
             snapshot_date=snapshot_date,
-            region=None,  # Global includes EN data
             game_format=game_format,
-            best_of=3,
             tournament_type=tournament_type,
         )
 
-        if not jp_snapshot or not en_snapshot:
-            return None
-
-        jp_shares = {
-            k: v
-            for k, v in (jp_snapshot.archetype_shares or {}).items()
-            if k not in EXCLUDED_ARCHETYPES
-        }
-        en_shares = {
-            k: v
-            for k, v in (en_snapshot.archetype_shares or {}).items()
-            if k not in EXCLUDED_ARCHETYPES
-        }
-
-        all_archetypes = set(jp_shares.keys()) | set(en_shares.keys())
-
-        rising: list[str] = []  # Higher in JP
-        falling: list[str] = []  # Lower in JP
-        divergent: list[DivergentArchetype] = []
-
-        for archetype in all_archetypes:
-            jp_share = jp_shares.get(archetype, 0.0)
-            en_share = en_shares.get(archetype, 0.0)
-            diff = jp_share - en_share
-
-            if abs(diff) > JP_SIGNAL_THRESHOLD:
-                divergent.append(
-                    DivergentArchetype(
-                        archetype=archetype,
-                        jp_share=round(jp_share, 4),
-                        en_share=round(en_share, 4),
-                        diff=round(diff, 4),
-                    )
-                )
+    async def get_jp_comparison(
+        self,
+        *,
+        game_format: Literal["standard", "expanded"] = "standard",
+        tournament_type: TournamentType = "all",
+        on_or_before: date | None = None,
+        min_en_sample_size: int = 0,
+        min_jp_sample_size: int = 0,
+    ) -> JPMetaComparison | None:
+        """Get the latest precomputed JP vs global comparison.
 
-                if diff > 0:
-                    rising.append(archetype)
-                else:
-                    falling.append(archetype)
+        Args:
+            game_format: Game format.
+            tournament_type: Tournament type of both snapshots.
+            on_or_before: Latest snapshot date to consider.
+            min_en_sample_size: Skip comparisons whose global snapshot has
+                fewer placements.
+            min_jp_sample_size: Skip comparisons whose JP snapshot has
+                fewer placements.
 
-        if not divergent:
-            return None
+        Raises:
+            SQLAlchemyError: If database query fails.
+        """
+        query = select(JPMetaComparison).where(
+            JPMetaComparison.format == game_format,
+            JPMetaComparison.tournament_type == tournament_type,
+        )
+        if on_or_before is not None:
+            query = query.where(JPMetaComparison.snapshot_date <= on_or_before)
+        if min_en_sample_size:
+            query = query.where(JPMetaComparison.en_sample_size >= min_en_sample_size)
+        if min_jp_sample_size:
+            query = query.where(JPMetaComparison.jp_sample_size >= min_jp_sample_size)
+        query = query.order_by(JPMetaComparison.snapshot_date.desc()).limit(1)
 
-        return {
-            "rising": rising,
-            "falling": falling,
-            "divergent": [
-                d.model_dump()
-                for d in sorted(divergent, key=lambda x: abs(x.diff), reverse=True)
-            ],
-        }
+        try:
+            result = await self.session.execute(query)
+            return result.scalar_one_or_none()
+        except SQLAlchemyError:
+            logger.error(
+                "Failed to get JP comparison: format=%s, tournament_type=%s",
+                game_format,
+                tournament_type,
+                exc_info=True,
+            )
+            raise
 
     async def compute_trends(
         self,
@@ -691,6 +1229,7 @@ class MetaService:
         game_format: Literal["standard", "expanded"],
         best_of: Literal[1, 3],
         tournament_type: TournamentType = "all",
+        context: SnapshotContext | None = None,
     ) -> dict | None:
         """Compute week-over-week trends for archetypes.
 
@@ -700,19 +1239,25 @@ class MetaService:
             region: Region filter.
             game_format: Game format.
             best_of: Match format.
+            context: Run context with prefetched previous-week snapshots.
 
         Returns:
             Dict mapping archetypes to trend info, or None if no previous data.
         """
         previous_date = snapshot_date - timedelta(days=7)
 
-        previous_snapshot = await self.get_snapshot(
-            snapshot_date=previous_date,
-            region=region,
-            game_format=game_format,
-            best_of=best_of,
-            tournament_type=tournament_type,
-        )
+        if context is not None and context.previous is not None:
+            previous_snapshot = context.previous.get(
+                (region, game_format, best_of, tournament_type)
+            )
+        else:
+            previous_snapshot = await self.get_snapshot(
+                snapshot_date=previous_date,
+                region=region,
+                game_format=game_format,
+                best_of=best_of,
+                tournament_type=tournament_type,
+            )
 
         if not previous_snapshot:
             return None
@@ -849,6 +1394,11 @@ class MetaService:
         Raises:
             ValueError: If no data found for either region.
         """
+        if region_a == "JP" and region_b is None:
+            return await self._compare_jp_with_global(
+                game_format=game_format, lag_days=lag_days, top_n=top_n
+            )
+
         today = date.today()
         bo_a = self._best_of_for_region(region_a)
         bo_b = self._best_of_for_region(region_b)
@@ -913,6 +1463,80 @@ class MetaService:
             lag_analysis=lag,
         )
 
+    async def _compare_jp_with_global(
+        self,
+        *,
+        game_format: Literal["standard", "expanded"],
+        lag_days: int,
+        top_n: int,
+    ) -> MetaComparisonResponse:
+        """JP vs global comparison read from the precomputed comparisons."""
+        today = date.today()
+        # The newest row can lack a JP side (JP snapshot not computed yet);
+        # fall back to the latest comparison that has one
+        comparison = await self.get_jp_comparison(
+            game_format=game_format, min_jp_sample_size=1
+        )
+        if comparison is None:
+            latest = await self.get_jp_comparison(game_format=game_format)
+            missing = "Global" if latest is None else "JP"
+            raise ValueError(f"No snapshot data for: {missing}")
+
+        entries = comparison.archetypes[:top_n]
+        freshness = (today - comparison.snapshot_date).days
+
+        lag = None
+        if lag_days > 0:
+            lagged = await self.get_jp_comparison(
+                game_format=game_format,
+                on_or_before=today - timedelta(days=lag_days),
+                min_jp_sample_size=1,
+            )
+            if lagged:
+                lag = LagAnalysis(
+                    lag_days=lag_days,
+                    jp_snapshot_date=lagged.snapshot_date,
+                    en_snapshot_date=comparison.snapshot_date,
+                    lagged_comparisons=await self._archetype_comparisons(
+                        lagged_jp_comparison_entries(lagged, comparison)[:top_n]
+                    ),
+                )
+
+        return MetaComparisonResponse(
+            region_a="JP",
+            region_b="Global",
+            region_a_snapshot_date=comparison.snapshot_date,
+            region_b_snapshot_date=comparison.snapshot_date,
+            comparisons=await self._archetype_comparisons(entries),
+            region_a_confidence=self._compute_confidence(
+                comparison.jp_sample_size, freshness
+            ),
+            region_b_confidence=self._compute_confidence(
+                comparison.en_sample_size, freshness
+            ),
+            lag_analysis=lag,
+        )
+
+    async def _archetype_comparisons(
+        self, entries: list[dict]
+    ) -> list[ArchetypeComparison]:
+        """Convert JP comparison entries, with sprites, to API comparisons."""
+        sprite_map = await self._get_sprite_urls_for_archetypes(
+            [entry["archetype"] for entry in entries]
+        )
+        return [
+            ArchetypeComparison(
+                archetype=entry["archetype"],
+                region_a_share=entry["jp_share"] or 0.0,
+                region_b_share=entry["en_share"] or 0.0,
+                divergence=entry["divergence"],
+                region_a_tier=entry["jp_tier"],
+                region_b_tier=entry["en_tier"],
+                sprite_urls=sprite_map.get(entry["archetype"], []),
+            )
+            for entry in entries
+        ]
+
     # --- Forecast ---
 
     async def compute_format_forecast(
@@ -1139,6 +1763,7 @@ class MetaService:
         start_date_floor: date | None = None,
         era_label: str | None = None,
         tournament_type: TournamentType = "all",
+        context: SnapshotContext | None = None,
     ) -> MetaSnapshot:
         """Compute an enhanced meta snapshot with diversity, tiers, and trends.
 
@@ -1156,6 +1781,10 @@ class MetaService:
             lookback_days: Days to look back for tournament data.
             start_date_floor: If provided, clamp start_date.
             era_label: Optional era tag for the snapshot.
+            context: Run context shared across combos. When given, JP
+                signals and trends read snapshots from it instead of the
+                database, and the result is recorded in it for dependents
+                (see ``snapshot_dependencies``).
 
         Returns:
             MetaSnapshot with all enhanced fields populated.
@@ -1170,9 +1799,51 @@ class MetaService:
             start_date_floor=start_date_floor,
             era_label=era_label,
             tournament_type=tournament_type,
+            context=context,
+        )
+        return await self.enhance_snapshot(
+            snapshot,
+            snapshot_date=snapshot_date,
+            region=region,
+            game_format=game_format,
+            best_of=best_of,
+            lookback_days=lookback_days,
+            tournament_type=tournament_type,
+            context=context,
         )
 
+    async def enhance_snapshot(
+        self,
+        snapshot: MetaSnapshot,
+        *,
+        snapshot_date: date,
+        region: str | None,
+        game_format: Literal["standard", "expanded"],
+        best_of: Literal[1, 3],
+        lookback_days: int = 90,
+        tournament_type: TournamentType = "all",
+        context: SnapshotContext | None = None,
+    ) -> MetaSnapshot:
+        """Fill diversity, tiers, JP signals and trends on a base snapshot.
+
+        Args:
+            snapshot: Base snapshot from ``compute_meta_snapshot`` or an
+                equivalent incremental computation for the same dimensions.
+            snapshot_date: Reference date for the snapshot.
+            region: Region filter or None for global.
+            game_format: Game format.
+            best_of: Match format.
+            lookback_days: Days to look back for JP signal data.
+            context: Run context (see ``compute_enhanced_meta_snapshot``).
+
+        Returns:
+            The same snapshot, with enhanced fields populated.
+        """
+        key: SnapshotKey = (region, game_format, best_of, tournament_type)
+
         if snapshot.sample_size == 0:
+            if context is not None:
+                context.current[key] = None
             return snapshot
 
         shares = snapshot.archetype_shares
@@ -1181,6 +1852,10 @@ class MetaService:
         snapshot.diversity_index = self.compute_diversity_index(shares)
         snapshot.tier_assignments = self.compute_tier_assignments(shares)
 
+        # The global snapshot is its own EN side of the JP comparison
+        if context is not None:
+            context.current[key] = snapshot
+
         # Compute JP signals (only for non-JP, BO3 snapshots)
         if region != "JP" and best_of == 3:
             snapshot.jp_signals = await self.compute_jp_signals(
@@ -1188,6 +1863,7 @@ class MetaService:
                 game_format=game_format,
                 lookback_days=lookback_days,
                 tournament_type=tournament_type,
+                context=context,
             )
 
         # Compute trends
@@ -1198,6 +1874,7 @@ class MetaService:
             game_format=game_format,
             best_of=best_of,
             tournament_type=tournament_type,
+            context=context,
         )
 
         return snapshot
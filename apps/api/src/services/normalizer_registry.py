@@ -0,0 +1,164 @@
+"""Process-wide registry for the compiled archetype sprite index.
+
+Building an ``ArchetypeNormalizer`` used to reload the whole
+``archetype_sprites`` table every time, once per JP tournament during a
+scrape. The registry compiles ``SPRITE_ARCHETYPE_MAP`` plus the DB
+overrides into one read-only index, keyed by a version stamp derived from
+the row count and latest ``updated_at`` of ``archetype_sprites``.
+
+The index is rebuilt only when the stamp changes. The admin sprite
+endpoints call ``invalidate_sprite_index`` after a write so the next
+lookup on this instance rechecks immediately; other instances recheck
+the stamp at most every ``VERSION_CHECK_INTERVAL`` seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.archetype_sprite import ArchetypeSprite
+from src.services.archetype_detector import ArchetypeDetector
+from src.services.archetype_normalizer import SPRITE_ARCHETYPE_MAP, ArchetypeNormalizer
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between version-stamp checks
+VERSION_CHECK_INTERVAL = 60.0
+
+
+@dataclass(frozen=True)
+class SpriteIndex:
+    """Read-only sprite-key to archetype index at one version."""
+
+    version: str
+    sprite_map: Mapping[str, str]
+    db_count: int = 0
+
+
+_index: SpriteIndex | None = None
+_last_checked: float = 0.0
+
+# Served when no index was ever loaded and the database cannot be read
+_STATIC_INDEX = SpriteIndex(version="", sprite_map=SPRITE_ARCHETYPE_MAP)
+
+
+async def _read_version(session: AsyncSession) -> str:
+    """Compute the version stamp of the archetype_sprites table."""
+    row = (
+        await session.execute(
+            select(func.count(ArchetypeSprite.id), func.max(ArchetypeSprite.updated_at))
+        )
+    ).one()
+    return f"{row[0]}:{row[1]}"
+
+
+async def _build(session: AsyncSession, version: str) -> SpriteIndex:
+    result = await session.execute(
+        select(
+            ArchetypeSprite.sprite_key,
+            ArchetypeSprite.archetype_name,
+            ArchetypeSprite.display_name,
+        )
+    )
+    rows = result.all()
+    sprite_map = dict(SPRITE_ARCHETYPE_MAP)
+    for sprite_key, archetype_name, display_name in rows:
+        sprite_map[sprite_key] = display_name or archetype_name
+    return SpriteIndex(
+        version=version,
+        sprite_map=MappingProxyType(sprite_map),
+        db_count=len(rows),
+    )
+
+
+async def load_sprite_index(
+    session: AsyncSession, *, force: bool = False
+) -> SpriteIndex:
+    """Load or rebuild the process-wide sprite index.
+
+    Rebuilds only when the version stamp has changed since the last load,
+    unless ``force`` is set.
+
+    Args:
+        session: Database session.
+        force: Rebuild even if the version stamp is unchanged.
+
+    Returns:
+        The current index.
+    """
+    global _index, _last_checked
+
+    version = await _read_version(session)
+    _last_checked = time.monotonic()
+    if _index is not None and not force and _index.version == version:
+        return _index
+
+    index = await _build(session, version)
+    _index = index
+    logger.info(
+        "Loaded sprite index: db_sprites=%d, keys=%d, version=%s",
+        index.db_count,
+        len(index.sprite_map),
+        version,
+    )
+    return index
+
+
+async def get_sprite_index(session: AsyncSession) -> SpriteIndex:
+    """Return the sprite index, loading or rechecking it when due.
+
+    Falls back to the last loaded index, or to the in-code map when none
+    was ever loaded, if the database cannot be read. The load runs in a
+    savepoint of the caller's session, so a failure leaves the caller's
+    transaction usable, and is not retried for another interval.
+    """
+    global _last_checked
+
+    # A nonzero check time without an index means the last load failed
+    current = _index or (_STATIC_INDEX if _last_checked else None)
+    recent = time.monotonic() - _last_checked < VERSION_CHECK_INTERVAL
+    if current is not None and recent:
+        return current
+    try:
+        async with session.begin_nested():
+            return await load_sprite_index(session)
+    except Exception:
+        _last_checked = time.monotonic()
+        logger.warning("Sprite index load failed", exc_info=True)
+        return _index or _STATIC_INDEX
+
+
+async def get_normalizer(
+    session: AsyncSession, detector: ArchetypeDetector | None = None
+) -> ArchetypeNormalizer:
+    """Build a normalizer over the shared sprite index.
+
+    The normalizer memoizes resolutions, so callers should reuse it for
+    all placements of a run rather than building one per tournament.
+    """
+    index = await get_sprite_index(session)
+    return ArchetypeNormalizer(
+        detector=detector,
+        sprite_map=index.sprite_map,
+        sprite_version=index.version,
+    )
+
+
+def invalidate_sprite_index() -> None:
+    """Force the next lookup to recheck the version stamp."""
+    global _last_checked
+    _last_checked = 0.0
+
+
+def reset_sprite_index() -> None:
+    """Drop the process-wide index."""
+    global _index, _last_checked
+    _index = None
+    _last_checked = 0.0
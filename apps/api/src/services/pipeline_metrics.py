@@ -0,0 +1,275 @@
+"""Per-step instrumentation for pipeline runs.
+
+``track_pipeline`` opens a run tagged with the pipeline's ``run_id`` and
+``pipeline_step`` times one step inside it. Each step records wall and
+CPU time, DB query count and time, and HTTP request count and bytes.
+When the run ends it is saved as one ``pipeline_runs`` row.
+
+Counters live in a context variable, so concurrent steps (e.g.
+compute-meta combos gathered in separate tasks) are attributed
+separately. DB queries are counted by the cursor listeners in
+``src.db.query_timing``. HTTP traffic is counted by the response hook from
+``http_event_hooks``, which the API clients pass to httpx.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+from src.db.query_timing import (
+    QueryCollector,
+    add_query_collector,
+    install_query_timing,
+)
+from src.models.pipeline_run import PipelineRun
+
+logger = logging.getLogger(__name__)
+
+# Steps stored per run; later steps still count toward run totals
+MAX_RECORDED_STEPS = 500
+
+
+@dataclass
+class _Counters:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    http_requests: int = 0
+    http_bytes: int = 0
+
+
+# Counters of the run and every open step in the current context,
+# outermost first. Queries and requests are added to all of them.
+_active: ContextVar[tuple[_Counters, ...]] = ContextVar(
+    "pipeline_metrics_active", default=()
+)
+_current_run: ContextVar[RunRecorder | None] = ContextVar(
+    "pipeline_metrics_run", default=None
+)
+
+
+@dataclass
+class StepMetrics:
+    """Measurements for one pipeline step."""
+
+    name: str
+    status: str = "ok"
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    http_requests: int = 0
+    http_bytes: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "db_queries": self.db_queries,
+            "db_seconds": round(self.db_seconds, 4),
+            "http_requests": self.http_requests,
+            "http_bytes": self.http_bytes,
+            "error": self.error,
+        }
+
+
+@contextmanager
+def _measure(metrics: StepMetrics, counters: _Counters) -> Generator[None]:
+    """Time a block and copy its counters into ``metrics``."""
+    token = _active.set((*_active.get(), counters))
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    try:
+        yield
+    except BaseException as e:
+        metrics.status = "error"
+        metrics.error = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        metrics.wall_seconds = time.perf_counter() - wall_started
+        metrics.cpu_seconds = time.process_time() - cpu_started
+        metrics.db_queries = counters.db_queries
+        metrics.db_seconds = counters.db_seconds
+        metrics.http_requests = counters.http_requests
+        metrics.http_bytes = counters.http_bytes
+        _active.reset(token)
+
+
+@dataclass
+class RunRecorder:
+    """Collects step metrics for one pipeline run."""
+
+    pipeline: str
+    run_id: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    totals: StepMetrics = field(init=False)
+    steps: list[StepMetrics] = field(default_factory=list)
+    steps_dropped: int = 0
+
+    def __post_init__(self) -> None:
+        self.totals = StepMetrics(name=self.pipeline)
+
+    @contextmanager
+    def step(self, name: str) -> Generator[StepMetrics]:
+        """Measure one step of this run."""
+        metrics = StepMetrics(name=name)
+        try:
+            with _measure(metrics, _Counters()):
+                yield metrics
+        finally:
+            self._add(metrics)
+
+    def _add(self, metrics: StepMetrics) -> None:
+        if len(self.steps) < MAX_RECORDED_STEPS:
+            self.steps.append(metrics)
+        else:
+            self.steps_dropped += 1
+
+    def fail(self, error: str) -> None:
+        """Mark the run failed for an error the pipeline handled itself."""
+        self.totals.status = "error"
+        self.totals.error = error[:500]
+
+    def slowest_steps(self, limit: int = 5) -> list[StepMetrics]:
+        return sorted(self.steps, key=lambda s: s.wall_seconds, reverse=True)[:limit]
+
+    def to_model(self) -> PipelineRun:
+        totals = self.totals
+        return PipelineRun(
+            run_id=self.run_id,
+            pipeline=self.pipeline,
+            status=totals.status,
+            started_at=self.started_at,
+            finished_at=datetime.now(UTC),
+            wall_seconds=round(totals.wall_seconds, 4),
+            cpu_seconds=round(totals.cpu_seconds, 4),
+            db_queries=totals.db_queries,
+            db_seconds=round(totals.db_seconds, 4),
+            http_requests=totals.http_requests,
+            http_bytes=totals.http_bytes,
+            steps=[s.to_dict() for s in self.steps],
+            steps_dropped=self.steps_dropped,
+            error=totals.error,
+        )
+
+
+@contextmanager
+def pipeline_step(name: str) -> Generator[StepMetrics | None]:
+    """Measure a step of the current run; a no-op outside of a run.
+
+    Usage:
+        with pipeline_step("fetch-listings"):
+            ...
+    """
+    run = _current_run.get()
+    if run is None:
+        yield None
+        return
+    with run.step(name) as metrics:
+        yield metrics
+
+
+@asynccontextmanager
+async def track_pipeline(
+    pipeline: str,
+    run_id: str,
+    session_factory: Callable[[], Any] | None = None,
+) -> AsyncGenerator[RunRecorder]:
+    """Record a pipeline run and save it to ``pipeline_runs`` on exit.
+
+    The row is saved even when the run raises; failing to save it is
+    logged and never fails the pipeline.
+
+    Args:
+        pipeline: Pipeline name (e.g. "compute-meta").
+        run_id: The run_id already used in the pipeline's log records.
+        session_factory: Session factory for saving the row, normally the
+            pipeline's own. Nothing is saved when None.
+    """
+    add_query_collector(_COLLECTOR)
+    install_query_timing()
+    recorder = RunRecorder(pipeline=pipeline, run_id=run_id)
+    run_token = _current_run.set(recorder)
+    try:
+        with _measure(recorder.totals, _Counters()):
+            yield recorder
+    finally:
+        _current_run.reset(run_token)
+        _log_summary(recorder)
+        if session_factory is not None:
+            await save_run(recorder, session_factory)
+
+
+async def save_run(recorder: RunRecorder, session_factory: Callable[[], Any]) -> None:
+    """Persist a finished run, logging instead of raising on failure."""
+    try:
+        async with session_factory() as session:
+            session.add(recorder.to_model())
+            await session.commit()
+    except Exception:
+        logger.warning(
+            "Failed to save pipeline run %s (%s)",
+            recorder.run_id,
+            recorder.pipeline,
+            exc_info=True,
+        )
+
+
+def _log_summary(recorder: RunRecorder) -> None:
+    totals = recorder.totals
+    logger.info(
+        "Pipeline run %s: status=%s wall=%.2fs cpu=%.2fs db=%d/%.2fs "
+        "http=%d/%dB slowest=%s",
+        recorder.pipeline,
+        totals.status,
+        totals.wall_seconds,
+        totals.cpu_seconds,
+        totals.db_queries,
+        totals.db_seconds,
+        totals.http_requests,
+        totals.http_bytes,
+        ", ".join(f"{s.name}={s.wall_seconds:.2f}s" for s in recorder.slowest_steps(3)),
+        extra={"pipeline": recorder.pipeline, "run_id": recorder.run_id},
+    )
+
+
+# -- DB instrumentation -----------------------------------------------------
+
+
+def _record_query(statement: str, seconds: float) -> None:
+    for counters in _active.get():
+        counters.db_queries += 1
+        counters.db_seconds += seconds
+
+
+_COLLECTOR = QueryCollector(active=lambda: bool(_active.get()), record=_record_query)
+
+
+# -- HTTP instrumentation ---------------------------------------------------
+
+
+async def _record_response(response: httpx.Response) -> None:
+    active = _active.get()
+    if not active:
+        return
+    await response.aread()
+    size = len(response.content)
+    for counters in active:
+        counters.http_requests += 1
+        counters.http_bytes += size
+
+
+def http_event_hooks() -> dict[str, list[Callable[[httpx.Response], Any]]]:
+    """httpx event hooks counting requests and bytes for the current step."""
+    return {"response": [_record_response]}
@@ -10,10 +10,13 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Coroutine
+from contextlib import nullcontext
 from typing import Any
 
 from sqlalchemy.exc import OperationalError
 
+from src.services.pipeline_metrics import pipeline_step
+
 logger = logging.getLogger(__name__)
 
 # Retry defaults
@@ -87,7 +90,8 @@ async def with_timeout(
 ) -> Any:
     """Wrap an async operation with a timeout.
 
-    Logs timeout events with pipeline context before re-raising.
+    Logs timeout events with pipeline context before re-raising. When a
+    step is given it is also measured as a step of the current run.
 
     Args:
         coro: The coroutine to run.
@@ -102,8 +106,9 @@ async def with_timeout(
         TimeoutError: If the operation exceeds the timeout.
     """
     try:
-        async with asyncio.timeout(timeout_seconds):
-            return await coro
+        with pipeline_step(step) if step else nullcontext():
+            async with asyncio.timeout(timeout_seconds):
+                return await coro
     except TimeoutError:
         logger.error(
             "Pipeline timeout after %ds: pipeline=%s step=%s",
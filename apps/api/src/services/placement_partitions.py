@@ -0,0 +1,156 @@
+"""Monthly range partitions of tournament_placements.
+
+Migration 050 range-partitions ``tournament_placements`` by
+``tournament_date`` into one partition per calendar month, named
+``tournament_placements_pYYYYMM``, plus a default partition that catches
+dates beyond the newest month. Pruning drops whole months instead of
+deleting rows, and ``ensure_month_partitions`` adds months ahead of the
+data, moving any rows the default partition caught for them.
+
+Dropping a partition takes ACCESS EXCLUSIVE on the parent, and every
+read of placements queues behind that request while it waits.
+``DETACH PARTITION ... CONCURRENTLY`` is not allowed while a default
+partition exists, so drops instead give up after
+``PARTITION_LOCK_TIMEOUT`` and leave the month's rows to be deleted.
+
+On an unpartitioned table every helper is a no-op.
+"""
+
+import logging
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "tournament_placements"
+DEFAULT_PARTITION = "tournament_placements_default"
+
+# Longest a partition drop may wait for (and so stall reads of) the parent
+PARTITION_LOCK_TIMEOUT = "2s"
+
+_PARTITION_RE = re.compile(r"^tournament_placements_p(\d{4})(\d{2})$")
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+def partition_name(month: date) -> str:
+    """Partition holding placements of ``month``'s calendar month."""
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(month: date) -> date:
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+async def list_month_partitions(session: AsyncSession) -> list[date]:
+    """First day of each month that has a partition, oldest first."""
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    months = []
+    for name in result.scalars().all():
+        match = _PARTITION_RE.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+async def drop_month_partitions(session: AsyncSession, before: date) -> dict[str, int]:
+    """Drop partitions whose whole month falls before ``before``.
+
+    Placements of a partially covered month, or of a month whose lock
+    was not granted within ``PARTITION_LOCK_TIMEOUT``, are left for the
+    caller to delete row by row.
+
+    Returns:
+        Placement count of each dropped partition, by name
+    """
+    months = await list_month_partitions(session)
+    expired = [partition_name(m) for m in months if _next_month(m) <= before]
+    dropped: dict[str, int] = {}
+    if not expired:
+        return dropped
+
+    await session.execute(text(f"SET LOCAL lock_timeout = '{PARTITION_LOCK_TIMEOUT}'"))
+    for name in expired:
+        counted = await session.execute(
+            text(f"SELECT count(*) FROM {name}")  # noqa: S608
+        )
+        try:
+            async with session.begin_nested():
+                await session.execute(text(f"DROP TABLE {name}"))
+        except DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            # Later months need the same lock; retry on the next prune
+            logger.warning(
+                "Parent lock not granted within %s; leaving %s for row deletes",
+                PARTITION_LOCK_TIMEOUT,
+                name,
+            )
+            break
+        dropped[name] = counted.scalar() or 0
+    await session.execute(text("SET LOCAL lock_timeout TO DEFAULT"))
+
+    if dropped:
+        logger.info("Dropped placement partitions: %s", ", ".join(dropped))
+    return dropped
+
+
+async def ensure_month_partitions(session: AsyncSession, through: date) -> list[str]:
+    """Create monthly partitions up to and including ``through``'s month.
+
+    Rows the default partition holds for a new month are moved into it
+    before it is attached.
+
+    Returns:
+        Names of the created partitions
+    """
+    months = await list_month_partitions(session)
+    if not months:
+        return []
+
+    created = []
+    month = _next_month(months[-1])
+    while month <= _month_start(through):
+        name = partition_name(month)
+        bounds = {"start": month, "end": _next_month(month)}
+        in_month = "tournament_date >= :start AND tournament_date < :end"
+        await session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        moved = f"FROM {DEFAULT_PARTITION} WHERE {in_month}"
+        await session.execute(
+            text(f"INSERT INTO {name} SELECT * {moved}"),  # noqa: S608
+            bounds,
+        )
+        await session.execute(text(f"DELETE {moved}"), bounds)  # noqa: S608
+        await session.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month}') TO ('{_next_month(month)}')"
+            )
+        )
+        created.append(name)
+        month = _next_month(month)
+
+    if created:
+        logger.info("Created placement partitions: %s", ", ".join(created))
+    return created
@@ -1,12 +1,14 @@
 """AI-powered prediction engine for archetype performance forecasting.
 
 Combines historical evolution data, JP meta signals, and upcoming set
-releases to predict archetype performance at future tournaments.
+releases to predict archetype performance at future tournaments. The
+statistical forecaster supplies the numbers for every archetype at once;
+Claude is only asked to narrate the forecast for top archetypes.
 """
 
 import json
 import logging
-from datetime import date
+from datetime import date, timedelta
 from uuid import UUID, uuid4
 
 from sqlalchemy import select
@@ -18,9 +20,18 @@ from src.models.archetype_prediction import ArchetypePrediction
 from src.models.meta_snapshot import MetaSnapshot
 from src.models.set import Set
 from src.models.tournament import Tournament
+from src.services.meta_forecaster import (
+    ArchetypeForecast,
+    ShareObservation,
+    forecast_meta,
+)
+from src.services.prediction_scoring import accuracy_score
 
 logger = logging.getLogger(__name__)
 
+# Days of tournament history the statistical forecast is fitted on
+FORECAST_HISTORY_DAYS = 120
+
 
 class PredictionEngineError(Exception):
     """Error during prediction generation."""
@@ -37,15 +48,19 @@ class PredictionEngine:
         self,
         archetype: str,
         target_tournament_id: UUID,
+        forecast: ArchetypeForecast | None = None,
     ) -> ArchetypePrediction:
         """Generate a prediction for an archetype at an upcoming tournament.
 
         Loads recent snapshots, JP meta data, and upcoming set releases
         to build context, then uses Claude Sonnet to generate predictions.
+        With a statistical ``forecast``, its numbers are kept and Claude
+        only adds adaptations, JP signals and methodology.
 
         Args:
             archetype: Normalized archetype name.
             target_tournament_id: Tournament to predict for.
+            forecast: Statistical forecast from ``forecast``.
 
         Returns:
             An ArchetypePrediction (not yet persisted).
@@ -74,13 +89,29 @@ class PredictionEngine:
         context = self._build_prediction_context(
             archetype, snapshots, meta_snapshot, new_sets, tournament
         )
+        if forecast is not None:
+            context["baseline_forecast"] = forecast.to_context()
 
         # Generate prediction via Claude
         try:
-            prediction_data = await self._generate_prediction(archetype, context)
+            prediction_data = await self._generate_prediction(
+                archetype, context, narrative_only=forecast is not None
+            )
         except ClaudeError as e:
             raise PredictionEngineError(f"Failed to generate prediction: {e}") from e
 
+        if forecast is not None:
+            prediction = self.baseline_prediction(
+                archetype, target_tournament_id, forecast
+            )
+            prediction.method = "narrated"
+            prediction.likely_adaptations = prediction_data.get("likely_adaptations")
+            prediction.jp_signals = prediction_data.get("jp_signals")
+            prediction.methodology = (
+                prediction_data.get("methodology") or prediction.methodology
+            )
+            return prediction
+
         return ArchetypePrediction(
             id=uuid4(),
             archetype_id=archetype,
@@ -92,6 +123,7 @@ class PredictionEngine:
             jp_signals=prediction_data.get("jp_signals"),
             confidence=prediction_data.get("confidence"),
             methodology=prediction_data.get("methodology"),
+            method="claude",
         )
 
     async def score_prediction(self, prediction_id: UUID) -> None:
@@ -130,15 +162,84 @@ class PredictionEngine:
 
         prediction.actual_meta_share = snapshot.meta_share
 
-        # Compute accuracy score
-        if prediction.predicted_meta_share and prediction.actual_meta_share is not None:
-            mid = prediction.predicted_meta_share.get("mid", 0)
-            if mid > 0:
-                error = abs(prediction.actual_meta_share - mid) / mid
-                prediction.accuracy_score = round(max(0, 1.0 - error), 4)
+        # Score the prediction and its statistical baseline the same way
+        if prediction.actual_meta_share is not None:
+            if prediction.predicted_meta_share:
+                prediction.accuracy_score = accuracy_score(
+                    prediction.predicted_meta_share.get("mid", 0),
+                    prediction.actual_meta_share,
+                )
+            if prediction.baseline_meta_share is not None:
+                prediction.baseline_accuracy_score = accuracy_score(
+                    prediction.baseline_meta_share, prediction.actual_meta_share
+                )
 
         await self.session.commit()
 
+    async def forecast(self, before: date) -> dict[str, ArchetypeForecast]:
+        """Statistically forecast every archetype for a tournament date.
+
+        Fits on all BO3 standard tournament results in the
+        ``FORECAST_HISTORY_DAYS`` before ``before``, loaded in one query,
+        with the latest global meta snapshot as prior.
+        """
+        query = (
+            select(
+                ArchetypeEvolutionSnapshot.archetype,
+                Tournament.date,
+                ArchetypeEvolutionSnapshot.meta_share,
+                ArchetypeEvolutionSnapshot.top_cut_conversion,
+                ArchetypeEvolutionSnapshot.deck_count,
+            )
+            .join(
+                Tournament,
+                ArchetypeEvolutionSnapshot.tournament_id == Tournament.id,
+            )
+            .where(
+                Tournament.date < before,
+                Tournament.date >= before - timedelta(days=FORECAST_HISTORY_DAYS),
+                Tournament.format == "standard",
+                Tournament.best_of == 3,
+            )
+        )
+        rows = (await self.session.execute(query)).all()
+        observations = [ShareObservation(*row) for row in rows]
+
+        meta_snapshot = await self._get_latest_meta_snapshot()
+        prior = meta_snapshot.archetype_shares if meta_snapshot else None
+        return forecast_meta(observations, prior)
+
+    @staticmethod
+    def baseline_prediction(
+        archetype: str,
+        target_tournament_id: UUID,
+        forecast: ArchetypeForecast,
+    ) -> ArchetypePrediction:
+        """Build a prediction from the statistical forecast alone."""
+        direction = (
+            "rising"
+            if forecast.trend > 0
+            else "falling"
+            if forecast.trend < 0
+            else "flat"
+        )
+        return ArchetypePrediction(
+            id=uuid4(),
+            archetype_id=archetype,
+            target_tournament_id=target_tournament_id,
+            predicted_meta_share=forecast.meta_share,
+            predicted_day2_rate=forecast.day2_rate,
+            predicted_tier=forecast.tier,
+            confidence=forecast.confidence,
+            methodology=(
+                "Statistical baseline: exponentially weighted share trend "
+                f"({direction}) over {forecast.observations} recent events, "
+                "smoothed toward the current global meta share."
+            ),
+            method="statistical",
+            baseline_meta_share=forecast.meta_share["mid"],
+        )
+
     async def _load_recent_snapshots(
         self, archetype: str, limit: int = 6
     ) -> list[ArchetypeEvolutionSnapshot]:
@@ -157,16 +258,22 @@ class PredictionEngine:
         return list(result.scalars().all())
 
     async def _get_latest_meta_snapshot(self) -> MetaSnapshot | None:
-        """Get the most recent meta snapshot."""
+        """Get the most recent global BO3 standard meta snapshot."""
         result = await self.session.execute(
-            select(MetaSnapshot).order_by(MetaSnapshot.snapshot_date.desc()).limit(1)
+            select(MetaSnapshot)
+            .where(
+                MetaSnapshot.region.is_(None),
+                MetaSnapshot.format == "standard",
+                MetaSnapshot.best_of == 3,
+                MetaSnapshot.tournament_type == "all",
+            )
+            .order_by(MetaSnapshot.snapshot_date.desc())
+            .limit(1)
         )
         return result.scalar_one_or_none()
 
     async def _get_upcoming_sets(self, before_date: date) -> list[Set]:
         """Get sets released recently (within 30 days before tournament)."""
-        from datetime import timedelta
-
         cutoff = before_date - timedelta(days=30)
         result = await self.session.execute(
             select(Set).where(
@@ -233,8 +340,32 @@ class PredictionEngine:
         self,
         archetype: str,
         context: dict,
+        narrative_only: bool = False,
     ) -> dict:
-        """Use Claude to generate the prediction."""
+        """Use Claude to generate the prediction, or only its narrative."""
+        if narrative_only:
+            system_prompt = (
+                "You are a Pokemon TCG meta analyst explaining a statistical "
+                "forecast for an upcoming tournament. Take the numbers in "
+                "baseline_forecast as given and explain them using the "
+                "archetype's trajectory, current meta, JP signals, and new "
+                "set releases.\n\n"
+                "Respond with JSON containing:\n"
+                '- "likely_adaptations": list of {{"type": str, '
+                '"description": str, "cards": list}}\n'
+                '- "jp_signals": dict with any relevant JP meta signals\n'
+                '- "methodology": 2-3 sentence explanation of the forecast'
+            )
+            user_prompt = (
+                f"Explain {archetype}'s forecast:\n\n{json.dumps(context, indent=2)}"
+            )
+            return await self.claude.classify(
+                system=system_prompt,
+                user=user_prompt,
+                model=MODEL_SONNET,
+                max_tokens=768,
+            )
+
         system_prompt = (
             "You are a Pokemon TCG meta analyst generating predictions "
             "for upcoming tournaments. Analyze the archetype's trajectory, "
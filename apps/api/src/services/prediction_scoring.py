@@ -0,0 +1,184 @@
+"""Batch scoring of archetype predictions and accuracy rollups.
+
+``score_completed_predictions`` scores every unscored prediction whose
+target tournament has passed, with one grouped count over the
+tournaments' placements, and writes all scores in one bulk UPDATE.
+``rebuild_accuracy_rollups`` then recomputes ``prediction_accuracy_rollups``
+with a single GROUPING SETS query, so readers fetch precomputed rows
+instead of aggregating the predictions table per request.
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import Date, cast, delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.archetype_prediction import ArchetypePrediction
+from src.models.prediction_accuracy_rollup import PredictionAccuracyRollup
+from src.models.tournament import Tournament
+from src.models.tournament_placement import TournamentPlacement
+
+logger = logging.getLogger(__name__)
+
+# Method of predictions made before the method column existed
+LEGACY_METHOD = "claude"
+
+
+def accuracy_score(predicted: float, actual: float) -> float | None:
+    """1 minus the relative error of a predicted share, floored at 0."""
+    if predicted <= 0:
+        return None
+    error = abs(actual - predicted) / predicted
+    return round(max(0, 1.0 - error), 4)
+
+
+async def score_completed_predictions(
+    session: AsyncSession, today: date | None = None
+) -> tuple[int, int]:
+    """Score unscored predictions for tournaments before ``today``.
+
+    The actual share is the archetype's fraction of the tournament's
+    placements; an archetype absent from a tournament with placements
+    scores against 0. Tournaments without placements yet are skipped
+    and retried on the next run.
+
+    Returns:
+        Tuple of (predictions_scored, tournaments_scored).
+    """
+    today = today or date.today()
+    pending = (
+        await session.execute(
+            select(
+                ArchetypePrediction.id,
+                ArchetypePrediction.archetype_id,
+                ArchetypePrediction.target_tournament_id,
+                ArchetypePrediction.predicted_meta_share,
+                ArchetypePrediction.baseline_meta_share,
+            )
+            .join(Tournament, ArchetypePrediction.target_tournament_id == Tournament.id)
+            .where(
+                ArchetypePrediction.actual_meta_share.is_(None),
+                Tournament.date < today,
+            )
+        )
+    ).all()
+    if not pending:
+        return 0, 0
+
+    tournament_ids = {row.target_tournament_id for row in pending}
+    count_rows = (
+        await session.execute(
+            select(
+                TournamentPlacement.tournament_id,
+                TournamentPlacement.archetype,
+                func.count(),
+            )
+            .where(TournamentPlacement.tournament_id.in_(tournament_ids))
+            .group_by(TournamentPlacement.tournament_id, TournamentPlacement.archetype)
+        )
+    ).all()
+    counts: dict[tuple, int] = {}
+    totals: dict = {}
+    for tournament_id, archetype, count in count_rows:
+        counts[(tournament_id, archetype)] = count
+        totals[tournament_id] = totals.get(tournament_id, 0) + count
+
+    updates = []
+    scored_tournaments = set()
+    for row in pending:
+        total = totals.get(row.target_tournament_id)
+        if not total:
+            continue
+        actual = counts.get((row.target_tournament_id, row.archetype_id), 0) / total
+        mid = (row.predicted_meta_share or {}).get("mid")
+        updates.append(
+            {
+                "id": row.id,
+                "actual_meta_share": round(actual, 4),
+                "accuracy_score": (
+                    accuracy_score(mid, actual) if mid is not None else None
+                ),
+                "baseline_accuracy_score": (
+                    accuracy_score(row.baseline_meta_share, actual)
+                    if row.baseline_meta_share is not None
+                    else None
+                ),
+            }
+        )
+        scored_tournaments.add(row.target_tournament_id)
+
+    if updates:
+        await session.execute(update(ArchetypePrediction), updates)
+
+    logger.info(
+        "Scored %d predictions across %d tournaments (%d still awaiting results)",
+        len(updates),
+        len(scored_tournaments),
+        len(pending) - len(updates),
+    )
+    return len(updates), len(scored_tournaments)
+
+
+async def rebuild_accuracy_rollups(session: AsyncSession) -> int:
+    """Recompute every accuracy rollup row in one statement.
+
+    Grouping sets produce per (archetype, method, month) rows, per-method
+    rows and the overall row, whose unused dimensions are NULL.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    method = func.coalesce(ArchetypePrediction.method, LEGACY_METHOD)
+    month = cast(func.date_trunc("month", Tournament.date), Date)
+    predicted_mid = ArchetypePrediction.predicted_meta_share["mid"].as_float()
+    scored = ArchetypePrediction.accuracy_score.is_not(None)
+
+    rollups = (
+        select(
+            func.gen_random_uuid(),
+            ArchetypePrediction.archetype_id,
+            method,
+            month,
+            func.count(),
+            func.count(ArchetypePrediction.accuracy_score),
+            func.avg(ArchetypePrediction.accuracy_score),
+            func.avg(
+                func.abs(ArchetypePrediction.actual_meta_share - predicted_mid)
+            ).filter(scored),
+            func.count(ArchetypePrediction.baseline_accuracy_score),
+            func.avg(ArchetypePrediction.baseline_accuracy_score),
+        )
+        .join(Tournament, ArchetypePrediction.target_tournament_id == Tournament.id)
+        .group_by(
+            func.grouping_sets(
+                tuple_(ArchetypePrediction.archetype_id, method, month),
+                tuple_(method),
+                tuple_(),
+            )
+        )
+    )
+
+    await session.execute(delete(PredictionAccuracyRollup))
+    result = await session.execute(
+        insert(PredictionAccuracyRollup)
+        .from_select(
+            [
+                "id",
+                "archetype_id",
+                "method",
+                "month",
+                "prediction_count",
+                "scored_count",
+                "average_accuracy",
+                "mean_absolute_error",
+                "baseline_scored_count",
+                "baseline_average_accuracy",
+            ],
+            rollups,
+        )
+        .returning(PredictionAccuracyRollup.id)
+    )
+    written = len(result.all())
+    logger.info("Rebuilt %d prediction accuracy rollups", written)
+    return written
@@ -0,0 +1,142 @@
+"""Request-scoped SQL query profiling and N+1 detection.
+
+``profile_queries`` opens a profile in the current context; while it is
+open every statement run on the shared engine is counted and timed by
+the cursor listeners in ``src.db.query_timing``. Statements are grouped
+by shape (literals and bind parameters collapsed), so a shape repeated
+many times within one request shows up as a likely N+1 pattern.
+
+The API opts in with the ``query_profiling`` setting, which adds a
+middleware that reports each request's profile in a ``Server-Timing``
+header and a structured log line. Tests use the same profile to enforce
+query budgets (see ``tests/query_budget.py``).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.db.query_timing import (
+    QueryCollector,
+    add_query_collector,
+    install_query_timing,
+)
+
+# Times one statement shape may run per request before it is flagged
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_RE = re.compile(r"(?:%\(\w+\)s|\$\d+|(?<![:\w]):\w+|\?)")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape.
+
+    Literals and bind parameters become ``?`` and ``IN`` lists collapse to
+    ``IN (?)``, so the same query issued for different rows has one shape.
+    """
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _BIND_RE.sub("?", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _IN_LIST_RE.sub("IN (?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class ShapeStats:
+    """Count and time of one statement shape."""
+
+    shape: str
+    count: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class QueryProfile:
+    """Statements run within one profiled scope."""
+
+    shapes: dict[str, ShapeStats] = field(default_factory=dict)
+    statements: int = 0
+    seconds: float = 0.0
+
+    def record(self, statement: str, seconds: float = 0.0) -> None:
+        shape = normalize_statement(statement)
+        stats = self.shapes.get(shape)
+        if stats is None:
+            stats = self.shapes[shape] = ShapeStats(shape=shape)
+        stats.count += 1
+        stats.seconds += seconds
+        self.statements += 1
+        self.seconds += seconds
+
+    def repeated_shapes(
+        self, threshold: int = DEFAULT_REPEAT_THRESHOLD
+    ) -> list[ShapeStats]:
+        """Shapes run at least ``threshold`` times, most frequent first."""
+        repeated = [s for s in self.shapes.values() if s.count >= threshold]
+        return sorted(repeated, key=lambda s: (-s.count, -s.seconds))
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value for this profile."""
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.statements} queries"'
+
+    def to_dict(self, threshold: int = DEFAULT_REPEAT_THRESHOLD) -> dict[str, Any]:
+        return {
+            "statements": self.statements,
+            "db_ms": round(self.seconds * 1000, 1),
+            "distinct_shapes": len(self.shapes),
+            "repeated": [
+                {
+                    "shape": s.shape[:200],
+                    "count": s.count,
+                    "db_ms": round(s.seconds * 1000, 1),
+                }
+                for s in self.repeated_shapes(threshold)
+            ],
+        }
+
+
+_profile: ContextVar[QueryProfile | None] = ContextVar("query_profile", default=None)
+
+
+def _record_query(statement: str, seconds: float) -> None:
+    profile = _profile.get()
+    if profile is not None:
+        profile.record(statement, seconds)
+
+
+_COLLECTOR = QueryCollector(
+    active=lambda: _profile.get() is not None, record=_record_query
+)
+
+
+def current_profile() -> QueryProfile | None:
+    """The profile open in the current context, if any."""
+    return _profile.get()
+
+
+@contextmanager
+def profile_queries() -> Generator[QueryProfile]:
+    """Profile the statements run inside this block.
+
+    Usage:
+        with profile_queries() as profile:
+            ...
+        profile.statements
+    """
+    add_query_collector(_COLLECTOR)
+    install_query_timing()
+    profile = QueryProfile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
@@ -0,0 +1,356 @@
+"""Rotation legality index and per-archetype survival evaluation.
+
+A format transition is reduced to one bit per card name: bit ``i`` of
+``LegalityIndex.rotating_mask`` is set when no printing of name ``i`` is
+legal in the target format. Legality is tracked by name because a
+reprint keeps an older printing legal. A decklist then becomes a single
+int bitset of the names it plays, and ``mask & rotating_mask`` yields
+its rotating cards without any per-card lookups.
+
+``evaluate_archetypes`` makes one pass over (archetype, decklist) rows
+and accumulates every archetype at once, so a season of placements is
+rated in a few seconds of pure Python.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.utils.card_ids import canonical_card_id
+
+# Fewer decklists than this rate an archetype "unknown"
+MIN_DECKLISTS = 5
+# Share of played copies that must resolve to a known card
+MIN_RESOLVED_SHARE = 0.8
+# A rotating card in at least this share of lists is a core card
+CORE_INCLUSION = 0.5
+# Average rotating copies per list for "crippled" / "adapts"
+CRIPPLED_LOST_COPIES = 12.0
+ADAPTS_LOST_COPIES = 3.0
+# Core cards lost for "crippled"
+CRIPPLED_CORE_CARDS = 3
+# Rotating cards stored per archetype
+MAX_ROTATING_CARDS = 15
+
+# Limitless IDs for basic energy, which never rotates
+_BASIC_ENERGY_PREFIX = "energy-"
+
+
+def _name_key(name: str | None) -> str:
+    """Normalize a card name for reprint matching."""
+    if not name:
+        return ""
+    normalized = name.casefold().replace("’", "'")
+    return " ".join(normalized.split())
+
+
+def archetype_slug(name: str) -> str:
+    """Convert an archetype name to a RotationImpact archetype ID."""
+    slug = name.lower().strip()
+    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    return slug.strip("-")
+
+
+def _set_code(limitless_id: str | None) -> str | None:
+    """Set code of a Limitless card ID (``OBF-125`` -> ``OBF``)."""
+    if not limitless_id or "-" not in limitless_id:
+        return None
+    return limitless_id.rsplit("-", 1)[0].upper()
+
+
+@dataclass(frozen=True)
+class CardLegalityRow:
+    """The card columns legality is derived from."""
+
+    id: str
+    name: str
+    limitless_id: str | None
+    regulation_mark: str | None
+    legalities: dict | None
+
+
+def legal_regulation_marks(
+    cards: Iterable[CardLegalityRow],
+    legal_sets: Iterable[str],
+    rotating_sets: Iterable[str] = (),
+) -> set[str]:
+    """Regulation marks legal in a format, derived from its sets.
+
+    A mark is legal when it is printed in one of ``legal_sets`` and in none
+    of ``rotating_sets``, so a stray older mark on a promo or reprint in a
+    legal set does not keep the whole rotating block legal.
+    """
+    legal = {code.upper() for code in legal_sets}
+    rotating = {code.upper() for code in rotating_sets}
+    legal_marks: set[str] = set()
+    rotating_marks: set[str] = set()
+    for card in cards:
+        code = _set_code(card.limitless_id)
+        if not card.regulation_mark or code is None:
+            continue
+        if code in legal:
+            legal_marks.add(card.regulation_mark.upper())
+        elif code in rotating:
+            rotating_marks.add(card.regulation_mark.upper())
+    return legal_marks - rotating_marks
+
+
+@dataclass
+class LegalityIndex:
+    """Bit index over card names for one format transition.
+
+    Attributes:
+        names: Display name of each bit.
+        bit_by_id: Every ID form of every printing, mapped to its name's bit.
+        bit_by_name: Normalized name mapped to its bit.
+        rotating_mask: Bits of names with no printing legal after rotation.
+    """
+
+    names: list[str] = field(default_factory=list)
+    bit_by_id: dict[str, int] = field(default_factory=dict)
+    bit_by_name: dict[str, int] = field(default_factory=dict)
+    rotating_mask: int = 0
+
+    def _bit_for_name(self, name: str) -> int:
+        key = _name_key(name)
+        bit = self.bit_by_name.get(key)
+        if bit is None:
+            bit = len(self.names)
+            self.names.append(name)
+            self.bit_by_name[key] = bit
+        return bit
+
+    def resolve(self, card_id: str, name: str | None = None) -> int | None:
+        """Bit of a decklist entry, by card ID then by name."""
+        bit = self.bit_by_id.get(card_id)
+        if bit is None:
+            bit = self.bit_by_id.get(canonical_card_id(card_id))
+        if bit is None and name:
+            bit = self.bit_by_name.get(_name_key(name))
+        return bit
+
+    @property
+    def rotating_count(self) -> int:
+        return self.rotating_mask.bit_count()
+
+
+def build_legality_index(
+    cards: Iterable[CardLegalityRow],
+    legal_sets: Iterable[str],
+    legal_marks: set[str],
+    placeholder_names: Iterable[str] = (),
+) -> LegalityIndex:
+    """Index card names and mark the ones that rotate.
+
+    A name stays legal if any printing is in ``legal_sets``, carries one
+    of ``legal_marks``, or has no mark but is currently standard legal
+    (basic energy), or if an announced placeholder card reprints it.
+    """
+    index = LegalityIndex()
+    legal_codes = {code.upper() for code in legal_sets}
+    marks = {mark.upper() for mark in legal_marks}
+    legal_bits = 0
+
+    for card in cards:
+        bit = index._bit_for_name(card.name)
+        for card_id in (card.id, canonical_card_id(card.id), card.limitless_id):
+            if card_id:
+                index.bit_by_id.setdefault(card_id, bit)
+
+        mark = card.regulation_mark.upper() if card.regulation_mark else None
+        if mark is not None:
+            legal = mark in marks
+        else:
+            legal = bool((card.legalities or {}).get("standard"))
+        if legal or _set_code(card.limitless_id) in legal_codes:
+            legal_bits |= 1 << bit
+
+    for name in placeholder_names:
+        legal_bits |= 1 << index._bit_for_name(name)
+
+    all_bits = (1 << len(index.names)) - 1
+    index.rotating_mask = all_bits & ~legal_bits
+    return index
+
+
+@dataclass
+class ArchetypeRotation:
+    """Evaluated rotation impact of one archetype."""
+
+    archetype: str
+    decklists: int
+    survival_rating: str
+    avg_lost_copies: float
+    core_cards_lost: int
+    resolved_share: float
+    rotating_cards: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _Accumulator:
+    decklists: int = 0
+    copies: int = 0
+    resolved: int = 0
+    lost_copies: int = 0
+    inclusions: dict[int, int] = field(default_factory=dict)
+    bit_copies: dict[int, int] = field(default_factory=dict)
+    card_ids: dict[int, str] = field(default_factory=dict)
+
+
+def _rate(
+    acc: _Accumulator,
+    signature_lost: bool,
+    core_lost: int,
+    avg_lost: float,
+    resolved_share: float,
+) -> str:
+    if acc.decklists < MIN_DECKLISTS or resolved_share < MIN_RESOLVED_SHARE:
+        return "unknown"
+    if signature_lost:
+        return "dies"
+    if avg_lost >= CRIPPLED_LOST_COPIES or core_lost >= CRIPPLED_CORE_CARDS:
+        return "crippled"
+    if avg_lost >= ADAPTS_LOST_COPIES or core_lost > 0:
+        return "adapts"
+    return "thrives"
+
+
+def evaluate_archetypes(
+    rows: Iterable[tuple[str, list[dict] | None]],
+    index: LegalityIndex,
+    signature_masks: Mapping[str, int] | None = None,
+) -> list[ArchetypeRotation]:
+    """Rate every archetype's survival in one pass over its decklists.
+
+    Args:
+        rows: (archetype, decklist) pairs; rows without a list are skipped.
+        index: Legality index of the transition.
+        signature_masks: Archetype name to the bits of its signature
+            cards; an archetype whose signature card rotates "dies".
+
+    Returns:
+        One evaluation per archetype with decklists, largest first.
+    """
+    rotating_mask = index.rotating_mask
+    signature_masks = signature_masks or {}
+    # Keyed with the name too: an unknown or empty ID resolves by name
+    resolved_bits: dict[tuple[str, str | None], int | None] = {}
+    accumulators: dict[str, _Accumulator] = {}
+
+    for archetype, decklist in rows:
+        if not decklist:
+            continue
+        acc = accumulators.get(archetype)
+        if acc is None:
+            acc = accumulators[archetype] = _Accumulator()
+        acc.decklists += 1
+
+        deck_mask = 0
+        deck_copies: dict[int, int] = {}
+        for entry in decklist:
+            if not isinstance(entry, dict):
+                continue
+            card_id = entry.get("card_id") or ""
+            try:
+                quantity = int(entry.get("quantity", 1))
+            except (TypeError, ValueError):
+                continue
+            if quantity < 1:
+                continue
+            acc.copies += quantity
+
+            if card_id.startswith(_BASIC_ENERGY_PREFIX):
+                acc.resolved += quantity
+                continue
+            key = (card_id, entry.get("name"))
+            if key in resolved_bits:
+                bit = resolved_bits[key]
+            else:
+                bit = index.resolve(*key)
+                resolved_bits[key] = bit
+            if bit is None:
+                continue
+            acc.resolved += quantity
+            deck_mask |= 1 << bit
+            deck_copies[bit] = deck_copies.get(bit, 0) + quantity
+            if card_id and (rotating_mask >> bit) & 1:
+                acc.card_ids.setdefault(bit, card_id)
+
+        lost = deck_mask & rotating_mask
+        while lost:
+            low = lost & -lost
+            bit = low.bit_length() - 1
+            lost ^= low
+            acc.inclusions[bit] = acc.inclusions.get(bit, 0) + 1
+            acc.bit_copies[bit] = acc.bit_copies.get(bit, 0) + deck_copies[bit]
+            acc.lost_copies += deck_copies[bit]
+
+    evaluations = []
+    for archetype, acc in accumulators.items():
+        evaluations.append(
+            _summarize(archetype, acc, index, signature_masks.get(archetype, 0))
+        )
+    evaluations.sort(key=lambda e: (-e.decklists, e.archetype))
+    return evaluations
+
+
+def _summarize(
+    archetype: str,
+    acc: _Accumulator,
+    index: LegalityIndex,
+    signature_mask: int,
+) -> ArchetypeRotation:
+    played_mask = 0
+    for bit in acc.inclusions:
+        played_mask |= 1 << bit
+    signature_lost = bool(signature_mask & played_mask)
+
+    core_lost = sum(
+        1
+        for appearances in acc.inclusions.values()
+        if appearances / acc.decklists >= CORE_INCLUSION
+    )
+    avg_lost = acc.lost_copies / acc.decklists
+    resolved_share = acc.resolved / acc.copies if acc.copies else 0.0
+
+    ranked = sorted(
+        acc.inclusions.items(),
+        key=lambda item: (-item[1], -acc.bit_copies[item[0]], item[0]),
+    )[:MAX_ROTATING_CARDS]
+    rotating_cards = [
+        {
+            "card_name": index.names[bit],
+            "card_id": acc.card_ids.get(bit),
+            # Typical copies in the lists that play the card
+            "count": min(4, max(1, round(acc.bit_copies[bit] / appearances))),
+            "inclusion_rate": round(appearances / acc.decklists, 4),
+            "role": None,
+            "replacement": None,
+        }
+        for bit, appearances in ranked
+    ]
+
+    return ArchetypeRotation(
+        archetype=archetype,
+        decklists=acc.decklists,
+        survival_rating=_rate(acc, signature_lost, core_lost, avg_lost, resolved_share),
+        avg_lost_copies=round(avg_lost, 2),
+        core_cards_lost=core_lost,
+        resolved_share=round(resolved_share, 4),
+        rotating_cards=rotating_cards,
+    )
+
+
+def signature_masks(
+    signature_cards: Mapping[str, str], index: LegalityIndex
+) -> dict[str, int]:
+    """Bits of each archetype's signature cards, from card ID to archetype."""
+    masks: dict[str, int] = {}
+    for card_id, archetype in signature_cards.items():
+        bit = index.resolve(card_id)
+        if bit is not None:
+            masks[archetype] = masks.get(archetype, 0) | (1 << bit)
+    return masks
@@ -1,13 +1,21 @@
 """Cloud Storage service for file uploads."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
-
-from google.cloud import storage
-from google.cloud.exceptions import NotFound
+from typing import TYPE_CHECKING
 
 from src.config import get_settings
+from src.utils.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    from google.cloud import exceptions as gcs_exceptions
+    from google.cloud import storage
+else:
+    gcs_exceptions = lazy_import("google.cloud.exceptions")
+    storage = lazy_import("google.cloud.storage")
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +77,24 @@ class StorageService:
         logger.info("Uploaded export to gs://%s/%s", self.bucket_name, blob_path)
         return blob.public_url
 
+    async def upload_ndjson(self, data: bytes, blob_path: str) -> None:
+        """Upload a gzip-compressed NDJSON object.
+
+        Args:
+            data: Gzip-compressed NDJSON content
+            blob_path: Target path in bucket
+        """
+        blob = self.bucket.blob(blob_path)
+        blob.content_encoding = "gzip"
+
+        await asyncio.to_thread(
+            blob.upload_from_string,
+            data,
+            content_type="application/x-ndjson",
+        )
+
+        logger.info("Uploaded NDJSON to gs://%s/%s", self.bucket_name, blob_path)
+
     async def generate_signed_url(
         self,
         filename: str,
@@ -112,7 +138,7 @@ class StorageService:
             await asyncio.to_thread(blob.delete)
             logger.info("Deleted export gs://%s/%s", self.bucket_name, blob_path)
             return True
-        except NotFound:
+        except gcs_exceptions.NotFound:
             logger.warning("Export not found: gs://%s/%s", self.bucket_name, blob_path)
             return False
 
@@ -5,14 +5,17 @@ tournament data in the database.
 """
 
 import logging
-import re
+import time
 from collections import Counter
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from uuid import uuid4
 
 import httpx
-from sqlalchemy import delete, func, select
+from sqlalchemy import Text, any_, bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,12 +26,16 @@ from src.clients.limitless import (
     LimitlessTournament,
 )
 from src.models import CardIdMapping, Tournament, TournamentPlacement
+from src.models.tournament_placement import tournament_columns
 from src.services.archetype_detector import ArchetypeDetector
 from src.services.archetype_normalizer import ArchetypeNormalizer
+from src.services.card_catalog import refresh_card_catalog
 from src.services.major_format_windows import (
     get_major_window_for_date,
     is_official_major_tier,
 )
+from src.services.normalizer_registry import get_normalizer
+from src.utils.card_ids import CanonicalCardIdMapping
 
 logger = logging.getLogger(__name__)
 
@@ -70,65 +77,51 @@ class TournamentScrapeService:
         """
         self.session = session
         self.client = client
+        # Seconds spent per discovery phase, accumulated across calls
+        self.phase_timings: dict[str, float] = {}
         self.detector = archetype_detector or ArchetypeDetector()
         self.normalizer = normalizer
-        self._jp_to_en_mapping: dict[str, str] | None = None
+        self._jp_normalizer: ArchetypeNormalizer | None = None
+        self._jp_to_en_mapping: Mapping[str, str] | None = None
 
-    async def _get_jp_to_en_mapping(self) -> dict[str, str]:
+    async def _get_jp_to_en_mapping(self) -> Mapping[str, str]:
         """Load JP-to-EN card mapping from database (cached).
 
+        Uses the process-wide card catalog when it is loaded. Otherwise
+        reads one entry per mapping keyed by ``jp_canonical_id``; both
+        forms canonicalize JP IDs on lookup instead of pre-expanding
+        case and zero-padding variants.
+
         Returns:
-            Dict mapping JP card IDs to EN card IDs.
+            Mapping of JP card IDs to EN card IDs.
         """
         if self._jp_to_en_mapping is None:
-            query = select(CardIdMapping.jp_card_id, CardIdMapping.en_card_id)
+            catalog = await refresh_card_catalog(self.session)
+            if catalog is not None:
+                self._jp_to_en_mapping = catalog.jp_to_en_mapping()
+                return self._jp_to_en_mapping
+
+            query = select(CardIdMapping.jp_canonical_id, CardIdMapping.en_card_id)
             result = await self.session.execute(query)
-            mapping: dict[str, str] = {}
-            base_count = 0
+            entries: dict[str, str] = {}
             for row in result:
-                base_count += 1
-                jp_card_id = row.jp_card_id
-                en_card_id = row.en_card_id
-                for variant in self._card_id_variants(jp_card_id):
-                    mapping.setdefault(variant, en_card_id)
-            self._jp_to_en_mapping = mapping
-            logger.info(
-                "Loaded %d JP-to-EN card mappings (%d normalized variants)",
-                base_count,
-                len(mapping),
-            )
+                if row.jp_canonical_id:
+                    entries.setdefault(row.jp_canonical_id, row.en_card_id)
+            self._jp_to_en_mapping = CanonicalCardIdMapping(entries)
+            logger.info("Loaded %d JP-to-EN card mappings", len(entries))
         return self._jp_to_en_mapping
 
-    @staticmethod
-    def _card_id_variants(card_id: str) -> set[str]:
-        """Generate normalized variants for a JP card ID.
+    async def _get_jp_normalizer(
+        self, detector: ArchetypeDetector
+    ) -> ArchetypeNormalizer:
+        """Return the JP normalizer for this service, built once.
 
-        Handles case differences and numeric zero-padding to improve
-        matching between JP decklists and JP-to-EN mapping keys.
+        Shares the process-wide sprite index and keeps its resolution
+        memo across every JP tournament the service saves.
         """
-        raw = card_id.strip()
-        if not raw:
-            return set()
-
-        if "-" not in raw:
-            return {raw, raw.lower(), raw.upper()}
-
-        set_part, num_part = raw.split("-", 1)
-        set_variants = {set_part, set_part.lower(), set_part.upper()}
-
-        num_variants: set[str] = {num_part, num_part.lower(), num_part.upper()}
-        match = re.match(r"^([A-Za-z]*)(\d+)$", num_part)
-        if match:
-            prefix, digits = match.groups()
-            digits_int = str(int(digits))
-            digit_variants = {digits, digits_int, digits.zfill(2), digits.zfill(3)}
-            prefix_variants = {prefix, prefix.lower(), prefix.upper()}
-            for p in prefix_variants:
-                for d in digit_variants:
-                    num_variants.add(f"{p}{d}")
-
-        variants = {f"{s}-{n}" for s in set_variants for n in num_variants}
-        return variants
+        if self._jp_normalizer is None:
+            self._jp_normalizer = await get_normalizer(self.session, detector)
+        return self._jp_normalizer
 
     def _get_detector_for_region(self, region: str) -> ArchetypeDetector:
         """Get an archetype detector configured for the given region.
@@ -206,6 +199,41 @@ class TournamentScrapeService:
         result = await self.session.execute(query)
         return result.first() is not None
 
+    async def existing_source_urls(self, source_urls: Iterable[str]) -> set[str]:
+        """Return which of the given source URLs are already stored.
+
+        Resolves the whole batch with a single ``source_url = ANY(:urls)``
+        query served by the unique index on ``tournaments.source_url``.
+
+        Args:
+            source_urls: Candidate source URLs.
+
+        Returns:
+            The subset of URLs that already have a tournament row.
+        """
+        urls = sorted({url for url in source_urls if url})
+        if not urls:
+            return set()
+
+        query = select(Tournament.source_url).where(
+            Tournament.source_url
+            == any_(bindparam("source_urls", urls, type_=ARRAY(Text)))
+        )
+        result = await self.session.execute(query)
+        return {url for url in result.scalars().all() if url}
+
+    @contextmanager
+    def _timed(self, phase: str) -> Generator[None]:
+        """Add the wall time of the enclosed block to ``phase_timings``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.phase_timings[phase] = round(
+                self.phase_timings.get(phase, 0.0) + elapsed, 4
+            )
+
     async def scrape_new_tournaments(
         self,
         region: str = "en",
@@ -482,9 +510,10 @@ class TournamentScrapeService:
         await self._get_jp_to_en_mapping()
 
         try:
-            all_tournaments = await self.client.fetch_jp_city_league_listings(
-                lookback_days=lookback_days,
-            )
+            with self._timed("fetch_listings"):
+                all_tournaments = await self.client.fetch_jp_city_league_listings(
+                    lookback_days=lookback_days,
+                )
         except (LimitlessError, httpx.RequestError) as e:
             error_msg = f"Error fetching JP City League listings: {e}"
             logger.error(error_msg, exc_info=True)
@@ -633,14 +662,13 @@ class TournamentScrapeService:
             # Auto-create normalizer for JP tournaments
             normalizer = self.normalizer
             if tournament.region == "JP" and normalizer is None:
-                normalizer = ArchetypeNormalizer(detector=detector)
-                await normalizer.load_db_sprites(self.session)
+                normalizer = await self._get_jp_normalizer(detector)
 
             method_counts: Counter[str | None] = Counter()
             for placement in tournament.placements:
                 db_placement = self._create_placement(
                     placement,
-                    db_tournament.id,
+                    db_tournament,
                     detector,
                     jp_mapping,
                     normalizer,
@@ -779,15 +807,14 @@ class TournamentScrapeService:
 
         normalizer = self.normalizer
         if is_jp and normalizer is None:
-            normalizer = ArchetypeNormalizer(detector=detector)
-            await normalizer.load_db_sprites(self.session)
+            normalizer = await self._get_jp_normalizer(detector)
 
         # Create new placements
         method_counts: Counter[str | None] = Counter()
         for placement in placements:
             db_placement = self._create_placement(
                 placement,
-                tournament.id,
+                tournament,
                 detector,
                 jp_mapping,
                 normalizer,
@@ -861,16 +888,16 @@ class TournamentScrapeService:
     def _create_placement(
         self,
         placement: LimitlessPlacement,
-        tournament_id,
+        tournament: Tournament,
         detector: ArchetypeDetector | None = None,
-        jp_to_en_mapping: dict[str, str] | None = None,
+        jp_to_en_mapping: Mapping[str, str] | None = None,
         normalizer: ArchetypeNormalizer | None = None,
     ) -> TournamentPlacement:
         """Create a TournamentPlacement model from Limitless data.
 
         Args:
             placement: Placement data from Limitless.
-            tournament_id: ID of the parent tournament.
+            tournament: The parent tournament.
             detector: Optional archetype detector (uses self.detector
                 if None).
             jp_to_en_mapping: Optional JP→EN card ID mapping.
@@ -943,7 +970,8 @@ class TournamentScrapeService:
 
         return TournamentPlacement(
             id=uuid4(),
-            tournament_id=tournament_id,
+            tournament_id=tournament.id,
+            **tournament_columns(tournament),
             placement=placement.placement,
             player_name=placement.player_name,
             archetype=archetype,
@@ -960,49 +988,69 @@ class TournamentScrapeService:
         game_format: str = "standard",
         lookback_days: int = 7,
         max_pages: int = 10,
+        stop_when_known: bool = True,
     ) -> list[LimitlessTournament]:
         """Discover new tournaments without processing them.
 
         Returns metadata for tournaments not yet in the database.
         Used by the two-phase pipeline (discover → enqueue → process).
 
+        Listings are newest first, so paging stops once a page reaches
+        past the cutoff date or, with ``stop_when_known``, once every
+        tournament on a page is already stored.
+
         Args:
             region: Region to scrape ("en", "jp", etc.).
             game_format: Game format ("standard", "expanded").
             lookback_days: Only include tournaments from last N days.
             max_pages: Maximum listing pages to fetch.
+            stop_when_known: Stop paging at the first fully known page.
 
         Returns:
             List of new LimitlessTournament metadata (no placements fetched).
         """
         cutoff_date = date.today() - timedelta(days=lookback_days)
-        all_tournaments: list[LimitlessTournament] = []
+        found = 0
+        seen_urls: set[str] = set()
+        new_tournaments: list[LimitlessTournament] = []
 
         for page in range(1, max_pages + 1):
             try:
-                tournaments = await self.client.fetch_tournament_listings(
-                    region=region,
-                    game_format=game_format,
-                    page=page,
-                )
-                if not tournaments:
-                    break
-                for t in tournaments:
-                    if t.tournament_date >= cutoff_date:
-                        all_tournaments.append(t)
+                with self._timed("fetch_listings"):
+                    tournaments = await self.client.fetch_tournament_listings(
+                        region=region,
+                        game_format=game_format,
+                        page=page,
+                    )
             except (LimitlessError, httpx.RequestError) as e:
                 logger.error("Error fetching page %d: %s", page, e)
                 break
+            if not tournaments:
+                break
 
-        # Filter out tournaments that already exist
-        new_tournaments = []
-        for t in all_tournaments:
-            if not await self.tournament_exists(t.source_url):
+            in_range = [t for t in tournaments if t.tournament_date >= cutoff_date]
+            found += len(in_range)
+            with self._timed("existence_check"):
+                known = await self.existing_source_urls(t.source_url for t in in_range)
+
+            page_new = 0
+            for t in in_range:
+                if t.source_url in known or t.source_url in seen_urls:
+                    continue
+                seen_urls.add(t.source_url)
                 new_tournaments.append(t)
+                page_new += 1
+
+            if len(in_range) < len(tournaments):
+                logger.debug("Page %d reached the cutoff, stopping", page)
+                break
+            if stop_when_known and page_new == 0:
+                logger.debug("Page %d already known, stopping", page)
+                break
 
         logger.info(
             "Discovery complete: found=%d, new=%d, region=%s",
-            len(all_tournaments),
+            found,
             len(new_tournaments),
             region,
         )
@@ -1028,9 +1076,10 @@ class TournamentScrapeService:
         cutoff_date = date.today() - timedelta(days=lookback_days)
 
         try:
-            all_tournaments = await self.client.fetch_official_tournament_listings(
-                game_format=game_format,
-            )
+            with self._timed("fetch_listings"):
+                all_tournaments = await self.client.fetch_official_tournament_listings(
+                    game_format=game_format,
+                )
         except (LimitlessError, httpx.RequestError) as e:
             logger.error("Error fetching official tournament listings: %s", e)
             return []
@@ -1047,10 +1096,11 @@ class TournamentScrapeService:
                 if t.region and t.region.upper() == region.upper()
             ]
 
-        new_tournaments = []
-        for t in tournaments_in_range:
-            if not await self.tournament_exists(t.source_url):
-                new_tournaments.append(t)
+        with self._timed("existence_check"):
+            known = await self.existing_source_urls(
+                t.source_url for t in tournaments_in_range
+            )
+        new_tournaments = [t for t in tournaments_in_range if t.source_url not in known]
 
         logger.info(
             "Official discovery complete: found=%d, new=%d",
@@ -1074,21 +1124,21 @@ class TournamentScrapeService:
             List of new LimitlessTournament metadata.
         """
         try:
-            all_tournaments = await self.client.fetch_jp_city_league_listings(
-                lookback_days=lookback_days,
-            )
+            with self._timed("fetch_listings"):
+                all_tournaments = await self.client.fetch_jp_city_league_listings(
+                    lookback_days=lookback_days,
+                )
         except (LimitlessError, httpx.RequestError) as e:
             logger.error("Error fetching JP City League listings: %s", e)
             return []
 
-        new_tournaments = []
-        skipped_before_min = 0
-        for t in all_tournaments:
-            if min_date and t.tournament_date < min_date:
-                skipped_before_min += 1
-                continue
-            if not await self.tournament_exists(t.source_url):
-                new_tournaments.append(t)
+        candidates = [
+            t for t in all_tournaments if not min_date or t.tournament_date >= min_date
+        ]
+        skipped_before_min = len(all_tournaments) - len(candidates)
+        with self._timed("existence_check"):
+            known = await self.existing_source_urls(t.source_url for t in candidates)
+        new_tournaments = [t for t in candidates if t.source_url not in known]
 
         logger.info(
             "JP discovery complete: found=%d, new=%d, skipped_before_min=%d",
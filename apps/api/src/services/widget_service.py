@@ -3,21 +3,25 @@
 import hashlib
 import html
 import logging
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from uuid import uuid4
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Date, Select, cast, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
 from src.models.widget import Widget, generate_widget_id
-from src.models.widget_view import WidgetView
+from src.models.widget_view_rollup import WidgetViewRollup
 from src.schemas.pagination import PaginatedResponse
 from src.services.widget_resolvers import get_resolver
+from src.services.widget_view_buffer import get_widget_view_buffer
 
 logger = logging.getLogger(__name__)
 
+# Referrer domains listed in widget analytics
+ANALYTICS_TOP_REFERRERS = 10
+
 
 class WidgetService:
     """Service for widget CRUD and data resolution."""
@@ -246,7 +250,7 @@ class WidgetService:
         logger.info("Deleted widget %s for user %s", widget_id, user.id)
         return True
 
-    async def record_view(
+    def record_view(
         self,
         widget_id: str,
         referrer: str | None = None,
@@ -255,34 +259,74 @@ class WidgetService:
     ) -> None:
         """Record a widget view.
 
+        The view is counted in the process-wide view buffer, which writes
+        hourly rollups and view counts in the background; callers should
+        only record views of widgets they have resolved.
+
         Args:
             widget_id: Widget ID
             referrer: HTTP referrer
             ip_address: Client IP (will be hashed)
             user_agent: Client user agent
         """
-        widget = await self.get_widget(widget_id)
-        if not widget:
-            return
-
         # Hash IP for privacy
         ip_hash = None
         if ip_address:
             ip_hash = hashlib.sha256(ip_address.encode()).hexdigest()
 
-        view = WidgetView(
-            id=uuid4(),
-            widget_id=widget_id,
+        get_widget_view_buffer().record(
+            widget_id,
             referrer=referrer[:500] if referrer else None,
             ip_hash=ip_hash,
             user_agent=user_agent[:500] if user_agent else None,
         )
-        self.session.add(view)
 
-        # Increment view counter
-        widget.view_count += 1
+    async def get_view_analytics(self, widget: Widget, days: int = 30) -> dict:
+        """Get daily views and top referrer domains from hourly rollups.
 
-        await self.session.commit()
+        Args:
+            widget: The widget (ownership already verified)
+            days: Number of days to include, counting today (UTC)
+
+        Returns:
+            Dict with total views, per-day views and top referrer domains
+        """
+        since = datetime.now(UTC).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=days - 1)
+        in_window = (
+            WidgetViewRollup.widget_id == widget.id,
+            WidgetViewRollup.hour >= since,
+        )
+
+        day = cast(func.timezone("UTC", WidgetViewRollup.hour), Date)
+        daily_result = await self.session.execute(
+            select(day, func.sum(WidgetViewRollup.view_count))
+            .where(*in_window)
+            .group_by(day)
+            .order_by(day)
+        )
+        daily_rows = [(d, int(v)) for d, v in daily_result.all()]
+
+        views = func.sum(WidgetViewRollup.view_count)
+        referrer_result = await self.session.execute(
+            select(WidgetViewRollup.referrer_domain, views)
+            .where(*in_window)
+            .group_by(WidgetViewRollup.referrer_domain)
+            .order_by(views.desc(), WidgetViewRollup.referrer_domain)
+            .limit(ANALYTICS_TOP_REFERRERS)
+        )
+        referrers = [
+            {"domain": domain, "views": int(v)} for domain, v in referrer_result.all()
+        ]
+
+        return {
+            "widget_id": widget.id,
+            "days": days,
+            "total_views": sum(v for _, v in daily_rows),
+            "daily": [{"date": d, "views": v} for d, v in daily_rows],
+            "top_referrers": referrers,
+        }
 
     def generate_embed_code(
         self,
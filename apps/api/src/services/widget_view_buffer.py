@@ -0,0 +1,256 @@
+"""In-process buffer for widget view analytics.
+
+Embed loads arrive in bursts: a streamer embedding a widget turns one
+widget into thousands of views a minute. Instead of writing a row per
+view on the request path, each view is counted in memory under its
+(widget_id, hour, referrer domain) key. A background task flushes the
+counts every ``widget_view_flush_seconds`` with one additive upsert into
+``widget_view_rollups`` and one ``widgets.view_count`` update, so a spike
+costs the same two statements per interval as a trickle. Instances flush
+independently; the additive upsert makes their counts sum.
+
+When ``widget_view_log_bucket`` is set, raw events (hashed IP, user agent,
+full referrer) are also appended to the bucket as one gzip-compressed
+NDJSON object per flush, for audits and reprocessing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import json
+import logging
+from collections import Counter
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from sqlalchemy import DateTime, Integer, String, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.db.database import async_session_factory
+from src.models.widget import Widget
+from src.models.widget_view_rollup import WidgetViewRollup
+from src.services.storage_service import StorageService
+
+logger = logging.getLogger(__name__)
+
+# Raw events held between flushes; beyond this they are dropped from the
+# log (counts are still kept)
+MAX_PENDING_EVENTS = 50_000
+
+RollupKey = tuple[str, datetime, str | None]
+
+
+def referrer_domain(referrer: str | None) -> str | None:
+    """Lowercased referrer host without a leading "www."."""
+    if not referrer:
+        return None
+    try:
+        host = urlsplit(referrer).hostname
+    except ValueError:
+        return None
+    if not host:
+        return None
+    return host.removeprefix("www.")[:255]
+
+
+class WidgetViewBuffer:
+    """Counts widget views in memory and flushes them as hourly rollups."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = 10.0,
+        log_bucket: str | None = None,
+        max_pending_events: int = MAX_PENDING_EVENTS,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.log_bucket = log_bucket
+        self.max_pending_events = max_pending_events
+        self.dropped_events = 0
+        self._counts: Counter[RollupKey] = Counter()
+        self._events: list[dict[str, Any]] = []
+        self._instance = uuid4().hex[:8]
+        self._log_sequence = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_views(self) -> int:
+        """Views recorded since the last successful flush."""
+        return self._counts.total()
+
+    def record(
+        self,
+        widget_id: str,
+        *,
+        referrer: str | None = None,
+        ip_hash: str | None = None,
+        user_agent: str | None = None,
+        viewed_at: datetime | None = None,
+    ) -> None:
+        """Count one view; no I/O happens until the next flush."""
+        viewed_at = viewed_at or datetime.now(UTC)
+        hour = viewed_at.replace(minute=0, second=0, microsecond=0)
+        self._counts[(widget_id, hour, referrer_domain(referrer))] += 1
+
+        if self.log_bucket is None:
+            return
+        if len(self._events) >= self.max_pending_events:
+            self.dropped_events += 1
+            return
+        self._events.append(
+            {
+                "widget_id": widget_id,
+                "viewed_at": viewed_at.isoformat(),
+                "referrer": referrer,
+                "ip_hash": ip_hash,
+                "user_agent": user_agent,
+            }
+        )
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Write buffered counts and events.
+
+        Counts that fail to write are put back for the next flush; a failed
+        log upload is logged and its events dropped.
+
+        Returns:
+            Number of views written to rollups
+        """
+        async with self._flush_lock:
+            counts, self._counts = self._counts, Counter()
+            events, self._events = self._events, []
+
+            written = 0
+            if counts:
+                try:
+                    await _write_rollups(session, counts)
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    self._counts.update(counts)
+                    raise
+                written = counts.total()
+
+            if events:
+                try:
+                    await self._upload_events(events)
+                except Exception:
+                    logger.exception(
+                        "Failed to upload %d widget view events", len(events)
+                    )
+
+            if self.dropped_events:
+                logger.warning(
+                    "Dropped %d widget view events from the raw log",
+                    self.dropped_events,
+                )
+                self.dropped_events = 0
+            return written
+
+    async def _upload_events(self, events: list[dict[str, Any]]) -> None:
+        body = "".join(json.dumps(event) + "\n" for event in events)
+        data = await asyncio.to_thread(gzip.compress, body.encode())
+        now = datetime.now(UTC)
+        self._log_sequence += 1
+        blob_path = (
+            f"widget-views/{now:%Y/%m/%d/%H%M%S}"
+            f"-{self._instance}-{self._log_sequence:06d}.ndjson.gz"
+        )
+        await StorageService(self.log_bucket).upload_ndjson(data, blob_path)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._counts and not self._events:
+                continue
+            try:
+                async with async_session_factory() as session:
+                    await self.flush(session)
+            except Exception:
+                logger.exception("Widget view flush failed; retrying next interval")
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if not self._counts and not self._events:
+            return
+        try:
+            async with async_session_factory() as session:
+                await self.flush(session)
+        except Exception:
+            logger.exception(
+                "Final widget view flush failed; %d views lost", self.pending_views
+            )
+
+
+async def _write_rollups(session: AsyncSession, counts: Counter[RollupKey]) -> None:
+    """Add counts to hourly rollups and to each widget's lifetime total."""
+    flushed = values(
+        column("widget_id", String),
+        column("hour", DateTime(timezone=True)),
+        column("referrer_domain", String),
+        column("view_count", Integer),
+        name="flushed",
+    ).data([(*key, count) for key, count in counts.items()])
+
+    # Joining widgets skips views of widgets deleted since they were counted
+    stmt = pg_insert(WidgetViewRollup).from_select(
+        ["id", "widget_id", "hour", "referrer_domain", "view_count"],
+        select(
+            func.gen_random_uuid(),
+            flushed.c.widget_id,
+            flushed.c.hour,
+            flushed.c.referrer_domain,
+            flushed.c.view_count,
+        ).join(Widget, Widget.id == flushed.c.widget_id),
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_widget_view_rollup",
+            set_={
+                "view_count": WidgetViewRollup.view_count + stmt.excluded.view_count,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+    per_widget: Counter[str] = Counter()
+    for (widget_id, _, _), count in counts.items():
+        per_widget[widget_id] += count
+    totals = values(
+        column("widget_id", String),
+        column("view_count", Integer),
+        name="totals",
+    ).data(list(per_widget.items()))
+    await session.execute(
+        update(Widget)
+        .where(Widget.id == totals.c.widget_id)
+        .values(view_count=Widget.view_count + totals.c.view_count)
+    )
+
+
+@lru_cache
+def get_widget_view_buffer() -> WidgetViewBuffer:
+    """Process-wide widget view buffer configured from settings."""
+    settings = get_settings()
+    return WidgetViewBuffer(
+        flush_interval=settings.widget_view_flush_seconds,
+        log_bucket=settings.widget_view_log_bucket,
+    )
@@ -0,0 +1,80 @@
+"""Canonical card ID form shared by card lookups.
+
+Card IDs reach us in several spellings of the same card: TCGdex stores
+zero-padded IDs (``sv03-076``), Limitless decklists use unpadded ones
+(``sv3-76``) and JP sources mix case (``SV3-076``). All of them reduce
+to one canonical key, which is also stored in the indexed
+``cards.canonical_id`` and ``card_id_mappings.jp_canonical_id`` columns.
+"""
+
+import re
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+_SET_PART_RE = re.compile(r"^([a-z]+)(\d+)((?:pt\d+)?)$")
+_NUMBER_PART_RE = re.compile(r"^([a-z]*)(\d+)$")
+
+
+def canonical_card_id(card_id: str) -> str:
+    """Reduce a card ID to a case- and zero-padding-insensitive key.
+
+    ``sv03-076``, ``sv3-76`` and ``SV3-076`` all reduce to ``sv3-76``.
+    Set digits are unpadded only for ``<letters><digits>[pt<digits>]`` set
+    parts, and card numbers keep any alphabetic prefix (``TG05`` -> ``tg5``).
+    """
+    raw = card_id.strip().lower()
+    dash_idx = raw.rfind("-")
+    if dash_idx == -1:
+        return raw
+
+    set_part = raw[:dash_idx]
+    number = raw[dash_idx + 1 :]
+
+    set_match = _SET_PART_RE.match(set_part)
+    if set_match:
+        prefix, digits, suffix = set_match.groups()
+        set_part = f"{prefix}{int(digits)}{suffix}"
+
+    number_match = _NUMBER_PART_RE.match(number)
+    if number_match:
+        prefix, digits = number_match.groups()
+        number = f"{prefix}{int(digits)}"
+
+    return f"{set_part}-{number}"
+
+
+def canonical_card_id_default(column: str) -> Callable[[Any], str | None]:
+    """Build a SQLAlchemy column default deriving the canonical ID.
+
+    Args:
+        column: Key of the column holding the raw card ID.
+    """
+
+    def default(context: Any) -> str | None:
+        card_id = context.get_current_parameters().get(column)
+        return canonical_card_id(card_id) if card_id else None
+
+    return default
+
+
+class CanonicalCardIdMapping(Mapping[str, str]):
+    """Read-only mapping keyed by canonical card ID.
+
+    Holds one entry per card and canonicalizes keys on lookup, so any
+    spelling of a card ID finds the same value.
+    """
+
+    def __init__(self, entries: Mapping[str, str]) -> None:
+        self._entries = dict(entries)
+
+    def __getitem__(self, key: str) -> str:
+        return self._entries[canonical_card_id(key)]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and canonical_card_id(key) in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
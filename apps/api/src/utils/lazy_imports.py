@@ -0,0 +1,51 @@
+"""Deferred imports for heavy optional dependencies.
+
+Importing the app imports every router, and through them the SDKs for
+Claude, Kernel/Playwright, Cloud Storage, Cloud Tasks and the HTML
+parsers. Together those cost seconds of cold start (see
+``python -m benchmarks.imports``), yet instances that only serve read
+traffic never call them. Modules bind such a dependency with
+``lazy_import``, importing it for real only under ``TYPE_CHECKING``::
+
+    if TYPE_CHECKING:
+        import anthropic
+    else:
+        anthropic = lazy_import("anthropic")
+
+The name behaves like the module and is executed on first attribute
+access, so ``patch("src.clients.claude.anthropic.AsyncAnthropic")``
+keeps working. Annotations that name the module must not be evaluated
+at import time (``from __future__ import annotations``).
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module ``name``, executed on first attribute access.
+
+    Parent packages are imported eagerly, as locating the module
+    requires them; an already imported module is returned as is.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
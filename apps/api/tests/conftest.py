@@ -1,14 +1,17 @@
 """Pytest fixtures for API tests."""
 
-from collections.abc import AsyncGenerator
-from unittest.mock import AsyncMock
+from collections.abc import AsyncGenerator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db import query_timing
 from src.main import app
 
+pytest_plugins = ["pytester", "tests.query_budget"]
+
 
 @pytest.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
@@ -24,3 +27,24 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
 def db_session() -> AsyncMock:
     """Create a mock async database session for unit/integration tests."""
     return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def no_engine_listeners() -> Generator[None]:
+    """Keep tests off the shared engine; listeners are called directly."""
+    with (
+        patch("src.services.pipeline_metrics.install_query_timing"),
+        patch("src.services.query_profiler.install_query_timing"),
+    ):
+        yield
+
+
+@pytest.fixture
+def run_query(no_engine_listeners: None) -> Callable[..., None]:
+    """Run a statement through the shared cursor-timing listeners."""
+
+    def _run(conn: MagicMock, statement: str = "SELECT 1") -> None:
+        query_timing._before_cursor_execute(conn, None, statement, {}, None, False)
+        query_timing._after_cursor_execute(conn, None, statement, {}, None, False)
+
+    return _run
@@ -0,0 +1,71 @@
+"""Pytest plugin enforcing per-test SQL query budgets.
+
+Mark a test with ``@pytest.mark.query_budget(n)`` to fail it when it runs
+more than ``n`` statements. Statements on the real engine are counted by
+the query profiler. Router tests mock the session, so they call
+``count_session_queries(session)`` to count the mocked session's query
+calls toward the same budget.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.services.query_profiler import QueryProfile, current_profile, profile_queries
+
+SESSION_QUERY_METHODS = ("execute", "scalar", "scalars", "get")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries): fail if the test runs more SQL statements",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    budget = marker.args[0] if marker.args else marker.kwargs["max_queries"]
+    with profile_queries() as profile:
+        result = yield
+    if profile.statements > budget:
+        pytest.fail(_budget_message(profile, budget), pytrace=False)
+    return result
+
+
+def _budget_message(profile: QueryProfile, budget: int) -> str:
+    shapes = sorted(profile.shapes.values(), key=lambda s: -s.count)
+    lines = [f"  {s.count}x {s.shape[:160]}" for s in shapes]
+    return (
+        f"Query budget exceeded: {profile.statements} statements, "
+        f"budget {budget}\n" + "\n".join(lines)
+    )
+
+
+def count_session_queries(session: Any) -> None:
+    """Count a mocked session's query calls toward the test's budget.
+
+    Call after the mock's return values are configured. Outside of a
+    ``query_budget`` test this does nothing.
+    """
+    profile = current_profile()
+    if profile is None:
+        return
+
+    for name in SESSION_QUERY_METHODS:
+        original = getattr(session, name)
+
+        async def counted(statement, *args, _original=original, _name=name, **kwargs):
+            if _name == "get":
+                profile.record(f"get {getattr(statement, '__name__', statement)}")
+            else:
+                profile.record(str(statement))
+            return await _original(statement, *args, **kwargs)
+
+        setattr(session, name, counted)
@@ -12,6 +12,7 @@ from src.db.database import get_db
 from src.dependencies.admin import require_admin
 from src.main import app
 from src.models.user import User
+from tests.query_budget import count_session_queries
 
 
 @pytest.fixture
@@ -317,6 +318,48 @@ class TestGetPipelineHealth:
         assert pipelines_map["RK9 Source"]["status"] == "healthy"
         assert pipelines_map["Pokemon Events Source"]["status"] == "healthy"
 
+    def test_includes_recent_runs(self, client: TestClient, mock_db: AsyncMock) -> None:
+        """Recorded pipeline runs are listed alongside freshness."""
+        run = MagicMock()
+        run.run_id = "run-1"
+        run.pipeline = "compute-meta"
+        run.status = "ok"
+        run.started_at = datetime.now(UTC)
+        run.finished_at = datetime.now(UTC)
+        run.wall_seconds = 4.2
+        run.cpu_seconds = 1.0
+        run.db_queries = 12
+        run.db_seconds = 2.5
+        run.http_requests = 0
+        run.http_bytes = 0
+        run.steps = []
+        run.steps_dropped = 0
+        run.error = None
+        runs_result = MagicMock()
+        runs_result.scalars.return_value.all.return_value = [run]
+        mock_db.execute = AsyncMock(return_value=runs_result)
+        mock_db.scalar = AsyncMock(return_value=None)
+
+        response = client.get("/api/v1/admin/data/pipeline-health")
+        assert response.status_code == 200
+
+        recent_runs = response.json()["recent_runs"]
+        assert len(recent_runs) == 1
+        assert recent_runs[0]["pipeline"] == "compute-meta"
+        assert recent_runs[0]["db_queries"] == 12
+
+    @pytest.mark.query_budget(11)
+    def test_query_budget(self, client: TestClient, mock_db: AsyncMock) -> None:
+        """One freshness query per pipeline plus one for recent runs."""
+        runs_result = MagicMock()
+        runs_result.scalars.return_value.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=runs_result)
+        mock_db.scalar = AsyncMock(return_value=None)
+        count_session_queries(mock_db)
+
+        response = client.get("/api/v1/admin/data/pipeline-health")
+        assert response.status_code == 200
+
     def test_null_dates_critical(self, client: TestClient, mock_db: AsyncMock) -> None:
         """All null dates should produce critical status."""
         mock_db.scalar = AsyncMock(
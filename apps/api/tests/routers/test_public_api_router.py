@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.models.api_key import ApiKey
 from src.models.meta_snapshot import MetaSnapshot
@@ -17,6 +18,48 @@ from src.routers.public_api import (
     get_meta_snapshot,
     list_tournaments,
 )
+from src.schemas.public import PublicMetaHistoryResponse
+from src.services.meta_service import build_jp_comparison
+
+
+def _comparison_result(
+    jp_shares: dict[str, float] | None,
+    en_shares: dict[str, float],
+    *,
+    snapshot_date: date = date(2024, 1, 15),
+    en_sample_size: int = 1500,
+) -> MagicMock:
+    """Execute result holding a JP comparison built from two snapshots."""
+    jp_snapshot = None
+    if jp_shares is not None:
+        jp_snapshot = MagicMock(spec=MetaSnapshot)
+        jp_snapshot.sample_size = 900
+        jp_snapshot.archetype_shares = jp_shares
+        jp_snapshot.tier_assignments = None
+    en_snapshot = MagicMock(spec=MetaSnapshot)
+    en_snapshot.sample_size = en_sample_size
+    en_snapshot.archetype_shares = en_shares
+    en_snapshot.tier_assignments = None
+
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = build_jp_comparison(
+        jp_snapshot,
+        en_snapshot,
+        snapshot_date=snapshot_date,
+        game_format="standard",
+        tournament_type="all",
+    )
+    return result
+
+
+def _skip_missing_jp(without_jp: MagicMock, with_jp: MagicMock):
+    """Execute side effect returning ``with_jp`` only to JP-filtered queries."""
+
+    async def execute(stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        return with_jp if "jp_sample_size >=" in sql else without_jp
+
+    return execute
 
 
 @pytest.fixture
@@ -165,35 +208,14 @@ class TestGetHomeTeaser:
     """Tests for GET /api/v1/public/teaser/home."""
 
     @pytest.mark.asyncio
-    async def test_uses_latest_eligible_delayed_snapshot(self, mock_session):
-        """Select latest delayed snapshot that meets teaser eligibility."""
-        too_small = MagicMock(spec=MetaSnapshot)
-        too_small.snapshot_date = date(2024, 1, 14)
-        too_small.sample_size = 10
-        too_small.archetype_shares = {"Deck A": 0.3}
-
-        eligible = MagicMock(spec=MetaSnapshot)
-        eligible.snapshot_date = date(2024, 1, 10)
-        eligible.sample_size = 120
-        eligible.archetype_shares = {
-            "Charizard ex": 0.123,
-            "Gardevoir ex": 0.091,
-        }
-
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 9)
-        jp_snapshot.sample_size = 90
-        jp_snapshot.archetype_shares = {"Charizard ex": 0.166}
-
-        global_scalars = MagicMock()
-        global_scalars.all.return_value = [too_small, eligible]
-        global_result = MagicMock()
-        global_result.scalars.return_value = global_scalars
-
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = jp_snapshot
-
-        mock_session.execute.side_effect = [global_result, jp_result]
+    async def test_uses_latest_eligible_delayed_comparison(self, mock_session):
+        """Build the teaser from the delayed JP comparison."""
+        mock_session.execute.return_value = _comparison_result(
+            {"Charizard ex": 0.166},
+            {"Charizard ex": 0.123, "Gardevoir ex": 0.091},
+            snapshot_date=date(2024, 1, 10),
+            en_sample_size=120,
+        )
 
         response = await get_home_teaser(mock_session, format="standard")
 
@@ -204,24 +226,42 @@ class TestGetHomeTeaser:
         assert response.top_archetypes[0].name == "Charizard ex"
         assert response.top_archetypes[0].global_share == 0.125
         assert response.top_archetypes[0].jp_share == 0.165
+        assert response.top_archetypes[1].jp_share is None
+        mock_session.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_returns_empty_when_no_eligible_delayed_data(self, mock_session):
-        """Return explicit empty teaser if no delayed eligible snapshot exists."""
-        ineligible = MagicMock(spec=MetaSnapshot)
-        ineligible.snapshot_date = date(2024, 1, 14)
-        ineligible.sample_size = 200
-        ineligible.archetype_shares = {}
+    async def test_orders_by_global_share(self, mock_session):
+        """JP-only archetypes are left out and rows follow global share."""
+        mock_session.execute.return_value = _comparison_result(
+            {"JP Only": 0.4, "Lugia VSTAR": 0.2},
+            {"Charizard ex": 0.1, "Lugia VSTAR": 0.15},
+        )
+
+        response = await get_home_teaser(mock_session, format="standard")
+
+        assert [a.name for a in response.top_archetypes] == [
+            "Lugia VSTAR",
+            "Charizard ex",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_skips_comparison_without_jp_data(self, mock_session):
+        """The teaser reads the latest delayed comparison with a JP side."""
+        mock_session.execute.side_effect = _skip_missing_jp(
+            _comparison_result(None, {"Charizard ex": 0.1}),
+            _comparison_result({"Charizard ex": 0.2}, {"Charizard ex": 0.1}),
+        )
 
-        global_scalars = MagicMock()
-        global_scalars.all.return_value = [ineligible]
-        global_result = MagicMock()
-        global_result.scalars.return_value = global_scalars
+        response = await get_home_teaser(mock_session, format="standard")
 
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = None
+        assert response.top_archetypes[0].jp_share == 0.2
 
-        mock_session.execute.side_effect = [global_result, jp_result]
+    @pytest.mark.asyncio
+    async def test_returns_empty_when_no_eligible_delayed_data(self, mock_session):
+        """Return explicit empty teaser if no delayed eligible comparison exists."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
 
         response = await get_home_teaser(mock_session, format="standard")
 
@@ -238,10 +278,14 @@ class TestGetMetaHistory:
         self, mock_session, mock_api_key, mock_meta_snapshot
     ):
         """Test getting meta history."""
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_meta_snapshot]
         mock_result = MagicMock()
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = [
+            (
+                mock_meta_snapshot.snapshot_date,
+                mock_meta_snapshot.archetype_shares,
+                mock_meta_snapshot.sample_size,
+            )
+        ]
         mock_session.execute.return_value = mock_result
 
         response = await get_meta_history(
@@ -253,17 +297,37 @@ class TestGetMetaHistory:
             days=7,
         )
 
-        assert response.days == 7
-        assert len(response.history) == 1
-        assert response.history[0].date == "2024-01-15"
+        history = PublicMetaHistoryResponse.model_validate_json(response.body)
+        assert history.days == 7
+        assert len(history.history) == 1
+        assert history.history[0].date == "2024-01-15"
+        assert history.history[0].archetypes["Charizard ex"] == 0.15
+
+    @pytest.mark.asyncio
+    async def test_selects_only_history_columns(self, mock_session, mock_api_key):
+        """Test the query skips card usage and other unused JSONB columns."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        await get_meta_history(
+            mock_session,
+            mock_api_key,
+            region=None,
+            format="standard",
+            best_of=3,
+            days=30,
+        )
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "meta_snapshots.archetype_shares" in sql
+        assert "card_usage" not in sql
 
     @pytest.mark.asyncio
     async def test_returns_empty_history(self, mock_session, mock_api_key):
         """Test returning empty history when no data."""
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
         mock_result = MagicMock()
-        mock_result.scalars.return_value = mock_scalars
+        mock_result.all.return_value = []
         mock_session.execute.return_value = mock_result
 
         response = await get_meta_history(
@@ -275,7 +339,8 @@ class TestGetMetaHistory:
             days=30,
         )
 
-        assert response.history == []
+        history = PublicMetaHistoryResponse.model_validate_json(response.body)
+        assert history.history == []
 
 
 class TestGetArchetypeDetail:
@@ -457,23 +522,10 @@ class TestJPComparison:
     @pytest.mark.asyncio
     async def test_gets_jp_comparison(self, mock_session, mock_api_key):
         """Test getting JP vs EN comparison."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.archetype_shares = {
-            "Charizard ex": 0.20,
-            "Gardevoir ex": 0.08,
-        }
-
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 15)
-        en_snapshot.archetype_shares = {
-            "Charizard ex": 0.15,
-            "Gardevoir ex": 0.12,
-        }
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.side_effect = [jp_snapshot, en_snapshot]
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _comparison_result(
+            {"Charizard ex": 0.20, "Gardevoir ex": 0.08},
+            {"Charizard ex": 0.15, "Gardevoir ex": 0.12},
+        )
 
         response = await get_jp_comparison(
             mock_session,
@@ -484,43 +536,20 @@ class TestJPComparison:
 
         assert response.jp_date == "2024-01-15"
         assert response.en_date == "2024-01-15"
-        assert len(response.comparisons) > 0
-
-    @pytest.mark.asyncio
-    async def test_handles_missing_jp_data(self, mock_session, mock_api_key):
-        """Test handling when JP data is missing."""
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 15)
-        en_snapshot.archetype_shares = {
-            "Charizard ex": 0.15,
+        assert response.comparisons[0] == {
+            "archetype": "Charizard ex",
+            "jp_share": 0.2,
+            "en_share": 0.15,
+            "divergence": 0.05,
         }
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.side_effect = [None, en_snapshot]
-        mock_session.execute.return_value = mock_result
-
-        response = await get_jp_comparison(
-            mock_session,
-            mock_api_key,
-            format="standard",
-            top_n=10,
-        )
-
-        assert response.jp_date is None
-        assert response.en_date == "2024-01-15"
-
     @pytest.mark.asyncio
-    async def test_handles_missing_en_data(self, mock_session, mock_api_key):
-        """Test handling when EN data is missing."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.archetype_shares = {
-            "Charizard ex": 0.20,
-        }
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.side_effect = [jp_snapshot, None]
-        mock_session.execute.return_value = mock_result
+    async def test_skips_comparison_without_jp_data(self, mock_session, mock_api_key):
+        """Test the newest comparison is passed over when it has no JP side."""
+        mock_session.execute.side_effect = _skip_missing_jp(
+            _comparison_result(None, {"Charizard ex": 0.15}),
+            _comparison_result({"Charizard ex": 0.2}, {"Charizard ex": 0.15}),
+        )
 
         response = await get_jp_comparison(
             mock_session,
@@ -530,13 +559,13 @@ class TestJPComparison:
         )
 
         assert response.jp_date == "2024-01-15"
-        assert response.en_date is None
+        assert response.comparisons[0]["jp_share"] == 0.2
 
     @pytest.mark.asyncio
-    async def test_handles_both_missing(self, mock_session, mock_api_key):
-        """Test handling when both datasets are missing."""
+    async def test_handles_missing_comparison(self, mock_session, mock_api_key):
+        """Test handling when no comparison has been computed."""
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.side_effect = [None, None]
+        mock_result.scalar_one_or_none.return_value = None
         mock_session.execute.return_value = mock_result
 
         response = await get_jp_comparison(
@@ -553,21 +582,8 @@ class TestJPComparison:
     @pytest.mark.asyncio
     async def test_respects_top_n(self, mock_session, mock_api_key):
         """Test respecting top_n parameter."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.archetype_shares = {
-            f"Archetype {i}": 0.10 - i * 0.01 for i in range(10)
-        }
-
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 15)
-        en_snapshot.archetype_shares = {
-            f"Archetype {i}": 0.10 - i * 0.01 for i in range(10)
-        }
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.side_effect = [jp_snapshot, en_snapshot]
-        mock_session.execute.return_value = mock_result
+        shares = {f"Archetype {i}": 0.10 - i * 0.01 for i in range(10)}
+        mock_session.execute.return_value = _comparison_result(shares, shares)
 
         response = await get_jp_comparison(
             mock_session,
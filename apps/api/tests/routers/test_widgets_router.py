@@ -13,6 +13,8 @@ from src.routers.widgets import (
     delete_widget,
     get_embed_code,
     get_widget,
+    get_widget_analytics,
+    get_widget_data,
     list_widgets,
     update_widget,
 )
@@ -229,6 +231,102 @@ class TestDeleteWidget:
         assert exc_info.value.status_code == 404
 
 
+class TestGetWidgetData:
+    """Tests for GET /api/v1/widgets/{widget_id}/data."""
+
+    @pytest.mark.asyncio
+    async def test_records_view_after_resolving(self, mock_session):
+        """Test the view is buffered once the widget resolves."""
+        request = MagicMock()
+        request.headers = {"referer": "https://twitch.tv/x", "user-agent": "UA"}
+        request.client.host = "10.0.0.1"
+        with patch("src.routers.widgets.WidgetService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_widget_data = AsyncMock(
+                return_value={
+                    "widget_id": "w_abc123",
+                    "type": "meta_snapshot",
+                    "theme": "dark",
+                    "show_attribution": True,
+                    "data": {},
+                }
+            )
+            mock_service_class.return_value = mock_service
+
+            response = await get_widget_data(request, mock_session, "w_abc123")
+
+        assert response.widget_id == "w_abc123"
+        mock_service.record_view.assert_called_once_with(
+            "w_abc123", "https://twitch.tv/x", "10.0.0.1", "UA"
+        )
+
+    @pytest.mark.asyncio
+    async def test_does_not_record_view_when_not_found(self, mock_session):
+        """Test unknown widgets are not counted."""
+        from fastapi import HTTPException
+
+        request = MagicMock()
+        request.headers = {}
+        with patch("src.routers.widgets.WidgetService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_widget_data = AsyncMock(
+                return_value={"error": "Widget not found"}
+            )
+            mock_service_class.return_value = mock_service
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_widget_data(request, mock_session, "w_notfound")
+
+        assert exc_info.value.status_code == 404
+        mock_service.record_view.assert_not_called()
+
+
+class TestGetWidgetAnalytics:
+    """Tests for GET /api/v1/widgets/{widget_id}/analytics."""
+
+    @pytest.mark.asyncio
+    async def test_gets_analytics(self, mock_session, mock_creator_user, mock_widget):
+        """Test getting view analytics for an owned widget."""
+        with patch("src.routers.widgets.WidgetService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_widget_for_owner = AsyncMock(return_value=mock_widget)
+            mock_service.get_view_analytics = AsyncMock(
+                return_value={
+                    "widget_id": "w_abc123",
+                    "days": 7,
+                    "total_views": 12,
+                    "daily": [{"date": "2026-04-02", "views": 12}],
+                    "top_referrers": [{"domain": "twitch.tv", "views": 12}],
+                }
+            )
+            mock_service_class.return_value = mock_service
+
+            response = await get_widget_analytics(
+                mock_session, mock_creator_user, "w_abc123", days=7
+            )
+
+        assert response.total_views == 12
+        assert response.top_referrers[0].domain == "twitch.tv"
+        mock_service.get_view_analytics.assert_awaited_once_with(mock_widget, days=7)
+
+    @pytest.mark.asyncio
+    async def test_returns_404_when_not_owned(self, mock_session, mock_creator_user):
+        """Test returning 404 for widgets the user does not own."""
+        from fastapi import HTTPException
+
+        with patch("src.routers.widgets.WidgetService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_widget_for_owner = AsyncMock(return_value=None)
+            mock_service_class.return_value = mock_service
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_widget_analytics(
+                    mock_session, mock_creator_user, "w_notfound"
+                )
+
+        assert exc_info.value.status_code == 404
+
+
 class TestGetEmbedCode:
     """Tests for GET /api/v1/widgets/{widget_id}/embed-code."""
 
@@ -1,10 +1,13 @@
 """Tests for archetype detection service."""
 
+import random
+
 import pytest
 
 from src.data.signature_cards import SIGNATURE_CARDS, normalize_archetype
 from src.services.archetype_detector import (
     ArchetypeDetector,
+    DetectionResult,
     detect_archetype,
     get_detector,
 )
@@ -174,6 +177,88 @@ class TestDetectWithConfidence:
         assert counts == {}
 
 
+class TestDetectBatch:
+    """Tests for batch detection."""
+
+    def test_matches_single_detection_on_random_decklists(self) -> None:
+        """Batch results should equal detect and detect_with_confidence."""
+        rng = random.Random(11)  # noqa: S311
+        signature_ids = list(SIGNATURE_CARDS)
+        pool = [*rng.sample(signature_ids, 40), "sv1-1", "sv2-2", "", "sv9-999"]
+        jp_mapping = {"jp-1": signature_ids[0], "jp-2": signature_ids[1]}
+        pool += list(jp_mapping)
+        detector = ArchetypeDetector(jp_to_en_mapping=jp_mapping)
+
+        decklists: list[list[dict] | None] = [None, []]
+        for _ in range(300):
+            decklists.append(
+                [
+                    {
+                        "card_id": rng.choice(pool),
+                        "quantity": rng.choice([1, 2, 3, 4, "2", "x", None]),
+                    }
+                    for _ in range(rng.randint(0, 12))
+                ]
+            )
+        decklists.append(["not-a-dict", {"quantity": 2}])
+
+        results = detector.detect_batch(decklists)
+
+        assert len(results) == len(decklists)
+        for decklist, result in zip(decklists, results, strict=True):
+            expected, scores = detector.detect_with_confidence(decklist or [])
+            assert result.archetype == expected
+            assert result.scores == scores
+
+    def test_tie_resolves_to_first_seen(self) -> None:
+        """Ties should go to the archetype seen first, as in detect."""
+        detector = ArchetypeDetector(signature_cards={"a-1": "Alpha", "b-1": "Beta"})
+        decklist = [
+            {"card_id": "b-1", "quantity": 2},
+            {"card_id": "a-1", "quantity": 2},
+        ]
+
+        (result,) = detector.detect_batch([decklist])
+
+        assert result.archetype == detector.detect(decklist) == "Beta"
+        assert result.runner_up == "Alpha"
+        assert result.margin == 0
+
+    def test_reports_runner_up_and_margin(self) -> None:
+        """Should report the runner-up archetype and score lead."""
+        detector = ArchetypeDetector(
+            signature_cards={"a-1": "Alpha", "a-2": "Alpha", "b-1": "Beta", "c-1": "C"}
+        )
+        decklist = [
+            {"card_id": "c-1", "quantity": 1},
+            {"card_id": "a-1", "quantity": 2},
+            {"card_id": "b-1", "quantity": 3},
+            {"card_id": "a-2", "quantity": 2},
+        ]
+
+        (result,) = detector.detect_batch([decklist])
+
+        assert result == DetectionResult(
+            archetype="Alpha",
+            scores={"C": 1, "Alpha": 4, "Beta": 3},
+            runner_up="Beta",
+            top_score=4,
+            runner_up_score=3,
+        )
+        assert result.margin == 1
+        assert result.share == pytest.approx(0.5)
+
+    def test_no_signature_cards_is_rogue(self) -> None:
+        """Decklists without signature cards should be Rogue."""
+        detector = ArchetypeDetector()
+
+        results = detector.detect_batch([[{"card_id": "xx-1", "quantity": 4}], None])
+
+        assert [r.archetype for r in results] == ["Rogue", "Rogue"]
+        assert results[0].runner_up is None
+        assert results[0].margin == 0
+
+
 class TestDetectFromExistingArchetype:
     """Tests for detect_from_existing_archetype method."""
 
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.services.archetype_detector import ArchetypeDetector
 from src.services.archetype_normalizer import (
     SPRITE_ARCHETYPE_MAP,
     ArchetypeNormalizer,
@@ -498,3 +499,102 @@ class TestSeedDbSprites:
 
         assert count == 1
         assert mock_session.add.call_count == 1
+
+
+class TestResolutionMemo:
+    """Tests for memoized resolution."""
+
+    def test_repeated_decklist_detected_once(self) -> None:
+        """Same raw label and decklist should hit the detector once."""
+        detector = MagicMock()
+        detector.detect.return_value = "Charizard ex"
+        normalizer = ArchetypeNormalizer(detector=detector)
+        decklist = [{"card_id": "sv3-125", "quantity": 3}]
+
+        first = normalizer.resolve_with_confidence([], "リザードン", decklist)
+        second = normalizer.resolve_with_confidence([], "リザードン", list(decklist))
+
+        assert first == second == ("Charizard ex", "リザードン", "signature_card", 0.70)
+        detector.detect.assert_called_once()
+        assert normalizer.cache_hits == 1
+        assert normalizer.cache_misses == 1
+
+    def test_different_decklists_not_shared(self) -> None:
+        """Decklists with different cards resolve separately."""
+        detector = MagicMock()
+        detector.detect.side_effect = ["Charizard ex", "Rogue"]
+        normalizer = ArchetypeNormalizer(detector=detector)
+
+        first = normalizer.resolve([], "X", [{"card_id": "a", "quantity": 1}])
+        second = normalizer.resolve([], "X", [{"card_id": "b", "quantity": 1}])
+
+        assert first[2] == "signature_card"
+        assert second[2] == "text_label"
+        assert detector.detect.call_count == 2
+
+    def test_sprite_lookup_sees_map_changes(self) -> None:
+        """Sprite-map edits apply even after a key was auto-derived."""
+        normalizer = ArchetypeNormalizer(sprite_map={})
+        urls = ["https://r2.limitlesstcg.net/pokemon/gen9/klawf.png"]
+
+        assert normalizer.resolve(urls, "")[2] == "auto_derive"
+        normalizer.sprite_map["klawf"] = "Klawf ex"
+        assert normalizer.resolve(urls, "") == ("Klawf ex", "", "sprite_lookup")
+
+
+class TestResolveBatch:
+    """Tests for batch resolution."""
+
+    def test_matches_resolve_per_item(self) -> None:
+        """Batch results should equal resolving each item on its own."""
+        items = [
+            (
+                ["https://r2.limitlesstcg.net/pokemon/gen9/charizard.png"],
+                "Charizard",
+                None,
+            ),
+            ([], "リザードン", [{"card_id": "sv3-125", "quantity": 3}]),
+            ([], "Unknown deck", [{"card_id": "xx-1", "quantity": 4}]),
+            ([], "Dragapult", None),
+            ([], "リザードン", [{"card_id": "sv3-125", "quantity": 3}]),
+            (["https://example.com/mystery.png"], "Mystery", None),
+        ]
+
+        expected = [ArchetypeNormalizer().resolve(*item) for item in items]
+        normalizer = ArchetypeNormalizer()
+
+        assert normalizer.resolve_batch(items) == expected
+        # The repeated decklist is detected once and then served from the memo
+        assert normalizer.resolve_batch(items[1:2]) == expected[1:2]
+        assert normalizer.cache_hits == 2
+
+    def test_detects_pending_decklists_in_one_call(self) -> None:
+        """Distinct decklists should go through a single detect_batch call."""
+        detector = ArchetypeDetector()
+        normalizer = ArchetypeNormalizer(detector=detector)
+        decklist = [{"card_id": "sv3-125", "quantity": 3}]
+
+        with patch.object(
+            detector, "detect_batch", wraps=detector.detect_batch
+        ) as mock_batch:
+            results = normalizer.resolve_batch(
+                [([], "A", decklist), ([], "A", decklist), ([], "B", decklist)]
+            )
+
+        mock_batch.assert_called_once()
+        assert len(mock_batch.call_args.args[0]) == 2
+        assert [r[0] for r in results] == ["Charizard ex"] * 3
+
+    def test_falls_back_when_batch_detection_fails(self) -> None:
+        """A failing batch should fall back to per-item detection."""
+        detector = MagicMock()
+        detector.detect_batch.side_effect = RuntimeError("boom")
+        detector.detect.return_value = "Charizard ex"
+        normalizer = ArchetypeNormalizer(detector=detector)
+
+        results = normalizer.resolve_batch(
+            [([], "X", [{"card_id": "sv3-125", "quantity": 3}])]
+        )
+
+        assert results == [("Charizard ex", "X", "signature_card")]
+        detector.detect.assert_called_once()
@@ -0,0 +1,276 @@
+"""Tests for the historical meta snapshot backfill pipeline."""
+
+import random
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.pipelines.backfill_meta_snapshots import (
+    SlidingMetaWindow,
+    TournamentContribution,
+    backfill_meta_snapshots,
+    build_snapshot,
+    jp_floor_for_date,
+    matches_combo,
+)
+from src.pipelines.compute_meta import SnapshotCombo
+from src.services.meta_service import MetaService
+
+ARCHETYPES = ["Charizard ex", "Dragapult ex", "Gardevoir ex", "Unknown", ""]
+CARDS = ["sv3-125", "sv6-130", "sv1-86", "sv2-185"]
+
+
+def _random_data(
+    rng: random.Random, start: date, days: int
+) -> tuple[list[TournamentContribution], list[MagicMock]]:
+    """Random tournaments plus the equivalent placement objects."""
+    contributions: list[TournamentContribution] = []
+    placements: list[MagicMock] = []
+    for _ in range(40):
+        contribution = TournamentContribution(
+            tournament_id=uuid4(),
+            date=start + timedelta(days=rng.randrange(days)),
+            region="NA",
+            tier=None,
+        )
+        for _ in range(rng.randrange(0, 12)):
+            archetype = rng.choice(ARCHETYPES)
+            decklist = [
+                {"card_id": card, "quantity": rng.randint(1, 4)}
+                for card in rng.sample(CARDS, rng.randint(0, len(CARDS)))
+            ] or None
+            contribution.add_placement(archetype, decklist)
+            placement = MagicMock()
+            placement.tournament_id = contribution.tournament_id
+            placement.archetype = archetype
+            placement.decklist = decklist
+            placements.append(placement)
+        contributions.append(contribution)
+    return contributions, placements
+
+
+class TestSlidingMetaWindow:
+    def test_matches_full_recompute_on_every_date(self):
+        rng = random.Random(7)  # noqa: S311
+        start = date(2025, 1, 1)
+        contributions, placements = _random_data(rng, start, 200)
+        dates = {c.tournament_id: c.date for c in contributions}
+        service = MetaService(AsyncMock())
+        window = SlidingMetaWindow(contributions, anchor=start + timedelta(days=60))
+
+        for offset in range(60, 200, 3):
+            snapshot_date = start + timedelta(days=offset)
+            window_start = snapshot_date - timedelta(days=30)
+            window.advance(window_start, snapshot_date)
+
+            in_window = [
+                p
+                for p in placements
+                if window_start <= dates[p.tournament_id] <= snapshot_date
+            ]
+            expected_shares = service._compute_archetype_shares(
+                in_window,
+                min_tournaments=2,
+                tournament_dates=dates,
+                reference_date=snapshot_date,
+            )
+            shares = window.archetype_shares(min_tournaments=2)
+
+            assert list(shares) == list(expected_shares)
+            for name, share in expected_shares.items():
+                assert shares[name] == pytest.approx(share)
+            assert window.card_usage() == service._compute_card_usage(in_window)
+            assert window.sample_size == len(in_window)
+            assert set(window.tournament_ids) == {
+                c.tournament_id
+                for c in contributions
+                if window_start <= c.date <= snapshot_date
+            }
+
+    def test_evicts_archetypes_that_leave_window(self):
+        old = TournamentContribution(uuid4(), date(2025, 1, 1), "NA", None)
+        old.add_placement("Lost Box", None)
+        new = TournamentContribution(uuid4(), date(2025, 3, 1), "NA", None)
+        new.add_placement("Charizard ex", None)
+        window = SlidingMetaWindow([old, new], anchor=date(2025, 1, 1))
+
+        window.advance(date(2025, 1, 1), date(2025, 3, 1))
+        assert set(window.archetype_shares(min_tournaments=1)) == {
+            "Lost Box",
+            "Charizard ex",
+        }
+
+        window.advance(date(2025, 2, 1), date(2025, 3, 2))
+        assert window.archetype_shares(min_tournaments=1) == {"Charizard ex": 1.0}
+        assert window.sample_size == 1
+
+
+class TestHelpers:
+    def test_matches_combo_filters(self):
+        major = TournamentContribution(uuid4(), date(2025, 1, 1), "EU", "major")
+        league = TournamentContribution(uuid4(), date(2025, 1, 1), "EU", None)
+
+        assert matches_combo(major, SnapshotCombo(None, "standard", 3, "official"))
+        assert not matches_combo(major, SnapshotCombo("NA", "standard", 3, "all"))
+        assert not matches_combo(
+            major, SnapshotCombo("EU", "standard", 3, "grassroots")
+        )
+        assert matches_combo(league, SnapshotCombo("EU", "standard", 3, "grassroots"))
+
+    def test_jp_floor_for_date(self):
+        starts = [(date(2025, 1, 24), "SV9"), (date(2025, 4, 18), "SV10")]
+        assert jp_floor_for_date(starts, date(2025, 2, 1), 90) == (
+            date(2025, 1, 24),
+            "post-SV9",
+        )
+        assert jp_floor_for_date(starts, date(2025, 5, 1), 90) == (
+            date(2025, 4, 18),
+            "post-SV10",
+        )
+        assert jp_floor_for_date(starts, date(2025, 1, 1), 90) == (None, None)
+
+    def test_build_snapshot_empty_window(self):
+        window = SlidingMetaWindow([], anchor=date(2025, 1, 1))
+        snapshot = build_snapshot(
+            window,
+            SnapshotCombo("JP", "standard", 1, "all"),
+            date(2025, 1, 1),
+            start_date=date(2024, 10, 3),
+            start_date_floor=None,
+            era_label="post-SV9",
+        )
+        assert snapshot.sample_size == 0
+        assert snapshot.archetype_shares == {}
+        assert snapshot.era_label == "post-SV9"
+
+
+class TestBackfillMetaSnapshots:
+    @staticmethod
+    def _contributions(start: date) -> list[TournamentContribution]:
+        contributions = []
+        for offset in range(-20, 10):
+            contribution = TournamentContribution(
+                uuid4(), start + timedelta(days=offset), "NA", "major"
+            )
+            for archetype in ("Charizard ex", "Dragapult ex", "Charizard ex"):
+                contribution.add_placement(archetype, None)
+            contributions.append(contribution)
+        return contributions
+
+    @pytest.mark.asyncio
+    async def test_computes_each_date_and_bulk_saves(self):
+        start = date(2025, 3, 1)
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        saved_batches: list[int] = []
+
+        async def save(snapshots, jp_comparisons=None):
+            saved_batches.append(len(snapshots))
+            return len(snapshots)
+
+        with (
+            patch(
+                "src.pipelines.backfill_meta_snapshots.async_session_factory",
+                return_value=mock_session,
+            ),
+            patch(
+                "src.pipelines.backfill_meta_snapshots._load_contributions",
+                new=AsyncMock(return_value=self._contributions(start)),
+            ) as mock_load,
+            patch.object(
+                MetaService, "get_snapshots_for_date", new=AsyncMock(return_value={})
+            ),
+            patch.object(MetaService, "save_snapshots", side_effect=save),
+        ):
+            result = await backfill_meta_snapshots(
+                start,
+                start + timedelta(days=9),
+                lookback_days=30,
+                regions=["NA"],
+                formats=["standard"],
+                batch_size=12,
+            )
+
+        assert result.success
+        assert result.dates_processed == 10
+        # 3 tournament types per date; "grassroots" has no tournaments
+        assert result.snapshots_computed == 30
+        assert result.snapshots_skipped == 10
+        assert result.snapshots_saved == 20
+        assert saved_batches == [12, 8]
+        # Loaded once for the whole range, not once per date
+        mock_load.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_trends_use_snapshots_from_earlier_in_run(self):
+        start = date(2025, 3, 1)
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        saved = []
+
+        async def save(snapshots, jp_comparisons=None):
+            saved.extend(snapshots)
+            return len(snapshots)
+
+        with (
+            patch(
+                "src.pipelines.backfill_meta_snapshots.async_session_factory",
+                return_value=mock_session,
+            ),
+            patch(
+                "src.pipelines.backfill_meta_snapshots._load_contributions",
+                new=AsyncMock(return_value=self._contributions(start)),
+            ),
+            patch.object(
+                MetaService, "get_snapshots_for_date", new=AsyncMock(return_value={})
+            ) as mock_previous,
+            patch.object(MetaService, "save_snapshots", side_effect=save),
+        ):
+            await backfill_meta_snapshots(
+                start,
+                start + timedelta(days=8),
+                lookback_days=30,
+                regions=["NA"],
+                formats=["standard"],
+            )
+
+        # The week before the range, plus one read per date for the JP and
+        # global snapshots that NA's JP signals need but the run skips
+        assert mock_previous.await_count == 7 + 9
+        by_date = {(s.snapshot_date, s.tournament_type): s for s in saved}
+        assert by_date[(start, "all")].trends is None
+        assert by_date[(start + timedelta(days=7), "all")].trends is not None
+
+    @pytest.mark.asyncio
+    async def test_rejects_inverted_range(self):
+        result = await backfill_meta_snapshots(date(2025, 3, 2), date(2025, 3, 1))
+        assert not result.success
+        assert result.dates_processed == 0
+
+    @pytest.mark.asyncio
+    async def test_load_error_is_reported(self):
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch(
+                "src.pipelines.backfill_meta_snapshots.async_session_factory",
+                return_value=mock_session,
+            ),
+            patch(
+                "src.pipelines.backfill_meta_snapshots._load_contributions",
+                new=AsyncMock(side_effect=SQLAlchemyError("boom")),
+            ),
+        ):
+            result = await backfill_meta_snapshots(
+                date(2025, 3, 1), date(2025, 3, 2), regions=["NA"]
+            )
+
+        assert len(result.errors) == 1
+        assert "boom" in result.errors[0]
@@ -0,0 +1,162 @@
+"""Tests for the benchmark generators and regression checks."""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks.db import check_throwaway
+from benchmarks.generators import (
+    PRODUCTION_VOLUME,
+    generate_dataset,
+    generate_resolve_inputs,
+    scaled_standings_html,
+)
+from benchmarks.harness import (
+    BenchmarkCase,
+    BenchmarkReport,
+    CaseResult,
+    find_regressions,
+    load_baseline,
+    run_case,
+)
+from benchmarks.imports import loaded_heavy_modules, parse_importtime
+
+
+def _result(name: str, median: float, threshold: float = 1.25) -> CaseResult:
+    return CaseResult(
+        name=name,
+        scale=1,
+        rounds=3,
+        median=median,
+        minimum=median,
+        maximum=median,
+        stdev=0.0,
+        threshold=threshold,
+    )
+
+
+class TestGenerators:
+    """Tests for the synthetic data generators."""
+
+    def test_dataset_matches_production_volume(self) -> None:
+        data = generate_dataset(1)
+
+        assert len(data.tournaments) == PRODUCTION_VOLUME["tournaments"]
+        assert len(data.placements) == (
+            PRODUCTION_VOLUME["tournaments"]
+            * PRODUCTION_VOLUME["placements_per_tournament"]
+        )
+        assert data.decklists
+
+    def test_dataset_is_deterministic(self) -> None:
+        first = generate_dataset(1)
+        second = generate_dataset(1)
+
+        assert [p.id for p in first.placements] == [p.id for p in second.placements]
+        assert [p.archetype for p in first.placements] == [
+            p.archetype for p in second.placements
+        ]
+
+    def test_resolve_inputs_cover_every_placement(self) -> None:
+        data = generate_dataset(1)
+
+        inputs = generate_resolve_inputs(data)
+
+        assert len(inputs) == len(data.placements)
+        assert any("unmapped" in sprites[0] for sprites, _, _ in inputs if sprites)
+
+    def test_scaled_standings_has_requested_rows(self) -> None:
+        html = scaled_standings_html("limitless_standings.html", 75)
+
+        rows = BeautifulSoup(html, "lxml").select("tbody tr")
+
+        assert len(rows) == 75
+        assert rows[-1].find("td").get_text(strip=True) == "75"
+
+
+class TestHarness:
+    """Tests for timing and baseline comparison."""
+
+    def test_run_case_times_rounds_and_tears_down(self) -> None:
+        torn_down = []
+
+        async def teardown(data: list[int]) -> None:
+            torn_down.append(data)
+
+        case = BenchmarkCase(
+            "sum", lambda scale: list(range(scale)), sum, teardown=teardown
+        )
+
+        result = run_case(case, 10, rounds=3)
+
+        assert result.key == "sum@10x"
+        assert result.rounds == 3
+        assert result.minimum <= result.median <= result.maximum
+        assert torn_down == [list(range(10))]
+
+    def test_flags_median_over_threshold(self) -> None:
+        report = BenchmarkReport(results=[_result("a", 0.2), _result("b", 0.11)])
+        baseline = {"a@1x": {"median": 0.1}, "b@1x": {"median": 0.1}}
+
+        regressions = find_regressions(report, baseline)
+
+        assert [r.key for r in regressions] == ["a@1x"]
+        assert regressions[0].ratio == pytest.approx(2.0)
+
+    def test_threshold_override_and_new_cases(self) -> None:
+        report = BenchmarkReport(results=[_result("a", 0.2), _result("new", 9.0)])
+        baseline = {"a@1x": {"median": 0.1}}
+
+        assert find_regressions(report, baseline, threshold=2.5) == []
+
+    def test_baseline_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        BenchmarkReport(results=[_result("a", 0.1)]).save(path)
+
+        baseline = load_baseline(path)
+
+        assert baseline["a@1x"]["median"] == 0.1
+
+    def test_rejects_unknown_results_version(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        path.write_text('{"version": 99, "results": {}}')
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            load_baseline(path)
+
+
+class TestCheckThrowaway:
+    """Tests for the database safety check."""
+
+    def test_accepts_bench_database(self) -> None:
+        check_throwaway("postgresql+asyncpg://u:p@localhost/trainerlab_bench")
+
+    def test_refuses_other_databases(self) -> None:
+        with pytest.raises(ValueError, match="Refusing"):
+            check_throwaway("postgresql+asyncpg://u:p@localhost/trainerlab")
+
+
+class TestImportAudit:
+    """Tests for the import-cost audit."""
+
+    def test_parses_importtime_output(self) -> None:
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     src.data.tcg_glossary\n"
+            "unrelated warning\n"
+            "import time:      2500 |    1800000 | src.main\n"
+        )
+
+        timings = parse_importtime(output)
+
+        assert [(t.module, t.cumulative_us, t.depth) for t in timings] == [
+            ("src.data.tcg_glossary", 120, 2),
+            ("src.main", 1800000, 0),
+        ]
+
+    def test_app_import_leaves_heavy_modules_deferred(self) -> None:
+        assert loaded_heavy_modules("src.main") == []
+
+    def test_reports_heavy_modules_imported_eagerly(self) -> None:
+        assert loaded_heavy_modules("bs4") == ["bs4"]
@@ -0,0 +1,285 @@
+"""Tests for the in-memory card catalog."""
+
+from collections.abc import Iterator
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.pipelines.sync_jp_adoption_rates import _resolve_card_for_adoption_entry
+from src.routers.meta import _batch_lookup_cards
+from src.services import card_catalog
+from src.services.archetype_detector import ArchetypeDetector
+from src.services.card_catalog import (
+    CardCatalog,
+    get_card_catalog,
+    invalidate_card_catalog,
+    load_card_catalog,
+    refresh_card_catalog,
+    reload_card_catalog_if_loaded,
+)
+from src.services.deck_import import DeckImportService, ParsedCard
+
+CARD_ROWS = [
+    # id, name, japanese_name, image_small, set_id, number, limitless_id,
+    # release_date, release_date_jp
+    (
+        "sv03-125",
+        "Charizard ex",
+        "リザードンex",
+        "https://img/charizard-old.webp",
+        "sv03",
+        "125",
+        "OBF-125",
+        date(2023, 8, 11),
+        date(2023, 7, 28),
+    ),
+    (
+        "sv03.5-006",
+        "Charizard ex",
+        None,
+        "https://img/charizard-new.webp",
+        "sv03.5",
+        "6",
+        "MEW-6",
+        date(2023, 9, 22),
+        None,
+    ),
+    (
+        "sv06-130",
+        "Dragapult ex",
+        "ドラパルトex",
+        "https://img/dragapult.webp",
+        "sv06",
+        "130",
+        None,
+        date(2024, 5, 24),
+        date(2024, 4, 26),
+    ),
+    (
+        "sv09-97",
+        "JP Only Card",
+        "ジャパンカード",
+        None,
+        "sv09",
+        "97",
+        None,
+        None,
+        date(2025, 1, 24),
+    ),
+]
+
+MAPPING_ROWS = [
+    # jp_card_id, en_card_id, card_name_en, en_set_id, confidence
+    ("SV6-130", "sv06-130", "Dragapult ex", "sv06", 1.0),
+    ("SV7-18", "sv07-028", "Terapagos ex", "sv07", 0.9),
+    ("SV7a-5", "sv07-028", "Terapagos ex", "sv07", 0.5),
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog() -> Iterator[None]:
+    invalidate_card_catalog()
+    yield
+    invalidate_card_catalog()
+
+
+@pytest.fixture
+def catalog() -> CardCatalog:
+    return CardCatalog(CARD_ROWS, MAPPING_ROWS, version="v1")
+
+
+def _install(catalog: CardCatalog) -> None:
+    card_catalog._catalog = catalog
+    card_catalog._last_checked = float("inf")
+
+
+class TestCardCatalogLookups:
+    def test_exact_and_padding_variants(self, catalog: CardCatalog) -> None:
+        assert catalog.resolve_id("sv03-125") == "sv03-125"
+        assert catalog.resolve_id("sv3-125") == "sv03-125"
+        assert catalog.resolve_id("SV6-130") == "sv06-130"
+        assert catalog.resolve_id("sv9-097") == "sv09-97"
+
+    def test_limitless_id(self, catalog: CardCatalog) -> None:
+        card = catalog.get("OBF-125")
+        assert card is not None
+        assert card.id == "sv03-125"
+        assert card.display_name == "Charizard ex"
+
+    def test_unknown_id(self, catalog: CardCatalog) -> None:
+        assert catalog.get("zzz-1") is None
+        assert catalog.get("") is None
+
+    def test_jp_to_en_exact_and_variant(self, catalog: CardCatalog) -> None:
+        assert catalog.jp_to_en("SV7-18") == "sv07-028"
+        assert catalog.jp_to_en("sv7-018") == "sv07-028"
+        assert catalog.jp_to_en("SV8-1") is None
+
+    def test_jp_to_en_mapping_view(self, catalog: CardCatalog) -> None:
+        mapping = catalog.jp_to_en_mapping()
+        assert len(mapping) == 3
+        assert mapping.get("SV7-018") == "sv07-028"
+        assert mapping.get("missing", "missing") == "missing"
+        assert "SV6-130" in mapping
+        with pytest.raises(KeyError):
+            mapping["missing"]
+
+    def test_detector_accepts_mapping_view(self, catalog: CardCatalog) -> None:
+        detector = ArchetypeDetector(
+            signature_cards={"sv07-028": "Terapagos ex"},
+            jp_to_en_mapping=catalog.jp_to_en_mapping(),
+        )
+        assert detector.detect([{"card_id": "SV7-018", "quantity": 3}]) == (
+            "Terapagos ex"
+        )
+
+    def test_find_by_set_number(self, catalog: CardCatalog) -> None:
+        assert catalog.find_by_set_number("SV03", "125") == "sv03-125"
+        assert catalog.find_by_set_number("sv03", "126") is None
+
+    def test_name_prefers_newest_printing(self, catalog: CardCatalog) -> None:
+        card = catalog.find_by_name("  CHARIZARD   ex ")
+        assert card is not None
+        assert card.id == "sv03.5-006"
+
+    def test_japanese_name(self, catalog: CardCatalog) -> None:
+        card = catalog.find_by_japanese_name("ドラパルトex")
+        assert card is not None
+        assert card.id == "sv06-130"
+
+    def test_mapping_by_name_prefers_confidence(self, catalog: CardCatalog) -> None:
+        assert catalog.find_mapping_by_name("terapagos ex") == ("sv07-028", "sv07")
+
+    def test_batch_lookup(self, catalog: CardCatalog) -> None:
+        result = catalog.batch_lookup(["OBF-125", "sv6-130", "SV7-18", "nope-1"])
+        assert result == {
+            "OBF-125": ("Charizard ex", "https://img/charizard-old.webp"),
+            "sv6-130": ("Dragapult ex", "https://img/dragapult.webp"),
+            # EN card not in catalog: falls back to mapping name
+            "SV7-18": ("Terapagos ex", None),
+        }
+
+    def test_batch_lookup_prefers_japanese_name_fallback(
+        self, catalog: CardCatalog
+    ) -> None:
+        rows = [("sv09-1", None, "カード", None, "sv09", "1", None, None, None)]
+        assert CardCatalog(rows, []).batch_lookup(["sv9-1"]) == {
+            "sv9-1": ("カード", None)
+        }
+
+
+class TestCatalogLifecycle:
+    async def test_refresh_without_load_issues_no_queries(self) -> None:
+        session = AsyncMock()
+        assert await refresh_card_catalog(session) is None
+        await reload_card_catalog_if_loaded(session)
+        session.execute.assert_not_called()
+
+    async def test_load_builds_then_reuses_same_version(self) -> None:
+        card_rows = MagicMock()
+        card_rows.all.return_value = CARD_ROWS
+        mapping_rows = MagicMock()
+        mapping_rows.all.return_value = MAPPING_ROWS
+        stamp = MagicMock()
+        stamp.one.return_value = (4, "2026-01-01")
+        session = AsyncMock()
+        session.execute.side_effect = [stamp, stamp, card_rows, mapping_rows]
+
+        first = await load_card_catalog(session)
+        assert len(first) == 4
+        assert get_card_catalog() is first
+
+        session.execute.side_effect = [stamp, stamp]
+        assert await load_card_catalog(session) is first
+
+    async def test_reload_after_sync_rebuilds_same_version(self) -> None:
+        card_rows = MagicMock()
+        card_rows.all.return_value = CARD_ROWS
+        mapping_rows = MagicMock()
+        mapping_rows.all.return_value = MAPPING_ROWS
+        stamp = MagicMock()
+        stamp.one.return_value = (4, "2026-01-01")
+        session = AsyncMock()
+        session.execute.side_effect = [stamp, stamp, card_rows, mapping_rows]
+        first = await load_card_catalog(session)
+
+        # An in-place sync may leave counts and max(updated_at) unchanged
+        session.execute.side_effect = [stamp, stamp, card_rows, mapping_rows]
+        session.begin_nested = MagicMock()
+        await reload_card_catalog_if_loaded(session)
+
+        reloaded = get_card_catalog()
+        assert reloaded is not first
+        assert reloaded is not None
+        assert reloaded.version == first.version
+
+    async def test_refresh_skips_check_within_interval(
+        self, catalog: CardCatalog
+    ) -> None:
+        _install(catalog)
+        session = AsyncMock()
+        assert await refresh_card_catalog(session) is catalog
+        session.execute.assert_not_called()
+
+    async def test_refresh_keeps_catalog_when_check_fails(
+        self, catalog: CardCatalog
+    ) -> None:
+        _install(catalog)
+        card_catalog._last_checked = 0.0
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("db down")
+        session.begin_nested = MagicMock()
+        assert await refresh_card_catalog(session) is catalog
+        # Rolled back to the savepoint, leaving the caller's transaction usable
+        exit_args = session.begin_nested.return_value.__aexit__.await_args.args
+        assert isinstance(exit_args[1], RuntimeError)
+
+        # Backs off instead of rechecking on the next request
+        assert await refresh_card_catalog(session) is catalog
+        assert session.execute.await_count == 1
+
+
+class TestCatalogCallers:
+    async def test_batch_lookup_cards_uses_catalog(self, catalog: CardCatalog) -> None:
+        _install(catalog)
+        db = AsyncMock()
+        result = await _batch_lookup_cards(["sv3-125"], db)
+        assert result == {"sv3-125": ("Charizard ex", "https://img/charizard-old.webp")}
+        db.execute.assert_not_called()
+
+    async def test_deck_import_uses_catalog(self, catalog: CardCatalog) -> None:
+        _install(catalog)
+        session = AsyncMock()
+        service = DeckImportService(session)
+        parsed = [
+            ParsedCard("4 Charizard ex OBF 125", "Charizard ex", "sv03", "125", 4),
+            ParsedCard("1 Missing X 1", "Missing", "x", "1", 1),
+        ]
+        matched, unmatched = await service._match_cards(parsed)
+        assert [(c.card_id, c.quantity) for c in matched] == [("sv03-125", 4)]
+        assert [u.set_code for u in unmatched] == ["X"]
+        session.execute.assert_not_called()
+
+    async def test_adoption_resolver_uses_catalog(self, catalog: CardCatalog) -> None:
+        _install(catalog)
+        session = AsyncMock()
+        by_en = await _resolve_card_for_adoption_entry(
+            session, "リザードンex", "Charizard ex", {}
+        )
+        assert (by_en.card_id, by_en.method) == ("sv03.5-006", "card_name_en")
+
+        by_jp = await _resolve_card_for_adoption_entry(
+            session, "ドラパルトex", None, {}
+        )
+        assert (by_jp.card_id, by_jp.method) == ("sv06-130", "card_name_jp")
+
+        by_mapping = await _resolve_card_for_adoption_entry(
+            session, "テラパゴスex", "Terapagos ex", {}
+        )
+        assert by_mapping.method == "mapping_name_en"
+        assert by_mapping.set_id == "sv07"
+
+        unresolved = await _resolve_card_for_adoption_entry(session, "なし", None, {})
+        assert unresolved.method == "generated_hash"
+        session.execute.assert_not_called()
@@ -264,6 +264,28 @@ class TestBatchLookupCardsNormalization:
         assert result["sv3-125"][0] == "Charizard ex"
         assert result["sv03-125"][0] == "Charizard ex"
 
+    @pytest.mark.asyncio
+    async def test_exact_id_wins_over_canonical_match(self, mock_db: AsyncMock) -> None:
+        """When padded and unpadded rows both exist, the exact ID is used."""
+        rows = []
+        for card_id, name in [("sv3-125", "Exact"), ("sv03-125", "Padded")]:
+            row = MagicMock()
+            row.id = card_id
+            row.name = name
+            row.japanese_name = None
+            row.image_small = None
+            rows.append(row)
+
+        for ordered in (rows, rows[::-1]):
+            mock_result = MagicMock()
+            mock_result.all.return_value = ordered
+            mock_db.execute.return_value = mock_result
+
+            result = await _batch_lookup_cards(["sv3-125", "sv03-125"], mock_db)
+
+            assert result["sv3-125"][0] == "Exact"
+            assert result["sv03-125"][0] == "Padded"
+
     @pytest.mark.asyncio
     async def test_empty_card_ids(self, mock_db: AsyncMock) -> None:
         """Empty input should return empty dict without DB query."""
@@ -335,7 +357,7 @@ class TestBatchLookupCardsNormalization:
 
         # Step 2: mapping lookup — DB stores padded JP ID sv08-076
         mapping_row = MagicMock()
-        mapping_row.jp_card_id = "sv08-076"
+        mapping_row.jp_canonical_id = "sv8-76"
         mapping_row.en_card_id = "sv08-76"
         mapping_row.card_name_en = "Test Card EN"
         mapping_result = MagicMock()
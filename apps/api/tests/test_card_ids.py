@@ -0,0 +1,74 @@
+"""Tests for the canonical card ID helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.card_ids import (
+    CanonicalCardIdMapping,
+    canonical_card_id,
+    canonical_card_id_default,
+)
+
+
+class TestCanonicalCardId:
+    """Tests for canonical_card_id()."""
+
+    @pytest.mark.parametrize(
+        "card_id",
+        ["sv3-76", "sv03-076", "SV3-076", "sv3-0076", " sv03-76 "],
+    )
+    def test_padding_and_case_collapse(self, card_id: str) -> None:
+        assert canonical_card_id(card_id) == "sv3-76"
+
+    def test_pt_suffix_set(self) -> None:
+        assert canonical_card_id("sv04pt5-010") == "sv4pt5-10"
+
+    def test_letter_prefixed_number(self) -> None:
+        assert canonical_card_id("SV2-TG01") == "sv2-tg1"
+
+    def test_zero_number(self) -> None:
+        assert canonical_card_id("sv1-000") == "sv1-0"
+
+    def test_non_numeric_set_part_kept(self) -> None:
+        assert canonical_card_id("OBF-125") == "obf-125"
+        assert canonical_card_id("sv8a-001") == "sv8a-1"
+
+    def test_no_hyphen(self) -> None:
+        assert canonical_card_id("SV7") == "sv7"
+
+    def test_splits_on_last_hyphen(self) -> None:
+        assert canonical_card_id("JP-ONLY-001") == "jp-only-1"
+
+
+class TestCanonicalCardIdDefault:
+    """Tests for the column default factory."""
+
+    def test_derives_from_named_column(self) -> None:
+        context = MagicMock()
+        context.get_current_parameters.return_value = {"jp_card_id": "SV7-018"}
+
+        assert canonical_card_id_default("jp_card_id")(context) == "sv7-18"
+
+    def test_missing_column_gives_none(self) -> None:
+        context = MagicMock()
+        context.get_current_parameters.return_value = {}
+
+        assert canonical_card_id_default("id")(context) is None
+
+
+class TestCanonicalCardIdMapping:
+    """Tests for CanonicalCardIdMapping."""
+
+    def test_lookup_with_any_spelling(self) -> None:
+        mapping = CanonicalCardIdMapping({"sv7-18": "sv7-28"})
+
+        assert mapping["SV7-018"] == "sv7-28"
+        assert mapping.get("sv7-18") == "sv7-28"
+        assert "sv07-0018" in mapping
+        assert mapping.get("SV7-019", "SV7-019") == "SV7-019"
+        assert len(mapping) == 1
+
+    def test_missing_key_raises(self) -> None:
+        with pytest.raises(KeyError):
+            CanonicalCardIdMapping({})["sv1-1"]
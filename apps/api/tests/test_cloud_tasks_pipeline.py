@@ -20,8 +20,8 @@ from src.pipelines.scrape_limitless import (
     discover_jp_tournaments,
     process_single_tournament,
 )
-from src.services.cloud_tasks import CloudTasksService
-from src.services.tournament_scrape import TournamentScrapeService
+from src.services.cloud_tasks import BulkEnqueueResult, CloudTasksService
+from src.services.tournament_scrape import ScrapeResult, TournamentScrapeService
 
 
 @pytest.fixture
@@ -159,7 +159,9 @@ class TestDiscoverEnTournaments:
             mock_discover_official.return_value = []
 
             mock_tasks = MagicMock(spec=CloudTasksService)
-            mock_tasks.enqueue_tournament = AsyncMock(return_value="task-name")
+            mock_tasks.enqueue_tournaments = AsyncMock(
+                return_value=BulkEnqueueResult(enqueued=[sample_tournament.source_url])
+            )
             mock_tasks_cls.return_value = mock_tasks
 
             result = await discover_en_tournaments(lookback_days=90)
@@ -167,7 +169,7 @@ class TestDiscoverEnTournaments:
             assert result.tournaments_discovered == 1
             assert result.tasks_enqueued == 1
             assert result.success is True
-            mock_tasks.enqueue_tournament.assert_called_once()
+            mock_tasks.enqueue_tournaments.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_handles_enqueue_failure(
@@ -207,8 +209,10 @@ class TestDiscoverEnTournaments:
             mock_discover_official.return_value = []
 
             mock_tasks = MagicMock(spec=CloudTasksService)
-            mock_tasks.enqueue_tournament = AsyncMock(
-                side_effect=RuntimeError("Queue error")
+            mock_tasks.enqueue_tournaments = AsyncMock(
+                return_value=BulkEnqueueResult(
+                    errors=[(sample_tournament.source_url, "Queue error")]
+                )
             )
             mock_tasks_cls.return_value = mock_tasks
 
@@ -219,6 +223,136 @@ class TestDiscoverEnTournaments:
             assert len(result.errors) == 1
             assert result.success is False
 
+    @pytest.mark.asyncio
+    async def test_flags_official_tournaments_and_reports_timings(
+        self, sample_tournament: LimitlessTournament
+    ) -> None:
+        """Should mark official payloads by URL and time the enqueue phase."""
+        official = LimitlessTournament(
+            name="Regional Championship",
+            tournament_date=sample_tournament.tournament_date,
+            region="NA",
+            game_format="standard",
+            best_of=3,
+            participant_count=1000,
+            source_url="https://limitlesstcg.com/tournaments/500",
+            placements=[],
+        )
+        with (
+            patch("src.pipelines.scrape_limitless.LimitlessClient") as mock_client_cls,
+            patch(
+                "src.pipelines.scrape_limitless.async_session_factory"
+            ) as mock_session_factory,
+            patch("src.pipelines.scrape_limitless.CloudTasksService") as mock_tasks_cls,
+            patch.object(
+                TournamentScrapeService,
+                "discover_new_tournaments",
+                new_callable=AsyncMock,
+                return_value=[sample_tournament],
+            ),
+            patch.object(
+                TournamentScrapeService,
+                "discover_official_tournaments",
+                new_callable=AsyncMock,
+                return_value=[official],
+            ),
+        ):
+            mock_client_cls.return_value.__aenter__ = AsyncMock(
+                return_value=AsyncMock(spec=LimitlessClient)
+            )
+            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_factory.return_value.__aenter__ = AsyncMock(
+                return_value=AsyncMock(spec=AsyncSession)
+            )
+            mock_session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            mock_tasks = MagicMock(spec=CloudTasksService)
+            mock_tasks.enqueue_tournaments = AsyncMock(return_value=BulkEnqueueResult())
+            mock_tasks_cls.return_value = mock_tasks
+
+            result = await discover_en_tournaments()
+
+            flags = {
+                payload["source_url"]: payload["is_official"]
+                for payload in mock_tasks.enqueue_tournaments.await_args.args[0]
+            }
+            assert flags == {
+                sample_tournament.source_url: False,
+                official.source_url: True,
+            }
+            assert "enqueue" in result.phase_timings
+
+    @pytest.mark.asyncio
+    async def test_auto_process_uses_local_worker_pool(
+        self, sample_tournament: LimitlessTournament
+    ) -> None:
+        """Without Cloud Tasks, should process every tournament locally."""
+        tournaments = [
+            LimitlessTournament(
+                name=f"League {i}",
+                tournament_date=sample_tournament.tournament_date,
+                region="NA",
+                game_format="standard",
+                best_of=3,
+                participant_count=32,
+                source_url=f"https://play.limitlesstcg.com/tournament/{i}",
+                placements=[],
+            )
+            for i in range(6)
+        ]
+
+        async def process(payload: dict) -> ScrapeResult:
+            if payload["name"] == "League 1":
+                raise RuntimeError("boom")
+            if payload["name"] == "League 2":
+                return ScrapeResult()
+            return ScrapeResult(tournaments_saved=1)
+
+        with (
+            patch("src.pipelines.scrape_limitless.LimitlessClient") as mock_client_cls,
+            patch(
+                "src.pipelines.scrape_limitless.async_session_factory"
+            ) as mock_session_factory,
+            patch("src.pipelines.scrape_limitless.CloudTasksService") as mock_tasks_cls,
+            patch(
+                "src.pipelines.scrape_limitless.process_single_tournament",
+                side_effect=process,
+            ) as mock_process,
+            patch.object(
+                TournamentScrapeService,
+                "discover_new_tournaments",
+                new_callable=AsyncMock,
+                return_value=tournaments,
+            ),
+            patch.object(
+                TournamentScrapeService,
+                "discover_official_tournaments",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+        ):
+            mock_client_cls.return_value.__aenter__ = AsyncMock(
+                return_value=AsyncMock(spec=LimitlessClient)
+            )
+            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_session_factory.return_value.__aenter__ = AsyncMock(
+                return_value=AsyncMock(spec=AsyncSession)
+            )
+            mock_session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+            mock_tasks = MagicMock(spec=CloudTasksService)
+            mock_tasks.is_configured = False
+            mock_tasks_cls.return_value = mock_tasks
+
+            result = await discover_en_tournaments(
+                auto_process=True, max_auto_process=5
+            )
+
+        assert mock_process.await_count == 5
+        assert result.tasks_enqueued == 3
+        assert result.tournaments_skipped == 1
+        assert result.errors == ["Failed to process League 1: boom"]
+        mock_tasks.enqueue_tournaments.assert_not_called()
+
 
 class TestDiscoverJpTournaments:
     """Tests for discover_jp_tournaments pipeline function."""
@@ -266,7 +400,9 @@ class TestDiscoverJpTournaments:
             mock_discover.return_value = [jp_tournament]
 
             mock_tasks = MagicMock(spec=CloudTasksService)
-            mock_tasks.enqueue_tournament = AsyncMock(return_value="task-name")
+            mock_tasks.enqueue_tournaments = AsyncMock(
+                return_value=BulkEnqueueResult(enqueued=[jp_tournament.source_url])
+            )
             mock_tasks_cls.return_value = mock_tasks
 
             result = await discover_jp_tournaments(lookback_days=30)
@@ -274,8 +410,8 @@ class TestDiscoverJpTournaments:
             assert result.tournaments_discovered == 1
             assert result.tasks_enqueued == 1
             # Verify JP-specific flag is set in payload
-            call_args = mock_tasks.enqueue_tournament.call_args[0][0]
-            assert call_args["is_jp_city_league"] is True
+            (payload,) = mock_tasks.enqueue_tournaments.await_args.args[0]
+            assert payload["is_jp_city_league"] is True
 
 
 class TestProcessSingleTournament:
@@ -382,6 +518,54 @@ class TestProcessSingleTournament:
             assert result.tournaments_skipped == 1
             assert result.tournaments_saved == 0
 
+    @pytest.mark.asyncio
+    async def test_records_scrape_errors_as_failed_run(self) -> None:
+        """A tournament that failed to scrape is recorded as a failed run."""
+        payload = {
+            "source_url": "https://play.limitlesstcg.com/tournament/12345",
+            "name": "Regional Championship",
+            "tournament_date": date.today().isoformat(),
+            "region": "NA",
+            "game_format": "standard",
+            "best_of": 3,
+            "participant_count": 256,
+        }
+
+        with (
+            patch("src.pipelines.scrape_limitless.LimitlessClient") as mock_client_cls,
+            patch(
+                "src.pipelines.scrape_limitless.async_session_factory"
+            ) as mock_session_factory,
+            patch.object(
+                TournamentScrapeService,
+                "process_tournament_by_url",
+                new_callable=AsyncMock,
+            ) as mock_process,
+        ):
+            from src.services.tournament_scrape import ScrapeResult
+
+            mock_client_cls.return_value.__aenter__ = AsyncMock(
+                return_value=AsyncMock(spec=LimitlessClient)
+            )
+            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            mock_session = AsyncMock(spec=AsyncSession)
+            mock_session_factory.return_value.__aenter__ = AsyncMock(
+                return_value=mock_session
+            )
+            mock_session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            mock_process.return_value = ScrapeResult(
+                errors=["Error fetching placements: 503", "Decklist parse failed"]
+            )
+
+            await process_single_tournament(payload)
+
+        saved = mock_session.add.call_args[0][0]
+        assert saved.pipeline == "process-tournament"
+        assert saved.status == "error"
+        assert saved.error == ("Error fetching placements: 503; Decklist parse failed")
+
 
 class TestDiscoverResult:
     """Tests for DiscoverResult dataclass."""
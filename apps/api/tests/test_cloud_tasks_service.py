@@ -1,11 +1,16 @@
 """Tests for CloudTasksService."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.services.cloud_tasks import CloudTasksService
+from src.services.cloud_tasks import (
+    CloudTasksService,
+    LocalTaskQueue,
+    reset_recently_enqueued,
+)
 
 
 def _make_configured_service():
@@ -125,3 +130,141 @@ class TestGetClient:
 
         client = service._get_client()
         assert client is mock_client
+
+
+class TestEnqueueTournaments:
+    """Tests for bulk enqueue with concurrency and the recent-task cache."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        reset_recently_enqueued()
+        yield
+        reset_recently_enqueued()
+
+    @staticmethod
+    def _payloads(count: int) -> list[dict]:
+        return [
+            {"source_url": f"https://play.limitlesstcg.com/tournament/{i}"}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_enqueues_concurrently_under_limit(self) -> None:
+        """Should run creates concurrently without exceeding the limit."""
+        service = _make_configured_service()
+        in_flight = 0
+        peak = 0
+
+        async def create_task(parent, task):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            created = MagicMock()
+            created.name = task.name
+            return created
+
+        service._client = AsyncMock()
+        service._client.create_task.side_effect = create_task
+
+        result = await service.enqueue_tournaments(self._payloads(12), concurrency=3)
+
+        assert len(result.enqueued) == 12
+        assert service._client.create_task.await_count == 12
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_skips_recent_and_repeated_tasks(self) -> None:
+        """Recently enqueued and in-batch duplicate URLs should skip the RPC."""
+        service = _make_configured_service()
+        service._client = AsyncMock()
+        service._client.create_task.return_value = MagicMock()
+        payloads = self._payloads(3)
+
+        await service.enqueue_tournaments(payloads[:1])
+        result = await service.enqueue_tournaments([*payloads, payloads[2]])
+
+        assert result.cached == [payloads[0]["source_url"], payloads[2]["source_url"]]
+        assert len(result.enqueued) == 2
+        assert service._client.create_task.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_already_exists_is_cached(self) -> None:
+        """An ALREADY_EXISTS response should also mark the task as recent."""
+        service = _make_configured_service()
+        service._client = AsyncMock()
+        service._client.create_task.side_effect = Exception("409 ALREADY_EXISTS")
+        payloads = self._payloads(1)
+
+        first = await service.enqueue_tournaments(payloads)
+        second = await service.enqueue_tournaments(payloads)
+
+        assert first.enqueued == [payloads[0]["source_url"]]
+        assert second.cached == [payloads[0]["source_url"]]
+        service._client.create_task.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_collects_errors_without_stopping(self) -> None:
+        """A failed create should be reported and not cached."""
+        service = _make_configured_service()
+        service._client = AsyncMock()
+        service._client.create_task.side_effect = [
+            MagicMock(),
+            Exception("500 INTERNAL"),
+        ]
+        payloads = self._payloads(2)
+
+        result = await service.enqueue_tournaments(payloads, concurrency=1)
+
+        assert result.enqueued == [payloads[0]["source_url"]]
+        assert result.errors == [(payloads[1]["source_url"], "500 INTERNAL")]
+
+    @pytest.mark.asyncio
+    async def test_not_configured(self) -> None:
+        """Should report every payload as not configured."""
+        with patch("src.services.cloud_tasks.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                cloud_tasks_queue_path=None, cloud_run_url=None
+            )
+            service = CloudTasksService()
+
+        result = await service.enqueue_tournaments(self._payloads(2))
+
+        assert len(result.not_configured) == 2
+        assert result.enqueued == []
+
+
+class TestLocalTaskQueue:
+    """Tests for the in-memory worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_items_with_bounded_workers(self) -> None:
+        """Should return results in order and cap concurrency at the pool size."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(item: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if item == 3:
+                raise ValueError("bad item")
+            return item * 2
+
+        results = await LocalTaskQueue(handler, workers=2).run(list(range(6)))
+
+        assert results[:3] == [0, 2, 4]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == [8, 10]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self) -> None:
+        """Should return an empty list without starting workers."""
+        handler = AsyncMock()
+
+        assert await LocalTaskQueue(handler).run([]) == []
+        handler.assert_not_called()
@@ -18,9 +18,22 @@ from src.pipelines.compute_evolution import (
 )
 from src.services.adaptation_classifier import AdaptationClassifierError
 from src.services.evolution_article_generator import ArticleGeneratorError
+from src.services.meta_forecaster import ArchetypeForecast
 from src.services.prediction_engine import PredictionEngineError
 
 
+def _forecast(archetype: str, share: float = 0.1) -> ArchetypeForecast:
+    return ArchetypeForecast(
+        archetype=archetype,
+        meta_share={"low": share / 2, "mid": share, "high": share * 2},
+        day2_rate=None,
+        tier="A",
+        confidence=0.5,
+        observations=3,
+        trend=0.0,
+    )
+
+
 class TestComputeEvolutionResult:
     """Tests for the ComputeEvolutionResult dataclass."""
 
@@ -354,8 +367,8 @@ class TestGeneratePredictions:
         assert result.predictions_generated == 0
 
     @pytest.mark.asyncio
-    async def test_handles_prediction_error(self) -> None:
-        """Should record errors when prediction fails."""
+    async def test_falls_back_to_baseline_when_narration_fails(self) -> None:
+        """Should save the statistical baseline when Claude narration fails."""
         mock_tournament = MagicMock()
         mock_tournament.id = uuid4()
         mock_tournament.date = date.today() + timedelta(days=7)
@@ -376,15 +389,64 @@ class TestGeneratePredictions:
             side_effect=[mock_db_result_1, mock_db_result_2, mock_db_result_3]
         )
 
+        session.add = MagicMock()
+
+        forecast = _forecast("Lugia VSTAR")
         engine = AsyncMock()
+        engine.forecast.return_value = {"Lugia VSTAR": forecast}
         engine.predict.side_effect = PredictionEngineError("Prediction failed")
+        engine.baseline_prediction = MagicMock()
         result = ComputeEvolutionResult()
 
-        await _generate_predictions(session, engine, result, dry_run=False)
+        with patch("src.pipelines.compute_evolution.retry_commit", AsyncMock()):
+            await _generate_predictions(session, engine, result, dry_run=False)
 
-        assert result.predictions_generated == 0
-        assert len(result.errors) == 1
-        assert "Prediction failed" in result.errors[0]
+        engine.baseline_prediction.assert_called_once_with(
+            "Lugia VSTAR", mock_tournament.id, forecast
+        )
+        session.add.assert_called_once_with(engine.baseline_prediction.return_value)
+        assert result.predictions_generated == 1
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_narrates_only_top_forecasts(self) -> None:
+        """Should ask Claude only for the largest forecasts."""
+        mock_tournament = MagicMock()
+        mock_tournament.id = uuid4()
+        mock_tournament.date = date.today() + timedelta(days=7)
+
+        mock_scalars_1 = MagicMock()
+        mock_scalars_1.all.return_value = [mock_tournament]
+        mock_db_result_1 = MagicMock()
+        mock_db_result_1.scalars.return_value = mock_scalars_1
+
+        archetypes = [f"Deck {i}" for i in range(10)]
+        mock_db_result_2 = MagicMock()
+        mock_db_result_2.all.return_value = [(a,) for a in [*archetypes, "Old Deck"]]
+
+        mock_db_result_3 = MagicMock()
+        mock_db_result_3.all.return_value = []
+
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.execute = AsyncMock(
+            side_effect=[mock_db_result_1, mock_db_result_2, mock_db_result_3]
+        )
+
+        engine = AsyncMock()
+        engine.forecast.return_value = {
+            a: _forecast(a, share=(i + 1) / 100) for i, a in enumerate(archetypes)
+        }
+        engine.baseline_prediction = MagicMock()
+        result = ComputeEvolutionResult()
+
+        with patch("src.pipelines.compute_evolution.retry_commit", AsyncMock()):
+            await _generate_predictions(session, engine, result, dry_run=False)
+
+        narrated = {call.args[0] for call in engine.predict.await_args_list}
+        assert narrated == set(archetypes[2:])
+        assert engine.baseline_prediction.call_count == 2
+        assert result.predictions_generated == 10  # "Old Deck" has no forecast
 
 
 class TestGenerateArticles:
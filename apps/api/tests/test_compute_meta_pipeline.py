@@ -1,5 +1,6 @@
 """Tests for meta snapshot computation pipeline functions."""
 
+import asyncio
 from datetime import date
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
@@ -8,6 +9,7 @@ import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.meta_snapshot import MetaSnapshot
+from src.models.pipeline_run import PipelineRun
 from src.pipelines.compute_meta import (
     FORMATS,
     REGION_BEST_OF,
@@ -16,6 +18,7 @@ from src.pipelines.compute_meta import (
     ComputeMetaResult,
     compute_daily_snapshots,
     compute_single_snapshot,
+    plan_snapshot_combos,
 )
 
 
@@ -124,7 +127,7 @@ class TestComputeDailySnapshots:
 
         mock_service = AsyncMock()
         mock_service.compute_enhanced_meta_snapshot.return_value = sample_snapshot
-        mock_service.save_snapshot.return_value = sample_snapshot
+        mock_service.save_snapshots.side_effect = lambda snapshots, **_: len(snapshots)
 
         with (
             patch(
@@ -138,8 +141,10 @@ class TestComputeDailySnapshots:
         ):
             result = await compute_daily_snapshots(dry_run=False)
 
-        assert result.snapshots_saved > 0
-        assert mock_service.save_snapshot.call_count == result.snapshots_saved
+        # All snapshots are written in one bulk upsert
+        assert result.snapshots_saved == result.snapshots_computed
+        mock_service.save_snapshots.assert_awaited_once()
+        mock_service.save_snapshot.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_skips_empty_snapshots(self, sample_snapshot, empty_snapshot):
@@ -217,6 +222,13 @@ class TestComputeDailySnapshots:
         assert len(result.errors) == 1
         assert "DB error" in result.errors[0]
         assert result.snapshots_computed >= 1
+        runs = [
+            c.args[0]
+            for c in mock_session.add.call_args_list
+            if isinstance(c.args[0], PipelineRun)
+        ]
+        assert [r.status for r in runs] == ["error"]
+        assert "DB error" in runs[0].error
 
     @pytest.mark.asyncio
     async def test_respects_custom_regions_filter(self, sample_snapshot):
@@ -544,3 +556,181 @@ class TestComputeMetaResult:
         assert result.snapshots_skipped == 0
         assert result.errors == []
         assert result.success
+
+
+class TestPlanSnapshotCombos:
+    """Tests for dependency-ordered combo planning."""
+
+    def test_jp_and_global_precede_dependents(self):
+        combos = plan_snapshot_combos(REGIONS, FORMATS)
+        order = {combo.key: i for i, combo in enumerate(combos)}
+
+        assert len(combos) == len(order)
+        for game_format in FORMATS:
+            for tournament_type in TOURNAMENT_TYPES:
+                jp = order[("JP", game_format, 1, tournament_type)]
+                global_ = order[(None, game_format, 3, tournament_type)]
+                assert jp < global_
+                for region in ("NA", "EU", "LATAM", "OCE"):
+                    assert global_ < order[(region, game_format, 3, tournament_type)]
+
+    def test_missing_dependencies_are_ignored(self):
+        combos = plan_snapshot_combos(["NA"], ["standard"])
+        assert [c.label for c in combos] == [
+            "NA/standard/BO3/all",
+            "NA/standard/BO3/official",
+            "NA/standard/BO3/grassroots",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_context_is_shared_across_combos(self, sample_snapshot):
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        mock_service = AsyncMock()
+        mock_service.compute_enhanced_meta_snapshot.return_value = sample_snapshot
+        mock_service.get_snapshots_for_date.return_value = {}
+
+        with (
+            patch(
+                "src.pipelines.compute_meta.async_session_factory",
+                return_value=mock_session,
+            ),
+            patch(
+                "src.pipelines.compute_meta.MetaService",
+                return_value=mock_service,
+            ),
+        ):
+            await compute_daily_snapshots(
+                dry_run=True, regions=[None, "JP"], formats=["standard"]
+            )
+
+        calls = mock_service.compute_enhanced_meta_snapshot.call_args_list
+        contexts = {id(call.kwargs["context"]) for call in calls}
+        assert len(contexts) == 1
+        assert [call.kwargs["region"] for call in calls[:3]] == ["JP"] * 3
+        mock_service.get_snapshots_for_date.assert_awaited_once()
+
+
+class TestConcurrentComputeDailySnapshots:
+    """Tests for compute_daily_snapshots with concurrency > 1."""
+
+    @staticmethod
+    def _patches(mock_service: AsyncMock):
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        return (
+            patch(
+                "src.pipelines.compute_meta.async_session_factory",
+                return_value=mock_session,
+            ),
+            patch(
+                "src.pipelines.compute_meta.MetaService",
+                return_value=mock_service,
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_jp_and_global(self, sample_snapshot):
+        finished: list[str | None] = []
+        started: list[tuple[str | None, list[str | None]]] = []
+
+        async def compute(**kwargs):
+            started.append((kwargs["region"], list(finished)))
+            await asyncio.sleep(0)
+            finished.append(kwargs["region"])
+            return sample_snapshot
+
+        mock_service = AsyncMock()
+        mock_service.compute_enhanced_meta_snapshot.side_effect = compute
+        mock_service.get_snapshots_for_date.return_value = {}
+        session_patch, service_patch = self._patches(mock_service)
+
+        with session_patch, service_patch:
+            result = await compute_daily_snapshots(
+                dry_run=True,
+                regions=[None, "JP", "NA"],
+                formats=["standard"],
+                concurrency=4,
+            )
+
+        assert result.snapshots_computed == 9
+        for region, done_before in started:
+            if region is None:
+                assert done_before.count("JP") == 3
+            elif region == "NA":
+                assert done_before.count(None) == 3
+
+    @pytest.mark.asyncio
+    async def test_saves_each_combo_separately(self, sample_snapshot):
+        mock_service = AsyncMock()
+        mock_service.compute_enhanced_meta_snapshot.return_value = sample_snapshot
+        mock_service.get_snapshots_for_date.return_value = {}
+        mock_service.save_snapshots.side_effect = lambda snapshots, **_: len(snapshots)
+        session_patch, service_patch = self._patches(mock_service)
+
+        with session_patch, service_patch:
+            result = await compute_daily_snapshots(
+                dry_run=False, regions=[None], formats=["standard"], concurrency=2
+            )
+
+        assert result.snapshots_saved == 3
+        assert mock_service.save_snapshots.await_count == 3
+        assert [t.status for t in result.combo_timings] == ["saved"] * 3
+
+    @pytest.mark.asyncio
+    async def test_failed_combo_does_not_block_others(self, sample_snapshot):
+        async def compute(**kwargs):
+            if kwargs["region"] == "JP" and kwargs["tournament_type"] == "all":
+                raise SQLAlchemyError("DB error")
+            return sample_snapshot
+
+        mock_service = AsyncMock()
+        mock_service.compute_enhanced_meta_snapshot.side_effect = compute
+        mock_service.get_snapshots_for_date.return_value = {}
+        mock_service.save_snapshots.side_effect = lambda snapshots, **_: len(snapshots)
+        session_patch, service_patch = self._patches(mock_service)
+
+        with session_patch, service_patch:
+            result = await compute_daily_snapshots(
+                dry_run=False,
+                regions=[None, "JP"],
+                formats=["standard"],
+                concurrency=3,
+            )
+
+        assert len(result.errors) == 1
+        assert "JP/standard/BO1/all" in result.errors[0]
+        assert result.snapshots_saved == 5
+        statuses = {t.combo: t.status for t in result.combo_timings}
+        assert statuses["JP/standard/BO1/all"] == "error"
+        assert statuses["global/standard/BO3/all"] == "saved"
+
+    @pytest.mark.asyncio
+    async def test_save_error_is_per_combo(self, sample_snapshot):
+        calls = 0
+
+        async def save(snapshots, **_):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise SQLAlchemyError("conflict")
+            return len(snapshots)
+
+        mock_service = AsyncMock()
+        mock_service.compute_enhanced_meta_snapshot.return_value = sample_snapshot
+        mock_service.get_snapshots_for_date.return_value = {}
+        mock_service.save_snapshots.side_effect = save
+        session_patch, service_patch = self._patches(mock_service)
+
+        with session_patch, service_patch:
+            result = await compute_daily_snapshots(
+                dry_run=False, regions=[None], formats=["standard"], concurrency=2
+            )
+
+        assert result.snapshots_computed == 3
+        assert result.snapshots_saved == 2
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Error saving global/standard/BO3/")
@@ -0,0 +1,182 @@
+"""Tests for rotation impact pipeline."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.pipelines.compute_rotation_impact import (
+    ComputeRotationImpactResult,
+    _save_impacts,
+    compute_rotation_impact,
+)
+from src.services.rotation_engine import (
+    MIN_DECKLISTS,
+    ArchetypeRotation,
+    CardLegalityRow,
+)
+
+MODULE = "src.pipelines.compute_rotation_impact"
+
+CARDS = [
+    CardLegalityRow("sv03-125", "Charizard ex", "OBF-125", "G", None),
+    CardLegalityRow("sv06-130", "Dragapult ex", "TWM-130", "H", None),
+]
+
+
+def _format(name: str, legal_sets: list[str], **kwargs) -> MagicMock:
+    config = MagicMock()
+    config.name = name
+    config.legal_sets = legal_sets
+    config.start_date = kwargs.get("start_date", date(2023, 3, 31))
+    config.rotation_details = kwargs.get("rotation_details")
+    return config
+
+
+def _decklists() -> list[tuple[str, list[dict] | None]]:
+    charizard = [{"card_id": "sv3-125", "quantity": 3}]
+    dragapult = [{"card_id": "sv6-130", "quantity": 4}]
+    return [("Charizard ex", charizard)] * 5 + [("Dragapult ex", dragapult)] * 5
+
+
+async def _run(
+    formats: tuple, *, dry_run: bool
+) -> tuple[ComputeRotationImpactResult, MagicMock, AsyncMock]:
+    """Run the pipeline with loaders patched; returns (result, session, save)."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    save = AsyncMock(return_value=(2, 1))
+    with (
+        patch(f"{MODULE}.async_session_factory") as mock_factory,
+        patch(f"{MODULE}._resolve_formats", AsyncMock(return_value=formats)),
+        patch(f"{MODULE}._load_cards", AsyncMock(return_value=CARDS)),
+        patch(f"{MODULE}._load_placeholder_names", AsyncMock(return_value=[])),
+        patch(f"{MODULE}._load_decklists", AsyncMock(return_value=_decklists())),
+        patch(f"{MODULE}._save_impacts", save),
+    ):
+        mock_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        mock_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        result = await compute_rotation_impact(dry_run=dry_run)
+    return result, session, save
+
+
+class TestComputeRotationImpact:
+    """Tests for the orchestrator function."""
+
+    @pytest.mark.asyncio
+    async def test_rates_and_saves_archetypes(self) -> None:
+        formats = (
+            _format("svi-asc", ["OBF", "TWM"]),
+            _format(
+                "tef-asc",
+                ["TWM"],
+                rotation_details={"rotating_out_sets": ["OBF"]},
+            ),
+        )
+
+        result, session, save = await _run(formats, dry_run=False)
+
+        assert result.success is True
+        assert result.format_transition == "svi-asc-to-tef-asc"
+        assert result.rotating_cards == 1
+        assert result.decklists_evaluated == 10
+        assert result.impacts_saved == 2
+        assert result.impacts_removed == 1
+        assert result.ratings == {"dies": 1, "thrives": 1}
+        transition, evaluations = save.await_args.args[1:]
+        assert transition == "svi-asc-to-tef-asc"
+        assert {e.archetype: e.survival_rating for e in evaluations} == {
+            # sv3-125 is a Charizard ex signature card
+            "Charizard ex": "dies",
+            "Dragapult ex": "thrives",
+        }
+        session.commit.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_save(self) -> None:
+        formats = (_format("svi-asc", ["OBF", "TWM"]), _format("tef-asc", ["TWM"]))
+
+        result, session, save = await _run(formats, dry_run=True)
+
+        assert result.archetypes_evaluated == 2
+        assert result.impacts_saved == 0
+        save.assert_not_awaited()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_format_is_an_error(self) -> None:
+        result, _, save = await _run((_format("svi-asc", ["OBF"]), None), dry_run=True)
+
+        assert result.success is False
+        assert "not found" in result.errors[0]
+        save.assert_not_awaited()
+
+
+def _evaluation(archetype: str, decklists: int) -> ArchetypeRotation:
+    return ArchetypeRotation(
+        archetype=archetype,
+        decklists=decklists,
+        survival_rating="thrives",
+        avg_lost_copies=0.0,
+        core_cards_lost=0,
+        resolved_share=1.0,
+    )
+
+
+class TestSaveImpacts:
+    """Tests for _save_impacts."""
+
+    @pytest.mark.asyncio
+    async def test_skips_rare_archetypes_and_removes_stale_rows(self) -> None:
+        session = MagicMock()
+        removed = MagicMock()
+        removed.all.return_value = [MagicMock()] * 3
+        session.execute = AsyncMock(return_value=removed)
+
+        saved, removed = await _save_impacts(
+            session,
+            "svi-asc-to-tef-asc",
+            [
+                _evaluation("Dragapult ex", MIN_DECKLISTS),
+                _evaluation("Rogue Deck", MIN_DECKLISTS - 1),
+            ],
+        )
+
+        assert (saved, removed) == (1, 3)
+        upsert, cleanup = (call.args[0] for call in session.execute.await_args_list)
+        upsert_params = upsert.compile(dialect=postgresql.dialect()).params
+        assert [
+            value
+            for key, value in upsert_params.items()
+            if key.startswith("archetype_id")
+        ] == ["dragapult-ex"]
+        sql = str(cleanup.compile(dialect=postgresql.dialect()))
+        assert "DELETE FROM rotation_impacts" in sql
+        assert "rotation_impacts.archetype_id NOT IN" in sql
+        assert "rotation_impacts.analysis IS NULL" in sql
+        assert "rotation_impacts.jp_evidence IS NULL" in sql
+        assert cleanup.compile().params["archetype_id_1"] == ["dragapult-ex"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_rows_when_nothing_is_rateable(self) -> None:
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        saved, removed = await _save_impacts(
+            session, "svi-asc-to-tef-asc", [_evaluation("Rogue Deck", 1)]
+        )
+
+        assert (saved, removed) == (0, 0)
+        session.execute.assert_not_awaited()
+
+
+class TestComputeRotationImpactResult:
+    """Tests for ComputeRotationImpactResult."""
+
+    def test_success_when_no_errors(self) -> None:
+        assert ComputeRotationImpactResult().success is True
+
+    def test_not_success_with_errors(self) -> None:
+        assert ComputeRotationImpactResult(errors=["boom"]).success is False
@@ -1,5 +1,8 @@
 """Tests for the DecklistDiffEngine."""
 
+import random
+from statistics import median
+
 import pytest
 
 from src.services.decklist_diff import DecklistDiffEngine, DecklistDiffResult
@@ -176,6 +179,122 @@ class TestComputeConsensusList:
         assert result[2]["name"] == "Mmm"
 
 
+def _reference_consensus(
+    engine: DecklistDiffEngine, decklists: list[list[dict]], threshold: float
+) -> list[dict]:
+    """Row-by-row consensus computation the matrix path must reproduce."""
+    card_counts: dict[str, list[int]] = {}
+    for decklist in decklists:
+        for name, quantity in engine._aggregate_decklist(decklist).items():
+            card_counts.setdefault(name, []).append(quantity)
+    consensus = [
+        {
+            "name": name,
+            "quantity": round(median(counts)),
+            "inclusion_rate": round(len(counts) / len(decklists), 3),
+        }
+        for name, counts in card_counts.items()
+        if len(counts) / len(decklists) >= threshold
+    ]
+    consensus.sort(key=lambda c: (-c["inclusion_rate"], -c["quantity"], c["name"]))
+    return consensus
+
+
+class TestConsensusMatrix:
+    """Tests for the matrix-backed and weighted consensus paths."""
+
+    @pytest.fixture
+    def engine(self) -> DecklistDiffEngine:
+        return DecklistDiffEngine()
+
+    @staticmethod
+    def _random_decklists(rng: random.Random, count: int) -> list[list[dict]]:
+        names = [f"Card{i}" for i in range(30)] + ["Boss's Orders"]
+        decklists = []
+        for _ in range(count):
+            decklist = [
+                {"card_id": f"x-{name}", "name": name, "quantity": rng.randint(1, 4)}
+                for name in rng.sample(names, rng.randint(5, 20))
+            ]
+            decklist.append(
+                {"card_id": "sv2-172", "name": "Ghetsis print", "quantity": 1}
+            )
+            decklists.append(decklist)
+        return decklists
+
+    def test_matches_row_by_row_computation(self, engine: DecklistDiffEngine) -> None:
+        """Matrix consensus should equal the per-list computation."""
+        rng = random.Random(3)  # noqa: S311
+        for count in (1, 2, 7, 40, 200):
+            decklists = self._random_decklists(rng, count)
+            for threshold in (0.0, 0.25, 0.5, 0.9):
+                assert engine.compute_consensus_list(
+                    decklists, threshold
+                ) == _reference_consensus(engine, decklists, threshold)
+
+    def test_multiple_thresholds_from_one_matrix(
+        self, engine: DecklistDiffEngine
+    ) -> None:
+        """Should return one consensus list per threshold."""
+        decklists = self._random_decklists(random.Random(5), 50)  # noqa: S311
+        matrix = engine.build_matrix(decklists)
+
+        lists = engine.compute_consensus_lists(matrix, [0.3, 0.5, 0.8])
+
+        assert set(lists) == {0.3, 0.5, 0.8}
+        for threshold, consensus in lists.items():
+            assert consensus == engine.compute_consensus_list(decklists, threshold)
+        assert len(lists[0.3]) >= len(lists[0.5]) >= len(lists[0.8])
+
+    def test_uniform_weights_match_unweighted(self, engine: DecklistDiffEngine) -> None:
+        """Equal weights should give the unweighted result, medians included."""
+        decklists = self._random_decklists(random.Random(9), 24)  # noqa: S311
+
+        weighted = engine.compute_consensus_list(decklists, weights=[2.5] * 24)
+
+        assert weighted == engine.compute_consensus_list(decklists)
+
+    def test_weights_shift_inclusion_and_quantity(
+        self, engine: DecklistDiffEngine
+    ) -> None:
+        """Heavier decklists should dominate inclusion rates and medians."""
+        decklists = [
+            [{"card_id": "a", "name": "CardA", "quantity": 4}],
+            [{"card_id": "a", "name": "CardA", "quantity": 1}],
+            [{"card_id": "b", "name": "CardB", "quantity": 2}],
+        ]
+
+        result = engine.compute_consensus_list(decklists, weights=[3.0, 1.0, 1.0])
+
+        assert result == [{"name": "CardA", "quantity": 4, "inclusion_rate": 0.8}]
+
+    def test_rejects_mismatched_weights(self, engine: DecklistDiffEngine) -> None:
+        """Should raise when weights don't line up with the decklists."""
+        decklists = [[{"card_id": "a", "name": "CardA", "quantity": 1}]]
+
+        with pytest.raises(ValueError, match="weights"):
+            engine.compute_consensus_list(decklists, weights=[1.0, 2.0])
+        with pytest.raises(ValueError, match="positive"):
+            engine.compute_consensus_list(decklists, weights=[0.0])
+
+    def test_card_usage(self, engine: DecklistDiffEngine) -> None:
+        """Should report average count and inclusion rate per card."""
+        matrix = engine.build_matrix(
+            [
+                [{"card_id": "a", "name": "CardA", "quantity": 4}],
+                [
+                    {"card_id": "a", "name": "CardA", "quantity": 3},
+                    {"card_id": "b", "name": "CardB", "quantity": 1},
+                ],
+            ]
+        )
+
+        assert matrix.card_usage() == {
+            "CardA": {"name": "CardA", "avg_count": 3.5, "inclusion_rate": 1.0},
+            "CardB": {"name": "CardB", "avg_count": 1.0, "inclusion_rate": 0.5},
+        }
+
+
 class TestDiff:
     """Tests for diffing two consensus decklists."""
 
@@ -13,6 +13,7 @@ from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
 from src.models.archetype_prediction import ArchetypePrediction
 from src.models.evolution_article import EvolutionArticle
 from src.models.evolution_article_snapshot import EvolutionArticleSnapshot
+from src.models.prediction_accuracy_rollup import PredictionAccuracyRollup
 
 _UNSET = object()
 
@@ -174,10 +175,14 @@ class TestGetPredictionAccuracy:
         prediction.accuracy_score = 0.92
         prediction.created_at = datetime.now(UTC)
 
+        rollup = MagicMock(spec=PredictionAccuracyRollup)
+        rollup.prediction_count = 5
+        rollup.scored_count = 3
+        rollup.average_accuracy = 0.85
+        rollup.baseline_average_accuracy = 0.8
+
         mock_db.execute.side_effect = [
-            _make_execute_result(scalar=5),  # total
-            _make_execute_result(scalar=3),  # scored
-            _make_execute_result(scalar=0.85),  # avg accuracy
+            _make_execute_result(scalar_one_or_none=rollup),  # overall rollup
             _make_execute_result(scalars_all=[prediction]),  # predictions
         ]
 
@@ -187,7 +192,24 @@ class TestGetPredictionAccuracy:
         assert data["total_predictions"] == 5
         assert data["scored_predictions"] == 3
         assert data["average_accuracy"] == 0.85
+        assert data["baseline_average_accuracy"] == 0.8
         assert len(data["predictions"]) == 1
+        assert mock_db.execute.await_count == 2
+
+    def test_returns_zeros_before_first_rollup(self, client, mock_db) -> None:
+        """Should return empty totals when no rollup has been computed."""
+        mock_db.execute.side_effect = [
+            _make_execute_result(scalar_one_or_none=None),
+            _make_execute_result(scalars_all=[]),
+        ]
+
+        response = client.get("/api/v1/evolution/accuracy")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_predictions"] == 0
+        assert data["scored_predictions"] == 0
+        assert data["average_accuracy"] is None
+        assert data["predictions"] == []
 
 
 class TestGetEvolutionArticle:
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
 from src.models.tournament import Tournament
@@ -19,7 +20,12 @@ _UNSET = object()
 
 
 def _make_execute_result(
-    *, scalar_one_or_none=_UNSET, scalars_all=_UNSET, one_or_none=_UNSET
+    *,
+    scalar_one_or_none=_UNSET,
+    scalars_all=_UNSET,
+    one_or_none=_UNSET,
+    all_rows=_UNSET,
+    scalar_one=_UNSET,
 ):
     """Create a mock result from session.execute().
 
@@ -33,6 +39,10 @@ def _make_execute_result(
         mock_result.scalars.return_value.all.return_value = scalars_all
     if one_or_none is not _UNSET:
         mock_result.one_or_none.return_value = one_or_none
+    if all_rows is not _UNSET:
+        mock_result.all.return_value = all_rows
+    if scalar_one is not _UNSET:
+        mock_result.scalar_one.return_value = scalar_one
     return mock_result
 
 
@@ -98,7 +108,7 @@ class TestComputeTournamentSnapshot:
 
         mock_session.execute.side_effect = [
             _make_execute_result(scalar_one_or_none=tournament),
-            _make_execute_result(scalars_all=[]),
+            _make_execute_result(all_rows=[]),
         ]
 
         with pytest.raises(EvolutionError, match="No placements"):
@@ -130,8 +140,8 @@ class TestComputeTournamentSnapshot:
 
         mock_session.execute.side_effect = [
             _make_execute_result(scalar_one_or_none=tournament),
-            _make_execute_result(scalars_all=charizard_placements),
-            _make_execute_result(scalars_all=all_placements),
+            _make_execute_result(all_rows=charizard_placements),
+            _make_execute_result(scalar_one=len(all_placements)),
         ]
 
         snapshot = await service.compute_tournament_snapshot("Charizard ex", tid)
@@ -170,8 +180,8 @@ class TestComputeTournamentSnapshot:
 
         mock_session.execute.side_effect = [
             _make_execute_result(scalar_one_or_none=tournament),
-            _make_execute_result(scalars_all=placements),
-            _make_execute_result(scalars_all=placements),
+            _make_execute_result(all_rows=placements),
+            _make_execute_result(scalar_one=len(placements)),
         ]
 
         snapshot = await service.compute_tournament_snapshot("Test", tid)
@@ -198,8 +208,8 @@ class TestComputeTournamentSnapshot:
 
         mock_session.execute.side_effect = [
             _make_execute_result(scalar_one_or_none=tournament),
-            _make_execute_result(scalars_all=placements),
-            _make_execute_result(scalars_all=placements),
+            _make_execute_result(all_rows=placements),
+            _make_execute_result(scalar_one=len(placements)),
         ]
 
         snapshot = await service.compute_tournament_snapshot("Test", tid)
@@ -207,6 +217,125 @@ class TestComputeTournamentSnapshot:
         assert snapshot.card_usage is None
 
 
+class TestComputeTournamentEvolution:
+    """Tests for the tournament-level evolution pass."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.add_all = MagicMock()
+        return session
+
+    @pytest.fixture
+    def service(self, mock_session: AsyncMock) -> EvolutionService:
+        return EvolutionService(mock_session)
+
+    @staticmethod
+    def _rows() -> list[tuple[str, int, list[dict] | None]]:
+        deck_a = [{"card_id": "a", "name": "CardA", "quantity": 4}]
+        deck_b = [
+            {"card_id": "a", "name": "CardA", "quantity": 3},
+            {"card_id": "b", "name": "CardB", "quantity": 2},
+        ]
+        return [
+            ("Charizard ex", 1, deck_a),
+            ("Dragapult ex", 2, deck_a),
+            ("Charizard ex", 5, deck_b),
+            ("Charizard ex", 12, deck_a),
+            ("Charizard ex", 20, None),
+            ("Dragapult ex", 3, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_computes_all_archetypes_in_one_pass(
+        self, service: EvolutionService, mock_session: AsyncMock
+    ) -> None:
+        """Should load placements once and save everything in one commit."""
+        tid = uuid4()
+        previous = ArchetypeEvolutionSnapshot(
+            id=uuid4(),
+            archetype="Charizard ex",
+            tournament_id=uuid4(),
+            consensus_list=[{"card_id": "z", "name": "CardZ", "quantity": 2}],
+        )
+        mock_session.execute.side_effect = [
+            _make_execute_result(one_or_none=(date(2026, 1, 15),)),
+            _make_execute_result(all_rows=self._rows()),
+            _make_execute_result(scalars_all=[]),
+            _make_execute_result(scalars_all=[previous]),
+        ]
+
+        result = await service.compute_tournament_evolution(tid)
+
+        assert mock_session.execute.await_count == 4
+        mock_session.commit.assert_awaited_once()
+        assert result.skipped == {"Dragapult ex": 1}
+        (snapshot,) = result.snapshots
+        assert snapshot.archetype == "Charizard ex"
+        assert snapshot.deck_count == 4
+        assert snapshot.meta_share == round(4 / 6, 4)
+        assert snapshot.best_placement == 1
+        assert snapshot.top_cut_conversion == round(2 / 4, 4)
+        mock_session.add.assert_called_once_with(snapshot)
+        assert {a.snapshot_id for a in result.adaptations} == {snapshot.id}
+        assert {a.type for a in result.adaptations} == {"tech", "removal"}
+
+    @pytest.mark.asyncio
+    async def test_updates_existing_snapshot_in_place(
+        self, service: EvolutionService, mock_session: AsyncMock
+    ) -> None:
+        """Recomputing should reuse the stored row and replace diff adaptations."""
+        tid = uuid4()
+        existing = ArchetypeEvolutionSnapshot(
+            id=uuid4(), archetype="Charizard ex", tournament_id=tid, deck_count=1
+        )
+        mock_session.execute.side_effect = [
+            _make_execute_result(one_or_none=(date(2026, 1, 15),)),
+            _make_execute_result(all_rows=self._rows()),
+            _make_execute_result(scalars_all=[existing]),
+            _make_execute_result(scalars_all=[]),
+            MagicMock(),
+        ]
+
+        result = await service.compute_tournament_evolution(tid)
+
+        assert result.snapshots == [existing]
+        assert existing.deck_count == 4
+        mock_session.add.assert_not_called()
+        # The fifth statement deletes the stale diff adaptations
+        assert mock_session.execute.await_count == 5
+        assert result.adaptations == []
+
+    @pytest.mark.asyncio
+    async def test_raises_when_tournament_not_found(
+        self, service: EvolutionService, mock_session: AsyncMock
+    ) -> None:
+        """Should raise EvolutionError when the tournament doesn't exist."""
+        mock_session.execute.return_value = _make_execute_result(one_or_none=None)
+
+        with pytest.raises(EvolutionError, match="not found"):
+            await service.compute_tournament_evolution(uuid4())
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_commit_error(
+        self, service: EvolutionService, mock_session: AsyncMock
+    ) -> None:
+        """Should roll back the whole tournament when the save fails."""
+        mock_session.execute.side_effect = [
+            _make_execute_result(one_or_none=(date(2026, 1, 15),)),
+            _make_execute_result(all_rows=self._rows()),
+            _make_execute_result(scalars_all=[]),
+            _make_execute_result(scalars_all=[]),
+        ]
+        mock_session.commit.side_effect = SQLAlchemyError("boom")
+
+        with pytest.raises(SQLAlchemyError):
+            await service.compute_tournament_evolution(uuid4())
+
+        mock_session.rollback.assert_awaited_once()
+
+
 class TestComputeAdaptations:
     """Tests for adaptation computation between snapshots."""
 
@@ -696,3 +696,68 @@ class TestSourceHealthDetail:
         assert by_source["limitless"].status == "ok"
         assert by_source["pokecabook"].status == "missing"
         assert by_source["pokecabook"].failure_reason == "no_recent_source_data"
+
+
+def make_pipeline_run(**overrides) -> MagicMock:
+    run = MagicMock()
+    run.run_id = "run-1"
+    run.pipeline = "compute-meta"
+    run.status = "ok"
+    run.started_at = datetime.now(UTC) - timedelta(minutes=5)
+    run.finished_at = datetime.now(UTC)
+    run.wall_seconds = 12.5
+    run.cpu_seconds = 3.1
+    run.db_queries = 40
+    run.db_seconds = 6.2
+    run.http_requests = 0
+    run.http_bytes = 0
+    run.steps = [
+        {
+            "name": "compute-NA-standard-BO3-all",
+            "status": "ok",
+            "wall_seconds": 2.0,
+            "cpu_seconds": 0.5,
+            "db_queries": 8,
+            "db_seconds": 1.1,
+            "http_requests": 0,
+            "http_bytes": 0,
+            "error": None,
+        }
+    ]
+    run.steps_dropped = 0
+    run.error = None
+    for key, value in overrides.items():
+        setattr(run, key, value)
+    return run
+
+
+class TestRecentRuns:
+    """Recorded pipeline runs."""
+
+    @pytest.mark.asyncio
+    async def test_returns_runs_with_steps(self) -> None:
+        session = make_mock_session()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            make_pipeline_run(),
+            make_pipeline_run(run_id="run-2", status="error", error="boom"),
+        ]
+        session.execute = AsyncMock(return_value=result)
+
+        service = PipelineHealthService(session)
+        runs = await service.get_recent_runs(pipeline="compute-meta", limit=2)
+
+        assert [r.run_id for r in runs] == ["run-1", "run-2"]
+        assert runs[0].steps[0].name == "compute-NA-standard-BO3-all"
+        assert runs[0].steps[0].db_queries == 8
+        assert runs[1].status == "error"
+        assert runs[1].error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_query_failure_returns_empty(self) -> None:
+        session = make_mock_session()
+        session.execute = AsyncMock(side_effect=Exception("no table"))
+
+        service = PipelineHealthService(session)
+
+        assert await service.get_recent_runs() == []
@@ -440,6 +440,10 @@ class TestCardCountEvolution:
         assert data["archetype"] == "Charizard ex"
         assert data["tournaments_analyzed"] == 1
         assert len(data["cards"]) == 2
+        from src.schemas.japan import CardCountEvolutionResponse
+
+        validated = CardCountEvolutionResponse.model_validate(data)
+        assert validated.model_dump(mode="json") == data
 
     def test_card_count_evolution_empty(
         self, client: TestClient, mock_db: AsyncMock
@@ -0,0 +1,39 @@
+"""Tests for the fast JSON response class."""
+
+import json
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from src.schemas.freshness import DataFreshness
+from src.utils.json_response import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    def test_encodes_dates_uuids_and_nested_models(self) -> None:
+        freshness = DataFreshness(status="fresh", cadence_profile="default_cadence")
+        response = FastJSONResponse(
+            {
+                "day": date(2024, 1, 15),
+                "at": datetime(2024, 1, 15, 9, 30, tzinfo=UTC),
+                "id": UUID("12345678-1234-5678-1234-567812345678"),
+                "freshness": freshness,
+            }
+        )
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "day": "2024-01-15",
+            "at": "2024-01-15T09:30:00Z",
+            "id": "12345678-1234-5678-1234-567812345678",
+            "freshness": freshness.model_dump(mode="json"),
+        }
+
+    def test_non_finite_floats_become_null(self) -> None:
+        response = FastJSONResponse({"share": float("nan"), "max": float("inf")})
+
+        assert json.loads(response.body) == {"share": None, "max": None}
+
+    def test_keeps_unicode_unescaped(self) -> None:
+        response = FastJSONResponse({"name": "リザードンex"})
+
+        assert response.body == '{"name":"リザードンex"}'.encode()
@@ -0,0 +1,36 @@
+"""Tests for deferred imports."""
+
+import sys
+
+import pytest
+
+from src.utils.lazy_imports import lazy_import
+
+
+@pytest.fixture
+def fresh_module():
+    """Drop a small stdlib module so it can be imported lazily."""
+    name = "colorsys"
+    saved = sys.modules.pop(name, None)
+    yield name
+    sys.modules.pop(name, None)
+    if saved is not None:
+        sys.modules[name] = saved
+
+
+def test_executes_module_on_first_attribute_access(fresh_module: str) -> None:
+    module = lazy_import(fresh_module)
+
+    assert type(module).__name__ == "_LazyModule"
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert type(module).__name__ == "module"
+    assert sys.modules[fresh_module] is module
+
+
+def test_returns_already_imported_module() -> None:
+    assert lazy_import("json") is sys.modules["json"]
+
+
+def test_missing_module_raises() -> None:
+    with pytest.raises(ModuleNotFoundError, match="no_such_module"):
+        lazy_import("no_such_module")
@@ -1,15 +1,20 @@
 """Tests for meta snapshot endpoints."""
 
 from datetime import date
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.models.archetype_key_cards import ArchetypeKeyCards
+from src.models.archetype_share_series import ArchetypeShareSeries
 from src.models.meta_snapshot import MetaSnapshot
 from src.models.tournament import Tournament
 from src.models.tournament_placement import TournamentPlacement
+from src.schemas import MetaHistoryResponse
+from tests.query_budget import count_session_queries
 
 
 class TestMetaEndpoints:
@@ -214,6 +219,40 @@ class TestGetMetaHistory(TestMetaEndpoints):
         data = response.json()
         assert data["snapshots"] == []
 
+    def test_get_meta_history_matches_response_model(
+        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+    ) -> None:
+        """Test the dict-built history serializes exactly as its schema would."""
+        sample_snapshot.diversity_index = 0.82
+        sample_snapshot.tier_assignments = {"Charizard ex": "S"}
+        sample_snapshot.jp_signals = {
+            "rising": ["Lugia VSTAR"],
+            "falling": [],
+            "divergent": [
+                {
+                    "archetype": "Lugia VSTAR",
+                    "jp_share": 0.2,
+                    "en_share": 0.12,
+                    "diff": 0.08,
+                    "note": "extra keys are dropped",
+                }
+            ],
+        }
+        sample_snapshot.trends = {
+            "Charizard ex": {"change": 0.02, "direction": "up"},
+        }
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_snapshot]
+        mock_db.execute.return_value = mock_result
+
+        response = client.get("/api/v1/meta/history")
+
+        assert response.status_code == 200
+        data = response.json()
+        expected = MetaHistoryResponse.model_validate(data).model_dump(mode="json")
+        assert data == expected
+        assert data["snapshots"][0]["trends"]["Charizard ex"]["previous_share"] is None
+
     def test_get_meta_history_with_days_filter(
         self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
     ) -> None:
@@ -540,19 +579,57 @@ class TestJapanBO1Meta(TestMetaEndpoints):
 class TestGetArchetypeDetail(TestMetaEndpoints):
     """Tests for GET /api/v1/meta/archetypes/{name}."""
 
+    @staticmethod
+    def _series(*points: tuple[date, float, int]) -> MagicMock:
+        """Series query result, newest first."""
+        rows = []
+        for snapshot_date, share, sample_size in points:
+            row = MagicMock(spec=ArchetypeShareSeries)
+            row.snapshot_date = snapshot_date
+            row.share = share
+            row.sample_size = sample_size
+            rows.append(row)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rows
+        return result
+
+    @staticmethod
+    def _key_cards(cards: list[dict] | None) -> MagicMock:
+        """Key card rollup query result (None = no rollup yet)."""
+        result = MagicMock()
+        if cards is None:
+            result.scalar_one_or_none.return_value = None
+        else:
+            rollup = MagicMock(spec=ArchetypeKeyCards)
+            rollup.key_cards = cards
+            result.scalar_one_or_none.return_value = rollup
+        return result
+
+    @staticmethod
+    def _placements(*placements: MagicMock) -> MagicMock:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(placements)
+        return result
+
+    @staticmethod
+    def _no_card_matches() -> list[MagicMock]:
+        """Card lookups (limitless ID, canonical ID, mapping) finding nothing."""
+        results = []
+        for _ in range(3):
+            result = MagicMock()
+            result.all.return_value = []
+            results.append(result)
+        return results
+
     def test_get_archetype_detail_success(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test getting archetype detail successfully."""
-        # Mock snapshot query
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        # Mock placement query (empty placements)
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
 
@@ -562,133 +639,145 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert data["current_share"] == 0.15
         assert len(data["history"]) == 1
         assert data["history"][0]["share"] == 0.15
+        assert data["key_cards"] == []
 
     def test_get_archetype_detail_not_found(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test getting archetype that doesn't exist returns 404."""
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-        mock_db.execute.return_value = mock_snapshot_result
+        mock_db.execute.return_value = self._series()
 
         response = client.get("/api/v1/meta/archetypes/NonexistentArchetype")
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
+        assert mock_db.execute.await_count == 1
 
-    def test_get_archetype_detail_with_placements(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+    def test_get_archetype_detail_reads_series_not_snapshots(
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
-        """Test archetype detail includes key cards from placements."""
+        """History comes from a range scan over the archetype's series."""
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
+
+        client.get(
+            "/api/v1/meta/archetypes/Charizard%20ex?region=NA&tournament_type=official"
+        )
+
+        series_sql = str(mock_db.execute.call_args_list[0].args[0])
+        key_cards_sql = str(mock_db.execute.call_args_list[1].args[0])
+        assert "FROM archetype_share_series" in series_sql
+        assert "meta_snapshots" not in series_sql
+        assert "archetype_share_series.snapshot_date >=" in series_sql
+        assert "archetype_share_series.region =" in series_sql
+        assert "archetype_share_series.tournament_type =" in series_sql
+        assert "FROM archetype_key_cards" in key_cards_sql
+
+    def test_get_archetype_detail_with_key_cards_and_samples(
+        self, client: TestClient, mock_db: AsyncMock
+    ) -> None:
+        """Test key cards come from the rollup and sample decks from placements."""
         from uuid import uuid4
 
-        # Mock placement with decklist
         placement = MagicMock(spec=TournamentPlacement)
         placement.id = uuid4()
         placement.tournament_id = uuid4()
         placement.archetype = "Charizard ex"
         placement.placement = 1
         placement.player_name = "Test Player"
-        placement.decklist = [
-            {"card_id": "sv4-6", "quantity": 4},
-            {"card_id": "sv3-1", "quantity": 3},
-        ]
+        placement.decklist = [{"card_id": "sv4-6", "quantity": 4}]
 
         tournament = MagicMock(spec=Tournament)
         tournament.id = placement.tournament_id
         tournament.name = "Test Tournament"
-
-        # Mock snapshot query
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        # Mock placement query
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = [placement]
-
-        # Mock tournament query
-        mock_tournament_result = MagicMock()
-        mock_tournament_result.scalars.return_value.all.return_value = [tournament]
-
-        # Card enrichment query (returns no matching cards)
-        mock_card_enrich_result = MagicMock()
-        mock_card_enrich_result.all.return_value = []
-
-        # Card ID mapping fallback (no mappings found)
-        mock_mapping_result = MagicMock()
-        mock_mapping_result.all.return_value = []
+        tournament_result = MagicMock()
+        tournament_result.scalars.return_value.all.return_value = [tournament]
 
         mock_db.execute.side_effect = [
-            mock_snapshot_result,
-            mock_placement_result,
-            mock_card_enrich_result,
-            mock_mapping_result,
-            mock_tournament_result,
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(
+                [
+                    {"card_id": "sv4-6", "inclusion_rate": 1.0, "avg_copies": 3.5},
+                    {"card_id": "sv3-1", "inclusion_rate": 0.5, "avg_copies": 2.0},
+                ]
+            ),
+            self._placements(placement),
+            *self._no_card_matches(),
+            tournament_result,
         ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data["key_cards"]) == 2
-        assert data["key_cards"][0]["card_id"] in ["sv4-6", "sv3-1"]
+        assert [kc["card_id"] for kc in data["key_cards"]] == ["sv4-6", "sv3-1"]
+        assert data["key_cards"][0]["inclusion_rate"] == 1.0
+        assert data["key_cards"][0]["avg_copies"] == 3.5
         assert len(data["sample_decks"]) == 1
         assert data["sample_decks"][0]["tournament_name"] == "Test Tournament"
 
-    def test_get_archetype_detail_with_region_filter(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+    def test_get_archetype_detail_global_samples_span_regions(
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
-        """Test filtering archetype detail by region."""
-        sample_snapshot.region = "NA"
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
+        """Global sample decks are not limited to tournaments without a region."""
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
+        client.get("/api/v1/meta/archetypes/Charizard%20ex")
 
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
+        placement_sql = str(mock_db.execute.call_args_list[2].args[0])
+        assert "tournaments.region" not in placement_sql
+        assert "LIMIT" in placement_sql
+
+    def test_get_archetype_detail_with_region_filter(
+        self, client: TestClient, mock_db: AsyncMock
+    ) -> None:
+        """Test filtering archetype detail by region."""
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex?region=NA")
 
         assert response.status_code == 200
+        placement_sql = str(mock_db.execute.call_args_list[2].args[0])
+        assert "tournament_placements.region =" in placement_sql
 
     def test_get_archetype_detail_history_over_time(
         self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test archetype history shows share changes over time."""
-        snapshot1 = MagicMock(spec=MetaSnapshot)
-        snapshot1.snapshot_date = date(2024, 1, 15)
-        snapshot1.archetype_shares = {"Charizard ex": 0.15}
-        snapshot1.sample_size = 100
-
-        snapshot2 = MagicMock(spec=MetaSnapshot)
-        snapshot2.snapshot_date = date(2024, 1, 8)
-        snapshot2.archetype_shares = {"Charizard ex": 0.12}
-        snapshot2.sample_size = 80
-
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [
-            snapshot1,
-            snapshot2,
+        mock_db.execute.side_effect = [
+            self._series(
+                (date(2024, 1, 15), 0.15, 100),
+                (date(2024, 1, 8), 0.12, 80),
+            ),
+            self._key_cards(None),
+            self._placements(),
         ]
 
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
-
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
 
         assert response.status_code == 200
         data = response.json()
+        assert data["current_share"] == 0.15
         assert len(data["history"]) == 2
         assert data["history"][0]["share"] == 0.15
         assert data["history"][1]["share"] == 0.12
+        assert data["history"][1]["sample_size"] == 80
 
-    def test_get_archetype_detail_snapshot_db_error_returns_503(
+    def test_get_archetype_detail_series_db_error_returns_503(
         self, client: TestClient, mock_db: AsyncMock
     ) -> None:
-        """Test database error during snapshot query returns 503."""
+        """Test database error during series query returns 503."""
         from sqlalchemy.exc import SQLAlchemyError
 
         mock_db.execute.side_effect = SQLAlchemyError("Connection failed")
@@ -698,17 +787,30 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert response.status_code == 503
         assert "try again later" in response.json()["detail"]
 
+    def test_get_archetype_detail_key_cards_db_error_returns_503(
+        self, client: TestClient, mock_db: AsyncMock
+    ) -> None:
+        """Test database error during key card query returns 503."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            SQLAlchemyError("Key card query failed"),
+        ]
+
+        response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
+
+        assert response.status_code == 503
+
     def test_get_archetype_detail_placement_db_error_returns_503(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test database error during placement query returns 503."""
         from sqlalchemy.exc import SQLAlchemyError
 
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
         mock_db.execute.side_effect = [
-            mock_snapshot_result,
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
             SQLAlchemyError("Placement query failed"),
         ]
 
@@ -718,7 +820,7 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert "try again later" in response.json()["detail"]
 
     def test_get_archetype_detail_tournament_db_error_returns_503(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test database error during tournament lookup returns 503."""
         from uuid import uuid4
@@ -730,25 +832,13 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         placement.tournament_id = uuid4()
         placement.decklist = [{"card_id": "sv4-6", "quantity": 4}]
 
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = [placement]
-
-        # Card enrichment query (returns no matching cards)
-        mock_card_enrich_result = MagicMock()
-        mock_card_enrich_result.all.return_value = []
-
-        # Card ID mapping fallback (no mappings found)
-        mock_mapping_result = MagicMock()
-        mock_mapping_result.all.return_value = []
-
         mock_db.execute.side_effect = [
-            mock_snapshot_result,
-            mock_placement_result,
-            mock_card_enrich_result,
-            mock_mapping_result,
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(
+                [{"card_id": "sv4-6", "inclusion_rate": 1.0, "avg_copies": 4.0}]
+            ),
+            self._placements(placement),
+            *self._no_card_matches(),
             SQLAlchemyError("Tournament query failed"),
         ]
 
@@ -757,19 +847,6 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert response.status_code == 503
         assert "try again later" in response.json()["detail"]
 
-    def test_get_archetype_detail_no_snapshots_returns_404(
-        self, client: TestClient, mock_db: AsyncMock
-    ) -> None:
-        """Test 404 when no meta snapshots exist."""
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = []
-        mock_db.execute.return_value = mock_snapshot_result
-
-        response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
-
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
-
     def test_get_archetype_detail_invalid_format(self, client: TestClient) -> None:
         """Test invalid format parameter returns 422."""
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex?format=invalid")
@@ -789,34 +866,28 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert response.status_code == 422
 
     def test_get_archetype_detail_with_format_filter(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test filtering archetype detail by format."""
-        sample_snapshot.format = "expanded"
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex?format=expanded")
 
         assert response.status_code == 200
 
     def test_get_archetype_detail_with_best_of_filter(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
+        self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test filtering archetype detail by best_of (BO1 for Japan)."""
-        sample_snapshot.best_of = 1
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.15, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex?best_of=1")
 
@@ -826,18 +897,11 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         self, client: TestClient, mock_db: AsyncMock
     ) -> None:
         """Test current_share=0.0 is returned correctly (not skipped)."""
-        snapshot = MagicMock(spec=MetaSnapshot)
-        snapshot.snapshot_date = date(2024, 1, 15)
-        snapshot.archetype_shares = {"Charizard ex": 0.0}  # Archetype dropped to 0%
-        snapshot.sample_size = 100
-
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_snapshot_result, mock_placement_result]
+        mock_db.execute.side_effect = [
+            self._series((date(2024, 1, 15), 0.0, 100)),
+            self._key_cards(None),
+            self._placements(),
+        ]
 
         response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
 
@@ -847,139 +911,6 @@ class TestGetArchetypeDetail(TestMetaEndpoints):
         assert len(data["history"]) == 1
         assert data["history"][0]["share"] == 0.0
 
-    def test_get_archetype_detail_handles_malformed_decklist(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
-    ) -> None:
-        """Test key cards computation handles malformed decklist data gracefully."""
-        from uuid import uuid4
-
-        placement = MagicMock(spec=TournamentPlacement)
-        placement.id = uuid4()
-        placement.tournament_id = uuid4()
-        placement.placement = 1
-        placement.player_name = "Test Player"
-        placement.decklist = [
-            {"card_id": "sv4-6", "quantity": 4},  # Valid
-            "not_a_dict",  # Non-dict entry (should be skipped)
-            {"quantity": 2},  # Missing card_id (should be skipped)
-            {"card_id": "", "quantity": 2},  # Empty card_id (should be skipped)
-            {"card_id": "sv3-1", "quantity": "invalid"},  # Non-numeric (skip)
-            {"card_id": "sv3-2", "quantity": 0},  # Zero quantity (skip)
-            {"card_id": "sv3-3", "quantity": -1},  # Negative quantity (skip)
-        ]
-
-        tournament = MagicMock(spec=Tournament)
-        tournament.id = placement.tournament_id
-        tournament.name = "Test Tournament"
-
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = [placement]
-
-        mock_tournament_result = MagicMock()
-        mock_tournament_result.scalars.return_value.all.return_value = [tournament]
-
-        # Card enrichment query (returns no matching cards)
-        mock_card_enrich_result = MagicMock()
-        mock_card_enrich_result.all.return_value = []
-
-        # Card ID mapping fallback (no mappings found)
-        mock_mapping_result = MagicMock()
-        mock_mapping_result.all.return_value = []
-
-        mock_db.execute.side_effect = [
-            mock_snapshot_result,
-            mock_placement_result,
-            mock_card_enrich_result,
-            mock_mapping_result,
-            mock_tournament_result,
-        ]
-
-        response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
-
-        assert response.status_code == 200
-        data = response.json()
-        # Only sv4-6 should appear in key_cards (only valid entry)
-        assert len(data["key_cards"]) == 1
-        assert data["key_cards"][0]["card_id"] == "sv4-6"
-        assert data["key_cards"][0]["inclusion_rate"] == 1.0
-        assert data["key_cards"][0]["avg_copies"] == 4.0
-
-    def test_get_archetype_detail_key_card_calculations(
-        self, client: TestClient, mock_db: AsyncMock, sample_snapshot: MagicMock
-    ) -> None:
-        """Test key card inclusion_rate and avg_copies are calculated correctly."""
-        from uuid import uuid4
-
-        # Two placements with different card counts
-        placement1 = MagicMock(spec=TournamentPlacement)
-        placement1.id = uuid4()
-        placement1.tournament_id = uuid4()
-        placement1.placement = 1
-        placement1.player_name = "Player 1"
-        placement1.decklist = [
-            {"card_id": "sv4-6", "quantity": 4},  # In both
-            {"card_id": "sv3-1", "quantity": 2},  # Only in placement1
-        ]
-
-        placement2 = MagicMock(spec=TournamentPlacement)
-        placement2.id = uuid4()
-        placement2.tournament_id = placement1.tournament_id
-        placement2.placement = 2
-        placement2.player_name = "Player 2"
-        placement2.decklist = [
-            {"card_id": "sv4-6", "quantity": 3},  # In both (different count)
-        ]
-
-        tournament = MagicMock(spec=Tournament)
-        tournament.id = placement1.tournament_id
-        tournament.name = "Test Tournament"
-
-        mock_snapshot_result = MagicMock()
-        mock_snapshot_result.scalars.return_value.all.return_value = [sample_snapshot]
-
-        mock_placement_result = MagicMock()
-        mock_placement_result.scalars.return_value.all.return_value = [
-            placement1,
-            placement2,
-        ]
-
-        mock_tournament_result = MagicMock()
-        mock_tournament_result.scalars.return_value.all.return_value = [tournament]
-
-        # Card enrichment query (returns no matching cards)
-        mock_card_enrich_result = MagicMock()
-        mock_card_enrich_result.all.return_value = []
-
-        # Card ID mapping fallback (no mappings found)
-        mock_mapping_result = MagicMock()
-        mock_mapping_result.all.return_value = []
-
-        mock_db.execute.side_effect = [
-            mock_snapshot_result,
-            mock_placement_result,
-            mock_card_enrich_result,
-            mock_mapping_result,
-            mock_tournament_result,
-        ]
-
-        response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # sv4-6: in both placements (2/2 = 100%), avg (4+3)/2 = 3.5
-        # sv3-1: in 1 placement (1/2 = 50%), avg = 2.0
-        key_cards = {kc["card_id"]: kc for kc in data["key_cards"]}
-
-        assert key_cards["sv4-6"]["inclusion_rate"] == 1.0
-        assert key_cards["sv4-6"]["avg_copies"] == 3.5
-
-        assert key_cards["sv3-1"]["inclusion_rate"] == 0.5
-        assert key_cards["sv3-1"]["avg_copies"] == 2.0
-
 
 class TestComputeMatchupsFromPlacements:
     """Tests for _compute_matchups_from_placements helper function."""
@@ -1265,3 +1196,107 @@ class TestGetArchetypeMatchups(TestMetaEndpoints):
         assert response.status_code == 200
         data = response.json()
         assert len(data["matchups"]) == 10  # Limited to top 10
+
+
+class TestMetaQueryBudgets(TestMetaEndpoints):
+    """Query counts of the meta endpoints stay flat as card counts grow.
+
+    Card lookups are batched, so enriching any number of cards costs the
+    limitless ID, canonical ID and JP mapping queries once.
+    """
+
+    @pytest.fixture(autouse=True)
+    def no_card_catalog(self):
+        """Resolve cards with queries rather than the in-memory catalog."""
+        with patch(
+            "src.routers.meta.refresh_card_catalog", AsyncMock(return_value=None)
+        ):
+            yield
+
+    @staticmethod
+    def _snapshot(snapshot_date: date, card_count: int) -> MagicMock:
+        snapshot = MagicMock(spec=MetaSnapshot)
+        snapshot.snapshot_date = snapshot_date
+        snapshot.region = None
+        snapshot.format = "standard"
+        snapshot.best_of = 3
+        snapshot.archetype_shares = {"Charizard ex": 0.15, "Lugia VSTAR": 0.12}
+        snapshot.card_usage = {
+            f"sv{snapshot_date.day}-{n}": {"inclusion_rate": 0.5, "avg_count": 2.0}
+            for n in range(card_count)
+        }
+        snapshot.sample_size = 100
+        snapshot.tournaments_included = []
+        snapshot.diversity_index = None
+        snapshot.tier_assignments = None
+        snapshot.jp_signals = None
+        snapshot.trends = None
+        snapshot.era_label = None
+        snapshot.tournament_type = "all"
+        return snapshot
+
+    @pytest.mark.query_budget(5)
+    def test_current_meta(self, client: TestClient, mock_db: AsyncMock) -> None:
+        """Snapshot, display overrides and three card lookups."""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = self._snapshot(date(2024, 1, 15), 40)
+        result.all.return_value = []
+        mock_db.execute.return_value = result
+        count_session_queries(mock_db)
+
+        response = client.get("/api/v1/meta/current")
+
+        assert response.status_code == 200
+        assert len(response.json()["card_usage"]) == 40
+
+    @pytest.mark.query_budget(5)
+    def test_meta_history(self, client: TestClient, mock_db: AsyncMock) -> None:
+        """Snapshots, display overrides and three card lookups for all of them."""
+        snapshots = [self._snapshot(date(2024, 1, day), 20) for day in range(1, 13)]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = snapshots
+        result.all.return_value = []
+        mock_db.execute.return_value = result
+        count_session_queries(mock_db)
+
+        response = client.get("/api/v1/meta/history")
+
+        assert response.status_code == 200
+        assert len(response.json()["snapshots"]) == 12
+
+    @pytest.mark.query_budget(7)
+    def test_archetype_detail(self, client: TestClient, mock_db: AsyncMock) -> None:
+        """Series, key cards, placements, three card lookups and tournaments."""
+        placements = []
+        for n in range(10):
+            placement = MagicMock(spec=TournamentPlacement)
+            placement.id = uuid4()
+            placement.tournament_id = uuid4()
+            placement.archetype = "Charizard ex"
+            placement.placement = n + 1
+            placement.player_name = f"Player {n}"
+            placement.decklist = [{"card_id": f"sv4-{n}", "quantity": 4}]
+            placements.append(placement)
+        key_cards = [
+            {"card_id": f"sv3-{n}", "inclusion_rate": 0.5, "avg_copies": 2.0}
+            for n in range(30)
+        ]
+        tournaments = MagicMock()
+        tournaments.scalars.return_value.all.return_value = []
+        no_matches = MagicMock()
+        no_matches.all.return_value = []
+        mock_db.execute.side_effect = [
+            TestGetArchetypeDetail._series((date(2024, 1, 15), 0.15, 100)),
+            TestGetArchetypeDetail._key_cards(key_cards),
+            TestGetArchetypeDetail._placements(*placements),
+            no_matches,
+            no_matches,
+            no_matches,
+            tournaments,
+        ]
+        count_session_queries(mock_db)
+
+        response = client.get("/api/v1/meta/archetypes/Charizard%20ex")
+
+        assert response.status_code == 200
+        assert len(response.json()["key_cards"]) == 30
@@ -8,7 +8,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import ArchetypeSprite, MetaSnapshot
-from src.services.meta_service import MetaService
+from src.services.meta_service import MetaService, build_jp_comparison
 
 
 def _make_snapshot(
@@ -42,6 +42,16 @@ def _make_snapshot(
     return snap
 
 
+def _comparison(jp_snap: MetaSnapshot | None, en_snap: MetaSnapshot):
+    return build_jp_comparison(
+        jp_snap,
+        en_snap,
+        snapshot_date=en_snap.snapshot_date,
+        game_format="standard",
+        tournament_type="all",
+    )
+
+
 @pytest.fixture
 def mock_session():
     return AsyncMock(spec=AsyncSession)
@@ -136,7 +146,9 @@ class TestComputeMetaComparison:
             tier_assignments={"Charizard ex": "S", "Lugia VSTAR": "A"},
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, global_snap])
+        service.get_jp_comparison = AsyncMock(
+            return_value=_comparison(jp_snap, global_snap)
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(region_a="JP", top_n=10)
@@ -167,8 +179,9 @@ class TestComputeMetaComparison:
             sample_size=180,
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, global_snap])
-        service._get_latest_snapshot_before = AsyncMock(return_value=lagged_jp)
+        current = _comparison(jp_snap, global_snap)
+        lagged = _comparison(lagged_jp, global_snap)
+        service.get_jp_comparison = AsyncMock(side_effect=[current, lagged])
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(
@@ -180,11 +193,51 @@ class TestComputeMetaComparison:
 
     @pytest.mark.asyncio
     async def test_missing_region_raises(self, service):
-        service._get_latest_snapshot = AsyncMock(side_effect=[None, _make_snapshot()])
+        service.get_jp_comparison = AsyncMock(return_value=None)
 
         with pytest.raises(ValueError, match="No snapshot data"):
             await service.compute_meta_comparison(region_a="JP")
 
+    @pytest.mark.asyncio
+    async def test_missing_jp_side_raises(self, service):
+        service.get_jp_comparison = AsyncMock(
+            side_effect=[None, _comparison(None, _make_snapshot())]
+        )
+
+        with pytest.raises(ValueError, match="No snapshot data for: JP"):
+            await service.compute_meta_comparison(region_a="JP")
+
+    @pytest.mark.asyncio
+    async def test_uses_latest_comparison_with_jp_side(self, service):
+        older = date.today() - timedelta(days=7)
+        comparison = _comparison(
+            _make_snapshot(region="JP", best_of=1, snapshot_date=older),
+            _make_snapshot(snapshot_date=older),
+        )
+        service.get_jp_comparison = AsyncMock(return_value=comparison)
+        service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
+
+        result = await service.compute_meta_comparison(region_a="JP")
+
+        assert result.region_a_snapshot_date == older
+        service.get_jp_comparison.assert_awaited_once_with(
+            game_format="standard", min_jp_sample_size=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_other_regions_compare_snapshots(self, service):
+        na_snap = _make_snapshot(region="NA", archetype_shares={"Deck A": 0.3})
+        global_snap = _make_snapshot(archetype_shares={"Deck A": 0.2})
+
+        service.get_jp_comparison = AsyncMock()
+        service._get_latest_snapshot = AsyncMock(side_effect=[na_snap, global_snap])
+        service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
+
+        result = await service.compute_meta_comparison(region_a="NA")
+
+        assert result.comparisons[0].divergence == 0.1
+        service.get_jp_comparison.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_comparison_divergence_sign(self, service):
         jp_snap = _make_snapshot(
@@ -198,7 +251,9 @@ class TestComputeMetaComparison:
             archetype_shares={"Deck A": 0.10, "Deck B": 0.15},
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, en_snap])
+        service.get_jp_comparison = AsyncMock(
+            return_value=_comparison(jp_snap, en_snap)
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(region_a="JP", top_n=10)
@@ -221,7 +276,9 @@ class TestComputeMetaComparison:
             archetype_shares={"EN Deck": 0.12},
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, en_snap])
+        service.get_jp_comparison = AsyncMock(
+            return_value=_comparison(jp_snap, en_snap)
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(region_a="JP", top_n=10)
@@ -245,7 +302,9 @@ class TestComputeMetaComparison:
             archetype_shares={"EN Only": 0.15},
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, en_snap])
+        service.get_jp_comparison = AsyncMock(
+            return_value=_comparison(jp_snap, en_snap)
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(region_a="JP", top_n=10)
@@ -275,7 +334,9 @@ class TestComputeMetaComparison:
             },
         )
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, en_snap])
+        service.get_jp_comparison = AsyncMock(
+            return_value=_comparison(jp_snap, en_snap)
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(region_a="JP", top_n=1)
@@ -289,8 +350,9 @@ class TestComputeMetaComparison:
         jp_snap = _make_snapshot(region="JP", best_of=1, sample_size=200)
         en_snap = _make_snapshot(region=None, best_of=3, sample_size=300)
 
-        service._get_latest_snapshot = AsyncMock(side_effect=[jp_snap, en_snap])
-        service._get_latest_snapshot_before = AsyncMock(return_value=None)
+        service.get_jp_comparison = AsyncMock(
+            side_effect=[_comparison(jp_snap, en_snap), None]
+        )
         service._get_sprite_urls_for_archetypes = AsyncMock(return_value={})
 
         result = await service.compute_meta_comparison(
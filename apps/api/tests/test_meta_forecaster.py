@@ -0,0 +1,109 @@
+"""Tests for the statistical meta forecaster."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.services.meta_forecaster import (
+    PRIOR_ONLY_CONFIDENCE,
+    ShareObservation,
+    forecast_meta,
+    share_tier,
+)
+
+START = date(2026, 1, 3)
+
+
+def _history(
+    archetype: str,
+    shares: list[float],
+    conversion: float | None = 0.25,
+    field_size: int = 200,
+) -> list[ShareObservation]:
+    return [
+        ShareObservation(
+            archetype=archetype,
+            observed_on=START + timedelta(weeks=week),
+            meta_share=share,
+            top_cut_conversion=conversion,
+            deck_count=round(share * field_size),
+        )
+        for week, share in enumerate(shares)
+    ]
+
+
+class TestShareTier:
+    """Tests for share_tier."""
+
+    @pytest.mark.parametrize(
+        ("share", "tier"),
+        [(0.2, "S"), (0.1, "A"), (0.05, "B"), (0.02, "C"), (0.005, "Rogue")],
+    )
+    def test_thresholds(self, share: float, tier: str) -> None:
+        assert share_tier(share) == tier
+
+
+class TestForecastMeta:
+    """Tests for forecast_meta."""
+
+    def test_shares_are_normalized_and_ordered_by_trend(self) -> None:
+        observations = [
+            *_history("Rising", [0.05, 0.08, 0.11, 0.14]),
+            *_history("Falling", [0.20, 0.16, 0.12, 0.08]),
+            *_history("Flat", [0.10, 0.10, 0.10, 0.10]),
+        ]
+
+        forecasts = forecast_meta(observations)
+
+        assert sum(f.meta_share["mid"] for f in forecasts.values()) == pytest.approx(
+            1.0, abs=1e-3
+        )
+        assert forecasts["Rising"].trend > 0 > forecasts["Falling"].trend
+        rising, falling = forecasts["Rising"], forecasts["Falling"]
+        assert rising.meta_share["mid"] > falling.meta_share["mid"]
+
+    def test_range_brackets_mid(self) -> None:
+        forecasts = forecast_meta(_history("Deck", [0.1, 0.14, 0.09, 0.12]))
+
+        share = forecasts["Deck"].meta_share
+        assert share["low"] <= share["mid"] <= share["high"]
+
+    def test_prior_pulls_toward_meta_snapshot(self) -> None:
+        observations = [*_history("A", [0.5]), *_history("B", [0.5])]
+
+        without_prior = forecast_meta(observations)
+        with_prior = forecast_meta(observations, {"A": 0.9, "B": 0.1})
+
+        assert without_prior["A"].meta_share["mid"] == pytest.approx(0.5)
+        assert with_prior["A"].meta_share["mid"] > 0.5
+
+    def test_prior_only_archetype(self) -> None:
+        forecasts = forecast_meta([], {"Newcomer": 0.04, "Unknown": 0.2})
+
+        assert set(forecasts) == {"Newcomer"}
+        assert forecasts["Newcomer"].confidence == PRIOR_ONLY_CONFIDENCE
+        assert forecasts["Newcomer"].day2_rate is None
+        assert forecasts["Newcomer"].observations == 0
+
+    def test_day2_rate_shrinks_toward_field(self) -> None:
+        observations = [
+            *_history("Hot", [0.1, 0.1], conversion=0.6, field_size=50),
+            *_history("Cold", [0.3, 0.3], conversion=0.1, field_size=500),
+        ]
+
+        forecasts = forecast_meta(observations)
+
+        hot = forecasts["Hot"].day2_rate
+        assert hot is not None
+        assert 0.1 < hot["mid"] < 0.6
+
+    def test_confidence_grows_with_history(self) -> None:
+        short = forecast_meta(_history("Deck", [0.1]))["Deck"].confidence
+        long = forecast_meta(_history("Deck", [0.1] * 6))["Deck"].confidence
+
+        assert short < long
+
+    def test_is_deterministic(self) -> None:
+        observations = _history("Deck", [0.1, 0.12, 0.08])
+
+        assert forecast_meta(observations) == forecast_meta(list(observations))
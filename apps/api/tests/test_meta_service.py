@@ -6,13 +6,21 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.models import MetaSnapshot, Tournament, TournamentPlacement
 from src.services.meta_service import (
     GRASSROOTS_TIERS,
+    KEY_CARDS_LIMIT,
     OFFICIAL_TIERS,
+    ArchetypeKeyCardRollup,
     MetaService,
+    SnapshotContext,
+    build_jp_comparison,
+    jp_signals_from_comparison,
+    lagged_jp_comparison_entries,
+    snapshot_dependencies,
 )
 
 
@@ -554,6 +562,38 @@ class TestComputeMetaSnapshotAsync:
         assert snapshot.sample_size == 0
         assert snapshot.archetype_shares == {}
 
+    @pytest.mark.asyncio
+    async def test_placement_query_filters_denormalized_columns(
+        self, service: MetaService, mock_session: AsyncMock
+    ) -> None:
+        """Should bound placements by their own date, format and region."""
+        mock_tournament = MagicMock(spec=Tournament)
+        mock_tournament.id = uuid4()
+        mock_tournament.date = date(2024, 6, 15)
+
+        tournament_result = MagicMock()
+        tournament_result.scalars.return_value.all.return_value = [mock_tournament]
+
+        placement_result = MagicMock()
+        placement_result.scalars.return_value.all.return_value = []
+
+        mock_session.execute.side_effect = [tournament_result, placement_result]
+
+        await service.compute_meta_snapshot(
+            snapshot_date=date(2024, 6, 15),
+            region="NA",
+            game_format="standard",
+            best_of=3,
+        )
+
+        stmt = mock_session.execute.call_args_list[1].args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "tournament_placements.tournament_date >=" in sql
+        assert "tournament_placements.tournament_date <=" in sql
+        assert "tournament_placements.format =" in sql
+        assert "tournament_placements.best_of =" in sql
+        assert "tournament_placements.region =" in sql
+
     @pytest.mark.asyncio
     async def test_raises_on_tournament_query_error(
         self, service: MetaService, mock_session: AsyncMock
@@ -1771,3 +1811,488 @@ class TestTournamentTypeFiltering:
 
         assert snapshot.tournament_type == "grassroots"
         assert snapshot.sample_size == 0
+
+
+class TestSnapshotContext:
+    """Tests for in-memory snapshot reuse across a compute-meta run."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_session: AsyncMock) -> MetaService:
+        return MetaService(mock_session)
+
+    @staticmethod
+    def _snapshot(region: str | None, best_of: int, shares: dict) -> MetaSnapshot:
+        return MetaSnapshot(
+            id=uuid4(),
+            snapshot_date=date(2024, 6, 15),
+            region=region,
+            format="standard",
+            best_of=best_of,
+            tournament_type="all",
+            archetype_shares=shares,
+            sample_size=10,
+        )
+
+    def test_dependencies(self) -> None:
+        assert snapshot_dependencies(("JP", "standard", 1, "all")) == []
+        assert snapshot_dependencies((None, "standard", 3, "all")) == [
+            ("JP", "standard", 1, "all")
+        ]
+        assert snapshot_dependencies(("NA", "expanded", 3, "official")) == [
+            ("JP", "expanded", 1, "official"),
+            (None, "expanded", 3, "official"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_jp_signals_read_from_context(
+        self, service: MetaService, mock_session: AsyncMock
+    ) -> None:
+        context = SnapshotContext()
+        context.current[("JP", "standard", 1, "all")] = self._snapshot(
+            "JP", 1, {"A": 0.30}
+        )
+        context.current[(None, "standard", 3, "all")] = self._snapshot(
+            None, 3, {"A": 0.10}
+        )
+
+        signals = await service.compute_jp_signals(
+            snapshot_date=date(2024, 6, 15), context=context
+        )
+
+        assert signals is not None
+        assert signals["rising"] == ["A"]
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_jp_comparison_built_once_per_run(
+        self, service: MetaService, mock_session: AsyncMock
+    ) -> None:
+        context = SnapshotContext()
+        context.current[("JP", "standard", 1, "all")] = self._snapshot(
+            "JP", 1, {"A": 0.30}
+        )
+        context.current[(None, "standard", 3, "all")] = self._snapshot(
+            None, 3, {"A": 0.10}
+        )
+
+        for _ in range(2):
+            await service.compute_jp_signals(
+                snapshot_date=date(2024, 6, 15), context=context
+            )
+        comparison = context.jp_comparisons[(date(2024, 6, 15), "standard", "all")]
+        context.current.clear()
+        signals = await service.compute_jp_signals(
+            snapshot_date=date(2024, 6, 15), context=context
+        )
+
+        assert comparison is not None
+        assert comparison.archetypes[0]["divergence"] == 0.2
+        assert signals is not None
+        assert signals["rising"] == ["A"]
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_dependency_does_not_fall_back_to_db(
+        self, service: MetaService, mock_session: AsyncMock
+    ) -> None:
+        context = SnapshotContext()
+        context.current[("JP", "standard", 1, "all")] = None
+        context.current[(None, "standard", 3, "all")] = self._snapshot(
+            None, 3, {"A": 0.10}
+        )
+
+        signals = await service.compute_jp_signals(
+            snapshot_date=date(2024, 6, 15), context=context
+        )
+
+        assert signals is None
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_trends_use_prefetched_previous(
+        self, service: MetaService, mock_session: AsyncMock
+    ) -> None:
+        context = SnapshotContext(
+            previous={("NA", "standard", 3, "all"): self._snapshot("NA", 3, {"A": 0.1})}
+        )
+
+        trends = await service.compute_trends(
+            current_shares={"A": 0.2},
+            snapshot_date=date(2024, 6, 15),
+            region="NA",
+            game_format="standard",
+            best_of=3,
+            context=context,
+        )
+        missing = await service.compute_trends(
+            current_shares={"A": 0.2},
+            snapshot_date=date(2024, 6, 15),
+            region="EU",
+            game_format="standard",
+            best_of=3,
+            context=context,
+        )
+
+        assert trends is not None
+        assert trends["A"]["direction"] == "up"
+        assert missing is None
+        mock_session.execute.assert_not_called()
+
+
+class TestSaveSnapshotsBulk:
+    """Tests for the bulk ON CONFLICT snapshot upsert."""
+
+    @pytest.mark.asyncio
+    async def test_single_upsert_statement(self) -> None:
+        session = AsyncMock()
+        service = MetaService(session)
+        snapshots = [
+            MetaSnapshot(
+                id=uuid4(),
+                snapshot_date=date(2024, 6, 15),
+                region=region,
+                format="standard",
+                best_of=3,
+                tournament_type="all",
+                archetype_shares={"A": 1.0},
+                sample_size=5,
+            )
+            for region in (None, "NA")
+        ]
+
+        saved = await service.save_snapshots(snapshots)
+
+        assert saved == 2
+        stmt = session.execute.call_args_list[0].args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_meta_snapshot DO UPDATE" in sql
+        assert "updated_at = now()" in sql
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self) -> None:
+        session = AsyncMock()
+        assert await MetaService(session).save_snapshots([]) == 0
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = SQLAlchemyError("boom")
+        snapshot = MetaSnapshot(
+            id=uuid4(),
+            snapshot_date=date(2024, 6, 15),
+            region="NA",
+            format="standard",
+            best_of=3,
+            tournament_type="all",
+            archetype_shares={},
+            sample_size=1,
+        )
+
+        with pytest.raises(SQLAlchemyError):
+            await MetaService(session).save_snapshots([snapshot])
+        session.rollback.assert_awaited_once()
+
+
+class TestJPComparison:
+    """Tests for the shared JP vs global comparison."""
+
+    @staticmethod
+    def _snapshot(shares: dict, tiers: dict | None = None) -> MetaSnapshot:
+        snapshot = MagicMock(spec=MetaSnapshot)
+        snapshot.archetype_shares = shares
+        snapshot.tier_assignments = tiers
+        snapshot.sample_size = 100
+        return snapshot
+
+    def _build(self, jp: MetaSnapshot | None, en: MetaSnapshot):
+        return build_jp_comparison(
+            jp,
+            en,
+            snapshot_date=date(2024, 6, 15),
+            game_format="standard",
+            tournament_type="all",
+        )
+
+    def test_entries_ranked_and_rounded(self) -> None:
+        comparison = self._build(
+            self._snapshot({"A": 0.123456, "JP Only": 0.3, "Unknown": 0.5}, {"A": "A"}),
+            self._snapshot({"A": 0.2, "B": 0.05}, {"A": "S", "B": "B"}),
+        )
+
+        assert [e["archetype"] for e in comparison.archetypes] == [
+            "JP Only",
+            "A",
+            "B",
+        ]
+        assert comparison.archetypes[1] == {
+            "archetype": "A",
+            "jp_share": 0.1235,
+            "en_share": 0.2,
+            "divergence": -0.0765,
+            "jp_tier": "A",
+            "en_tier": "S",
+        }
+        assert comparison.archetypes[2]["jp_share"] is None
+        assert comparison.jp_sample_size == 100
+
+    def test_without_jp_snapshot(self) -> None:
+        comparison = self._build(None, self._snapshot({"A": 0.2}))
+
+        assert comparison.jp_sample_size == 0
+        assert comparison.archetypes[0]["jp_share"] is None
+        assert jp_signals_from_comparison(comparison) is None
+
+    def test_signals_sorted_by_divergence(self) -> None:
+        comparison = self._build(
+            self._snapshot({"A": 0.30, "B": 0.02, "C": 0.11}),
+            self._snapshot({"A": 0.20, "B": 0.20, "C": 0.10}),
+        )
+
+        signals = jp_signals_from_comparison(comparison)
+
+        assert signals is not None
+        assert signals["rising"] == ["A"]
+        assert signals["falling"] == ["B"]
+        assert [d["archetype"] for d in signals["divergent"]] == ["B", "A"]
+
+    def test_lagged_entries_pair_old_jp_with_current_global(self) -> None:
+        lagged = self._build(
+            self._snapshot({"A": 0.4}), self._snapshot({"A": 0.9, "Old": 0.1})
+        )
+        current = self._build(
+            self._snapshot({"A": 0.1}), self._snapshot({"A": 0.25, "B": 0.3})
+        )
+
+        entries = lagged_jp_comparison_entries(lagged, current)
+
+        by_name = {e["archetype"]: e for e in entries}
+        assert set(by_name) == {"A", "B"}
+        assert by_name["A"]["divergence"] == 0.15
+        assert by_name["B"]["jp_share"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_latest_comparison_filters(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        service = MetaService(session)
+
+        await service.get_jp_comparison(
+            on_or_before=date(2024, 6, 1), min_en_sample_size=50, min_jp_sample_size=1
+        )
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "jp_meta_comparisons.snapshot_date <=" in sql
+        assert "jp_meta_comparisons.en_sample_size >=" in sql
+        assert "jp_meta_comparisons.jp_sample_size >=" in sql
+        assert "ORDER BY jp_meta_comparisons.snapshot_date DESC" in sql
+
+
+class TestArchetypeKeyCards:
+    """Tests for the per-archetype key card rollup."""
+
+    @staticmethod
+    def _placement(archetype: str, decklist: list | None) -> MagicMock:
+        p = MagicMock(spec=TournamentPlacement)
+        p.archetype = archetype
+        p.decklist = decklist
+        return p
+
+    def test_rates_are_per_archetype(self) -> None:
+        placements = [
+            self._placement(
+                "A",
+                [
+                    {"card_id": "sv4-6", "quantity": 4},
+                    {"card_id": "sv3-1", "quantity": 2},
+                ],
+            ),
+            self._placement("A", [{"card_id": "sv4-6", "quantity": 3}]),
+            self._placement("B", [{"card_id": "sv3-1", "quantity": 1}]),
+            self._placement("A", None),
+        ]
+
+        rollups = MetaService(AsyncMock()).compute_archetype_key_cards(
+            placements, ["A", "B"]
+        )
+
+        assert rollups["A"].decklist_count == 2
+        assert rollups["A"].key_cards == [
+            {"card_id": "sv4-6", "inclusion_rate": 1.0, "avg_copies": 3.5},
+            {"card_id": "sv3-1", "inclusion_rate": 0.5, "avg_copies": 2.0},
+        ]
+        assert rollups["B"].key_cards == [
+            {"card_id": "sv3-1", "inclusion_rate": 1.0, "avg_copies": 1.0}
+        ]
+
+    def test_skips_malformed_entries_and_other_archetypes(self) -> None:
+        placements = [
+            self._placement(
+                "A",
+                [
+                    {"card_id": "sv4-6", "quantity": 4},
+                    "not_a_dict",
+                    {"quantity": 2},
+                    {"card_id": "sv3-1", "quantity": "invalid"},
+                    {"card_id": "sv3-2", "quantity": 0},
+                ],
+            ),
+            self._placement("Rogue", [{"card_id": "sv1-1", "quantity": 4}]),
+        ]
+
+        rollups = MetaService(AsyncMock()).compute_archetype_key_cards(
+            placements, ["A"]
+        )
+
+        assert list(rollups) == ["A"]
+        assert [c["card_id"] for c in rollups["A"].key_cards] == ["sv4-6"]
+
+    def test_limits_key_cards(self) -> None:
+        decklist = [
+            {"card_id": f"sv1-{i}", "quantity": 1} for i in range(KEY_CARDS_LIMIT + 5)
+        ]
+
+        rollups = MetaService(AsyncMock()).compute_archetype_key_cards(
+            [self._placement("A", decklist)], ["A"]
+        )
+
+        assert len(rollups["A"].key_cards) == KEY_CARDS_LIMIT
+
+    @pytest.mark.asyncio
+    async def test_compute_records_key_cards_in_context(self) -> None:
+        session = AsyncMock()
+        tournaments = []
+        placements = []
+        for _ in range(3):
+            t = MagicMock(spec=Tournament)
+            t.id = uuid4()
+            t.date = date(2024, 6, 15)
+            tournaments.append(t)
+            p = self._placement("A", [{"card_id": "sv4-6", "quantity": 4}])
+            p.tournament_id = t.id
+            placements.append(p)
+        tournament_result = MagicMock()
+        tournament_result.scalars.return_value.all.return_value = tournaments
+        placement_result = MagicMock()
+        placement_result.scalars.return_value.all.return_value = placements
+        session.execute.side_effect = [tournament_result, placement_result]
+        context = SnapshotContext()
+
+        await MetaService(session).compute_meta_snapshot(
+            snapshot_date=date(2024, 6, 15),
+            region="NA",
+            context=context,
+        )
+
+        rollup = context.key_cards[("NA", "standard", 3, "all")]["A"]
+        assert rollup.decklist_count == 3
+
+
+class TestSaveArchetypeRollups:
+    """Tests for the share series and key cards written with snapshots."""
+
+    @staticmethod
+    def _snapshot(region: str | None, shares: dict[str, float]) -> MetaSnapshot:
+        return MetaSnapshot(
+            id=uuid4(),
+            snapshot_date=date(2024, 6, 15),
+            region=region,
+            format="standard",
+            best_of=3,
+            tournament_type="all",
+            archetype_shares=shares,
+            sample_size=40,
+        )
+
+    @staticmethod
+    def _statements(session: AsyncMock) -> list[str]:
+        return [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in session.execute.call_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_writes_series_and_key_cards_before_commit(self) -> None:
+        session = AsyncMock()
+        snapshots = [
+            self._snapshot(None, {"A": 0.6, "B": 0.4}),
+            self._snapshot("NA", {"A": 1.0}),
+        ]
+        key_cards = {
+            (None, "standard", 3, "all"): {
+                "A": ArchetypeKeyCardRollup(
+                    decklist_count=3,
+                    key_cards=[
+                        {"card_id": "sv4-6", "inclusion_rate": 1.0, "avg_copies": 4}
+                    ],
+                )
+            }
+        }
+
+        await MetaService(session).save_snapshots(snapshots, key_cards=key_cards)
+
+        sql = self._statements(session)
+        assert len(sql) == 4
+        assert sql[1].startswith("DELETE FROM archetype_share_series")
+        assert "archetype_share_series.region IS NULL" in sql[1]
+        assert "ON CONFLICT ON CONSTRAINT uq_archetype_share_series" in sql[2]
+        series_rows = session.execute.call_args_list[2].args[0].compile().params
+        assert sum(1 for k in series_rows if k.startswith("archetype_m")) == 3
+        assert "ON CONFLICT ON CONSTRAINT uq_archetype_key_cards" in sql[3]
+        # Older rollups (e.g. from a backfill) never replace newer ones
+        assert "archetype_key_cards.snapshot_date <=" in sql[3]
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_without_key_cards_writes_series_only(self) -> None:
+        session = AsyncMock()
+
+        await MetaService(session).save_snapshots([self._snapshot("EU", {"A": 1.0})])
+
+        sql = self._statements(session)
+        assert len(sql) == 3
+        assert not any("archetype_key_cards" in statement for statement in sql)
+
+    @pytest.mark.asyncio
+    async def test_saves_jp_comparison_with_global_snapshot(self) -> None:
+        session = AsyncMock()
+        snapshots = [
+            self._snapshot(None, {"A": 1.0}),
+            self._snapshot("NA", {"A": 1.0}),
+        ]
+        comparison = build_jp_comparison(
+            None,
+            snapshots[0],
+            snapshot_date=date(2024, 6, 15),
+            game_format="standard",
+            tournament_type="all",
+        )
+
+        await MetaService(session).save_snapshots(
+            snapshots,
+            jp_comparisons={(date(2024, 6, 15), "standard", "all"): comparison},
+        )
+
+        sql = self._statements(session)
+        assert len(sql) == 4
+        assert "ON CONFLICT ON CONSTRAINT uq_jp_meta_comparison" in sql[3]
+        params = session.execute.call_args_list[3].args[0].compile().params
+        assert params["en_sample_size_m0"] == 40
+        assert "en_sample_size_m1" not in params
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_series(self, monkeypatch) -> None:
+        monkeypatch.setattr("src.services.meta_service.ROLLUP_UPSERT_CHUNK", 2)
+        session = AsyncMock()
+        shares = dict.fromkeys("ABCDE", 0.2)
+
+        await MetaService(session).save_snapshots([self._snapshot(None, shares)])
+
+        sql = self._statements(session)
+        assert sum("INSERT INTO archetype_share_series" in s for s in sql) == 3
@@ -0,0 +1,137 @@
+"""Tests for the process-wide archetype sprite index registry."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services import normalizer_registry
+from src.services.archetype_normalizer import SPRITE_ARCHETYPE_MAP
+from src.services.normalizer_registry import (
+    get_normalizer,
+    get_sprite_index,
+    invalidate_sprite_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry() -> Iterator[None]:
+    normalizer_registry.reset_sprite_index()
+    yield
+    normalizer_registry.reset_sprite_index()
+
+
+def _session(version: tuple, rows: list[tuple]) -> AsyncMock:
+    """Session answering the version query, then the sprite query."""
+    version_result = MagicMock()
+    version_result.one.return_value = version
+    rows_result = MagicMock()
+    rows_result.all.return_value = rows
+
+    async def execute(query):
+        sql = str(query)
+        return version_result if "count" in sql else rows_result
+
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.begin_nested = MagicMock()
+    return session
+
+
+class TestGetSpriteIndex:
+    @pytest.mark.asyncio
+    async def test_merges_db_overrides(self) -> None:
+        session = _session((1, "t1"), [("klawf", "Klawf ex", "Klawf Box")])
+
+        index = await get_sprite_index(session)
+
+        assert index.sprite_map["klawf"] == "Klawf Box"
+        assert index.sprite_map["charizard"] == SPRITE_ARCHETYPE_MAP["charizard"]
+        assert index.db_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reuses_index_within_interval(self) -> None:
+        session = _session((1, "t1"), [])
+
+        first = await get_sprite_index(session)
+        second = await get_sprite_index(session)
+
+        assert first is second
+        # One version check and one load; the second call issues no query
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_rechecks_but_keeps_unchanged_index(self) -> None:
+        session = _session((1, "t1"), [])
+        first = await get_sprite_index(session)
+
+        invalidate_sprite_index()
+        second = await get_sprite_index(session)
+
+        assert first is second
+        # Second lookup only rechecked the version stamp
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_when_version_changes(self) -> None:
+        first = await get_sprite_index(_session((1, "t1"), []))
+
+        invalidate_sprite_index()
+        second = await get_sprite_index(
+            _session((2, "t2"), [("klawf", "Klawf ex", None)])
+        )
+
+        assert second is not first
+        assert second.sprite_map["klawf"] == "Klawf ex"
+
+    @pytest.mark.asyncio
+    async def test_db_error_falls_back_to_static_map(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("no table")
+        session.begin_nested = MagicMock()
+
+        index = await get_sprite_index(session)
+
+        assert dict(index.sprite_map) == SPRITE_ARCHETYPE_MAP
+        # The failed load was rolled back to its savepoint
+        exit_args = session.begin_nested.return_value.__aexit__.await_args.args
+        assert isinstance(exit_args[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_db_error_backs_off_before_retrying(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("no table")
+        session.begin_nested = MagicMock()
+
+        await get_sprite_index(session)
+        index = await get_sprite_index(session)
+
+        assert dict(index.sprite_map) == SPRITE_ARCHETYPE_MAP
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_db_error_keeps_loaded_index(self) -> None:
+        loaded = await get_sprite_index(
+            _session((1, "t1"), [("klawf", "Klawf ex", None)])
+        )
+        invalidate_sprite_index()
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("timeout")
+        session.begin_nested = MagicMock()
+
+        assert await get_sprite_index(session) is loaded
+        assert await get_sprite_index(session) is loaded
+        assert session.execute.await_count == 1
+
+
+class TestGetNormalizer:
+    @pytest.mark.asyncio
+    async def test_uses_shared_index(self) -> None:
+        session = _session((3, "t3"), [("klawf", "Klawf ex", None)])
+        detector = MagicMock()
+
+        normalizer = await get_normalizer(session, detector)
+
+        assert normalizer.detector is detector
+        assert normalizer.sprite_map["klawf"] == "Klawf ex"
+        assert normalizer.sprite_version == "3:t3"
@@ -0,0 +1,204 @@
+"""Tests for pipeline run instrumentation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.services.pipeline_metrics import (
+    MAX_RECORDED_STEPS,
+    RunRecorder,
+    http_event_hooks,
+    pipeline_step,
+    track_pipeline,
+)
+from src.services.pipeline_resilience import with_timeout
+from src.services.query_profiler import profile_queries
+
+pytestmark = pytest.mark.usefixtures("no_engine_listeners")
+
+
+def _make_factory() -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    session.add = MagicMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+class TestPipelineStep:
+    """Tests for pipeline_step()."""
+
+    def test_noop_outside_run(self, run_query) -> None:
+        conn = MagicMock(info={})
+
+        with pipeline_step("orphan") as metrics:
+            run_query(conn)
+
+        assert metrics is None
+        assert "query_timing_started" not in conn.info
+
+    @pytest.mark.asyncio
+    async def test_queries_count_toward_step_and_run(self, run_query) -> None:
+        conn = MagicMock(info={})
+
+        async with track_pipeline("test", "run-1") as run:
+            run_query(conn)
+            with pipeline_step("load"):
+                run_query(conn)
+                run_query(conn)
+            with pipeline_step("save"):
+                run_query(conn)
+
+        steps = {s.name: s for s in run.steps}
+        assert steps["load"].db_queries == 2
+        assert steps["save"].db_queries == 1
+        assert run.totals.db_queries == 4
+        assert run.totals.status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_query_profile_shares_one_timing(self, run_query) -> None:
+        conn = MagicMock(info={})
+
+        async with track_pipeline("test", "run-1") as run:
+            with profile_queries() as profile:
+                run_query(conn)
+
+        assert run.totals.db_queries == profile.statements == 1
+        assert run.totals.db_seconds == profile.seconds
+        assert conn.info["query_timing_started"] == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_steps_are_attributed_separately(self, run_query) -> None:
+        conn = MagicMock(info={})
+
+        async def work(name: str, queries: int) -> None:
+            with pipeline_step(name):
+                for _ in range(queries):
+                    run_query(conn)
+                    await asyncio.sleep(0)
+
+        async with track_pipeline("test", "run-1") as run:
+            await asyncio.gather(work("a", 3), work("b", 1))
+
+        steps = {s.name: s for s in run.steps}
+        assert steps["a"].db_queries == 3
+        assert steps["b"].db_queries == 1
+        assert run.totals.db_queries == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_step_records_error(self) -> None:
+        async with track_pipeline("test", "run-1") as run:
+            with pytest.raises(ValueError, match="bad row"), pipeline_step("parse"):
+                raise ValueError("bad row")
+
+        assert run.steps[0].status == "error"
+        assert run.steps[0].error == "ValueError: bad row"
+        assert run.totals.status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_with_timeout_measures_named_step(self) -> None:
+        async def fetch() -> int:
+            return 1
+
+        async with track_pipeline("test", "run-1") as run:
+            await with_timeout(fetch(), 5, pipeline="test", step="fetch")
+
+        assert [s.name for s in run.steps] == ["fetch"]
+
+    def test_steps_beyond_limit_are_counted(self) -> None:
+        run = RunRecorder(pipeline="test", run_id="run-1")
+
+        for i in range(MAX_RECORDED_STEPS + 2):
+            with run.step(f"step-{i}"):
+                pass
+
+        assert len(run.steps) == MAX_RECORDED_STEPS
+        assert run.steps_dropped == 2
+
+
+class TestHttpHooks:
+    """Tests for the httpx response hook."""
+
+    @pytest.mark.asyncio
+    async def test_counts_requests_and_bytes(self) -> None:
+        transport = httpx.MockTransport(
+            lambda _: httpx.Response(200, content=b"x" * 10)
+        )
+
+        async with (
+            track_pipeline("test", "run-1") as run,
+            httpx.AsyncClient(
+                transport=transport, event_hooks=http_event_hooks()
+            ) as client,
+        ):
+            with pipeline_step("fetch"):
+                await client.get("https://example.com/a")
+                await client.get("https://example.com/b")
+
+        assert run.steps[0].http_requests == 2
+        assert run.steps[0].http_bytes == 20
+        assert run.totals.http_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_ignored_outside_run(self) -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, content=b"ok"))
+
+        async with httpx.AsyncClient(
+            transport=transport, event_hooks=http_event_hooks()
+        ) as client:
+            response = await client.get("https://example.com/")
+
+        assert response.content == b"ok"
+
+
+class TestTrackPipeline:
+    """Tests for track_pipeline()."""
+
+    @pytest.mark.asyncio
+    async def test_saves_run(self) -> None:
+        factory, session = _make_factory()
+
+        async with track_pipeline("compute-meta", "run-1", factory):
+            with pipeline_step("compute"):
+                pass
+
+        saved = session.add.call_args[0][0]
+        assert saved.run_id == "run-1"
+        assert saved.pipeline == "compute-meta"
+        assert saved.status == "ok"
+        assert saved.steps[0]["name"] == "compute"
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_saves_failed_run_and_reraises(self) -> None:
+        factory, session = _make_factory()
+
+        with pytest.raises(RuntimeError):
+            async with track_pipeline("compute-meta", "run-1", factory):
+                raise RuntimeError("db down")
+
+        saved = session.add.call_args[0][0]
+        assert saved.status == "error"
+        assert saved.error == "RuntimeError: db down"
+
+    @pytest.mark.asyncio
+    async def test_handled_failure_marks_run(self) -> None:
+        factory, session = _make_factory()
+
+        async with track_pipeline("compute-evolution", "run-1", factory) as run:
+            run.fail("Claude API error: timeout")
+
+        saved = session.add.call_args[0][0]
+        assert saved.status == "error"
+        assert saved.error == "Claude API error: timeout"
+
+    @pytest.mark.asyncio
+    async def test_save_failure_does_not_raise(self) -> None:
+        factory, session = _make_factory()
+        session.commit = AsyncMock(side_effect=Exception("no table"))
+
+        async with track_pipeline("compute-meta", "run-1", factory):
+            pass
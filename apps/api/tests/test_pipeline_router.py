@@ -317,8 +317,18 @@ class TestComputeMetaEndpoint:
                 snapshot_date=None,
                 dry_run=True,
                 lookback_days=90,
+                concurrency=1,
             )
 
+    def test_compute_meta_validates_concurrency(self, client: TestClient) -> None:
+        """Should validate concurrency range (1-8)."""
+        response = client.post(
+            "/api/v1/pipeline/compute-meta",
+            json={"concurrency": 9},
+        )
+
+        assert response.status_code == 422
+
     def test_compute_meta_validates_lookback(self, client: TestClient) -> None:
         """Should validate lookback_days range (7-365)."""
         response = client.post(
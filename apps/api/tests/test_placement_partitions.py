@@ -0,0 +1,143 @@
+"""Tests for monthly tournament_placements partition helpers."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+
+from src.services.placement_partitions import (
+    drop_month_partitions,
+    ensure_month_partitions,
+    list_month_partitions,
+    partition_name,
+)
+
+
+def _session(
+    partition_names: list[str], results: list[object] | None = None
+) -> AsyncMock:
+    """Session listing ``partition_names``, then returning ``results``."""
+    listed = MagicMock()
+    listed.scalars.return_value.all.return_value = partition_names
+    if results is None:
+        results = [MagicMock() for _ in range(100)]
+    session = AsyncMock()
+    session.execute.side_effect = [listed, *results]
+    session.begin_nested = MagicMock()
+    return session
+
+
+def _count(rows: int) -> MagicMock:
+    counted = MagicMock()
+    counted.scalar.return_value = rows
+    return counted
+
+
+def _statements(session: AsyncMock) -> list[str]:
+    return [str(c.args[0]) for c in session.execute.await_args_list[1:]]
+
+
+def test_partition_name() -> None:
+    assert partition_name(date(2026, 3, 17)) == "tournament_placements_p202603"
+
+
+@pytest.mark.asyncio
+async def test_lists_month_partitions_ignoring_default() -> None:
+    session = _session(
+        [
+            "tournament_placements_p202602",
+            "tournament_placements_default",
+            "tournament_placements_p202512",
+        ]
+    )
+
+    assert await list_month_partitions(session) == [
+        date(2025, 12, 1),
+        date(2026, 2, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drops_only_months_wholly_before_cutoff() -> None:
+    session = _session(
+        [
+            "tournament_placements_p202512",
+            "tournament_placements_p202601",
+            "tournament_placements_p202602",
+        ],
+        [MagicMock(), _count(120), MagicMock(), _count(80), MagicMock(), MagicMock()],
+    )
+
+    dropped = await drop_month_partitions(session, date(2026, 2, 15))
+
+    assert dropped == {
+        "tournament_placements_p202512": 120,
+        "tournament_placements_p202601": 80,
+    }
+    assert _statements(session) == [
+        "SET LOCAL lock_timeout = '2s'",
+        "SELECT count(*) FROM tournament_placements_p202512",
+        "DROP TABLE tournament_placements_p202512",
+        "SELECT count(*) FROM tournament_placements_p202601",
+        "DROP TABLE tournament_placements_p202601",
+        "SET LOCAL lock_timeout TO DEFAULT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stops_dropping_when_parent_lock_times_out() -> None:
+    lock_error = DBAPIError("DROP TABLE", None, MagicMock(sqlstate="55P03"))
+    session = _session(
+        ["tournament_placements_p202512", "tournament_placements_p202601"],
+        [MagicMock(), _count(120), lock_error, MagicMock()],
+    )
+
+    dropped = await drop_month_partitions(session, date(2026, 2, 15))
+
+    assert dropped == {}
+    statements = _statements(session)
+    assert statements[-1] == "SET LOCAL lock_timeout TO DEFAULT"
+    assert not any("p202601" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_other_drop_errors_propagate() -> None:
+    error = DBAPIError("DROP TABLE", None, MagicMock(sqlstate="42501"))
+    session = _session(
+        ["tournament_placements_p202512"], [MagicMock(), _count(1), error]
+    )
+
+    with pytest.raises(DBAPIError):
+        await drop_month_partitions(session, date(2026, 2, 15))
+
+
+@pytest.mark.asyncio
+async def test_unpartitioned_table_is_left_alone() -> None:
+    session = _session([])
+
+    assert await drop_month_partitions(session, date(2026, 2, 1)) == {}
+    assert await ensure_month_partitions(_session([]), date(2027, 1, 1)) == []
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_creates_missing_months_moving_default_rows() -> None:
+    session = _session(["tournament_placements_p202611"])
+
+    created = await ensure_month_partitions(session, date(2027, 1, 20))
+
+    assert created == ["tournament_placements_p202612", "tournament_placements_p202701"]
+    statements = _statements(session)
+    assert len(statements) == 8
+    assert statements[0].startswith("CREATE TABLE tournament_placements_p202612")
+    assert "FROM tournament_placements_default" in statements[1]
+    assert statements[2].startswith("DELETE FROM tournament_placements_default")
+    assert statements[3].endswith(
+        "ATTACH PARTITION tournament_placements_p202612 "
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+    )
+    assert session.execute.await_args_list[2].args[1] == {
+        "start": date(2026, 12, 1),
+        "end": date(2027, 1, 1),
+    }
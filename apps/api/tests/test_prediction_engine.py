@@ -11,6 +11,7 @@ from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
 from src.models.archetype_prediction import ArchetypePrediction
 from src.models.meta_snapshot import MetaSnapshot
 from src.models.tournament import Tournament
+from src.services.meta_forecaster import ArchetypeForecast
 from src.services.prediction_engine import (
     PredictionEngine,
     PredictionEngineError,
@@ -185,6 +186,99 @@ class TestPredict:
         call_args = mock_claude.classify.call_args
         assert "Gardevoir ex" in call_args.kwargs["user"]
 
+    @pytest.mark.asyncio
+    async def test_forecast_keeps_numbers_and_asks_for_narrative(
+        self,
+        engine: PredictionEngine,
+        mock_session: AsyncMock,
+        mock_claude: AsyncMock,
+    ) -> None:
+        """Should take numbers from the forecast and narrative from Claude."""
+        tournament = _make_tournament()
+        forecast = ArchetypeForecast(
+            archetype="Charizard ex",
+            meta_share={"low": 0.1, "mid": 0.13, "high": 0.16},
+            day2_rate={"low": 0.2, "mid": 0.3, "high": 0.4},
+            tier="A",
+            confidence=0.6,
+            observations=4,
+            trend=0.01,
+        )
+        mock_claude.classify.return_value = {
+            "predicted_tier": "S",  # ignored
+            "likely_adaptations": [{"type": "tech", "description": "Add Drapion V"}],
+            "methodology": "Rising on the back of new support.",
+        }
+        mock_session.execute.side_effect = [
+            _make_execute_result(scalars_all=[]),
+            _make_execute_result(scalar_one_or_none=tournament),
+            _make_execute_result(scalar_one_or_none=None),
+            _make_execute_result(scalars_all=[]),
+        ]
+
+        prediction = await engine.predict(
+            "Charizard ex", tournament.id, forecast=forecast
+        )
+
+        assert prediction.predicted_tier == "A"
+        assert prediction.predicted_meta_share == forecast.meta_share
+        assert prediction.baseline_meta_share == 0.13
+        assert prediction.confidence == 0.6
+        assert prediction.methodology == "Rising on the back of new support."
+        assert prediction.likely_adaptations is not None
+        assert "baseline_forecast" in mock_claude.classify.call_args.kwargs["user"]
+
+
+class TestForecast:
+    """Tests for the statistical fast path."""
+
+    @pytest.mark.asyncio
+    async def test_forecasts_all_archetypes_from_one_query(self) -> None:
+        """Should forecast every archetype from one history query."""
+        session = AsyncMock()
+        history = MagicMock()
+        history.all.return_value = [
+            ("Charizard ex", date(2026, 2, 1), 0.10, 0.3, 20),
+            ("Charizard ex", date(2026, 2, 8), 0.14, 0.35, 28),
+            ("Gardevoir ex", date(2026, 2, 8), 0.06, 0.2, 12),
+        ]
+        meta_snapshot = MagicMock(spec=MetaSnapshot)
+        meta_snapshot.archetype_shares = {"Charizard ex": 0.12, "Raging Bolt ex": 0.05}
+        session.execute.side_effect = [
+            history,
+            _make_execute_result(scalar_one_or_none=meta_snapshot),
+        ]
+        engine = PredictionEngine(session, AsyncMock())
+
+        forecasts = await engine.forecast(date(2026, 3, 1))
+
+        assert set(forecasts) == {"Charizard ex", "Gardevoir ex", "Raging Bolt ex"}
+        assert forecasts["Charizard ex"].observations == 2
+        assert session.execute.await_count == 2
+
+    def test_baseline_prediction(self) -> None:
+        """Should build a Claude-free prediction from a forecast."""
+        forecast = ArchetypeForecast(
+            archetype="Gardevoir ex",
+            meta_share={"low": 0.04, "mid": 0.06, "high": 0.08},
+            day2_rate=None,
+            tier="B",
+            confidence=0.5,
+            observations=3,
+            trend=-0.01,
+        )
+        tournament_id = uuid4()
+
+        prediction = PredictionEngine.baseline_prediction(
+            "Gardevoir ex", tournament_id, forecast
+        )
+
+        assert prediction.target_tournament_id == tournament_id
+        assert prediction.predicted_tier == "B"
+        assert prediction.baseline_meta_share == 0.06
+        assert prediction.methodology is not None
+        assert "falling" in prediction.methodology
+
 
 class TestScorePrediction:
     """Tests for post-event scoring."""
@@ -218,6 +312,7 @@ class TestScorePrediction:
             "mid": 0.12,
             "high": 0.16,
         }
+        prediction.baseline_meta_share = 0.10
 
         snapshot = MagicMock(spec=ArchetypeEvolutionSnapshot)
         snapshot.meta_share = 0.11  # Close to mid=0.12
@@ -233,6 +328,7 @@ class TestScorePrediction:
         # Error = |0.11 - 0.12| / 0.12 = 0.0833...
         # Accuracy = 1 - 0.0833 = 0.9167
         assert prediction.accuracy_score == round(1.0 - abs(0.11 - 0.12) / 0.12, 4)
+        assert prediction.baseline_accuracy_score == 0.9
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -0,0 +1,118 @@
+"""Tests for batch prediction scoring and accuracy rollups."""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.prediction_scoring import (
+    accuracy_score,
+    rebuild_accuracy_rollups,
+    score_completed_predictions,
+)
+
+
+def _pending(tournament_id, archetype: str, mid: float | None, baseline=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        archetype_id=archetype,
+        target_tournament_id=tournament_id,
+        predicted_meta_share={"mid": mid} if mid is not None else None,
+        baseline_meta_share=baseline,
+    )
+
+
+def _result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestAccuracyScore:
+    """Tests for accuracy_score."""
+
+    def test_exact_prediction(self) -> None:
+        assert accuracy_score(0.1, 0.1) == 1.0
+
+    def test_relative_error(self) -> None:
+        assert accuracy_score(0.1, 0.12) == 0.8
+
+    def test_floored_at_zero(self) -> None:
+        assert accuracy_score(0.1, 0.5) == 0
+
+    def test_no_score_for_zero_prediction(self) -> None:
+        assert accuracy_score(0.0, 0.1) is None
+
+
+class TestScoreCompletedPredictions:
+    """Tests for score_completed_predictions."""
+
+    @pytest.mark.asyncio
+    async def test_scores_against_placements_in_one_update(self) -> None:
+        played, awaiting = uuid4(), uuid4()
+        charizard = _pending(played, "Charizard ex", 0.5, baseline=0.4)
+        absent = _pending(played, "Gardevoir ex", 0.1)
+        unplayed = _pending(awaiting, "Charizard ex", 0.2)
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result([charizard, absent, unplayed]),
+            _result([(played, "Charizard ex", 4), (played, "Dragapult ex", 6)]),
+            MagicMock(),
+        ]
+
+        scored, tournaments = await score_completed_predictions(
+            session, today=date(2026, 3, 1)
+        )
+
+        assert (scored, tournaments) == (2, 1)
+        assert session.execute.await_count == 3
+        updates = {u["id"]: u for u in session.execute.await_args.args[1]}
+        assert set(updates) == {charizard.id, absent.id}
+        assert updates[charizard.id]["actual_meta_share"] == 0.4
+        assert updates[charizard.id]["accuracy_score"] == 0.8
+        assert updates[charizard.id]["baseline_accuracy_score"] == 1.0
+        assert updates[absent.id]["actual_meta_share"] == 0.0
+        assert updates[absent.id]["accuracy_score"] == 0
+        assert updates[absent.id]["baseline_accuracy_score"] is None
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = _result([])
+
+        assert await score_completed_predictions(session) == (0, 0)
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_update_without_placements(self) -> None:
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result([_pending(uuid4(), "Charizard ex", 0.2)]),
+            _result([]),
+        ]
+
+        assert await score_completed_predictions(session) == (0, 0)
+        assert session.execute.await_count == 2
+
+
+class TestRebuildAccuracyRollups:
+    """Tests for rebuild_accuracy_rollups."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_rollups_with_grouping_sets(self) -> None:
+        session = AsyncMock()
+        inserted = MagicMock()
+        inserted.all.return_value = [(uuid4(),) for _ in range(7)]
+        session.execute.side_effect = [MagicMock(), inserted]
+
+        assert await rebuild_accuracy_rollups(session) == 7
+
+        delete_stmt = session.execute.await_args_list[0].args[0]
+        insert_stmt = session.execute.await_args_list[1].args[0]
+        assert str(delete_stmt).startswith("DELETE FROM prediction_accuracy_rollups")
+        sql = str(insert_stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO prediction_accuracy_rollups")
+        assert "GROUP BY GROUPING SETS(" in sql
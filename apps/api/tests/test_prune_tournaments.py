@@ -1,15 +1,21 @@
 """Tests for the prune_tournaments pipeline."""
 
+import gzip
+import json
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
 from src.pipelines.prune_tournaments import (
     PruneTournamentsResult,
+    archive_blob_path,
     prune_tournaments,
 )
 
+MODULE = "src.pipelines.prune_tournaments"
+
 
 def _make_scalar_result(value: int) -> MagicMock:
     result = MagicMock()
@@ -17,6 +23,43 @@ def _make_scalar_result(value: int) -> MagicMock:
     return result
 
 
+def _make_rows_result(rows: list[dict]) -> MagicMock:
+    result = MagicMock()
+    result.mappings.return_value = rows
+    return result
+
+
+def _make_returning_result(count: int) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = [(uuid4(),) for _ in range(count)]
+    return result
+
+
+def _tournaments(count: int, day: date = date(2023, 5, 1)) -> list[dict]:
+    return [{"id": uuid4(), "date": day, "region": "NA"} for _ in range(count)]
+
+
+def _batch(tournaments: list[dict], placements: int) -> list[MagicMock]:
+    """Results for one un-archived batch: select, delete placements, delete."""
+    return [
+        _make_rows_result(tournaments),
+        _make_returning_result(placements),
+        MagicMock(),
+    ]
+
+
+@pytest.fixture(autouse=True)
+def partitions():
+    """Placement partition helpers; unpartitioned unless a test says so."""
+    with (
+        patch(f"{MODULE}.drop_month_partitions", AsyncMock(return_value={})) as drop,
+        patch(
+            f"{MODULE}.ensure_month_partitions", AsyncMock(return_value=[])
+        ) as ensure,
+    ):
+        yield drop, ensure
+
+
 def _mock_session_factory(mock_session: AsyncMock) -> MagicMock:
     mock_ctx = AsyncMock()
     mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
@@ -24,6 +67,20 @@ def _mock_session_factory(mock_session: AsyncMock) -> MagicMock:
     return mock_ctx
 
 
+def _session(results: list[MagicMock]) -> AsyncMock:
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(side_effect=results)
+    return mock_session
+
+
+async def _prune(mock_session: AsyncMock, **kwargs) -> PruneTournamentsResult:
+    with patch(
+        f"{MODULE}.async_session_factory",
+        return_value=_mock_session_factory(mock_session),
+    ):
+        return await prune_tournaments(**kwargs)
+
+
 class TestPruneTournamentsResult:
     def test_successful_result(self) -> None:
         r = PruneTournamentsResult(
@@ -35,6 +92,7 @@ class TestPruneTournamentsResult:
         )
         assert r.success is True
         assert r.tournaments_deleted == 5
+        assert r.completed is True
 
     def test_failed_result(self) -> None:
         r = PruneTournamentsResult(
@@ -52,169 +110,258 @@ class TestPruneDryRun:
 
     @pytest.mark.asyncio
     async def test_dry_run_reports_counts(self) -> None:
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(
-            side_effect=[
+        mock_session = _session(
+            [
                 _make_scalar_result(10),  # tournaments to delete
                 _make_scalar_result(80),  # placements to delete
                 _make_scalar_result(50),  # total tournaments
             ]
         )
 
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2024, 1, 1), dry_run=True)
+        result = await _prune(mock_session, before_date=date(2024, 1, 1), dry_run=True)
 
         assert result.success is True
         assert result.tournaments_deleted == 0
         assert result.placements_deleted == 0
         assert result.tournaments_remaining == 40  # 50 - 10
-
-    @pytest.mark.asyncio
-    async def test_dry_run_never_commits(self) -> None:
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(
-            side_effect=[
-                _make_scalar_result(5),
-                _make_scalar_result(25),
-                _make_scalar_result(20),
-            ]
-        )
-
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            await prune_tournaments(before_date=date(2024, 1, 1), dry_run=True)
-
         mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_dry_run_with_region_filter(self) -> None:
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(
-            side_effect=[
+        mock_session = _session(
+            [
                 _make_scalar_result(3),  # JP tournaments to delete
                 _make_scalar_result(30),  # JP placements to delete
                 _make_scalar_result(10),  # total JP tournaments
             ]
         )
 
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(
-                before_date=date(2024, 6, 1),
-                region="JP",
-                dry_run=True,
-            )
+        result = await _prune(
+            mock_session, before_date=date(2024, 6, 1), region="JP", dry_run=True
+        )
 
         assert result.success is True
         assert result.tournaments_remaining == 7  # 10 - 3
 
+    @pytest.mark.asyncio
+    async def test_dry_run_leaves_partitions(self, partitions) -> None:
+        drop, ensure = partitions
+        mock_session = _session(
+            [_make_scalar_result(5), _make_scalar_result(40), _make_scalar_result(20)]
+        )
+
+        await _prune(mock_session, before_date=date(2024, 3, 15), dry_run=True)
+
+        drop.assert_not_awaited()
+        ensure.assert_not_awaited()
 
-class TestPruneExecution:
-    """Normal execution deletes tournaments and placements."""
+
+class TestPruneBatches:
+    """Tournaments are deleted in committed batches until none match."""
 
     @pytest.mark.asyncio
-    async def test_deletes_tournaments_and_placements(self) -> None:
-        mock_session = AsyncMock()
+    async def test_deletes_in_batches_committing_each(self) -> None:
+        mock_session = _session(
+            [
+                *_batch(_tournaments(2), 16),
+                *_batch(_tournaments(1), 8),
+                _make_rows_result([]),  # nothing left
+                _make_scalar_result(20),  # remaining
+            ]
+        )
 
-        call_count = 0
-
-        async def execute_side_effect(stmt):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _make_scalar_result(5)  # tournaments count
-            if call_count == 2:
-                return _make_scalar_result(40)  # placements count
-            if call_count == 3:
-                return MagicMock()  # delete placements
-            if call_count == 4:
-                return MagicMock()  # delete tournaments
-            return _make_scalar_result(20)  # remaining
-
-        mock_session.execute = AsyncMock(side_effect=execute_side_effect)
-
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2024, 1, 1))
+        result = await _prune(mock_session, before_date=date(2024, 1, 1), batch_size=2)
 
         assert result.success is True
-        assert result.tournaments_deleted == 5
-        assert result.placements_deleted == 40
+        assert result.completed is True
+        assert result.batches == 2
+        assert result.tournaments_deleted == 3
+        assert result.placements_deleted == 24
         assert result.tournaments_remaining == 20
-        mock_session.commit.assert_called_once()
+        # One commit per batch, one after partitions are dropped, one final
+        assert mock_session.commit.await_count == 4
 
     @pytest.mark.asyncio
-    async def test_with_region_filter(self) -> None:
-        mock_session = AsyncMock()
+    async def test_batch_statements_are_bounded(self) -> None:
+        mock_session = _session(
+            [
+                *_batch(_tournaments(2), 16),
+                _make_rows_result([]),
+                _make_scalar_result(0),
+            ]
+        )
 
-        call_count = 0
-
-        async def execute_side_effect(stmt):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _make_scalar_result(2)  # JP tournaments
-            if call_count == 2:
-                return _make_scalar_result(16)  # JP placements
-            if call_count == 3:
-                return MagicMock()  # delete placements
-            if call_count == 4:
-                return MagicMock()  # delete tournaments
-            return _make_scalar_result(8)  # remaining JP
-
-        mock_session.execute = AsyncMock(side_effect=execute_side_effect)
-
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2024, 1, 1), region="JP")
+        await _prune(
+            mock_session, before_date=date(2024, 1, 1), region="JP", batch_size=2
+        )
 
-        assert result.success is True
-        assert result.tournaments_deleted == 2
-        assert result.placements_deleted == 16
+        select_stmt, delete_placements, delete_tournaments = (
+            str(c.args[0]) for c in mock_session.execute.await_args_list[:3]
+        )
+        assert "ORDER BY tournaments.date, tournaments.id" in select_stmt
+        assert "LIMIT" in select_stmt
+        assert "tournaments.region =" in select_stmt
+        assert "tournament_placements.tournament_id IN" in delete_placements
+        assert "tournament_placements.tournament_date <" in delete_placements
+        assert "RETURNING tournament_placements.id" in delete_placements
+        assert "tournaments.id IN" in delete_tournaments
 
     @pytest.mark.asyncio
     async def test_nothing_to_prune(self) -> None:
-        mock_session = AsyncMock()
+        mock_session = _session([_make_rows_result([]), _make_scalar_result(50)])
 
-        call_count = 0
-
-        async def execute_side_effect(stmt):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _make_scalar_result(0)  # no tournaments
-            if call_count == 2:
-                return _make_scalar_result(0)  # no placements
-            if call_count == 3:
-                return MagicMock()  # delete placements (noop)
-            if call_count == 4:
-                return MagicMock()  # delete tournaments (noop)
-            return _make_scalar_result(50)  # all remaining
-
-        mock_session.execute = AsyncMock(side_effect=execute_side_effect)
-
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2020, 1, 1))
+        result = await _prune(mock_session, before_date=date(2020, 1, 1))
 
         assert result.success is True
+        assert result.completed is True
         assert result.tournaments_deleted == 0
         assert result.placements_deleted == 0
         assert result.tournaments_remaining == 50
 
+    @pytest.mark.asyncio
+    async def test_time_budget_stops_between_batches(self) -> None:
+        mock_session = _session([*_batch(_tournaments(2), 10), _make_scalar_result(9)])
+
+        with patch(f"{MODULE}.time.perf_counter", side_effect=[0.0, 5.0, 6.0]):
+            result = await _prune(
+                mock_session,
+                before_date=date(2024, 1, 1),
+                batch_size=2,
+                time_budget_seconds=1,
+            )
+
+        assert result.success is True
+        assert result.completed is False
+        assert result.batches == 1
+        assert result.tournaments_remaining == 9
+        assert result.duration_seconds == 6.0
+        assert result.placements_per_second == pytest.approx(10 / 6, abs=0.1)
+
+
+class TestPruneArchive:
+    """Archived batches are uploaded before they are deleted."""
+
+    @pytest.fixture
+    def storage(self):
+        with (
+            patch(f"{MODULE}.StorageService") as storage,
+            patch(f"{MODULE}.get_settings") as settings,
+        ):
+            settings.return_value.prune_archive_bucket = "archive"
+            storage.return_value.upload_ndjson = AsyncMock()
+            yield storage
+
+    @pytest.mark.asyncio
+    async def test_uploads_batch_with_its_placements(self, storage) -> None:
+        tournaments = _tournaments(2)
+        placement = {"id": uuid4(), "tournament_id": tournaments[0]["id"]}
+        mock_session = _session(
+            [
+                _make_rows_result(tournaments),
+                _make_rows_result([placement]),  # placements to archive
+                _make_returning_result(1),
+                MagicMock(),
+                _make_rows_result([]),
+                _make_scalar_result(0),
+            ]
+        )
+
+        result = await _prune(
+            mock_session, before_date=date(2024, 1, 1), region="NA", archive=True
+        )
+
+        assert result.success is True
+        storage.assert_called_once_with("archive")
+        data, blob_path = storage.return_value.upload_ndjson.await_args.args
+        assert blob_path == archive_blob_path(date(2024, 1, 1), "NA", tournaments[0])
+        assert result.archived_objects == [blob_path]
+        lines = [json.loads(line) for line in gzip.decompress(data).splitlines()]
+        assert [line["tournament"]["id"] for line in lines] == [
+            str(t["id"]) for t in tournaments
+        ]
+        assert [len(line["placements"]) for line in lines] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_keeps_batch(self, storage) -> None:
+        storage.return_value.upload_ndjson.side_effect = OSError("gcs")
+        mock_session = _session(
+            [_make_rows_result(_tournaments(1)), _make_rows_result([])]
+        )
+
+        result = await _prune(mock_session, before_date=date(2024, 1, 1), archive=True)
+
+        assert result.success is False
+        assert result.completed is False
+        assert result.tournaments_deleted == 0
+        assert mock_session.execute.await_count == 2  # nothing deleted
+        mock_session.commit.assert_not_awaited()
+        mock_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_requires_archive_bucket(self) -> None:
+        mock_session = _session([])
+
+        with patch(f"{MODULE}.get_settings") as settings:
+            settings.return_value.prune_archive_bucket = None
+            result = await _prune(
+                mock_session, before_date=date(2024, 1, 1), archive=True
+            )
+
+        assert result.success is False
+        assert "PRUNE_ARCHIVE_BUCKET" in result.errors[0]
+        mock_session.execute.assert_not_awaited()
+
+    def test_blob_path_is_stable_per_batch_start(self) -> None:
+        first = {"id": "abc", "date": date(2023, 5, 1)}
+
+        assert (
+            archive_blob_path(date(2024, 1, 1), None, first)
+            == "prune-archive/before-2024-01-01/all/2023-05-01-abc.ndjson.gz"
+        )
+
+
+class TestPrunePartitions:
+    """Partitioned placements drop whole months."""
+
+    @pytest.mark.asyncio
+    async def test_drops_months_up_front_and_adds_future_months(
+        self, partitions
+    ) -> None:
+        drop, ensure = partitions
+        drop.return_value = {"tournament_placements_p202401": 5000}
+        mock_session = _session([_make_rows_result([]), _make_scalar_result(20)])
+
+        result = await _prune(mock_session, before_date=date(2024, 3, 15))
+
+        assert result.partitions_dropped == ["tournament_placements_p202401"]
+        assert result.placements_dropped == 5000
+        assert result.placements_deleted == 0
+        assert result.placements_per_second > 0
+        drop.assert_awaited_once_with(mock_session, date(2024, 3, 15))
+        ensure.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_region_prune_deletes_rows_only(self, partitions) -> None:
+        drop, _ = partitions
+        mock_session = _session([_make_rows_result([]), _make_scalar_result(20)])
+
+        await _prune(mock_session, before_date=date(2024, 3, 15), region="JP")
+
+        drop.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_archived_prune_drops_months_after_batches(self, partitions) -> None:
+        drop, _ = partitions
+        mock_session = _session([_make_rows_result([]), _make_scalar_result(0)])
+
+        with patch(f"{MODULE}.get_settings") as settings:
+            settings.return_value.prune_archive_bucket = "archive"
+            await _prune(mock_session, before_date=date(2024, 3, 15), archive=True)
+
+        drop.assert_awaited_once()
+        # The batch query ran before any partition was dropped
+        assert mock_session.execute.await_count == 2
+
 
 class TestPruneErrorHandling:
     """Error handling with rollback."""
@@ -224,11 +371,7 @@ class TestPruneErrorHandling:
         mock_session = AsyncMock()
         mock_session.execute = AsyncMock(side_effect=RuntimeError("Connection lost"))
 
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2024, 1, 1))
+        result = await _prune(mock_session, before_date=date(2024, 1, 1))
 
         assert result.success is False
         assert result.tournaments_deleted == 0
@@ -238,26 +381,15 @@ class TestPruneErrorHandling:
         mock_session.rollback.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_rollback_on_commit_failure(self) -> None:
-        mock_session = AsyncMock()
-
-        call_count = 0
-
-        async def execute_side_effect(stmt):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                return _make_scalar_result(3)  # counts
-            return MagicMock()  # deletes
-
-        mock_session.execute = AsyncMock(side_effect=execute_side_effect)
-        mock_session.commit = AsyncMock(side_effect=RuntimeError("Commit failed"))
+    async def test_failure_keeps_counts_of_committed_batches(self) -> None:
+        mock_session = _session(
+            [*_batch(_tournaments(2), 12), RuntimeError("Connection lost")]
+        )
 
-        with patch(
-            "src.pipelines.prune_tournaments.async_session_factory",
-            return_value=_mock_session_factory(mock_session),
-        ):
-            result = await prune_tournaments(before_date=date(2024, 1, 1))
+        result = await _prune(mock_session, before_date=date(2024, 1, 1), batch_size=2)
 
         assert result.success is False
-        mock_session.rollback.assert_called_once()
+        assert result.completed is False
+        assert result.tournaments_deleted == 2
+        assert result.placements_deleted == 12
+        mock_session.rollback.assert_awaited_once()
@@ -0,0 +1,52 @@
+"""Tests for the query budget pytest plugin."""
+
+import pytest
+
+BUDGETED_TESTS = """
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tests.query_budget import count_session_queries
+
+
+def _run_queries(count):
+    session = AsyncMock()
+    count_session_queries(session)
+
+    async def run():
+        for _ in range(count):
+            await session.execute("SELECT 1")
+
+    asyncio.run(run())
+
+
+@pytest.mark.query_budget(2)
+def test_within_budget():
+    _run_queries(2)
+
+
+@pytest.mark.query_budget(2)
+def test_over_budget():
+    _run_queries(3)
+
+
+def test_unbudgeted():
+    _run_queries(10)
+"""
+
+
+def test_fails_only_tests_over_budget(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_budgets=BUDGETED_TESTS)
+
+    result = pytester.runpytest("-p", "tests.query_budget")
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_over_budget*",
+            "*Query budget exceeded: 3 statements, budget 2*",
+            "*3x SELECT ?*",
+        ]
+    )
@@ -0,0 +1,113 @@
+"""Tests for the request-scoped SQL query profiler."""
+
+import logging
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main import CorrelationIDMiddleware, QueryProfilerMiddleware
+from src.services.query_profiler import (
+    QueryProfile,
+    current_profile,
+    normalize_statement,
+    profile_queries,
+)
+
+pytestmark = pytest.mark.usefixtures("no_engine_listeners")
+
+
+class TestNormalizeStatement:
+    """Tests for normalize_statement()."""
+
+    def test_bind_parameters_share_a_shape(self) -> None:
+        a = normalize_statement("SELECT * FROM cards WHERE cards.id = $1")
+        b = normalize_statement("SELECT * FROM cards WHERE cards.id = %(id_1)s")
+
+        assert a == b == "SELECT * FROM cards WHERE cards.id = ?"
+
+    def test_literals_and_in_lists_collapse(self) -> None:
+        shape = normalize_statement(
+            "SELECT * FROM cards\n  WHERE name = 'Iono' AND id IN ($1, $2, $3) LIMIT 10"
+        )
+
+        assert shape == "SELECT * FROM cards WHERE name = ? AND id IN (?) LIMIT ?"
+
+    def test_casts_are_kept(self) -> None:
+        shape = normalize_statement("SELECT $1::jsonb")
+
+        assert shape == "SELECT ?::jsonb"
+
+
+class TestQueryProfile:
+    """Tests for QueryProfile."""
+
+    def test_repeated_shapes(self) -> None:
+        profile = QueryProfile()
+        for card_id in range(6):
+            profile.record(f"SELECT * FROM cards WHERE id = {card_id}", 0.001)  # noqa: S608
+        profile.record("SELECT * FROM sets", 0.002)
+
+        repeated = profile.repeated_shapes(threshold=5)
+
+        assert profile.statements == 7
+        assert [s.count for s in repeated] == [6]
+        assert repeated[0].shape == "SELECT * FROM cards WHERE id = ?"
+
+    def test_server_timing(self) -> None:
+        profile = QueryProfile()
+        profile.record("SELECT 1", 0.0125)
+
+        assert profile.server_timing() == 'db;dur=12.5;desc="1 queries"'
+
+    def test_listeners_record_only_inside_profile(self, run_query) -> None:
+        conn = MagicMock(info={})
+        run_query(conn, "SELECT 1")
+
+        with profile_queries() as profile:
+            run_query(conn, "SELECT 1")
+            run_query(conn, "SELECT 2")
+
+        assert profile.statements == 2
+        assert current_profile() is None
+
+
+def _make_app(run_query: Callable[..., None], statements: list[str]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryProfilerMiddleware)
+    app.add_middleware(CorrelationIDMiddleware)
+
+    @app.get("/cards")
+    async def cards() -> dict:
+        conn = MagicMock(info={})
+        for statement in statements:
+            run_query(conn, statement)
+        return {}
+
+    return app
+
+
+class TestQueryProfilerMiddleware:
+    """Tests for QueryProfilerMiddleware."""
+
+    def test_server_timing_header(self, run_query) -> None:
+        client = TestClient(_make_app(run_query, ["SELECT 1", "SELECT 2"]))
+
+        response = client.get("/cards")
+
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+    def test_repeated_shape_logged_as_warning(self, run_query, caplog) -> None:
+        statements = [f"SELECT * FROM cards WHERE id = {i}" for i in range(6)]  # noqa: S608
+        client = TestClient(_make_app(run_query, statements))
+
+        with caplog.at_level(logging.INFO, logger="src.main"):
+            client.get("/cards", headers={"X-Correlation-ID": "cid-123"})
+
+        record = next(r for r in caplog.records if r.msg.startswith("Query profile"))
+        assert record.levelno == logging.WARNING
+        assert record.query_profile["statements"] == 6
+        assert record.query_profile["repeated"][0]["count"] == 6
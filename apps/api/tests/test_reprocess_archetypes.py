@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
 
 from src.config import Settings
+from src.models.archetype_reprocess_checkpoint import ArchetypeReprocessCheckpoint
 from src.pipelines.reprocess_archetypes import (
     ReprocessArchetypesResult,
+    bulk_update_statement,
     reprocess_archetypes,
+    resolve_chunk,
+    run_reprocess_job,
 )
 from src.routers.pipeline import router
+from src.services.archetype_normalizer import ArchetypeNormalizer
 
 
 def _make_placement(
@@ -452,3 +458,225 @@ class TestReprocessEndpoint:
             data = response.json()
             assert data["success"] is False
             assert len(data["errors"]) == 1
+
+
+CHARIZARD_SPRITES = ["https://r2.limitlesstcg.net/pokemon/gen9/charizard.png"]
+
+
+def _row(
+    *,
+    sprites: list[str] | None = CHARIZARD_SPRITES,
+    archetype: str = "Unknown",
+    method: str | None = None,
+    placement_id: UUID | None = None,
+) -> tuple:
+    return (placement_id or uuid4(), sprites, None, archetype, method, None)
+
+
+def _job_sessions(
+    partitions: list[list[tuple]],
+    checkpoint: ArchetypeReprocessCheckpoint | None = None,
+):
+    """Reader session streaming partitions and writer session with checkpoint."""
+    reader = AsyncMock()
+    reader.__aenter__ = AsyncMock(return_value=reader)
+    reader.__aexit__ = AsyncMock(return_value=None)
+    sprites_result = MagicMock()
+    sprites_result.all.return_value = []
+    reader.execute = AsyncMock(return_value=sprites_result)
+
+    async def _partitions(_size):
+        for partition in partitions:
+            yield partition
+
+    stream = MagicMock()
+    stream.partitions = _partitions
+    reader.stream = AsyncMock(return_value=stream)
+
+    writer = AsyncMock()
+    writer.__aenter__ = AsyncMock(return_value=writer)
+    writer.__aexit__ = AsyncMock(return_value=None)
+    writer.add = MagicMock()
+    checkpoint_result = MagicMock()
+    checkpoint_result.scalar_one_or_none.return_value = checkpoint
+    writer.execute = AsyncMock(return_value=checkpoint_result)
+
+    def _stored_last_id(*_args, **_kwargs):
+        # The checkpoint row as committed: where this run left it
+        stored = checkpoint or writer.add.call_args.args[0]
+        return stored.last_placement_id
+
+    writer.scalar = AsyncMock(side_effect=_stored_last_id)
+    return reader, writer
+
+
+class TestResolveChunk:
+    def test_keeps_only_changed_rows(self):
+        normalizer = ArchetypeNormalizer(sprite_map={"charizard": "Charizard ex"})
+        changed = _row()
+        unchanged = _row(archetype="Charizard ex", method="sprite_lookup")
+        no_sprites = _row(sprites=None)
+
+        chunk = resolve_chunk(normalizer, [changed, unchanged, no_sprites])
+
+        assert chunk.processed == 3
+        assert chunk.skipped == 2
+        assert chunk.changes == [(changed[0], "Charizard ex", "sprite_lookup")]
+        assert chunk.last_id == no_sprites[0]
+
+    def test_bulk_update_uses_values_join(self):
+        stmt = bulk_update_statement([(uuid4(), "Charizard ex", "sprite_lookup")])
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "UPDATE tournament_placements SET" in sql
+        assert "FROM (VALUES" in sql
+
+
+class TestRunReprocessJob:
+    @pytest.mark.asyncio
+    async def test_applies_chunks_and_completes(self):
+        partitions = [[_row(), _row(sprites=None)], [_row()]]
+        reader, writer = _job_sessions(partitions)
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP")
+
+        assert result.success
+        assert result.completed
+        assert (result.processed, result.updated, result.skipped) == (3, 2, 1)
+        assert result.chunks == 2
+        checkpoint = writer.add.call_args.args[0]
+        assert checkpoint.status == "completed"
+        assert checkpoint.last_placement_id == partitions[-1][-1][0]
+        assert checkpoint.processed == 3
+        # Advisory lock and checkpoint lookup, one bulk UPDATE per chunk
+        # with changes, plus a commit per chunk and one for completion
+        assert writer.execute.await_count == 2 + 2
+        lock = writer.execute.await_args_list[0].args[0]
+        assert "pg_advisory_xact_lock(hashtext(" in str(lock)
+        # The checkpoint row is locked and checked before every write
+        assert writer.scalar.await_count == 3
+        assert writer.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self):
+        last_id = uuid4()
+        checkpoint = ArchetypeReprocessCheckpoint(
+            job_key="reprocess-archetypes:JP:missing",
+            region="JP",
+            force=False,
+            status="running",
+            last_placement_id=last_id,
+            processed=1000,
+            updated=10,
+            skipped=990,
+        )
+        reader, writer = _job_sessions([[_row()]], checkpoint)
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP")
+
+        assert result.resumed_from == str(last_id)
+        assert checkpoint.processed == 1001
+        assert checkpoint.updated == 11
+        query = reader.stream.await_args.args[0]
+        assert str(last_id).replace("-", "") in str(
+            query.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        ).replace("-", "")
+
+    @pytest.mark.asyncio
+    async def test_completed_checkpoint_starts_new_pass(self):
+        checkpoint = ArchetypeReprocessCheckpoint(
+            job_key="reprocess-archetypes:JP:force",
+            region="JP",
+            force=True,
+            status="completed",
+            last_placement_id=uuid4(),
+            processed=5,
+            updated=5,
+            skipped=0,
+        )
+        reader, writer = _job_sessions([], checkpoint)
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP", force=True)
+
+        assert result.resumed_from is None
+        assert result.completed
+        assert checkpoint.processed == 0
+
+    @pytest.mark.asyncio
+    async def test_dry_run_writes_nothing(self):
+        reader, writer = _job_sessions([[_row()]])
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP", dry_run=True)
+
+        assert result.updated == 1
+        writer.commit.assert_not_awaited()
+        assert writer.execute.await_count == 1  # checkpoint lookup only
+        writer.scalar.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_time_budget_leaves_job_resumable(self):
+        reader, writer = _job_sessions([[_row()], [_row()]])
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP", time_budget_seconds=1e-9)
+
+        assert result.chunks == 1
+        assert not result.completed
+        checkpoint = writer.add.call_args.args[0]
+        assert checkpoint.status == "running"
+
+    @pytest.mark.asyncio
+    async def test_stops_when_another_run_moved_checkpoint(self):
+        reader, writer = _job_sessions([[_row()], [_row()]])
+        writer.scalar = AsyncMock(side_effect=[None, uuid4()])
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP")
+
+        assert not result.success
+        assert "moved by another run" in result.errors[0]
+        assert not result.completed
+        assert result.chunks == 1
+        writer.rollback.assert_awaited_once()
+        checkpoint = writer.add.call_args.args[0]
+        assert checkpoint.status == "running"
+
+    @pytest.mark.asyncio
+    async def test_process_pool_preserves_chunk_order(self):
+        partitions = [[_row(), _row()] for _ in range(5)]
+        reader, writer = _job_sessions(partitions)
+
+        with patch(
+            "src.pipelines.reprocess_archetypes.async_session_factory",
+            side_effect=[reader, writer],
+        ):
+            result = await run_reprocess_job(region="JP", workers=2, dry_run=True)
+
+        assert result.completed
+        assert result.processed == 10
+        checkpoint = writer.add.call_args.args[0]
+        assert checkpoint.last_placement_id == partitions[-1][-1][0]
@@ -0,0 +1,190 @@
+"""Tests for the rotation legality index and archetype evaluation."""
+
+from src.services.rotation_engine import (
+    MIN_DECKLISTS,
+    CardLegalityRow,
+    archetype_slug,
+    build_legality_index,
+    evaluate_archetypes,
+    legal_regulation_marks,
+    signature_masks,
+)
+
+LEGAL_SETS = ["TEF", "TWM"]
+ROTATING_SETS = ["PAL", "OBF"]
+
+
+def _card(
+    card_id: str,
+    name: str,
+    limitless_id: str | None,
+    mark: str | None,
+    standard: bool = True,
+) -> CardLegalityRow:
+    return CardLegalityRow(
+        id=card_id,
+        name=name,
+        limitless_id=limitless_id,
+        regulation_mark=mark,
+        legalities={"standard": standard},
+    )
+
+
+CARDS = [
+    _card("sv02-185", "Iono", "PAL-185", "G"),
+    _card("sv05-144", "Iono", "TEF-144", "H"),  # reprint keeps Iono legal
+    _card("sv03-125", "Charizard ex", "OBF-125", "G"),
+    _card("sv02-172", "Boss's Orders", "PAL-172", "G"),
+    _card("sv06-130", "Dragapult ex", "TWM-130", "H"),
+    _card("sv05-123", "Rare Candy", "SVP-123", "G"),
+    _card("sve-1", "Basic Grass Energy", None, None),
+    _card("swsh1-1", "Old Card", None, None, standard=False),
+]
+
+
+def _index(placeholders: tuple[str, ...] = ()):
+    marks = legal_regulation_marks(CARDS, LEGAL_SETS, ROTATING_SETS)
+    return build_legality_index(CARDS, LEGAL_SETS, marks, placeholders)
+
+
+def _deck(*entries: tuple[str, int]) -> list[dict]:
+    return [{"card_id": card_id, "quantity": qty} for card_id, qty in entries]
+
+
+class TestLegalRegulationMarks:
+    """Tests for legal_regulation_marks."""
+
+    def test_marks_of_legal_sets(self) -> None:
+        assert legal_regulation_marks(CARDS, LEGAL_SETS, ROTATING_SETS) == {"H"}
+
+    def test_rotating_marks_excluded_even_if_in_legal_set(self) -> None:
+        cards = [*CARDS, _card("sv05-1", "Stray Reprint", "TEF-1", "G")]
+
+        assert legal_regulation_marks(cards, LEGAL_SETS, ROTATING_SETS) == {"H"}
+
+
+class TestBuildLegalityIndex:
+    """Tests for build_legality_index."""
+
+    def _rotating_names(self, placeholders: tuple[str, ...] = ()) -> set[str]:
+        index = _index(placeholders)
+        return {
+            name
+            for bit, name in enumerate(index.names)
+            if (index.rotating_mask >> bit) & 1
+        }
+
+    def test_rotating_names(self) -> None:
+        assert self._rotating_names() == {
+            "Charizard ex",
+            "Boss's Orders",
+            "Rare Candy",
+            "Old Card",
+        }
+
+    def test_placeholder_reprint_keeps_name_legal(self) -> None:
+        assert "Boss's Orders" not in self._rotating_names(("Boss’s Orders",))
+
+    def test_resolves_every_id_form(self) -> None:
+        index = _index()
+        bit = index.bit_by_name["charizard ex"]
+
+        assert index.resolve("sv03-125") == bit
+        assert index.resolve("sv3-125") == bit
+        assert index.resolve("OBF-125") == bit
+        assert index.resolve("unknown-1", "Charizard ex") == bit
+        assert index.resolve("unknown-1") is None
+
+
+class TestEvaluateArchetypes:
+    """Tests for evaluate_archetypes."""
+
+    def test_rates_by_lost_copies(self) -> None:
+        index = _index()
+        rows = [
+            ("Dragapult ex", _deck(("sv6-130", 4), ("sv2-185", 4), ("sv2-172", 2)))
+        ] * MIN_DECKLISTS
+        rows += [("Gardevoir ex", _deck(("sv6-130", 4), ("sv5-144", 4)))] * 6
+
+        evaluations = evaluate_archetypes(rows, index)
+
+        assert [e.archetype for e in evaluations] == ["Gardevoir ex", "Dragapult ex"]
+        gardevoir, dragapult = evaluations
+        assert gardevoir.survival_rating == "thrives"
+        assert gardevoir.rotating_cards == []
+        assert dragapult.survival_rating == "adapts"
+        assert dragapult.core_cards_lost == 1
+        assert dragapult.rotating_cards == [
+            {
+                "card_name": "Boss's Orders",
+                "card_id": "sv2-172",
+                "count": 2,
+                "inclusion_rate": 1.0,
+                "role": None,
+                "replacement": None,
+            }
+        ]
+
+    def test_crippled_by_many_lost_copies(self) -> None:
+        index = _index()
+        deck = _deck(("sv3-125", 3), ("sv2-172", 4), ("SVP-123", 4), ("sve-1", 10))
+        rows = [("Other", deck)] * MIN_DECKLISTS
+
+        (evaluation,) = evaluate_archetypes(rows, index)
+
+        assert evaluation.avg_lost_copies == 11.0
+        assert evaluation.core_cards_lost == 3
+        assert evaluation.survival_rating == "crippled"
+
+    def test_dies_when_signature_card_rotates(self) -> None:
+        index = _index()
+        rows = [("Charizard ex", _deck(("sv3-125", 2), ("sv5-144", 4)))] * 5
+        masks = signature_masks({"sv03-125": "Charizard ex"}, index)
+
+        (evaluation,) = evaluate_archetypes(rows, index, masks)
+
+        assert evaluation.survival_rating == "dies"
+
+    def test_unknown_with_few_lists_or_unresolved_cards(self) -> None:
+        index = _index()
+        rows = [("Rare Deck", _deck(("sv6-130", 4)))] * (MIN_DECKLISTS - 1)
+        rows += [("Unmapped", _deck(("zzz-1", 10), ("sv6-130", 1)))] * 5
+
+        evaluations = {e.archetype: e for e in evaluate_archetypes(rows, index)}
+
+        assert evaluations["Rare Deck"].survival_rating == "unknown"
+        assert evaluations["Unmapped"].survival_rating == "unknown"
+
+    def test_resolves_each_name_when_card_id_is_empty(self) -> None:
+        index = _index()
+        deck = [
+            {"card_id": "", "name": "Dragapult ex", "quantity": 4},
+            {"card_id": "", "name": "Boss's Orders", "quantity": 2},
+        ]
+
+        (evaluation,) = evaluate_archetypes([("A", deck)], index)
+
+        assert evaluation.resolved_share == 1.0
+        assert evaluation.avg_lost_copies == 2.0
+        assert evaluation.rotating_cards[0]["card_name"] == "Boss's Orders"
+        assert evaluation.rotating_cards[0]["card_id"] is None
+
+    def test_skips_missing_and_malformed_entries(self) -> None:
+        index = _index()
+        deck = [
+            "bad",
+            {"card_id": "sv6-130", "quantity": "x"},
+            {"card_id": "sv6-130", "quantity": 4},
+        ]
+
+        (evaluation,) = evaluate_archetypes([("A", deck), ("A", None)], index)
+
+        assert evaluation.decklists == 1
+        assert evaluation.resolved_share == 1.0
+
+
+class TestArchetypeSlug:
+    """Tests for archetype_slug."""
+
+    def test_slugifies(self) -> None:
+        assert archetype_slug(" Chien-Pao ex ") == "chien-pao-ex"
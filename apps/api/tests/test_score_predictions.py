@@ -0,0 +1,64 @@
+"""Tests for prediction scoring pipeline."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.pipelines.score_predictions import ScorePredictionsResult, score_predictions
+
+MODULE = "src.pipelines.score_predictions"
+
+
+async def _run(
+    *, dry_run: bool, score: AsyncMock
+) -> tuple[ScorePredictionsResult, MagicMock]:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    with (
+        patch(f"{MODULE}.async_session_factory") as mock_factory,
+        patch(f"{MODULE}.score_completed_predictions", score),
+        patch(f"{MODULE}.rebuild_accuracy_rollups", AsyncMock(return_value=12)),
+    ):
+        mock_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        mock_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        result = await score_predictions(dry_run=dry_run)
+    return result, session
+
+
+class TestScorePredictions:
+    """Tests for the orchestrator function."""
+
+    @pytest.mark.asyncio
+    async def test_scores_and_commits(self) -> None:
+        result, session = await _run(
+            dry_run=False, score=AsyncMock(return_value=(30, 2))
+        )
+
+        assert result.success is True
+        assert result.predictions_scored == 30
+        assert result.tournaments_scored == 2
+        assert result.rollups_written == 12
+        session.commit.assert_awaited()
+        session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_rolls_back(self) -> None:
+        result, session = await _run(
+            dry_run=True, score=AsyncMock(return_value=(30, 2))
+        )
+
+        assert result.predictions_scored == 30
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_records_error(self) -> None:
+        result, session = await _run(
+            dry_run=False, score=AsyncMock(side_effect=RuntimeError("db down"))
+        )
+
+        assert result.success is False
+        assert "db down" in result.errors[0]
+        assert result.rollups_written == 0
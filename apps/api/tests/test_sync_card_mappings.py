@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.clients.limitless import CardEquivalent, LimitlessClient, LimitlessError
 from src.models.card_id_mapping import CardIdMapping
@@ -111,6 +112,9 @@ class TestSyncCardMappingsForSet:
         assert inserted == 1
         assert updated == 2
         mock_session.commit.assert_called_once()
+        # The card catalog's version stamp needs updated_at to move
+        upsert = mock_session.execute.call_args_list[-1].args[0]
+        assert "updated_at = now()" in str(upsert.compile(dialect=postgresql.dialect()))
 
     @pytest.mark.asyncio
     async def test_returns_zero_for_empty_equivalents(self):
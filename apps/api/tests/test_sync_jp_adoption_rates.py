@@ -20,6 +20,13 @@ from src.pipelines.sync_jp_adoption_rates import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _skip_run_persistence():
+    """Keep the pipeline run record off the mocked session."""
+    with patch("src.services.pipeline_metrics.save_run", new=AsyncMock()):
+        yield
+
+
 @pytest.fixture
 def sample_adoption_data() -> PokecabookAdoptionRates:
     """Create sample adoption rate data for testing."""
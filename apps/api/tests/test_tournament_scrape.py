@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +23,16 @@ from src.services.archetype_normalizer import ArchetypeNormalizer
 from src.services.tournament_scrape import ScrapeResult, TournamentScrapeService
 
 
+def _tournament() -> Tournament:
+    return Tournament(
+        id=uuid4(),
+        date=date(2024, 1, 15),
+        region="NA",
+        format="standard",
+        best_of=3,
+    )
+
+
 @pytest.fixture
 def mock_session() -> AsyncMock:
     """Create a mock async session."""
@@ -595,11 +606,13 @@ class TestCreatePlacement:
     ) -> None:
         """Should create placement with decklist data."""
         sample_placement.decklist = sample_decklist
-        tournament_id = uuid4()
+        tournament = _tournament()
 
-        result = service._create_placement(sample_placement, tournament_id)
+        result = service._create_placement(sample_placement, tournament)
 
-        assert result.tournament_id == tournament_id
+        assert result.tournament_id == tournament.id
+        assert result.tournament_date == tournament.date
+        assert (result.region, result.format, result.best_of) == ("NA", "standard", 3)
         assert result.placement == 1
         assert result.player_name == "Champion Player"
         assert result.decklist is not None
@@ -615,9 +628,7 @@ class TestCreatePlacement:
     ) -> None:
         """Should create placement without decklist data."""
         sample_placement.decklist = None
-        tournament_id = uuid4()
-
-        result = service._create_placement(sample_placement, tournament_id)
+        result = service._create_placement(sample_placement, _tournament())
 
         assert result.decklist is None
         assert result.decklist_source is None
@@ -632,9 +643,7 @@ class TestCreatePlacement:
         """Should use existing archetype when no decklist."""
         sample_placement.decklist = None
         sample_placement.archetype = "Custom Archetype"
-        tournament_id = uuid4()
-
-        result = service._create_placement(sample_placement, tournament_id)
+        result = service._create_placement(sample_placement, _tournament())
 
         assert result.archetype == "Custom Archetype"
         mock_detector.detect_from_existing_archetype.assert_not_called()
@@ -770,15 +779,9 @@ class TestDiscoverNewTournaments:
         mock_client.fetch_tournament_listings.return_value = [sample_tournament]
 
         mock_result = MagicMock()
-        mock_result.first.return_value = Tournament(
-            id=uuid4(),
-            name="Existing",
-            date=date.today(),
-            region="NA",
-            format="standard",
-            best_of=3,
-            source_url=sample_tournament.source_url,
-        )
+        mock_result.scalars.return_value.all.return_value = [
+            sample_tournament.source_url
+        ]
         mock_session.execute.return_value = mock_result
 
         result = await service.discover_new_tournaments(max_pages=1)
@@ -825,6 +828,132 @@ class TestDiscoverNewTournaments:
 
         assert len(result) == 0
 
+    @staticmethod
+    def _listing(url: str, days_ago: int) -> LimitlessTournament:
+        return LimitlessTournament(
+            name=url,
+            tournament_date=date.today() - timedelta(days=days_ago),
+            region="NA",
+            game_format="standard",
+            best_of=3,
+            participant_count=100,
+            source_url=url,
+            placements=[],
+        )
+
+    @pytest.mark.asyncio
+    async def test_checks_each_page_with_one_query(
+        self,
+        service: TournamentScrapeService,
+        mock_session: AsyncMock,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Should resolve a page's URLs with a single ANY() query."""
+        mock_client.fetch_tournament_listings.side_effect = [
+            [self._listing(f"url{i}", 1) for i in range(50)],
+            [],
+        ]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = ["url3", "url7"]
+        mock_session.execute.return_value = mock_result
+
+        result = await service.discover_new_tournaments(max_pages=5)
+
+        assert len(result) == 48
+        assert mock_session.execute.await_count == 1
+        query = mock_session.execute.await_args.args[0]
+        assert "= ANY (" in str(query.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_stops_paging_at_cutoff(
+        self,
+        service: TournamentScrapeService,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Should not fetch further pages once a page passes the cutoff."""
+        mock_client.fetch_tournament_listings.side_effect = [
+            [self._listing("url1", 1), self._listing("url2", 30)],
+            [self._listing("url3", 40)],
+        ]
+
+        result = await service.discover_new_tournaments(lookback_days=7, max_pages=5)
+
+        assert [t.source_url for t in result] == ["url1"]
+        assert mock_client.fetch_tournament_listings.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_paging_at_known_page(
+        self,
+        service: TournamentScrapeService,
+        mock_session: AsyncMock,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Should stop once every tournament on a page is already stored."""
+        mock_client.fetch_tournament_listings.side_effect = [
+            [self._listing("url1", 1)],
+            [self._listing("url2", 2)],
+            [self._listing("url3", 3)],
+        ]
+        new_page = MagicMock()
+        new_page.scalars.return_value.all.return_value = []
+        known_page = MagicMock()
+        known_page.scalars.return_value.all.return_value = ["url2"]
+        mock_session.execute.side_effect = [new_page, known_page]
+
+        result = await service.discover_new_tournaments(max_pages=5)
+
+        assert [t.source_url for t in result] == ["url1"]
+        assert mock_client.fetch_tournament_listings.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_records_phase_timings(
+        self,
+        service: TournamentScrapeService,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Should report time spent fetching and checking existence."""
+        mock_client.fetch_tournament_listings.side_effect = [
+            [self._listing("url1", 1)],
+            [],
+        ]
+
+        await service.discover_new_tournaments(max_pages=5)
+
+        assert set(service.phase_timings) == {"fetch_listings", "existence_check"}
+        assert all(v >= 0 for v in service.phase_timings.values())
+
+
+class TestExistingSourceUrls:
+    """Tests for existing_source_urls method."""
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_query(
+        self,
+        service: TournamentScrapeService,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Should not hit the database when there is nothing to check."""
+        assert await service.existing_source_urls([]) == set()
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_urls(
+        self,
+        service: TournamentScrapeService,
+        mock_session: AsyncMock,
+    ) -> None:
+        """Should bind each URL once as a single array parameter."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = ["a"]
+        mock_session.execute.return_value = mock_result
+
+        known = await service.existing_source_urls(["a", "b", "a", ""])
+
+        assert known == {"a"}
+        query = mock_session.execute.await_args.args[0]
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert params == {"source_urls": ["a", "b"]}
+
 
 class TestDiscoverOfficialTournaments:
     """Tests for discover_official_tournaments method."""
@@ -1181,11 +1310,9 @@ class TestCreatePlacementWithNormalizer:
             archetype="Unknown",
             sprite_urls=["https://r2.limitlesstcg.net/pokemon/gen9/charizard.png"],
         )
-        tournament_id = uuid4()
-
         result = service._create_placement(
             placement,
-            tournament_id,
+            _tournament(),
             normalizer=normalizer,
         )
 
@@ -1212,11 +1339,9 @@ class TestCreatePlacementWithNormalizer:
                 "https://example.com/froslass.png",
             ],
         )
-        tournament_id = uuid4()
-
         result = service._create_placement(
             placement,
-            tournament_id,
+            _tournament(),
             normalizer=normalizer,
         )
 
@@ -1238,11 +1363,9 @@ class TestCreatePlacementWithNormalizer:
             archetype="Charizard ex",
             decklist=LimitlessDecklist(cards=[{"card_id": "sv3-125", "quantity": 2}]),
         )
-        tournament_id = uuid4()
-
         result = service._create_placement(
             placement,
-            tournament_id,
+            _tournament(),
             normalizer=None,
         )
 
@@ -1264,11 +1387,9 @@ class TestCreatePlacementWithNormalizer:
             archetype="Charizard",
             sprite_urls=[],
         )
-        tournament_id = uuid4()
-
         result = service._create_placement(
             placement,
-            tournament_id,
+            _tournament(),
             normalizer=normalizer,
         )
 
@@ -1409,7 +1530,7 @@ class TestCreatePlacementJpMapping:
 
         result = service._create_placement(
             placement,
-            uuid4(),
+            _tournament(),
             jp_to_en_mapping=jp_to_en,
         )
 
@@ -1447,7 +1568,7 @@ class TestCreatePlacementJpMapping:
         with caplog.at_level(logging.WARNING):
             result = service._create_placement(
                 placement,
-                uuid4(),
+                _tournament(),
                 jp_to_en_mapping=jp_to_en,
             )
 
@@ -1488,61 +1609,15 @@ class TestCreatePlacementJpMapping:
         with caplog.at_level(logging.WARNING):
             service._create_placement(
                 placement,
-                uuid4(),
+                _tournament(),
                 jp_to_en_mapping=jp_to_en,
             )
 
         assert not any("Unmapped JP card IDs" in r.message for r in caplog.records)
 
 
-class TestCardIdVariants:
-    """Tests for _card_id_variants static method."""
-
-    def test_empty_string(self) -> None:
-        result = TournamentScrapeService._card_id_variants("")
-        assert result == set()
-
-    def test_whitespace_only(self) -> None:
-        result = TournamentScrapeService._card_id_variants("  ")
-        assert result == set()
-
-    def test_no_hyphen(self) -> None:
-        result = TournamentScrapeService._card_id_variants("SV7")
-        assert "SV7" in result
-        assert "sv7" in result
-        assert "SV7" in result
-
-    def test_standard_card_id(self) -> None:
-        result = TournamentScrapeService._card_id_variants("SV7-018")
-        assert "sv7-18" in result
-        assert "SV7-018" in result
-        assert "sv7-018" in result
-        assert "SV7-18" in result
-
-    def test_zero_padding_variants(self) -> None:
-        result = TournamentScrapeService._card_id_variants("SV9-5")
-        assert "sv9-5" in result
-        assert "sv9-05" in result
-        assert "sv9-005" in result
-        assert "SV9-5" in result
-
-    def test_case_variants(self) -> None:
-        result = TournamentScrapeService._card_id_variants("SV8a-001")
-        # Set part case variants
-        assert any("sv8a-" in v for v in result)
-        assert any("SV8A-" in v for v in result)
-        assert any("SV8a-" in v for v in result)
-
-    def test_letter_prefix_in_num_part(self) -> None:
-        """Card IDs like 'SV2D-TG01' with letter prefix."""
-        result = TournamentScrapeService._card_id_variants("SV2-TG01")
-        assert "SV2-TG01" in result
-        assert "sv2-tg1" in result
-        assert "sv2-TG1" in result
-
-
 class TestGetJpToEnMapping:
-    """Tests for _get_jp_to_en_mapping caching and expansion."""
+    """Tests for _get_jp_to_en_mapping caching and lookup."""
 
     @pytest.mark.asyncio
     async def test_loads_and_caches_mapping(
@@ -1553,7 +1628,7 @@ class TestGetJpToEnMapping:
         mock_result.__iter__ = MagicMock(
             return_value=iter(
                 [
-                    MagicMock(jp_card_id="SV9-001", en_card_id="sv09-1"),
+                    MagicMock(jp_canonical_id="sv9-1", en_card_id="sv09-1"),
                 ]
             )
         )
@@ -1565,8 +1640,10 @@ class TestGetJpToEnMapping:
         # Only one DB query (cached on second call)
         assert mock_session.execute.call_count == 1
         assert mapping1 is mapping2
-        # Variants should be expanded
-        assert "sv9-1" in mapping1 or "sv9-001" in mapping1
+        # One entry per mapping, matched in any case or padding
+        assert len(mapping1) == 1
+        assert mapping1["SV9-001"] == "sv09-1"
+        assert mapping1.get("sv9-01") == "sv09-1"
 
     @pytest.mark.asyncio
     async def test_empty_mapping(
@@ -1581,6 +1658,26 @@ class TestGetJpToEnMapping:
         assert mapping == {}
 
 
+class TestGetJpNormalizer:
+    """Tests for _get_jp_normalizer reuse."""
+
+    @pytest.mark.asyncio
+    async def test_builds_normalizer_once_per_service(
+        self, service: TournamentScrapeService
+    ) -> None:
+        """JP tournaments in one run share a normalizer and its memo."""
+        normalizer = MagicMock(spec=ArchetypeNormalizer)
+        with patch(
+            "src.services.tournament_scrape.get_normalizer",
+            new=AsyncMock(return_value=normalizer),
+        ) as mock_get:
+            first = await service._get_jp_normalizer(ArchetypeDetector())
+            second = await service._get_jp_normalizer(ArchetypeDetector())
+
+        assert first is second is normalizer
+        mock_get.assert_awaited_once()
+
+
 class TestGetDetectorForRegion:
     """Tests for _get_detector_for_region."""
 
@@ -2113,7 +2210,7 @@ class TestCreatePlacementEdgeCases:
             ),
         )
 
-        result = service._create_placement(placement, uuid4())
+        result = service._create_placement(placement, _tournament())
 
         # Only the valid card should be included
         assert result.decklist is not None
@@ -2136,7 +2233,7 @@ class TestCreatePlacementEdgeCases:
             ),
         )
 
-        result = service._create_placement(placement, uuid4())
+        result = service._create_placement(placement, _tournament())
 
         assert result.decklist is not None
         assert len(result.decklist) == 0
@@ -2156,7 +2253,7 @@ class TestCreatePlacementEdgeCases:
             decklist=decklist,
         )
 
-        result = service._create_placement(placement, uuid4())
+        result = service._create_placement(placement, _tournament())
 
         assert result.decklist is None
 
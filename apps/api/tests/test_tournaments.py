@@ -10,6 +10,7 @@ from fastapi.testclient import TestClient
 from src.main import app
 from src.models.tournament import Tournament
 from src.models.tournament_placement import TournamentPlacement
+from src.schemas import PaginatedResponse, TournamentSummary
 
 
 class TestListTournaments:
@@ -107,6 +108,34 @@ class TestListTournaments:
         assert len(data["items"][0]["top_placements"]) == 2
         assert data["freshness"]["cadence_profile"] == "default_cadence"
         assert data["freshness"]["snapshot_date"] == "2024-01-15"
+        validated = PaginatedResponse[TournamentSummary].model_validate(data)
+        assert validated.model_dump(mode="json") == data
+        assert data["total_pages"] == 1
+
+    def test_large_list_is_gzipped_when_accepted(
+        self, client: TestClient, mock_db: AsyncMock, sample_tournament: MagicMock
+    ) -> None:
+        """Test responses over the size threshold are compressed."""
+        mock_count_result = MagicMock()
+        mock_count_result.scalar.return_value = 40
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.unique.return_value.all.return_value = [
+            sample_tournament
+        ] * 40
+
+        mock_db.execute.side_effect = [
+            mock_count_result,
+            self._freshness_result(sample_tournament.date),
+            mock_result,
+        ]
+
+        response = client.get(
+            "/api/v1/tournaments?limit=40", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["items"]) == 40
 
     def test_list_tournaments_empty(
         self, client: TestClient, mock_db: AsyncMock
@@ -125,6 +125,7 @@ class TestBatchLookupCards:
         # Step 2: Mapping lookup returns a JP->EN mapping
         mapping_row = MagicMock()
         mapping_row.jp_card_id = "sv09-97"
+        mapping_row.jp_canonical_id = "sv9-97"
         mapping_row.en_card_id = "JTG-097"
         mapping_row.card_name_en = "Hydrapple ex"
         mock_mapping = MagicMock()
@@ -173,6 +174,7 @@ class TestBatchLookupCards:
         # Step 2: Mapping exists
         mapping_row = MagicMock()
         mapping_row.jp_card_id = "sv09-50"
+        mapping_row.jp_canonical_id = "sv9-50"
         mapping_row.en_card_id = "JTG-050"
         mapping_row.card_name_en = "Raichu ex"
         mock_mapping = MagicMock()
@@ -242,6 +244,7 @@ class TestBatchLookupCards:
         # Step 2: Mapping for sv09-97
         mapping_row = MagicMock()
         mapping_row.jp_card_id = "sv09-97"
+        mapping_row.jp_canonical_id = "sv9-97"
         mapping_row.en_card_id = "JTG-097"
         mapping_row.card_name_en = "Hydrapple ex"
         mock_mapping = MagicMock()
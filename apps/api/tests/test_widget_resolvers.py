@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.archetype_evolution_snapshot import ArchetypeEvolutionSnapshot
@@ -14,6 +15,7 @@ from src.models.deck import Deck
 from src.models.meta_snapshot import MetaSnapshot
 from src.models.tournament import Tournament
 from src.models.tournament_placement import TournamentPlacement
+from src.services.meta_service import build_jp_comparison
 from src.services.widget_resolvers import (
     get_all_widget_types,
     get_resolver,
@@ -463,56 +465,64 @@ class TestMetaTrendResolver:
         # without error, and 200 was capped to 90
 
 
+def _jp_comparison_result(
+    jp_shares: dict[str, float] | None,
+    en_shares: dict[str, float],
+    jp_tiers: dict[str, str] | None = None,
+) -> MagicMock:
+    """Execute result holding a comparison built from two snapshots."""
+    jp_snapshot = None
+    if jp_shares is not None:
+        jp_snapshot = MagicMock(spec=MetaSnapshot)
+        jp_snapshot.sample_size = 800
+        jp_snapshot.archetype_shares = jp_shares
+        jp_snapshot.tier_assignments = jp_tiers or {}
+    en_snapshot = MagicMock(spec=MetaSnapshot)
+    en_snapshot.sample_size = 1500
+    en_snapshot.archetype_shares = en_shares
+    en_snapshot.tier_assignments = {}
+
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = build_jp_comparison(
+        jp_snapshot,
+        en_snapshot,
+        snapshot_date=date(2024, 1, 15),
+        game_format="standard",
+        tournament_type="all",
+    )
+    return result
+
+
 class TestJPComparisonResolver:
     """Tests for JPComparisonResolver."""
 
     @pytest.mark.asyncio
     async def test_resolve_returns_comparison_data(self, mock_session: AsyncMock):
         """Test resolving JP vs EN comparison data."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.sample_size = 800
-        jp_snapshot.archetype_shares = {
-            "Charizard ex": 0.30,
-            "Gardevoir ex": 0.15,
-        }
-        jp_snapshot.tier_assignments = {"Charizard ex": "S", "Gardevoir ex": "A"}
-
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 14)
-        en_snapshot.sample_size = 1500
-        en_snapshot.archetype_shares = {
-            "Charizard ex": 0.25,
-            "Gardevoir ex": 0.20,
-        }
-        en_snapshot.tier_assignments = {"Charizard ex": "S", "Gardevoir ex": "S"}
-
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = jp_snapshot
-        en_result = MagicMock()
-        en_result.scalar_one_or_none.return_value = en_snapshot
-
-        mock_session.execute.side_effect = [jp_result, en_result]
+        mock_session.execute.return_value = _jp_comparison_result(
+            {"Charizard ex": 0.30, "Gardevoir ex": 0.15},
+            {"Charizard ex": 0.25, "Gardevoir ex": 0.20},
+            jp_tiers={"Charizard ex": "S", "Gardevoir ex": "A"},
+        )
 
         resolver = JPComparisonResolver()
         result = await resolver.resolve(mock_session, {"format": "standard"})
 
         assert result["format"] == "standard"
         assert result["jp_date"] == "2024-01-15"
-        assert result["en_date"] == "2024-01-14"
+        assert result["en_date"] == "2024-01-15"
         assert result["jp_sample_size"] == 800
         assert result["en_sample_size"] == 1500
-        assert len(result["comparisons"]) > 0
+        assert result["comparisons"][0]["archetype"] == "Charizard ex"
+        assert result["comparisons"][0]["jp_tier"] == "S"
+        mock_session.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_resolve_returns_error_when_no_data(self, mock_session: AsyncMock):
-        """Test returning error when neither JP nor EN data available."""
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = None
-        en_result = MagicMock()
-        en_result.scalar_one_or_none.return_value = None
-
-        mock_session.execute.side_effect = [jp_result, en_result]
+        """Test returning error when no comparison has been computed."""
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = result_mock
 
         resolver = JPComparisonResolver()
         result = await resolver.resolve(mock_session, {})
@@ -526,24 +536,10 @@ class TestJPComparisonResolver:
         mock_session: AsyncMock,
     ):
         """Test divergent archetypes identified correctly."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.sample_size = 800
-        jp_snapshot.archetype_shares = {"Charizard ex": 0.30, "Lugia VSTAR": 0.05}
-        jp_snapshot.tier_assignments = {}
-
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 14)
-        en_snapshot.sample_size = 1500
-        en_snapshot.archetype_shares = {"Charizard ex": 0.20, "Lugia VSTAR": 0.15}
-        en_snapshot.tier_assignments = {}
-
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = jp_snapshot
-        en_result = MagicMock()
-        en_result.scalar_one_or_none.return_value = en_snapshot
-
-        mock_session.execute.side_effect = [jp_result, en_result]
+        mock_session.execute.return_value = _jp_comparison_result(
+            {"Charizard ex": 0.30, "Lugia VSTAR": 0.05},
+            {"Charizard ex": 0.20, "Lugia VSTAR": 0.15},
+        )
 
         resolver = JPComparisonResolver()
         result = await resolver.resolve(mock_session, {"min_divergence": 0.05})
@@ -554,68 +550,39 @@ class TestJPComparisonResolver:
         assert "Lugia VSTAR" in result["falling_in_jp"]
 
     @pytest.mark.asyncio
-    async def test_resolve_with_only_jp_data(self, mock_session: AsyncMock):
-        """Test resolving when only JP data is available."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.sample_size = 800
-        jp_snapshot.archetype_shares = {"Charizard ex": 0.30}
-        jp_snapshot.tier_assignments = {"Charizard ex": "S"}
+    async def test_resolve_skips_comparison_without_jp_data(
+        self, mock_session: AsyncMock
+    ):
+        """Test the newest comparison is passed over when it has no JP side."""
+        without_jp = _jp_comparison_result(None, {"Charizard ex": 0.30})
+        with_jp = _jp_comparison_result({"Charizard ex": 0.28}, {"Charizard ex": 0.25})
 
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = jp_snapshot
-        en_result = MagicMock()
-        en_result.scalar_one_or_none.return_value = None
+        async def execute(stmt):
+            sql = str(stmt.compile(dialect=postgresql.dialect()))
+            return with_jp if "jp_sample_size >=" in sql else without_jp
 
-        mock_session.execute.side_effect = [jp_result, en_result]
+        mock_session.execute.side_effect = execute
 
         resolver = JPComparisonResolver()
         result = await resolver.resolve(mock_session, {})
 
         assert result["jp_date"] == "2024-01-15"
-        assert result["en_date"] is None
-        assert result["en_sample_size"] == 0
-        assert len(result["comparisons"]) == 1
-        assert result["comparisons"][0]["en_share"] == 0
+        assert result["jp_sample_size"] == 800
+        assert result["comparisons"][0]["jp_share"] == 0.28
+        assert result["falling_in_jp"] == []
 
     @pytest.mark.asyncio
     async def test_resolve_respects_top_n(self, mock_session: AsyncMock):
         """Test that comparisons are limited by top_n."""
-        jp_snapshot = MagicMock(spec=MetaSnapshot)
-        jp_snapshot.snapshot_date = date(2024, 1, 15)
-        jp_snapshot.sample_size = 800
-        jp_snapshot.archetype_shares = {
-            "A": 0.30,
-            "B": 0.20,
-            "C": 0.15,
-            "D": 0.10,
-            "E": 0.05,
-        }
-        jp_snapshot.tier_assignments = {}
-
-        en_snapshot = MagicMock(spec=MetaSnapshot)
-        en_snapshot.snapshot_date = date(2024, 1, 14)
-        en_snapshot.sample_size = 1500
-        en_snapshot.archetype_shares = {
-            "A": 0.25,
-            "B": 0.18,
-            "C": 0.12,
-            "D": 0.08,
-            "E": 0.04,
-        }
-        en_snapshot.tier_assignments = {}
-
-        jp_result = MagicMock()
-        jp_result.scalar_one_or_none.return_value = jp_snapshot
-        en_result = MagicMock()
-        en_result.scalar_one_or_none.return_value = en_snapshot
-
-        mock_session.execute.side_effect = [jp_result, en_result]
+        mock_session.execute.return_value = _jp_comparison_result(
+            {"A": 0.30, "B": 0.20, "C": 0.15, "D": 0.10, "E": 0.05},
+            {"A": 0.25, "B": 0.18, "C": 0.12, "D": 0.08, "E": 0.04},
+        )
 
         resolver = JPComparisonResolver()
         result = await resolver.resolve(mock_session, {"top_n": 3})
 
-        assert len(result["comparisons"]) == 3
+        assert [c["archetype"] for c in result["comparisons"]] == ["A", "B", "C"]
 
 
 class TestDeckCostResolver:
@@ -1,5 +1,6 @@
 """Tests for WidgetService."""
 
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -404,70 +405,75 @@ class TestDeleteWidget:
 class TestRecordView:
     """Tests for record_view method."""
 
-    @pytest.mark.asyncio
-    async def test_records_view_with_all_data(
-        self, mock_session: AsyncMock, mock_widget: Widget
-    ):
-        """Test recording view with all data."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_widget
-        mock_session.execute.return_value = mock_result
+    @pytest.fixture
+    def buffer(self):
+        with patch("src.services.widget_service.get_widget_view_buffer") as get:
+            yield get.return_value
 
+    def test_buffers_view_without_database_work(
+        self, mock_session: AsyncMock, buffer: MagicMock
+    ):
+        """Test recording a view only counts it in the buffer."""
         service = WidgetService(mock_session)
-        await service.record_view(
+        service.record_view(
             "w_abc123",
             referrer="https://example.com",
             ip_address="192.168.1.1",
             user_agent="Mozilla/5.0",
         )
 
-        mock_session.add.assert_called_once()
-        assert mock_widget.view_count == 1
-        mock_session.commit.assert_called_once()
+        buffer.record.assert_called_once()
+        assert buffer.record.call_args.args == ("w_abc123",)
+        assert buffer.record.call_args.kwargs["referrer"] == "https://example.com"
+        assert buffer.record.call_args.kwargs["user_agent"] == "Mozilla/5.0"
+        mock_session.execute.assert_not_called()
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_hashes_ip_address(
-        self, mock_session: AsyncMock, mock_widget: Widget
-    ):
+    def test_hashes_ip_address(self, mock_session: AsyncMock, buffer: MagicMock):
         """Test that IP address is hashed."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_widget
-        mock_session.execute.return_value = mock_result
-
         service = WidgetService(mock_session)
-        await service.record_view("w_abc123", ip_address="192.168.1.1")
+        service.record_view("w_abc123", ip_address="192.168.1.1")
 
-        added_view = mock_session.add.call_args[0][0]
-        assert added_view.ip_hash is not None
-        assert added_view.ip_hash != "192.168.1.1"
-
-    @pytest.mark.asyncio
-    async def test_skips_when_widget_not_found(self, mock_session: AsyncMock):
-        """Test skipping view recording when widget not found."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        ip_hash = buffer.record.call_args.kwargs["ip_hash"]
+        assert ip_hash is not None
+        assert ip_hash != "192.168.1.1"
 
+    def test_truncates_long_referrer(self, mock_session: AsyncMock, buffer: MagicMock):
+        """Test truncating long referrer URL."""
         service = WidgetService(mock_session)
-        await service.record_view("w_notfound")
+        long_referrer = "https://example.com/" + "a" * 600
+        service.record_view("w_abc123", referrer=long_referrer)
 
-        mock_session.add.assert_not_called()
+        assert len(buffer.record.call_args.kwargs["referrer"]) == 500
+
+
+class TestGetViewAnalytics:
+    """Tests for get_view_analytics method."""
 
     @pytest.mark.asyncio
-    async def test_truncates_long_referrer(
+    async def test_reads_daily_views_and_referrers_from_rollups(
         self, mock_session: AsyncMock, mock_widget: Widget
     ):
-        """Test truncating long referrer URL."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_widget
-        mock_session.execute.return_value = mock_result
+        """Test analytics are aggregated from hourly rollups."""
+        daily = MagicMock()
+        daily.all.return_value = [(date(2026, 4, 1), 120), (date(2026, 4, 2), 30)]
+        referrers = MagicMock()
+        referrers.all.return_value = [("twitch.tv", 140), (None, 10)]
+        mock_session.execute.side_effect = [daily, referrers]
 
         service = WidgetService(mock_session)
-        long_referrer = "https://example.com/" + "a" * 600
-        await service.record_view("w_abc123", referrer=long_referrer)
-
-        added_view = mock_session.add.call_args[0][0]
-        assert len(added_view.referrer) == 500
+        result = await service.get_view_analytics(mock_widget, days=7)
+
+        assert result["total_views"] == 150
+        assert result["daily"][0] == {"date": date(2026, 4, 1), "views": 120}
+        assert result["top_referrers"] == [
+            {"domain": "twitch.tv", "views": 140},
+            {"domain": None, "views": 10},
+        ]
+        sql = str(mock_session.execute.await_args_list[0].args[0])
+        assert "FROM widget_view_rollups" in sql
+        assert "widget_views " not in sql
 
 
 class TestGenerateEmbedCode:
@@ -0,0 +1,176 @@
+"""Tests for the in-process widget view buffer."""
+
+import gzip
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.widget_view_buffer import WidgetViewBuffer, referrer_domain
+
+MODULE = "src.services.widget_view_buffer"
+VIEWED_AT = datetime(2026, 4, 2, 18, 42, 7, tzinfo=UTC)
+HOUR = datetime(2026, 4, 2, 18, tzinfo=UTC)
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    return session
+
+
+class TestReferrerDomain:
+    """Tests for referrer_domain."""
+
+    def test_lowercases_host_and_strips_www(self) -> None:
+        assert referrer_domain("https://WWW.Twitch.tv/streamer?x=1") == "twitch.tv"
+
+    def test_keeps_subdomains(self) -> None:
+        assert referrer_domain("https://blog.example.com:8080/") == "blog.example.com"
+
+    def test_direct_and_malformed(self) -> None:
+        assert referrer_domain(None) is None
+        assert referrer_domain("not a url") is None
+        assert referrer_domain("http://[::1") is None
+
+
+class TestRecord:
+    """Tests for WidgetViewBuffer.record."""
+
+    def test_aggregates_by_widget_hour_and_domain(self) -> None:
+        buffer = WidgetViewBuffer()
+        for _ in range(3):
+            buffer.record("w_a", referrer="https://twitch.tv/a", viewed_at=VIEWED_AT)
+        buffer.record("w_a", referrer="https://www.twitch.tv/b", viewed_at=HOUR)
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+
+        assert buffer.pending_views == 5
+        assert buffer._counts == {
+            ("w_a", HOUR, "twitch.tv"): 4,
+            ("w_a", HOUR, None): 1,
+        }
+
+    def test_keeps_no_raw_events_without_log_bucket(self) -> None:
+        buffer = WidgetViewBuffer()
+        buffer.record("w_a", ip_hash="abc", viewed_at=VIEWED_AT)
+
+        assert buffer._events == []
+
+    def test_caps_raw_events(self) -> None:
+        buffer = WidgetViewBuffer(log_bucket="views", max_pending_events=2)
+        for _ in range(3):
+            buffer.record("w_a", viewed_at=VIEWED_AT)
+
+        assert len(buffer._events) == 2
+        assert buffer.dropped_events == 1
+        assert buffer.pending_views == 3
+
+
+class TestFlush:
+    """Tests for WidgetViewBuffer.flush."""
+
+    @pytest.mark.asyncio
+    async def test_upserts_counts_additively_and_bumps_widget_totals(self) -> None:
+        buffer = WidgetViewBuffer()
+        buffer.record("w_a", referrer="https://twitch.tv", viewed_at=VIEWED_AT)
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+        buffer.record("w_b", viewed_at=VIEWED_AT)
+        session = _session()
+
+        assert await buffer.flush(session) == 3
+
+        assert buffer.pending_views == 0
+        assert session.execute.await_count == 2
+        upsert, totals = (c.args[0] for c in session.execute.await_args_list)
+        upsert_sql = str(upsert.compile(dialect=postgresql.dialect()))
+        assert upsert_sql.startswith("INSERT INTO widget_view_rollups")
+        assert "ON CONFLICT ON CONSTRAINT uq_widget_view_rollup" in upsert_sql
+        assert (
+            "view_count = (widget_view_rollups.view_count + excluded.view_count)"
+            in upsert_sql
+        )
+        totals_sql = str(totals.compile(dialect=postgresql.dialect()))
+        assert "view_count=(widgets.view_count + totals.view_count)" in totals_sql
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_buffer_does_nothing(self) -> None:
+        session = _session()
+
+        assert await WidgetViewBuffer().flush(session) == 0
+        session.execute.assert_not_awaited()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_requeues_counts_when_write_fails(self) -> None:
+        buffer = WidgetViewBuffer()
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+        session = _session()
+        session.execute.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush(session)
+
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+        assert buffer._counts == {("w_a", HOUR, None): 2}
+        session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_appends_compressed_event_log(self) -> None:
+        buffer = WidgetViewBuffer(log_bucket="views")
+        buffer.record(
+            "w_a",
+            referrer="https://twitch.tv/streamer",
+            ip_hash="abc",
+            user_agent="Mozilla/5.0",
+            viewed_at=VIEWED_AT,
+        )
+
+        with patch(f"{MODULE}.StorageService") as storage:
+            storage.return_value.upload_ndjson = AsyncMock()
+            await buffer.flush(_session())
+
+        storage.assert_called_once_with("views")
+        data, blob_path = storage.return_value.upload_ndjson.await_args.args
+        assert blob_path.startswith("widget-views/")
+        assert blob_path.endswith("-000001.ndjson.gz")
+        (event,) = [json.loads(line) for line in gzip.decompress(data).splitlines()]
+        assert event["widget_id"] == "w_a"
+        assert event["referrer"] == "https://twitch.tv/streamer"
+        assert event["ip_hash"] == "abc"
+        assert buffer._events == []
+
+    @pytest.mark.asyncio
+    async def test_log_upload_failure_keeps_counts_written(self) -> None:
+        buffer = WidgetViewBuffer(log_bucket="views")
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+        session = _session()
+
+        with patch(f"{MODULE}.StorageService") as storage:
+            storage.return_value.upload_ndjson = AsyncMock(side_effect=OSError("gcs"))
+            assert await buffer.flush(session) == 1
+
+        session.commit.assert_awaited_once()
+        assert buffer._events == []
+
+
+class TestStop:
+    """Tests for WidgetViewBuffer.start/stop."""
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_views(self) -> None:
+        buffer = WidgetViewBuffer(flush_interval=3600)
+        buffer.record("w_a", viewed_at=VIEWED_AT)
+        session = _session()
+
+        with patch(f"{MODULE}.async_session_factory") as factory:
+            factory.return_value.__aenter__ = AsyncMock(return_value=session)
+            factory.return_value.__aexit__ = AsyncMock(return_value=False)
+            buffer.start()
+            await buffer.stop()
+
+        assert buffer._task is None
+        assert buffer.pending_views == 0
+        session.commit.assert_awaited_once()
@@ -87,15 +87,14 @@ class TestCreateTournamentWithPlacements:
             ],
         }
 
-        with patch("src.routers.admin.ArchetypeNormalizer") as mock_norm_cls:
+        with patch("src.routers.admin.get_normalizer") as mock_get_normalizer:
             mock_normalizer = MagicMock()
-            mock_normalizer.load_db_sprites = AsyncMock()
             mock_normalizer.resolve.return_value = (
                 "Charizard ex",
                 "Charizard ex",
                 "text_label",
             )
-            mock_norm_cls.return_value = mock_normalizer
+            mock_get_normalizer.return_value = mock_normalizer
 
             resp = client.post(URL, json=payload)
 
@@ -122,10 +121,9 @@ class TestCreateTournamentWithPlacements:
             "placements": [],
         }
 
-        with patch("src.routers.admin.ArchetypeNormalizer") as mock_norm_cls:
+        with patch("src.routers.admin.get_normalizer") as mock_get_normalizer:
             mock_normalizer = MagicMock()
-            mock_normalizer.load_db_sprites = AsyncMock()
-            mock_norm_cls.return_value = mock_normalizer
+            mock_get_normalizer.return_value = mock_normalizer
 
             resp = client.post(URL, json=payload)
 
@@ -207,15 +205,14 @@ class TestArchetypeNormalization:
             ],
         }
 
-        with patch("src.routers.admin.ArchetypeNormalizer") as mock_norm_cls:
+        with patch("src.routers.admin.get_normalizer") as mock_get_normalizer:
             mock_normalizer = MagicMock()
-            mock_normalizer.load_db_sprites = AsyncMock()
             mock_normalizer.resolve.return_value = (
                 "Charizard ex",
                 "Charizard ex",
                 "text_label",
             )
-            mock_norm_cls.return_value = mock_normalizer
+            mock_get_normalizer.return_value = mock_normalizer
 
             resp = client.post(URL, json=payload)
 
@@ -251,11 +248,10 @@ class TestArchetypeNormalization:
             ],
         }
 
-        with patch("src.routers.admin.ArchetypeNormalizer") as mock_norm_cls:
+        with patch("src.routers.admin.get_normalizer") as mock_get_normalizer:
             mock_normalizer = MagicMock()
-            mock_normalizer.load_db_sprites = AsyncMock()
             mock_normalizer.resolve.side_effect = RuntimeError("boom")
-            mock_norm_cls.return_value = mock_normalizer
+            mock_get_normalizer.return_value = mock_normalizer
 
             resp = client.post(URL, json=payload)
 
@@ -14,6 +14,7 @@ from src.clients.limitless import (
     LimitlessClient,
     LimitlessTournament,
 )
+from src.services.cloud_tasks import BulkEnqueueResult
 from src.services.tournament_scrape import TournamentScrapeService
 
 
@@ -205,7 +206,7 @@ class TestDiscoverJpCombined:
             # Cloud Tasks not configured, no auto_process
             mock_tasks = MagicMock()
             mock_tasks.is_configured = True
-            mock_tasks.enqueue_tournament = AsyncMock(return_value="task-1")
+            mock_tasks.enqueue_tournaments = AsyncMock(return_value=BulkEnqueueResult())
             mock_tasks_cls.return_value = mock_tasks
 
             from src.pipelines.scrape_limitless import (
@@ -259,7 +260,7 @@ class TestDiscoverJpCombined:
 
             mock_tasks = MagicMock()
             mock_tasks.is_configured = True
-            mock_tasks.enqueue_tournament = AsyncMock(return_value="task-1")
+            mock_tasks.enqueue_tournaments = AsyncMock(return_value=BulkEnqueueResult())
             mock_tasks_cls.return_value = mock_tasks
 
             from src.pipelines.scrape_limitless import (
@@ -269,16 +270,16 @@ class TestDiscoverJpCombined:
             await discover_jp_tournaments(lookback_days=90)
 
             # Check payloads sent to enqueue
-            calls = mock_tasks.enqueue_tournament.call_args_list
-            assert len(calls) == 2
+            payloads = mock_tasks.enqueue_tournaments.await_args.args[0]
+            assert len(payloads) == 2
 
-            # First call: city league
-            city_payload = calls[0][0][0]
+            # First payload: city league
+            city_payload = payloads[0]
             assert city_payload.get("is_jp_city_league") is True
             assert "is_official" not in city_payload
 
-            # Second call: official
-            official_payload = calls[1][0][0]
+            # Second payload: official
+            official_payload = payloads[1]
             assert official_payload.get("is_official") is True
             assert "is_jp_city_league" not in official_payload
 
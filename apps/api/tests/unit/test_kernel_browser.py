@@ -67,11 +67,11 @@ class TestFetchRendered:
 
         with (
             patch(
-                "src.clients.kernel_browser.AsyncKernel",
+                "src.clients.kernel_browser.kernel.AsyncKernel",
                 return_value=mock_kernel,
             ),
             patch(
-                "src.clients.kernel_browser.async_playwright",
+                "src.clients.kernel_browser.playwright_api.async_playwright",
             ) as mock_pw_fn,
         ):
             mock_pw_fn.return_value.start = AsyncMock(
@@ -118,11 +118,11 @@ class TestFetchRendered:
 
         with (
             patch(
-                "src.clients.kernel_browser.AsyncKernel",
+                "src.clients.kernel_browser.kernel.AsyncKernel",
                 return_value=mock_kernel,
             ),
             patch(
-                "src.clients.kernel_browser.async_playwright",
+                "src.clients.kernel_browser.playwright_api.async_playwright",
             ) as mock_pw_fn,
         ):
             mock_pw_fn.return_value.start = AsyncMock(
@@ -165,11 +165,11 @@ class TestFetchRendered:
 
         with (
             patch(
-                "src.clients.kernel_browser.AsyncKernel",
+                "src.clients.kernel_browser.kernel.AsyncKernel",
                 return_value=mock_kernel,
             ),
             patch(
-                "src.clients.kernel_browser.async_playwright",
+                "src.clients.kernel_browser.playwright_api.async_playwright",
             ) as mock_pw_fn,
         ):
             mock_pw_fn.return_value.start = AsyncMock(
@@ -216,11 +216,11 @@ class TestFetchRendered:
 
         with (
             patch(
-                "src.clients.kernel_browser.AsyncKernel",
+                "src.clients.kernel_browser.kernel.AsyncKernel",
                 return_value=mock_kernel,
             ),
             patch(
-                "src.clients.kernel_browser.async_playwright",
+                "src.clients.kernel_browser.playwright_api.async_playwright",
             ) as mock_pw_fn,
         ):
             mock_pw_fn.return_value.start = AsyncMock(
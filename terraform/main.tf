@@ -317,6 +317,7 @@ module "api" {
     CLOUD_TASKS_LOCATION       = var.region
     API_SERVICE_ACCOUNT        = google_service_account.api.email
     EXPORTS_BUCKET             = google_storage_bucket.exports.name
+    PRUNE_ARCHIVE_BUCKET       = google_storage_bucket.prune_archive.name
 
   }
 
@@ -453,6 +454,39 @@ resource "google_storage_bucket" "exports" {
 }
 
 
+# Archive of pruned tournaments and placements (kept for historical
+# reprocessing; moved to colder storage as it ages, never deleted)
+resource "google_storage_bucket" "prune_archive" {
+  name     = "${var.project_id}-prune-archive"
+  location = var.region
+  project  = var.project_id
+
+  uniform_bucket_level_access = true
+
+  lifecycle_rule {
+    condition {
+      age = 30
+    }
+    action {
+      type          = "SetStorageClass"
+      storage_class = "COLDLINE"
+    }
+  }
+
+  labels = {
+    environment = var.environment
+    app         = "trainerlab"
+    purpose     = "prune-archive"
+  }
+}
+
+# Grant API SA permission to write pruned-row archives
+resource "google_storage_bucket_iam_member" "api_prune_archive_writer" {
+  bucket = google_storage_bucket.prune_archive.name
+  role   = "roles/storage.objectAdmin"
+  member = "serviceAccount:${google_service_account.api.email}"
+}
+
 # Grant API SA permission to write to exports bucket
 resource "google_storage_bucket_iam_member" "api_exports_writer" {
   bucket = google_storage_bucket.exports.name
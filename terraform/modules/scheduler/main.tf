@@ -5,6 +5,8 @@
 # - discover-jp: 7 AM daily (discover new JP tournaments, enqueue via Cloud Tasks)
 # - compute-meta: 8 AM daily (after scraping)
 # - compute-evolution: 9 AM daily (after compute-meta, AI classification + predictions)
+# - compute-rotation-impact: 8:30 AM daily (after compute-meta, rotation survival ratings)
+# - score-predictions: 8:45 AM daily (before compute-evolution, prediction accuracy rollups)
 # - sync-cards: 3 AM Sunday weekly (low traffic)
 # - sync-jp-cards: 3:30 AM Sunday weekly (after sync-cards, JP card sync)
 # - sync-card-mappings: 4 AM Sunday weekly (after JP sync, JP-to-EN mappings)
@@ -38,6 +40,20 @@ locals {
       body             = jsonencode({ dry_run = false, lookback_days = 90 })
       attempt_deadline = "600s"
     }
+    compute-rotation-impact = {
+      description      = "Rate archetype survival for the upcoming rotation"
+      schedule         = "30 8 * * *" # Daily at 8:30 AM (after compute-meta at 8 AM)
+      uri              = "${var.cloud_run_url}/api/v1/pipeline/compute-rotation-impact"
+      body             = jsonencode({ dry_run = false, lookback_days = 90 })
+      attempt_deadline = "300s"
+    }
+    score-predictions = {
+      description      = "Score completed archetype predictions and rebuild accuracy rollups"
+      schedule         = "45 8 * * *" # Daily at 8:45 AM (before compute-evolution at 9 AM)
+      uri              = "${var.cloud_run_url}/api/v1/pipeline/score-predictions"
+      body             = jsonencode({ dry_run = false })
+      attempt_deadline = "120s"
+    }
     compute-evolution = {
       description      = "Run evolution intelligence (AI classification, predictions, articles)"
       schedule         = "0 9 * * *" # Daily at 9 AM (after compute-meta at 8 AM)